@@ -42,14 +42,11 @@ import WorkingPlane
 from BillOfMaterial.BOMPreferences import BOMPreferences
 from BillOfMaterial.BOMfunc import (
     getReinforcementRebarObjects,
-    getHostReinforcementsDict,
     fixColumnUnits,
 )
+from BillOfMaterial.BOMTable import BOMTable
 from BillOfMaterial.BillOfMaterial_SVG import makeBillOfMaterialSVG
-from RebarShapeCutList.RebarShapeCutListfunc import (
-    getBaseRebarsList,
-    getRebarShapeCutList,
-)
+from RebarShapeCutList.RebarShapeCutListfunc import getRebarShapeCutList
 from SVGfunc import getSVGRootElement, getSVGRectangle, getSVGDataCell
 
 
@@ -232,6 +229,12 @@ def getBarBendingSchedule(
     reinforcement_group_by = (
         reinforcement_group_by or bom_preferences.getReinforcementGroupBy()
     )
+    bom_table = BOMTable(
+        rebar_objects,
+        rebar_length_type or bom_preferences.getRebarLengthType(),
+        reinforcement_group_by,
+        dia_weight_map or bom_preferences.getDiaWeightMap(),
+    )
 
     svg_pref = bom_preferences.getSVGPrefGroup()
     font_family = font_family or svg_pref.GetString("FontFamily")
@@ -253,6 +256,7 @@ def getBarBendingSchedule(
         rebar_objects=rebar_objects,
         reinforcement_group_by=reinforcement_group_by,
         return_svg_only=True,
+        bom_table=bom_table,
     )
     bom_table_svg = bom_svg.find("./g[@id='BOM_table']")
     bbs_svg.append(bom_table_svg)
@@ -274,16 +278,9 @@ def getBarBendingSchedule(
     )
     bbs_svg.append(rebar_shape_cut_list_header)
 
-    base_rebars_list = []
-    if reinforcement_group_by == "Mark":
-        base_rebars_list = getBaseRebarsList(rebar_objects)
-    else:
-        host_reinforcement_dict = getHostReinforcementsDict(rebar_objects)
-        for reinforcement_list in host_reinforcement_dict.values():
-            base_rebars_list.extend(getBaseRebarsList(reinforcement_list))
-
+    # Render one rebar shape per BOM row, in the same order
     bar_cut_list_svg = getRebarShapeCutList(
-        base_rebars_list,
+        bom_table.base_rebars,
         rebar_shape_view_directions,
         False if "Mark" in column_headers else True,
         rebar_shape_stirrup_extended_edge_offset,
@@ -38,6 +38,7 @@ from Rebarfunc import (
     _BeamReinforcementGroup,
     _ViewProviderBeamReinforcementGroup,
     setGroupProperties,
+    setGroupPropertiesValues,
 )
 from Stirrup import makeStirrup, editStirrup
 from StraightRebar import makeStraightRebar, editStraightRebar
@@ -362,6 +363,128 @@ def getHookOrientationListofShearRebars(
     return hook_orientation_list
 
 
+def getRebarsRoles(rebar_type_list):
+    """getRebarsRoles(RebarTypeList):
+    Returns list of roles of rebars from rebar_type_list stored in RebarType
+    property of top/bottom/left/right rebars group. Role of rebar is a tuple:
+    (layer, set_index, rebar_type).
+    """
+    if not rebar_type_list:
+        return []
+    # Left/right rebars group have single layer of rebars
+    if isinstance(rebar_type_list[0], str):
+        return [
+            (1, i, rebar_type) for i, rebar_type in enumerate(rebar_type_list)
+        ]
+    rebars_roles = []
+    for layer, layer_rebar_type in enumerate(rebar_type_list, start=1):
+        for i, rebar_type in enumerate(layer_rebar_type):
+            rebars_roles.append((layer, i, rebar_type))
+    return rebars_roles
+
+
+def getRebarParametersSignature(rebar_type, parameters, offset_end):
+    """getRebarParametersSignature(RebarType, Parameters, OffsetEnd):
+    Returns signature string of rebar parameters. It also includes placement
+    and bounding box of structure, so that signature changes when structure is
+    modified.
+    """
+    structure = parameters[-2]
+    return repr(
+        (rebar_type,)
+        + tuple(parameters[:-2])
+        + (structure.Name, parameters[-1], offset_end)
+        + (repr(structure.Shape.BoundBox), repr(structure.Placement))
+    )
+
+
+def updateRebars(rebar_group, rebars_property, rebars_parameters):
+    """updateRebars(RebarGroup, RebarsProperty, RebarsParameters):
+    Update rebars listed in rebars_property of rebar_group to match
+    rebars_parameters returned by get<Side>ReinforcementRebarsParameters().
+
+    Existing rebars are matched to rebars_parameters by role i.e. (layer,
+    set_index, rebar_type) and the remaining ones by rebar_type. Matched rebars
+    are edited only if their parameters are changed, new rebars are created
+    for unmatched rebars_parameters and unmatched existing rebars are removed.
+
+    Returns list of rebars in the order of rebars_parameters.
+    """
+    prev_rebars = list(getattr(rebar_group, rebars_property))
+    prev_roles = getRebarsRoles(rebar_group.RebarType)
+    if len(prev_roles) != len(prev_rebars):
+        # Rebars are deleted by user, so match remaining rebars by type only
+        prev_roles = [
+            (None, None, getattr(rebar, "RebarShape", None))
+            for rebar in prev_rebars
+        ]
+    if not hasattr(rebar_group, "RebarsParameters"):
+        setGroupProperties(
+            [
+                (
+                    "App::PropertyPythonObject",
+                    "RebarsParameters",
+                    "Parameters signature of rebars",
+                    2,
+                )
+            ],
+            rebar_group,
+        )
+    prev_signatures = rebar_group.RebarsParameters or {}
+
+    unmatched_rebars = dict(enumerate(prev_rebars))
+    role_index = {role: i for i, role in enumerate(prev_roles)}
+    rebars = [None] * len(rebars_parameters)
+    for j, (role, _, _, _) in enumerate(rebars_parameters):
+        i = role_index.get(role)
+        if i is not None and i in unmatched_rebars:
+            rebars[j] = unmatched_rebars.pop(i)
+    for j, (_, rebar_type, _, _) in enumerate(rebars_parameters):
+        if rebars[j]:
+            continue
+        for i in unmatched_rebars:
+            if prev_roles[i][2] == rebar_type:
+                rebars[j] = unmatched_rebars.pop(i)
+                break
+
+    for rebar in unmatched_rebars.values():
+        base_name = rebar.Base.Name
+        FreeCAD.ActiveDocument.removeObject(rebar.Name)
+        FreeCAD.ActiveDocument.removeObject(base_name)
+
+    new_rebars = []
+    signatures = {}
+    for j, (_, rebar_type, parameters, offset_end) in enumerate(
+        rebars_parameters
+    ):
+        signature = getRebarParametersSignature(
+            rebar_type, parameters, offset_end
+        )
+        rebar = rebars[j]
+        if not rebar:
+            if rebar_type == "StraightRebar":
+                rebar = makeStraightRebar(*parameters)
+            else:
+                rebar = makeLShapeRebar(*parameters)
+            rebar.OffsetEnd = offset_end
+            new_rebars.append(rebar)
+        elif prev_signatures.get(rebar.Name) != signature:
+            if rebar_type == "StraightRebar":
+                editStraightRebar(rebar, *parameters)
+            else:
+                editLShapeRebar(rebar, *parameters)
+            rebar.OffsetEnd = offset_end
+        rebars[j] = rebar
+        signatures[rebar.Name] = signature
+    FreeCAD.ActiveDocument.recompute()
+
+    if new_rebars:
+        rebar_group.addObjects(new_rebars)
+    setattr(rebar_group, rebars_property, rebars)
+    rebar_group.RebarsParameters = signatures
+    return rebars
+
+
 def makeReinforcement(
     l_cover_of_stirrup,
     r_cover_of_stirrup,
@@ -637,8 +760,7 @@ def makeReinforcement(
     return TwoLeggedBeam.Object
 
 
-def makeTopReinforcement(
-    obj,
+def getTopReinforcementRebarsParameters(
     l_cover_of_stirrup,
     r_cover_of_stirrup,
     t_cover_of_stirrup,
@@ -654,6 +776,13 @@ def makeTopReinforcement(
     facename,
     structure,
 ):
+    """Returns tuple of list of parameters of top reinforcement rebars and
+    list of (property, value) of top reinforcement group.
+
+    Each element of rebars parameters list is a tuple: (role, rebar_type,
+    parameters, offset_end). Here role is (layer, set_index, rebar_type) and
+    parameters are the arguments of make/edit function of rebar_type.
+    """
     facename_for_t_rebars = getFacenamesforBeamReinforcement(
         facename, structure
     )[0]
@@ -712,7 +841,7 @@ def makeTopReinforcement(
     spacing_in_top_reinforcement = top_reinforcement_rebars_number_spacing[1]
 
     coverAlong = "Top Side"
-    top_reinforcement_rebars = []
+    rebars_parameters = []
     layer = 1
     while layer <= top_reinforcement_layers:
         top_reinforcement_number_diameter_offset_list = (
@@ -740,23 +869,19 @@ def makeTopReinforcement(
                 - number * diameter
                 - (number - 1) * spacing_in_top_reinforcement[layer - 1]
             )
-            if (
-                top_reinforcement_rebar_type_list[layer - 1][i]
-                == "StraightRebar"
-            ):
-                top_reinforcement_rebars.append(
-                    makeStraightRebar(
-                        f_cover,
-                        (coverAlong, t_cover),
-                        r_cover,
-                        l_cover,
-                        diameter,
-                        True,
-                        number,
-                        "Horizontal",
-                        structure,
-                        facename_for_t_rebars,
-                    )
+            rebar_type = top_reinforcement_rebar_type_list[layer - 1][i]
+            if rebar_type == "StraightRebar":
+                parameters = (
+                    f_cover,
+                    (coverAlong, t_cover),
+                    r_cover,
+                    l_cover,
+                    diameter,
+                    True,
+                    number,
+                    "Horizontal",
+                    structure,
+                    facename_for_t_rebars,
                 )
             else:
                 if layer == 1:
@@ -803,46 +928,46 @@ def makeTopReinforcement(
                     else:
                         orientation = "Top Left"
 
-                top_reinforcement_rebars.append(
-                    makeLShapeRebar(
-                        f_cover,
-                        b_cover,
-                        l_cover,
-                        r_cover,
-                        diameter,
-                        t_cover,
-                        top_reinforcement_l_rebar_rounding_list[layer - 1][i],
-                        True,
-                        number,
-                        orientation,
-                        structure,
-                        facename_for_t_rebars,
-                    )
+                parameters = (
+                    f_cover,
+                    b_cover,
+                    l_cover,
+                    r_cover,
+                    diameter,
+                    t_cover,
+                    top_reinforcement_l_rebar_rounding_list[layer - 1][i],
+                    True,
+                    number,
+                    orientation,
+                    structure,
+                    facename_for_t_rebars,
+                )
+            rebars_parameters.append(
+                (
+                    (layer, i, rebar_type),
+                    rebar_type,
+                    parameters,
+                    rear_cover + diameter / 2,
                 )
-            top_reinforcement_rebars[-1].OffsetEnd = rear_cover + diameter / 2
+            )
             f_cover += (
                 number * diameter
                 + number * spacing_in_top_reinforcement[layer - 1]
             )
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
-
-    obj.addObjects(top_reinforcement_rebars)
-    prev_top_reinforcement_rebars = obj.TopRebars
-    prev_top_reinforcement_rebars.extend(top_reinforcement_rebars)
-    obj.TopRebars = prev_top_reinforcement_rebars
-    obj.NumberDiameterOffset = top_reinforcement_number_diameter_offset
-    obj.RebarType = top_reinforcement_rebar_type_list
-    obj.LRebarRounding = top_reinforcement_l_rebar_rounding_list
-    obj.LayerSpacing = list(top_reinforcement_layer_spacing)
-    obj.HookExtension = top_reinforcement_hook_extension_list
-    obj.HookOrientation = top_reinforcement_hook_orientation_list
 
-    return top_reinforcement_rebars
+    properties_values = [
+        ("NumberDiameterOffset", top_reinforcement_number_diameter_offset),
+        ("RebarType", top_reinforcement_rebar_type_list),
+        ("LRebarRounding", top_reinforcement_l_rebar_rounding_list),
+        ("LayerSpacing", list(top_reinforcement_layer_spacing)),
+        ("HookExtension", top_reinforcement_hook_extension_list),
+        ("HookOrientation", top_reinforcement_hook_orientation_list),
+    ]
+    return rebars_parameters, properties_values
 
 
-def makeBottomReinforcement(
-    obj,
+def getBottomReinforcementRebarsParameters(
     l_cover_of_stirrup,
     r_cover_of_stirrup,
     t_cover_of_stirrup,
@@ -858,6 +983,11 @@ def makeBottomReinforcement(
     facename,
     structure,
 ):
+    """Returns tuple of list of parameters of bottom reinforcement rebars and
+    list of (property, value) of bottom reinforcement group.
+
+    For format of returned values, refer getTopReinforcementRebarsParameters().
+    """
     facename_for_b_rebars = getFacenamesforBeamReinforcement(
         facename, structure
     )[0]
@@ -926,7 +1056,7 @@ def makeBottomReinforcement(
     )
 
     coverAlong = "Bottom Side"
-    bottom_reinforcement_rebars = []
+    rebars_parameters = []
     layer = 1
     while layer <= bottom_reinforcement_layers:
         bottom_reinforcement_number_diameter_offset_list = (
@@ -959,23 +1089,19 @@ def makeBottomReinforcement(
                 - number * diameter
                 - (number - 1) * spacing_in_bottom_reinforcement[layer - 1]
             )
-            if (
-                bottom_reinforcement_rebar_type_list[layer - 1][i]
-                == "StraightRebar"
-            ):
-                bottom_reinforcement_rebars.append(
-                    makeStraightRebar(
-                        f_cover,
-                        (coverAlong, b_cover),
-                        r_cover,
-                        l_cover,
-                        diameter,
-                        True,
-                        number,
-                        "Horizontal",
-                        structure,
-                        facename_for_b_rebars,
-                    )
+            rebar_type = bottom_reinforcement_rebar_type_list[layer - 1][i]
+            if rebar_type == "StraightRebar":
+                parameters = (
+                    f_cover,
+                    (coverAlong, b_cover),
+                    r_cover,
+                    l_cover,
+                    diameter,
+                    True,
+                    number,
+                    "Horizontal",
+                    structure,
+                    facename_for_b_rebars,
                 )
             else:
                 if layer == 1:
@@ -1022,50 +1148,46 @@ def makeBottomReinforcement(
                     else:
                         orientation = "Bottom Left"
 
-                bottom_reinforcement_rebars.append(
-                    makeLShapeRebar(
-                        f_cover,
-                        b_cover,
-                        l_cover,
-                        r_cover,
-                        diameter,
-                        t_cover,
-                        bottom_reinforcement_l_rebar_rounding_list[layer - 1][
-                            i
-                        ],
-                        True,
-                        number,
-                        orientation,
-                        structure,
-                        facename_for_b_rebars,
-                    )
+                parameters = (
+                    f_cover,
+                    b_cover,
+                    l_cover,
+                    r_cover,
+                    diameter,
+                    t_cover,
+                    bottom_reinforcement_l_rebar_rounding_list[layer - 1][i],
+                    True,
+                    number,
+                    orientation,
+                    structure,
+                    facename_for_b_rebars,
+                )
+            rebars_parameters.append(
+                (
+                    (layer, i, rebar_type),
+                    rebar_type,
+                    parameters,
+                    rear_cover + diameter / 2,
                 )
-            bottom_reinforcement_rebars[-1].OffsetEnd = (
-                rear_cover + diameter / 2
             )
             f_cover += (
                 number * diameter
                 + number * spacing_in_bottom_reinforcement[layer - 1]
             )
         layer += 1
-    FreeCAD.ActiveDocument.recompute()
 
-    obj.addObjects(bottom_reinforcement_rebars)
-    prev_bottom_reinforcement_rebars = obj.BottomRebars
-    prev_bottom_reinforcement_rebars.extend(bottom_reinforcement_rebars)
-    obj.BottomRebars = prev_bottom_reinforcement_rebars
-    obj.NumberDiameterOffset = bottom_reinforcement_number_diameter_offset
-    obj.RebarType = bottom_reinforcement_rebar_type_list
-    obj.LRebarRounding = bottom_reinforcement_l_rebar_rounding_list
-    obj.LayerSpacing = list(bottom_reinforcement_layer_spacing)
-    obj.HookExtension = bottom_reinforcement_hook_extension_list
-    obj.HookOrientation = bottom_reinforcement_hook_orientation_list
-
-    return bottom_reinforcement_rebars
+    properties_values = [
+        ("NumberDiameterOffset", bottom_reinforcement_number_diameter_offset),
+        ("RebarType", bottom_reinforcement_rebar_type_list),
+        ("LRebarRounding", bottom_reinforcement_l_rebar_rounding_list),
+        ("LayerSpacing", list(bottom_reinforcement_layer_spacing)),
+        ("HookExtension", bottom_reinforcement_hook_extension_list),
+        ("HookOrientation", bottom_reinforcement_hook_orientation_list),
+    ]
+    return rebars_parameters, properties_values
 
 
-def makeLeftReinforcement(
-    obj,
+def getLeftReinforcementRebarsParameters(
     l_cover_of_stirrup,
     dia_of_stirrup,
     left_rebars_number_diameter_offset,
@@ -1077,11 +1199,11 @@ def makeLeftReinforcement(
     structure,
     facename,
 ):
-    if not left_rebars_number_diameter_offset:
-        if obj:
-            FreeCAD.ActiveDocument.removeObject(obj.Name)
-        return None
+    """Returns tuple of list of parameters of left reinforcement rebars and
+    list of (property, value) of left rebars group.
 
+    For format of returned values, refer getTopReinforcementRebarsParameters().
+    """
     facename_for_s_rebars = getFacenamesforBeamReinforcement(
         facename, structure
     )[1]
@@ -1126,7 +1248,7 @@ def makeLeftReinforcement(
     )
     left_rebars_f_cover = (face_width - left_reinforcement_span_length) / 2
 
-    left_reinforcement_rebars = []
+    rebars_parameters = []
     for i, (number, diameter, offset) in enumerate(
         left_rebars_number_diameter_offset_tuple
     ):
@@ -1138,26 +1260,25 @@ def makeLeftReinforcement(
             - number * diameter
             - (number - 1) * left_rebars_spacing
         )
-        if left_rebars_type_list[i] == "StraightRebar":
+        rebar_type = left_rebars_type_list[i]
+        if rebar_type == "StraightRebar":
             if face.normalAt(0, 0).x in (1, -1):
                 orientation = "Horizontal"
                 coverAlong = "Top Side"
             else:
                 orientation = "Vertical"
                 coverAlong = "Left Side"
-            left_reinforcement_rebars.append(
-                makeStraightRebar(
-                    left_rebars_f_cover,
-                    (coverAlong, t_cover),
-                    r_cover,
-                    l_cover,
-                    diameter,
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_s_rebars,
-                )
+            parameters = (
+                left_rebars_f_cover,
+                (coverAlong, t_cover),
+                r_cover,
+                l_cover,
+                diameter,
+                True,
+                number,
+                orientation,
+                structure,
+                facename_for_s_rebars,
             )
         else:
             b_cover = face_length - t_cover - diameter / 2
@@ -1200,43 +1321,42 @@ def makeLeftReinforcement(
                 r_cover = b_cover
                 t_cover = b_cover = offset
 
-            left_reinforcement_rebars.append(
-                makeLShapeRebar(
-                    left_rebars_f_cover,
-                    b_cover,
-                    l_cover,
-                    r_cover,
-                    diameter,
-                    t_cover,
-                    left_l_rebar_rounding_list[i],
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_s_rebars,
-                )
+            parameters = (
+                left_rebars_f_cover,
+                b_cover,
+                l_cover,
+                r_cover,
+                diameter,
+                t_cover,
+                left_l_rebar_rounding_list[i],
+                True,
+                number,
+                orientation,
+                structure,
+                facename_for_s_rebars,
+            )
+        rebars_parameters.append(
+            (
+                (1, i, rebar_type),
+                rebar_type,
+                parameters,
+                rear_cover + diameter / 2,
             )
-        left_reinforcement_rebars[-1].OffsetEnd = rear_cover + diameter / 2
+        )
         left_rebars_f_cover += number * diameter + number * left_rebars_spacing
-    FreeCAD.ActiveDocument.recompute()
-
-    obj.addObjects(left_reinforcement_rebars)
-    prev_left_reinforcement_rebars = obj.LeftRebars
-    prev_left_reinforcement_rebars.extend(left_reinforcement_rebars)
-    obj.LeftRebars = prev_left_reinforcement_rebars
-    obj.NumberDiameterOffset = left_rebars_number_diameter_offset
-    obj.RebarType = left_rebars_type_list
-    obj.LRebarRounding = left_l_rebar_rounding_list
-    obj.RebarSpacing = left_rebars_spacing
-    obj.HookExtension = left_rebars_hook_extension_list
-    obj.HookOrientation = left_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
-    return left_reinforcement_rebars
+    properties_values = [
+        ("NumberDiameterOffset", left_rebars_number_diameter_offset),
+        ("RebarType", left_rebars_type_list),
+        ("LRebarRounding", left_l_rebar_rounding_list),
+        ("RebarSpacing", left_rebars_spacing),
+        ("HookExtension", left_rebars_hook_extension_list),
+        ("HookOrientation", left_rebars_hook_orientation_list),
+    ]
+    return rebars_parameters, properties_values
 
 
-def makeRightReinforcement(
-    obj,
+def getRightReinforcementRebarsParameters(
     r_cover_of_stirrup,
     dia_of_stirrup,
     right_rebars_number_diameter_offset,
@@ -1248,11 +1368,11 @@ def makeRightReinforcement(
     structure,
     facename,
 ):
-    if not right_rebars_number_diameter_offset:
-        if obj:
-            FreeCAD.ActiveDocument.removeObject(obj.Name)
-        return None
+    """Returns tuple of list of parameters of right reinforcement rebars and
+    list of (property, value) of right rebars group.
 
+    For format of returned values, refer getTopReinforcementRebarsParameters().
+    """
     facename_for_s_rebars = getFacenamesforBeamReinforcement(
         facename, structure
     )[1]
@@ -1297,7 +1417,7 @@ def makeRightReinforcement(
     )
     right_rebars_f_cover = (face_width - right_reinforcement_span_length) / 2
 
-    right_reinforcement_rebars = []
+    rebars_parameters = []
     for i, (number, diameter, offset) in enumerate(
         right_rebars_number_diameter_offset_tuple
     ):
@@ -1309,26 +1429,25 @@ def makeRightReinforcement(
             - number * diameter
             - (number - 1) * right_rebars_spacing
         )
-        if right_rebars_type_list[i] == "StraightRebar":
+        rebar_type = right_rebars_type_list[i]
+        if rebar_type == "StraightRebar":
             if face.normalAt(0, 0).x in (1, -1):
                 orientation = "Horizontal"
                 coverAlong = "Bottom Side"
             else:
                 orientation = "Vertical"
                 coverAlong = "Right Side"
-            right_reinforcement_rebars.append(
-                makeStraightRebar(
-                    right_rebars_f_cover,
-                    (coverAlong, b_cover),
-                    r_cover,
-                    l_cover,
-                    diameter,
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_s_rebars,
-                )
+            parameters = (
+                right_rebars_f_cover,
+                (coverAlong, b_cover),
+                r_cover,
+                l_cover,
+                diameter,
+                True,
+                number,
+                orientation,
+                structure,
+                facename_for_s_rebars,
             )
         else:
             t_cover = face_length - b_cover - diameter / 2
@@ -1371,70 +1490,228 @@ def makeRightReinforcement(
                 r_cover = b_cover
                 t_cover = b_cover = offset
 
-            right_reinforcement_rebars.append(
-                makeLShapeRebar(
-                    right_rebars_f_cover,
-                    b_cover,
-                    l_cover,
-                    r_cover,
-                    diameter,
-                    t_cover,
-                    right_l_rebar_rounding_list[i],
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_s_rebars,
-                )
+            parameters = (
+                right_rebars_f_cover,
+                b_cover,
+                l_cover,
+                r_cover,
+                diameter,
+                t_cover,
+                right_l_rebar_rounding_list[i],
+                True,
+                number,
+                orientation,
+                structure,
+                facename_for_s_rebars,
+            )
+        rebars_parameters.append(
+            (
+                (1, i, rebar_type),
+                rebar_type,
+                parameters,
+                rear_cover + diameter / 2,
             )
-        right_reinforcement_rebars[-1].OffsetEnd = rear_cover + diameter / 2
+        )
         right_rebars_f_cover += (
             number * diameter + number * right_rebars_spacing
         )
-    FreeCAD.ActiveDocument.recompute()
-
-    obj.addObjects(right_reinforcement_rebars)
-    prev_right_reinforcement_rebars = obj.RightRebars
-    prev_right_reinforcement_rebars.extend(right_reinforcement_rebars)
-    obj.RightRebars = prev_right_reinforcement_rebars
-    obj.NumberDiameterOffset = right_rebars_number_diameter_offset
-    obj.RebarType = right_rebars_type_list
-    obj.LRebarRounding = right_l_rebar_rounding_list
-    obj.RebarSpacing = right_rebars_spacing
-    obj.HookExtension = right_rebars_hook_extension_list
-    obj.HookOrientation = right_rebars_hook_orientation_list
 
-    FreeCAD.ActiveDocument.recompute()
-    return right_reinforcement_rebars
+    properties_values = [
+        ("NumberDiameterOffset", right_rebars_number_diameter_offset),
+        ("RebarType", right_rebars_type_list),
+        ("LRebarRounding", right_l_rebar_rounding_list),
+        ("RebarSpacing", right_rebars_spacing),
+        ("HookExtension", right_rebars_hook_extension_list),
+        ("HookOrientation", right_rebars_hook_orientation_list),
+    ]
+    return rebars_parameters, properties_values
 
 
-def editReinforcement(
-    rebar_group,
+def makeTopReinforcement(
+    obj,
     l_cover_of_stirrup,
     r_cover_of_stirrup,
     t_cover_of_stirrup,
     b_cover_of_stirrup,
     offset_of_stirrup,
-    bent_angle,
-    extension_factor,
     dia_of_stirrup,
-    number_spacing_check,
-    number_spacing_value,
     top_reinforcement_number_diameter_offset,
     top_reinforcement_rebar_type,
     top_reinforcement_layer_spacing,
+    top_reinforcement_l_rebar_rounding,
+    top_reinforcement_hook_extension,
+    top_reinforcement_hook_orientation,
+    facename,
+    structure,
+):
+    rebars_parameters, group_values = getTopReinforcementRebarsParameters(
+        l_cover_of_stirrup,
+        r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
+        dia_of_stirrup,
+        top_reinforcement_number_diameter_offset,
+        top_reinforcement_rebar_type,
+        top_reinforcement_layer_spacing,
+        top_reinforcement_l_rebar_rounding,
+        top_reinforcement_hook_extension,
+        top_reinforcement_hook_orientation,
+        facename,
+        structure,
+    )
+    top_reinforcement_rebars = updateRebars(obj, "TopRebars", rebars_parameters)
+    setGroupPropertiesValues(group_values, obj)
+    return top_reinforcement_rebars
+
+
+def makeBottomReinforcement(
+    obj,
+    l_cover_of_stirrup,
+    r_cover_of_stirrup,
+    t_cover_of_stirrup,
+    b_cover_of_stirrup,
+    offset_of_stirrup,
+    dia_of_stirrup,
     bottom_reinforcement_number_diameter_offset,
     bottom_reinforcement_rebar_type,
     bottom_reinforcement_layer_spacing,
-    left_rebars_number_diameter_offset,
-    left_rebars_type,
-    left_rebars_spacing,
-    right_rebars_number_diameter_offset,
-    right_rebars_type,
-    right_rebars_spacing,
-    top_reinforcement_l_rebar_rounding=2,
-    top_reinforcement_hook_extension=40,
-    top_reinforcement_hook_orientation="Front Inside",
+    bottom_reinforcement_l_rebar_rounding,
+    bottom_reinforcement_hook_extension,
+    bottom_reinforcement_hook_orientation,
+    facename,
+    structure,
+):
+    rebars_parameters, group_values = getBottomReinforcementRebarsParameters(
+        l_cover_of_stirrup,
+        r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
+        dia_of_stirrup,
+        bottom_reinforcement_number_diameter_offset,
+        bottom_reinforcement_rebar_type,
+        bottom_reinforcement_layer_spacing,
+        bottom_reinforcement_l_rebar_rounding,
+        bottom_reinforcement_hook_extension,
+        bottom_reinforcement_hook_orientation,
+        facename,
+        structure,
+    )
+    bottom_reinforcement_rebars = updateRebars(
+        obj, "BottomRebars", rebars_parameters
+    )
+    setGroupPropertiesValues(group_values, obj)
+    return bottom_reinforcement_rebars
+
+
+def makeLeftReinforcement(
+    obj,
+    l_cover_of_stirrup,
+    dia_of_stirrup,
+    left_rebars_number_diameter_offset,
+    left_rebars_type,
+    left_rebars_spacing,
+    left_l_rebar_rounding,
+    left_rebars_hook_extension,
+    left_rebars_hook_orientation,
+    structure,
+    facename,
+):
+    if not left_rebars_number_diameter_offset:
+        if obj:
+            updateRebars(obj, "LeftRebars", [])
+            FreeCAD.ActiveDocument.removeObject(obj.Name)
+        return None
+
+    rebars_parameters, group_values = getLeftReinforcementRebarsParameters(
+        l_cover_of_stirrup,
+        dia_of_stirrup,
+        left_rebars_number_diameter_offset,
+        left_rebars_type,
+        left_rebars_spacing,
+        left_l_rebar_rounding,
+        left_rebars_hook_extension,
+        left_rebars_hook_orientation,
+        structure,
+        facename,
+    )
+    left_reinforcement_rebars = updateRebars(
+        obj, "LeftRebars", rebars_parameters
+    )
+    setGroupPropertiesValues(group_values, obj)
+
+    FreeCAD.ActiveDocument.recompute()
+    return left_reinforcement_rebars
+
+
+def makeRightReinforcement(
+    obj,
+    r_cover_of_stirrup,
+    dia_of_stirrup,
+    right_rebars_number_diameter_offset,
+    right_rebars_type,
+    right_rebars_spacing,
+    right_l_rebar_rounding,
+    right_rebars_hook_extension,
+    right_rebars_hook_orientation,
+    structure,
+    facename,
+):
+    if not right_rebars_number_diameter_offset:
+        if obj:
+            updateRebars(obj, "RightRebars", [])
+            FreeCAD.ActiveDocument.removeObject(obj.Name)
+        return None
+
+    rebars_parameters, group_values = getRightReinforcementRebarsParameters(
+        r_cover_of_stirrup,
+        dia_of_stirrup,
+        right_rebars_number_diameter_offset,
+        right_rebars_type,
+        right_rebars_spacing,
+        right_l_rebar_rounding,
+        right_rebars_hook_extension,
+        right_rebars_hook_orientation,
+        structure,
+        facename,
+    )
+    right_reinforcement_rebars = updateRebars(
+        obj, "RightRebars", rebars_parameters
+    )
+    setGroupPropertiesValues(group_values, obj)
+
+    FreeCAD.ActiveDocument.recompute()
+    return right_reinforcement_rebars
+
+
+def editReinforcement(
+    rebar_group,
+    l_cover_of_stirrup,
+    r_cover_of_stirrup,
+    t_cover_of_stirrup,
+    b_cover_of_stirrup,
+    offset_of_stirrup,
+    bent_angle,
+    extension_factor,
+    dia_of_stirrup,
+    number_spacing_check,
+    number_spacing_value,
+    top_reinforcement_number_diameter_offset,
+    top_reinforcement_rebar_type,
+    top_reinforcement_layer_spacing,
+    bottom_reinforcement_number_diameter_offset,
+    bottom_reinforcement_rebar_type,
+    bottom_reinforcement_layer_spacing,
+    left_rebars_number_diameter_offset,
+    left_rebars_type,
+    left_rebars_spacing,
+    right_rebars_number_diameter_offset,
+    right_rebars_type,
+    right_rebars_spacing,
+    top_reinforcement_l_rebar_rounding=2,
+    top_reinforcement_hook_extension=40,
+    top_reinforcement_hook_orientation="Front Inside",
     bottom_reinforcement_l_rebar_rounding=2,
     bottom_reinforcement_hook_extension=40,
     bottom_reinforcement_hook_orientation="Front Inside",
@@ -1608,124 +1885,41 @@ def editReinforcement(
                 elif hasattr(shear_rebar_group, "RightRebars"):
                     right_rebars_group = shear_rebar_group
 
-    recreate_top_reinforcement = False
-    prev_top_reinforcement_number_diameter_offset = (
-        top_reinforcement_group.NumberDiameterOffset
-    )
-    prev_top_reinforcement_rebar_type = top_reinforcement_group.RebarType
-    if prev_top_reinforcement_number_diameter_offset != list(
-        top_reinforcement_number_diameter_offset
-    ):
-        recreate_top_reinforcement = True
-    elif prev_top_reinforcement_rebar_type != getRebarTypeListofTopBottomRebars(
-        top_reinforcement_number_diameter_offset_dict,
+    editTopReinforcement(
+        top_reinforcement_group,
+        l_cover_of_stirrup,
+        r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
+        dia_of_stirrup,
+        top_reinforcement_number_diameter_offset,
         top_reinforcement_rebar_type,
-    ):
-        recreate_top_reinforcement = True
-
-    recreate_bottom_reinforcement = False
-    prev_bottom_reinforcement_number_diameter_offset = (
-        bottom_reinforcement_group.NumberDiameterOffset
+        top_reinforcement_layer_spacing,
+        top_reinforcement_l_rebar_rounding,
+        top_reinforcement_hook_extension,
+        top_reinforcement_hook_orientation,
+        facename,
+        structure,
     )
-    prev_bottom_reinforcement_rebar_type = bottom_reinforcement_group.RebarType
-    if prev_bottom_reinforcement_number_diameter_offset != list(
-        bottom_reinforcement_number_diameter_offset
-    ):
-        recreate_bottom_reinforcement = True
-    elif (
-        prev_bottom_reinforcement_rebar_type
-        != getRebarTypeListofTopBottomRebars(
-            bottom_reinforcement_number_diameter_offset_dict,
-            bottom_reinforcement_rebar_type,
-        )
-    ):
-        recreate_bottom_reinforcement = True
-
-    if recreate_top_reinforcement:
-        for Rebar in top_reinforcement_group.TopRebars:
-            base_name = Rebar.Base.Name
-            FreeCAD.ActiveDocument.removeObject(Rebar.Name)
-            FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
-
-        makeTopReinforcement(
-            top_reinforcement_group,
-            l_cover_of_stirrup,
-            r_cover_of_stirrup,
-            t_cover_of_stirrup,
-            b_cover_of_stirrup,
-            offset_of_stirrup,
-            dia_of_stirrup,
-            top_reinforcement_number_diameter_offset,
-            top_reinforcement_rebar_type,
-            top_reinforcement_layer_spacing,
-            top_reinforcement_l_rebar_rounding,
-            top_reinforcement_hook_extension,
-            top_reinforcement_hook_orientation,
-            facename,
-            structure,
-        )
-    else:
-        editTopReinforcement(
-            top_reinforcement_group,
-            l_cover_of_stirrup,
-            r_cover_of_stirrup,
-            t_cover_of_stirrup,
-            b_cover_of_stirrup,
-            offset_of_stirrup,
-            dia_of_stirrup,
-            top_reinforcement_number_diameter_offset,
-            top_reinforcement_rebar_type,
-            top_reinforcement_layer_spacing,
-            top_reinforcement_l_rebar_rounding,
-            top_reinforcement_hook_extension,
-            top_reinforcement_hook_orientation,
-            facename,
-            structure,
-        )
-
-    if recreate_bottom_reinforcement:
-        for Rebar in bottom_reinforcement_group.BottomRebars:
-            base_name = Rebar.Base.Name
-            FreeCAD.ActiveDocument.removeObject(Rebar.Name)
-            FreeCAD.ActiveDocument.removeObject(base_name)
-        FreeCAD.ActiveDocument.recompute()
 
-        makeBottomReinforcement(
-            bottom_reinforcement_group,
-            l_cover_of_stirrup,
-            r_cover_of_stirrup,
-            t_cover_of_stirrup,
-            b_cover_of_stirrup,
-            offset_of_stirrup,
-            dia_of_stirrup,
-            bottom_reinforcement_number_diameter_offset,
-            bottom_reinforcement_rebar_type,
-            bottom_reinforcement_layer_spacing,
-            bottom_reinforcement_l_rebar_rounding,
-            bottom_reinforcement_hook_extension,
-            bottom_reinforcement_hook_orientation,
-            facename,
-            structure,
-        )
-    else:
-        editBottomReinforcement(
-            bottom_reinforcement_group,
-            l_cover_of_stirrup,
-            r_cover_of_stirrup,
-            t_cover_of_stirrup,
-            b_cover_of_stirrup,
-            offset_of_stirrup,
-            dia_of_stirrup,
-            bottom_reinforcement_number_diameter_offset,
-            bottom_reinforcement_rebar_type,
-            bottom_reinforcement_layer_spacing,
-            bottom_reinforcement_l_rebar_rounding,
-            bottom_reinforcement_hook_extension,
-            bottom_reinforcement_hook_orientation,
-            facename,
-            structure,
-        )
+    editBottomReinforcement(
+        bottom_reinforcement_group,
+        l_cover_of_stirrup,
+        r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
+        dia_of_stirrup,
+        bottom_reinforcement_number_diameter_offset,
+        bottom_reinforcement_rebar_type,
+        bottom_reinforcement_layer_spacing,
+        bottom_reinforcement_l_rebar_rounding,
+        bottom_reinforcement_hook_extension,
+        bottom_reinforcement_hook_orientation,
+        facename,
+        structure,
+    )
 
     if (
         left_rebars_number_diameter_offset
@@ -1753,63 +1947,25 @@ def editReinforcement(
         ]
         setGroupProperties(properties, shear_reinforcement_group)
         FreeCAD.ActiveDocument.recompute()
-    if left_rebars_group and left_rebars_number_diameter_offset:
-        left_rebars_number_diameter_offset_tuple = (
-            gettupleOfNumberDiameterOffset(left_rebars_number_diameter_offset)
+    if left_rebars_number_diameter_offset and not left_rebars_group:
+        left_rebars_group = shear_reinforcement_group.newObject(
+            "App::DocumentObjectGroupPython", "LeftRebars"
         )
-        prev_left_rebars_type = left_rebars_group.RebarType
-        if prev_left_rebars_type != getRebarTypeListofShearRebars(
-            left_rebars_number_diameter_offset_tuple, left_rebars_type
-        ):
-            recreate_left_reinforcement = True
-        else:
-            recreate_left_reinforcement = False
-    else:
-        recreate_left_reinforcement = True
-
-    if recreate_left_reinforcement:
-        if left_rebars_group:
-            for Rebar in left_rebars_group.LeftRebars:
-                base_name = Rebar.Base.Name
-                FreeCAD.ActiveDocument.removeObject(Rebar.Name)
-                FreeCAD.ActiveDocument.removeObject(base_name)
-            FreeCAD.ActiveDocument.recompute()
-        elif left_rebars_number_diameter_offset:
-            left_rebars_group = shear_reinforcement_group.newObject(
-                "App::DocumentObjectGroupPython", "LeftRebars"
-            )
-            shear_rebar_groups = (
-                shear_reinforcement_group.ShearReinforcementGroups
-            )
-            shear_rebar_groups.append(left_rebars_group)
-            shear_reinforcement_group.ShearReinforcementGroups = (
-                shear_rebar_groups
+        shear_rebar_groups = shear_reinforcement_group.ShearReinforcementGroups
+        shear_rebar_groups.append(left_rebars_group)
+        shear_reinforcement_group.ShearReinforcementGroups = shear_rebar_groups
+        properties = [
+            (
+                "App::PropertyLinkList",
+                "LeftRebars",
+                "List of shear reinforcement left rebars",
+                1,
             )
-            properties = [
-                (
-                    "App::PropertyLinkList",
-                    "LeftRebars",
-                    "List of shear reinforcement left rebars",
-                    1,
-                )
-            ]
-            setGroupProperties(properties, left_rebars_group)
-            addLeftRightRebarGroupsProperties(left_rebars_group)
+        ]
+        setGroupProperties(properties, left_rebars_group)
+        addLeftRightRebarGroupsProperties(left_rebars_group)
 
-        makeLeftReinforcement(
-            left_rebars_group,
-            l_cover_of_stirrup,
-            dia_of_stirrup,
-            left_rebars_number_diameter_offset,
-            left_rebars_type,
-            left_rebars_spacing,
-            left_l_rebar_rounding,
-            left_rebars_hook_extension,
-            left_rebars_hook_orientation,
-            structure,
-            facename,
-        )
-    else:
+    if left_rebars_group:
         editLeftReinforcement(
             left_rebars_group,
             l_cover_of_stirrup,
@@ -1824,66 +1980,28 @@ def editReinforcement(
             facename,
         )
 
-    if right_rebars_group and right_rebars_number_diameter_offset:
-        right_rebars_number_diameter_offset_tuple = (
-            gettupleOfNumberDiameterOffset(right_rebars_number_diameter_offset)
+    if right_rebars_number_diameter_offset and not right_rebars_group:
+        right_rebars_group = shear_reinforcement_group.newObject(
+            "App::DocumentObjectGroupPython", "RightRebars"
         )
-        prev_right_rebars_type = right_rebars_group.RebarType
-        if prev_right_rebars_type != getRebarTypeListofShearRebars(
-            right_rebars_number_diameter_offset_tuple, right_rebars_type
-        ):
-            recreate_right_reinforcement = True
-        else:
-            recreate_right_reinforcement = False
-    else:
-        recreate_right_reinforcement = True
-
-    if recreate_right_reinforcement:
-        if right_rebars_group:
-            for Rebar in right_rebars_group.RightRebars:
-                base_name = Rebar.Base.Name
-                FreeCAD.ActiveDocument.removeObject(Rebar.Name)
-                FreeCAD.ActiveDocument.removeObject(base_name)
-            FreeCAD.ActiveDocument.recompute()
-        elif right_rebars_number_diameter_offset:
-            right_rebars_group = shear_reinforcement_group.newObject(
-                "App::DocumentObjectGroupPython", "RightRebars"
-            )
-            shear_rebar_groups = (
-                shear_reinforcement_group.ShearReinforcementGroups
-            )
-            shear_rebar_groups.append(right_rebars_group)
-            shear_reinforcement_group.ShearReinforcementGroups = (
-                shear_rebar_groups
+        shear_rebar_groups = shear_reinforcement_group.ShearReinforcementGroups
+        shear_rebar_groups.append(right_rebars_group)
+        shear_reinforcement_group.ShearReinforcementGroups = shear_rebar_groups
+        properties = [
+            (
+                "App::PropertyLinkList",
+                "RightRebars",
+                "List of shear reinforcement right rebars",
+                1,
             )
-            properties = [
-                (
-                    "App::PropertyLinkList",
-                    "RightRebars",
-                    "List of shear reinforcement right rebars",
-                    1,
-                )
-            ]
-            setGroupProperties(properties, right_rebars_group)
-            addLeftRightRebarGroupsProperties(right_rebars_group)
+        ]
+        setGroupProperties(properties, right_rebars_group)
+        addLeftRightRebarGroupsProperties(right_rebars_group)
 
-        makeRightReinforcement(
+    if right_rebars_group:
+        editRightReinforcement(
             right_rebars_group,
-            l_cover_of_stirrup,
-            dia_of_stirrup,
-            right_rebars_number_diameter_offset,
-            right_rebars_type,
-            right_rebars_spacing,
-            right_l_rebar_rounding,
-            right_rebars_hook_extension,
-            right_rebars_hook_orientation,
-            structure,
-            facename,
-        )
-    else:
-        editRightReinforcement(
-            right_rebars_group,
-            l_cover_of_stirrup,
+            r_cover_of_stirrup,
             dia_of_stirrup,
             right_rebars_number_diameter_offset,
             right_rebars_type,
@@ -1925,191 +2043,24 @@ def editTopReinforcement(
     facename,
     structure,
 ):
-    facename_for_t_rebars = getFacenamesforBeamReinforcement(
-        facename, structure
-    )[0]
-
-    top_reinforcement_layers = len(top_reinforcement_number_diameter_offset)
-
-    top_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(top_reinforcement_number_diameter_offset)
-    )
-
-    top_reinforcement_layer_spacing = getLayerSpacing(
-        top_reinforcement_layers, top_reinforcement_layer_spacing
-    )
-
-    top_reinforcement_rebar_type_list = getRebarTypeListofTopBottomRebars(
-        top_reinforcement_number_diameter_offset_dict,
-        top_reinforcement_rebar_type,
-    )
-
-    top_reinforcement_l_rebar_rounding_list = (
-        getLRebarRoundingofTopBottomRebars(
-            top_reinforcement_number_diameter_offset_dict,
-            top_reinforcement_rebar_type_list,
-            top_reinforcement_l_rebar_rounding,
-        )
-    )
-
-    top_reinforcement_hook_extension_list = (
-        getHookExtensionListofTopBottomRebars(
-            top_reinforcement_number_diameter_offset_dict,
-            top_reinforcement_rebar_type_list,
-            top_reinforcement_hook_extension,
-        )
-    )
-
-    top_reinforcement_hook_orientation_list = (
-        getHookOrientationListofTopBottomRebars(
-            top_reinforcement_number_diameter_offset_dict,
-            top_reinforcement_rebar_type_list,
-            top_reinforcement_hook_orientation,
-        )
-    )
-
-    FacePRM = getParametersOfFace(structure, facename)
-    face_length = FacePRM[0][0]
-    face_width = FacePRM[0][1]
-
-    top_reinforcement_rebars_number_spacing = getNumberSpacingofTopBottomRebars(
+    rebars_parameters, group_values = getTopReinforcementRebarsParameters(
         l_cover_of_stirrup,
         r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
         dia_of_stirrup,
-        top_reinforcement_number_diameter_offset_dict,
-        face_length,
-    )
-    top_reinforcement_rebars_number = top_reinforcement_rebars_number_spacing[0]
-    spacing_in_top_reinforcement = top_reinforcement_rebars_number_spacing[1]
-
-    coverAlong = "Top Side"
-    top_reinforcement_rebars = top_reinforcement_group.TopRebars
-    layer = 1
-    index = 0
-    while layer <= top_reinforcement_layers:
-        top_reinforcement_number_diameter_offset_list = (
-            top_reinforcement_number_diameter_offset_dict["layer" + str(layer)]
-        )
-        if layer == 1:
-            t_cover = t_cover_of_stirrup + dia_of_stirrup
-        else:
-            t_cover += (
-                max(x[1] for x in top_reinforcement_number_diameter_offset_list)
-                + top_reinforcement_layer_spacing[layer - 2]
-            )
-
-        f_cover = l_cover_of_stirrup + dia_of_stirrup
-        if top_reinforcement_rebars_number[layer - 1] == 1:
-            f_cover += spacing_in_top_reinforcement[layer - 1]
-
-        for i, (number, diameter, offset) in enumerate(
-            top_reinforcement_number_diameter_offset_list
-        ):
-            r_cover = l_cover = offset
-            rear_cover = (
-                face_length
-                - f_cover
-                - number * diameter
-                - (number - 1) * spacing_in_top_reinforcement[layer - 1]
-            )
-            if (
-                top_reinforcement_rebar_type_list[layer - 1][i]
-                == "StraightRebar"
-            ):
-                editStraightRebar(
-                    top_reinforcement_rebars[index],
-                    f_cover,
-                    (coverAlong, t_cover),
-                    r_cover,
-                    l_cover,
-                    diameter,
-                    True,
-                    number,
-                    "Horizontal",
-                    structure,
-                    facename_for_t_rebars,
-                )
-            else:
-                if layer == 1:
-                    b_cover = face_width - t_cover - diameter / 2
-                else:
-                    b_cover = (
-                        face_width
-                        - t_cover
-                        - sum(
-                            x
-                            for x in top_reinforcement_layer_spacing[
-                                : layer - 1
-                            ]
-                        )
-                        - diameter / 2
-                    )
-                if top_reinforcement_hook_orientation_list[layer - 1][i] in (
-                    "Front Inside",
-                    "Rear Inside",
-                ):
-                    b_cover -= (
-                        top_reinforcement_l_rebar_rounding_list[layer - 1][i]
-                        * diameter
-                        + top_reinforcement_hook_extension_list[layer - 1][i]
-                    )
-                    if (
-                        top_reinforcement_hook_orientation_list[layer - 1][i]
-                        == "Front Inside"
-                    ):
-                        orientation = "Top Right"
-                    else:
-                        orientation = "Top Left"
-                else:
-                    b_cover += (
-                        top_reinforcement_l_rebar_rounding_list[layer - 1][i]
-                        * diameter
-                        + top_reinforcement_hook_extension_list[layer - 1][i]
-                    )
-                    if (
-                        top_reinforcement_hook_orientation_list[layer - 1][i]
-                        == "Front Outside"
-                    ):
-                        orientation = "Top Right"
-                    else:
-                        orientation = "Top Left"
-
-                editLShapeRebar(
-                    top_reinforcement_rebars[index],
-                    f_cover,
-                    b_cover,
-                    l_cover,
-                    r_cover,
-                    diameter,
-                    t_cover,
-                    top_reinforcement_l_rebar_rounding_list[layer - 1][i],
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_t_rebars,
-                )
-            top_reinforcement_rebars[-1].OffsetEnd = rear_cover + diameter / 2
-            f_cover += (
-                number * diameter
-                + number * spacing_in_top_reinforcement[layer - 1]
-            )
-            index += 1
-        layer += 1
-    FreeCAD.ActiveDocument.recompute()
-
-    top_reinforcement_group.NumberDiameterOffset = (
-        top_reinforcement_number_diameter_offset
-    )
-    top_reinforcement_group.RebarType = top_reinforcement_rebar_type_list
-    top_reinforcement_group.LayerSpacing = list(top_reinforcement_layer_spacing)
-    top_reinforcement_group.HookExtension = (
-        top_reinforcement_hook_extension_list
-    )
-    top_reinforcement_group.HookOrientation = (
-        top_reinforcement_hook_orientation_list
+        top_reinforcement_number_diameter_offset,
+        top_reinforcement_rebar_type,
+        top_reinforcement_layer_spacing,
+        top_reinforcement_l_rebar_rounding,
+        top_reinforcement_hook_extension,
+        top_reinforcement_hook_orientation,
+        facename,
+        structure,
     )
-
+    updateRebars(top_reinforcement_group, "TopRebars", rebars_parameters)
+    setGroupPropertiesValues(group_values, top_reinforcement_group)
     FreeCAD.ActiveDocument.recompute()
 
 
@@ -2130,373 +2081,61 @@ def editBottomReinforcement(
     facename,
     structure,
 ):
-    facename_for_b_rebars = getFacenamesforBeamReinforcement(
-        facename, structure
-    )[0]
-
-    bottom_reinforcement_layers = len(
-        bottom_reinforcement_number_diameter_offset
+    rebars_parameters, group_values = getBottomReinforcementRebarsParameters(
+        l_cover_of_stirrup,
+        r_cover_of_stirrup,
+        t_cover_of_stirrup,
+        b_cover_of_stirrup,
+        offset_of_stirrup,
+        dia_of_stirrup,
+        bottom_reinforcement_number_diameter_offset,
+        bottom_reinforcement_rebar_type,
+        bottom_reinforcement_layer_spacing,
+        bottom_reinforcement_l_rebar_rounding,
+        bottom_reinforcement_hook_extension,
+        bottom_reinforcement_hook_orientation,
+        facename,
+        structure,
     )
+    updateRebars(bottom_reinforcement_group, "BottomRebars", rebars_parameters)
+    setGroupPropertiesValues(group_values, bottom_reinforcement_group)
+    FreeCAD.ActiveDocument.recompute()
 
-    bottom_reinforcement_number_diameter_offset_dict = (
-        getdictofNumberDiameterOffset(
-            bottom_reinforcement_number_diameter_offset
-        )
-    )
 
-    bottom_reinforcement_layer_spacing = getLayerSpacing(
-        bottom_reinforcement_layers, bottom_reinforcement_layer_spacing
-    )
+def editLeftReinforcement(
+    left_rebars_group,
+    l_cover_of_stirrup,
+    dia_of_stirrup,
+    left_rebars_number_diameter_offset,
+    left_rebars_type,
+    left_rebars_spacing,
+    left_l_rebar_rounding,
+    left_rebars_hook_extension,
+    left_rebars_hook_orientation,
+    structure,
+    facename,
+):
+    if not left_rebars_number_diameter_offset:
+        updateRebars(left_rebars_group, "LeftRebars", [])
+        FreeCAD.ActiveDocument.removeObject(left_rebars_group.Name)
+        return None
 
-    bottom_reinforcement_rebar_type_list = getRebarTypeListofTopBottomRebars(
-        bottom_reinforcement_number_diameter_offset_dict,
-        bottom_reinforcement_rebar_type,
+    rebars_parameters, group_values = getLeftReinforcementRebarsParameters(
+        l_cover_of_stirrup,
+        dia_of_stirrup,
+        left_rebars_number_diameter_offset,
+        left_rebars_type,
+        left_rebars_spacing,
+        left_l_rebar_rounding,
+        left_rebars_hook_extension,
+        left_rebars_hook_orientation,
+        structure,
+        facename,
     )
+    updateRebars(left_rebars_group, "LeftRebars", rebars_parameters)
+    setGroupPropertiesValues(group_values, left_rebars_group)
 
-    bottom_reinforcement_l_rebar_rounding_list = (
-        getLRebarRoundingofTopBottomRebars(
-            bottom_reinforcement_number_diameter_offset_dict,
-            bottom_reinforcement_rebar_type_list,
-            bottom_reinforcement_l_rebar_rounding,
-        )
-    )
-
-    bottom_reinforcement_hook_extension_list = (
-        getHookExtensionListofTopBottomRebars(
-            bottom_reinforcement_number_diameter_offset_dict,
-            bottom_reinforcement_rebar_type_list,
-            bottom_reinforcement_hook_extension,
-        )
-    )
-
-    bottom_reinforcement_hook_orientation_list = (
-        getHookOrientationListofTopBottomRebars(
-            bottom_reinforcement_number_diameter_offset_dict,
-            bottom_reinforcement_rebar_type_list,
-            bottom_reinforcement_hook_orientation,
-        )
-    )
-
-    FacePRM = getParametersOfFace(structure, facename)
-    face_length = FacePRM[0][0]
-    face_width = FacePRM[0][1]
-
-    bottom_reinforcement_rebars_number_spacing = (
-        getNumberSpacingofTopBottomRebars(
-            l_cover_of_stirrup,
-            r_cover_of_stirrup,
-            dia_of_stirrup,
-            bottom_reinforcement_number_diameter_offset_dict,
-            face_length,
-        )
-    )
-    bottom_reinforcement_rebars_number = (
-        bottom_reinforcement_rebars_number_spacing[0]
-    )
-    spacing_in_bottom_reinforcement = (
-        bottom_reinforcement_rebars_number_spacing[1]
-    )
-
-    coverAlong = "Bottom Side"
-    bottom_reinforcement_rebars = bottom_reinforcement_group.BottomRebars
-    layer = 1
-    index = 0
-    while layer <= bottom_reinforcement_layers:
-        bottom_reinforcement_number_diameter_offset_list = (
-            bottom_reinforcement_number_diameter_offset_dict[
-                "layer" + str(layer)
-            ]
-        )
-        if layer == 1:
-            b_cover = b_cover_of_stirrup + dia_of_stirrup
-        else:
-            b_cover += (
-                max(
-                    x[1]
-                    for x in bottom_reinforcement_number_diameter_offset_list
-                )
-                + bottom_reinforcement_layer_spacing[layer - 2]
-            )
-
-        f_cover = l_cover_of_stirrup + dia_of_stirrup
-        if bottom_reinforcement_rebars_number[layer - 1] == 1:
-            f_cover += spacing_in_bottom_reinforcement[layer - 1]
-
-        for i, (number, diameter, offset) in enumerate(
-            bottom_reinforcement_number_diameter_offset_list
-        ):
-            r_cover = l_cover = offset
-            rear_cover = (
-                face_length
-                - f_cover
-                - number * diameter
-                - (number - 1) * spacing_in_bottom_reinforcement[layer - 1]
-            )
-            if (
-                bottom_reinforcement_rebar_type_list[layer - 1][i]
-                == "StraightRebar"
-            ):
-                editStraightRebar(
-                    bottom_reinforcement_rebars[index],
-                    f_cover,
-                    (coverAlong, b_cover),
-                    r_cover,
-                    l_cover,
-                    diameter,
-                    True,
-                    number,
-                    "Horizontal",
-                    structure,
-                    facename_for_b_rebars,
-                )
-            else:
-                if layer == 1:
-                    t_cover = face_width - b_cover - diameter / 2
-                else:
-                    t_cover = (
-                        face_width
-                        - b_cover
-                        - sum(
-                            x
-                            for x in bottom_reinforcement_layer_spacing[
-                                : layer - 1
-                            ]
-                        )
-                        - diameter / 2
-                    )
-                if bottom_reinforcement_hook_orientation_list[layer - 1][i] in (
-                    "Front Inside",
-                    "Rear Inside",
-                ):
-                    t_cover -= (
-                        bottom_reinforcement_l_rebar_rounding_list[layer - 1][i]
-                        * diameter
-                        + bottom_reinforcement_hook_extension_list[layer - 1][i]
-                    )
-                    if (
-                        bottom_reinforcement_hook_orientation_list[layer - 1][i]
-                        == "Front Inside"
-                    ):
-                        orientation = "Bottom Right"
-                    else:
-                        orientation = "Bottom Left"
-                else:
-                    t_cover += (
-                        bottom_reinforcement_l_rebar_rounding_list[layer - 1][i]
-                        * diameter
-                        + bottom_reinforcement_hook_extension_list[layer - 1][i]
-                    )
-                    if (
-                        bottom_reinforcement_hook_orientation_list[layer - 1][i]
-                        == "Front Outside"
-                    ):
-                        orientation = "Bottom Right"
-                    else:
-                        orientation = "Bottom Left"
-
-                editLShapeRebar(
-                    bottom_reinforcement_rebars[index],
-                    f_cover,
-                    b_cover,
-                    l_cover,
-                    r_cover,
-                    diameter,
-                    t_cover,
-                    bottom_reinforcement_l_rebar_rounding_list[layer - 1][i],
-                    True,
-                    number,
-                    orientation,
-                    structure,
-                    facename_for_b_rebars,
-                )
-            bottom_reinforcement_rebars[-1].OffsetEnd = (
-                rear_cover + diameter / 2
-            )
-            f_cover += (
-                number * diameter
-                + number * spacing_in_bottom_reinforcement[layer - 1]
-            )
-            index += 1
-        layer += 1
-    FreeCAD.ActiveDocument.recompute()
-
-    bottom_reinforcement_group.NumberDiameterOffset = (
-        bottom_reinforcement_number_diameter_offset
-    )
-    bottom_reinforcement_group.RebarType = bottom_reinforcement_rebar_type_list
-    bottom_reinforcement_group.LayerSpacing = list(
-        bottom_reinforcement_layer_spacing
-    )
-    bottom_reinforcement_group.HookExtension = (
-        bottom_reinforcement_hook_extension_list
-    )
-    bottom_reinforcement_group.HookOrientation = (
-        bottom_reinforcement_hook_orientation_list
-    )
-
-    FreeCAD.ActiveDocument.recompute()
-
-
-def editLeftReinforcement(
-    left_rebars_group,
-    l_cover_of_stirrup,
-    dia_of_stirrup,
-    left_rebars_number_diameter_offset,
-    left_rebars_type,
-    left_rebars_spacing,
-    left_l_rebar_rounding,
-    left_rebars_hook_extension,
-    left_rebars_hook_orientation,
-    structure,
-    facename,
-):
-    if not left_rebars_number_diameter_offset:
-        FreeCAD.ActiveDocument.removeObject(left_rebars_group.Name)
-        return None
-
-    facename_for_s_rebars = getFacenamesforBeamReinforcement(
-        facename, structure
-    )[1]
-    face = structure.Shape.Faces[getFaceNumber(facename) - 1]
-    FacePRM = getParametersOfFace(structure, facename)
-    face_length = FacePRM[0][0]
-    face_width = FacePRM[0][1]
-
-    left_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        left_rebars_number_diameter_offset
-    )
-
-    left_rebars_type_list = getRebarTypeListofShearRebars(
-        left_rebars_number_diameter_offset_tuple, left_rebars_type
-    )
-
-    left_l_rebar_rounding_list = getLRebarRoundingofShearRebars(
-        left_rebars_number_diameter_offset_tuple,
-        left_rebars_type_list,
-        left_l_rebar_rounding,
-    )
-
-    left_rebars_hook_extension_list = getHookExtensionListofShearRebars(
-        left_rebars_number_diameter_offset_tuple,
-        left_rebars_type_list,
-        left_rebars_hook_extension,
-    )
-
-    left_rebars_hook_orientation_list = getHookOrientationListofShearRebars(
-        left_rebars_number_diameter_offset_tuple,
-        left_rebars_type_list,
-        left_rebars_hook_orientation,
-    )
-
-    left_rebars_number = sum(
-        x[0] for x in left_rebars_number_diameter_offset_tuple
-    )
-    left_reinforcement_span_length = (
-        left_rebars_number - 1
-    ) * left_rebars_spacing + sum(
-        x[0] * x[1] for x in left_rebars_number_diameter_offset_tuple
-    )
-    left_rebars_f_cover = (face_width - left_reinforcement_span_length) / 2
-
-    left_reinforcement_rebars = left_rebars_group.LeftRebars
-    for i, (number, diameter, offset) in enumerate(
-        left_rebars_number_diameter_offset_tuple
-    ):
-        t_cover = l_cover_of_stirrup + dia_of_stirrup
-        r_cover = l_cover = offset
-        rear_cover = (
-            face_width
-            - left_rebars_f_cover
-            - number * diameter
-            - (number - 1) * left_rebars_spacing
-        )
-        if left_rebars_type_list[i] == "StraightRebar":
-            if face.normalAt(0, 0).x in (1, -1):
-                orientation = "Horizontal"
-                coverAlong = "Top Side"
-            else:
-                orientation = "Vertical"
-                coverAlong = "Left Side"
-            editStraightRebar(
-                left_reinforcement_rebars[i],
-                left_rebars_f_cover,
-                (coverAlong, t_cover),
-                r_cover,
-                l_cover,
-                diameter,
-                True,
-                number,
-                orientation,
-                structure,
-                facename_for_s_rebars,
-            )
-        else:
-            b_cover = face_length - t_cover - diameter / 2
-            if left_rebars_hook_orientation_list[i] in (
-                "Front Inside",
-                "Rear Inside",
-            ):
-                b_cover -= (
-                    left_l_rebar_rounding_list[i] * diameter
-                    + left_rebars_hook_extension_list[i]
-                )
-                if left_rebars_hook_orientation_list[i] == "Front Inside":
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Top Right"
-                    else:
-                        orientation = "Top Left"
-                else:
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Top Left"
-                    else:
-                        orientation = "Bottom Left"
-            else:
-                b_cover += (
-                    left_l_rebar_rounding_list[i] * diameter
-                    + left_rebars_hook_extension_list[i]
-                )
-                if left_rebars_hook_orientation_list[i] == "Front Outside":
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Top Right"
-                    else:
-                        orientation = "Top Left"
-                else:
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Top Left"
-                    else:
-                        orientation = "Bottom Left"
-
-            if face.normalAt(0, 0).y in (1, -1):
-                l_cover = t_cover
-                r_cover = b_cover
-                t_cover = b_cover = offset
-
-            editLShapeRebar(
-                left_reinforcement_rebars[i],
-                left_rebars_f_cover,
-                b_cover,
-                l_cover,
-                r_cover,
-                diameter,
-                t_cover,
-                left_l_rebar_rounding_list[i],
-                True,
-                number,
-                orientation,
-                structure,
-                facename_for_s_rebars,
-            )
-        left_reinforcement_rebars[i].OffsetEnd = rear_cover + diameter / 2
-        left_rebars_f_cover += number * diameter + number * left_rebars_spacing
-    FreeCAD.ActiveDocument.recompute()
-
-    left_rebars_group.NumberDiameterOffset = left_rebars_number_diameter_offset
-    left_rebars_group.RebarType = left_rebars_type_list
-    left_rebars_group.RebarSpacing = left_rebars_spacing
-    left_rebars_group.HookExtension = left_rebars_hook_extension_list
-    left_rebars_group.HookOrientation = left_rebars_hook_orientation_list
-
-    FreeCAD.ActiveDocument.recompute()
+    FreeCAD.ActiveDocument.recompute()
 
 
 def editRightReinforcement(
@@ -2513,154 +2152,24 @@ def editRightReinforcement(
     facename,
 ):
     if not right_rebars_number_diameter_offset:
+        updateRebars(right_rebars_group, "RightRebars", [])
         FreeCAD.ActiveDocument.removeObject(right_rebars_group.Name)
         return None
 
-    facename_for_s_rebars = getFacenamesforBeamReinforcement(
-        facename, structure
-    )[1]
-    face = structure.Shape.Faces[getFaceNumber(facename) - 1]
-    FacePRM = getParametersOfFace(structure, facename)
-    face_length = FacePRM[0][0]
-    face_width = FacePRM[0][1]
-
-    right_rebars_number_diameter_offset_tuple = gettupleOfNumberDiameterOffset(
-        right_rebars_number_diameter_offset
-    )
-
-    right_rebars_type_list = getRebarTypeListofShearRebars(
-        right_rebars_number_diameter_offset_tuple, right_rebars_type
-    )
-
-    right_l_rebar_rounding_list = getLRebarRoundingofShearRebars(
-        right_rebars_number_diameter_offset_tuple,
-        right_rebars_type_list,
+    rebars_parameters, group_values = getRightReinforcementRebarsParameters(
+        r_cover_of_stirrup,
+        dia_of_stirrup,
+        right_rebars_number_diameter_offset,
+        right_rebars_type,
+        right_rebars_spacing,
         right_l_rebar_rounding,
-    )
-
-    right_rebars_hook_extension_list = getHookExtensionListofShearRebars(
-        right_rebars_number_diameter_offset_tuple,
-        right_rebars_type_list,
         right_rebars_hook_extension,
-    )
-
-    right_rebars_hook_orientation_list = getHookOrientationListofShearRebars(
-        right_rebars_number_diameter_offset_tuple,
-        right_rebars_type_list,
         right_rebars_hook_orientation,
+        structure,
+        facename,
     )
-
-    right_rebars_number = sum(
-        x[0] for x in right_rebars_number_diameter_offset_tuple
-    )
-    right_reinforcement_span_length = (
-        right_rebars_number - 1
-    ) * right_rebars_spacing + sum(
-        x[0] * x[1] for x in right_rebars_number_diameter_offset_tuple
-    )
-    right_rebars_f_cover = (face_width - right_reinforcement_span_length) / 2
-
-    right_reinforcement_rebars = right_rebars_group.RightRebars
-    for i, (number, diameter, offset) in enumerate(
-        right_rebars_number_diameter_offset_tuple
-    ):
-        b_cover = r_cover_of_stirrup + dia_of_stirrup
-        r_cover = l_cover = offset
-        rear_cover = (
-            face_width
-            - right_rebars_f_cover
-            - number * diameter
-            - (number - 1) * right_rebars_spacing
-        )
-        if right_rebars_type_list[i] == "StraightRebar":
-            if face.normalAt(0, 0).x in (1, -1):
-                orientation = "Horizontal"
-                coverAlong = "Bottom Side"
-            else:
-                orientation = "Vertical"
-                coverAlong = "Right Side"
-            editStraightRebar(
-                right_reinforcement_rebars[i],
-                right_rebars_f_cover,
-                (coverAlong, b_cover),
-                r_cover,
-                l_cover,
-                diameter,
-                True,
-                number,
-                orientation,
-                structure,
-                facename_for_s_rebars,
-            )
-        else:
-            t_cover = face_length - b_cover - diameter / 2
-            if right_rebars_hook_orientation_list[i] in (
-                "Front Inside",
-                "Rear Inside",
-            ):
-                t_cover -= (
-                    right_l_rebar_rounding_list[i] * diameter
-                    + right_rebars_hook_extension_list[i]
-                )
-                if right_rebars_hook_orientation_list[i] == "Front Inside":
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Bottom Right"
-                    else:
-                        orientation = "Top Right"
-                else:
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Bottom Left"
-                    else:
-                        orientation = "Bottom Right"
-            else:
-                t_cover += (
-                    right_l_rebar_rounding_list[i] * diameter
-                    + right_rebars_hook_extension_list[i]
-                )
-                if right_rebars_hook_orientation_list[i] == "Front Outside":
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Bottom Right"
-                    else:
-                        orientation = "Top Right"
-                else:
-                    if face.normalAt(0, 0).x in (1, -1):
-                        orientation = "Bottom Left"
-                    else:
-                        orientation = "Bottom Right"
-
-            if face.normalAt(0, 0).y in (1, -1):
-                l_cover = t_cover
-                r_cover = b_cover
-                t_cover = b_cover = offset
-
-            editLShapeRebar(
-                right_reinforcement_rebars[i],
-                right_rebars_f_cover,
-                b_cover,
-                l_cover,
-                r_cover,
-                diameter,
-                t_cover,
-                right_l_rebar_rounding_list[i],
-                True,
-                number,
-                orientation,
-                structure,
-                facename_for_s_rebars,
-            )
-        right_reinforcement_rebars[i].OffsetEnd = rear_cover + diameter / 2
-        right_rebars_f_cover += (
-            number * diameter + number * right_rebars_spacing
-        )
-    FreeCAD.ActiveDocument.recompute()
-
-    right_rebars_group.NumberDiameterOffset = (
-        right_rebars_number_diameter_offset
-    )
-    right_rebars_group.RebarType = right_rebars_type_list
-    right_rebars_group.RebarSpacing = right_rebars_spacing
-    right_rebars_group.HookExtension = right_rebars_hook_extension_list
-    right_rebars_group.HookOrientation = right_rebars_hook_orientation_list
+    updateRebars(right_rebars_group, "RightRebars", rebars_parameters)
+    setGroupPropertiesValues(group_values, right_rebars_group)
 
     FreeCAD.ActiveDocument.recompute()
 
@@ -29,7 +29,6 @@ import math
 from pathlib import Path
 from typing import Tuple, List
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -42,6 +41,7 @@ from Rebarfunc import (
     getSelectedFace,
     getFaceNumber,
     getParametersOfFace,
+    getShapeExtent,
     showWarning,
     check_selected_face,
     facenormalDirection,
@@ -459,11 +459,7 @@ def makeBentShapeRebar(
         )
         FreeCAD.ActiveDocument.recompute()
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             sketch,
@@ -654,11 +650,7 @@ def editBentShapeRebar(
         FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
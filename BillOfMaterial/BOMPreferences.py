@@ -38,6 +38,7 @@ from .config import (
     DIA_WEIGHT_MAP,
     REBAR_LENGTH_TYPE,
     REINFORCEMENT_GROUP_BY,
+    MARK_COLLISION,
     COLUMN_WIDTH,
     ROW_HEIGHT,
     FONT_FAMILY,
@@ -86,6 +87,10 @@ class BOMPreferences:
         #     "Mark", "Host"
         # ] = REINFORCEMENT_GROUP_BY,
         conf_reinforcement_group_by: str = REINFORCEMENT_GROUP_BY,
+        # conf_mark_collision: Literal[
+        #     "Rename", "Merge", "Error"
+        # ] = MARK_COLLISION,
+        conf_mark_collision: str = MARK_COLLISION,
         conf_column_width: float = COLUMN_WIDTH,
         conf_row_height: float = ROW_HEIGHT,
         conf_font_family: str = FONT_FAMILY,
@@ -113,6 +118,8 @@ class BOMPreferences:
         ]
         self.conf_reinforcement_group_by = conf_reinforcement_group_by
         self.available_reinforcement_group_by = ["Mark", "Host"]
+        self.conf_mark_collision = conf_mark_collision
+        self.available_mark_collisions = ["Rename", "Merge", "Error"]
         self.conf_column_width = conf_column_width
         self.conf_row_height = conf_row_height
         self.conf_font_family = conf_font_family
@@ -145,12 +152,19 @@ class BOMPreferences:
                 ),
             )
         ]
+        self.mark_collision = self.available_mark_collisions[
+            self.bom_pref.GetInt(
+                "MarkCollision",
+                self.available_mark_collisions.index(self.conf_mark_collision),
+            )
+        ]
         self.svg_pref = self.bom_pref.GetGroup("SVG")
         self.setColumnUnits()
         self.setColumnHeaders()
         self.setDiaWeightMap()
         self.setRebarLengthType()
         self.setReinforcementGroupBy()
+        self.setMarkCollision()
         self.setSVGPref()
 
     def setColumnUnits(self):
@@ -215,6 +229,16 @@ class BOMPreferences:
             ),
         )
 
+    def setMarkCollision(self):
+        self.bom_pref.SetInt(
+            "MarkCollision",
+            self.available_mark_collisions.index(self.mark_collision)
+            if not self.overwrite
+            else self.available_mark_collisions.index(
+                self.conf_mark_collision
+            ),
+        )
+
     def setSVGPref(self):
         column_width = self.svg_pref.GetFloat(
             "ColumnWidth", self.conf_column_width
@@ -382,5 +406,15 @@ class BOMPreferences:
         ]
         return reinforcement_group_by
 
+    # def getMarkCollision(self) -> Literal["Rename", "Merge", "Error"]:
+    def getMarkCollision(self) -> str:
+        mark_collision = self.available_mark_collisions[
+            self.bom_pref.GetInt(
+                "MarkCollision",
+                self.available_mark_collisions.index(self.conf_mark_collision),
+            )
+        ]
+        return mark_collision
+
     def getSVGPrefGroup(self):
         return self.svg_pref
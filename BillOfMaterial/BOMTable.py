@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2020 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Bill Of Material Table"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+from typing import Dict, List, Optional
+
+import FreeCAD
+import numpy as np
+
+from RebarGeometry import getRebarGeometrySnapshot
+from .BOMfunc import (
+    getBaseRebar,
+    getRebarSharpEdgedLength,
+    naturalKey,
+)
+
+
+# TODO: Use(Uncomment) typing.Literal for minimum python3.8
+
+
+def getRebarMark(rebar, base_rebar=None) -> str:
+    """Returns mark of ArchRebar or rebar2 reinforcement object. base_rebar is
+    the result of getBaseRebar(rebar), if already known."""
+    if base_rebar is None:
+        base_rebar = getBaseRebar(rebar)
+    if base_rebar is not rebar:
+        return str(base_rebar.MarkNumber)
+    if hasattr(rebar, "Mark"):
+        return str(rebar.Mark)
+    return str(rebar.Label)
+
+
+def getRebarDiameter(rebar) -> Optional[FreeCAD.Units.Quantity]:
+    """Returns diameter of ArchRebar or rebar2 reinforcement object."""
+    if hasattr(rebar, "Diameter"):
+        return rebar.Diameter
+    if hasattr(rebar, "BaseRebar"):
+        return rebar.BaseRebar.Diameter
+    return None
+
+
+def getUnitFactor(unit: str, base_unit: str = "mm") -> float:
+    """Returns value of one unit expressed in base_unit, e.g.
+    getUnitFactor("m") returns 1000.0"""
+    return FreeCAD.Units.Quantity("1 " + unit).getValueAs(base_unit).Value
+
+
+class BOMTable:
+    """Compact table of rebar quantities aggregated in a single pass over
+    reinforcement objects.
+
+    The table has one row per mark, if reinforcement_group_by is "Mark", or one
+    row per host and mark, if reinforcement_group_by is "Host". Rows are sorted
+    the same way as getMarkReinforcementsDict() and
+    getHostReinforcementsDict(). Lengths are stored in mm and weights in kg, as
+    float arrays, so that writers only have to convert and format them.
+
+    Mark, diameter, host, length and amount of ArchRebar objects are read
+    from their RebarGeometrySnapshot while the table is built, so that the
+    snapshot already cached by drawings and dimensionings of the same rebars
+    is reused.
+
+    The table can be updated incrementally with setReinforcement(),
+    removeReinforcement() and refreshObject(), followed by updateRows(), which
+    recomputes only rows of changed groups unless rows are added, removed or
+    reordered.
+    """
+
+    def __init__(
+        self,
+        reinforcement_objects: List,
+        # rebar_length_type: Optional[
+        #     Literal["RealLength", "LengthWithSharpEdges"]
+        # ] = "RealLength",
+        rebar_length_type: str = "RealLength",
+        # reinforcement_group_by: Optional[Literal["Mark", "Host"]] = "Mark",
+        reinforcement_group_by: str = "Mark",
+        dia_weight_map: Optional[Dict[float, FreeCAD.Units.Quantity]] = None,
+    ):
+        """Aggregate rebar_objects into BOM table.
+
+        Parameters
+        ----------
+        reinforcement_objects: list of <ArchRebar._Rebar and
+                rebar2.Reinforcement>
+            The list of ArchRebar and rebar2 reinforcement objects, as returned
+            by getReinforcementRebarObjects().
+        rebar_length_type: {"RealLength", "LengthWithSharpEdges"}, optional
+            The rebar length type used for unit and total lengths.
+            Default is "RealLength".
+        reinforcement_group_by: {"Mark", "Host"}, optional
+            Specifies if rows are grouped by mark or by host and mark.
+            Default is "Mark".
+        dia_weight_map: dict of (float, FreeCAD.Units.Quantity), optional
+            The dictionary with diameter as key and corresponding weight (kg/m)
+            as value.
+        """
+        self.rebar_length_type = rebar_length_type
+        self.reinforcement_group_by = reinforcement_group_by
+        self.dia_weight_map = dia_weight_map or {}
+
+        # Groups with mark or (host, mark) as key. Each group has its member
+        # reinforcement objects, with name as key, and aggregated values
+        self.groups = {}
+        # Reinforcement objects and their (group key, diameter, host name,
+        # base rebar name) with name as key
+        self.rebars = {}
+        self.rebar_keys = {}
+        # Sequence number of reinforcement objects with name as key. The first
+        # member of group in sequence is used as its representative, to keep
+        # unit length and diameter of rows independent of order of updates
+        self.rebar_order = {}
+        self.next_rebar_order = 0
+        # Names of reinforcement objects with name of their host or base rebar
+        # as key, to find groups affected by change of host or base rebar
+        self.host_rebars = {}
+        self.base_rebar_rebars = {}
+        # Number of reinforcement objects with diameter value as key
+        self.diameter_counts = {}
+        self.diameter_quantities = {}
+        # Order of first occurrence of hosts, to keep rows of different hosts
+        # with same label apart
+        self.host_order = {}
+
+        self.dirty_keys = set()
+        self.structure_changed = True
+        # Snapshot of ArchRebar objects, used only while table is built.
+        # Reinforcement objects updated later are read from their properties
+        self.snapshot = getRebarGeometrySnapshot(
+            [
+                rebar
+                for rebar in reinforcement_objects
+                if getBaseRebar(rebar) is rebar
+            ]
+        )
+        for rebar in reinforcement_objects:
+            self.setReinforcement(rebar)
+        self.updateRows()
+        self.snapshot = None
+
+    def __len__(self) -> int:
+        return len(self.marks)
+
+    @property
+    def reinforcement_objects(self) -> List:
+        """Reinforcement objects in table."""
+        return list(self.rebars.values())
+
+    def getSnapshotIndex(self, rebar) -> Optional[int]:
+        """Returns row index of rebar in snapshot, if table is being built and
+        rebar is ArchRebar object, otherwise None."""
+        if self.snapshot is None:
+            return None
+        return self.snapshot.index.get(rebar.Name)
+
+    def getGroupKey(self, mark: str, host):
+        """Returns key of group of rebar with mark and host, mark or
+        (host, mark)."""
+        if self.reinforcement_group_by == "Host":
+            host = host or "None"
+            if host not in self.host_order:
+                self.host_order[host] = len(self.host_order)
+            return (host, mark)
+        return mark
+
+    def setReinforcement(self, rebar) -> None:
+        """Add reinforcement object to table or update its group, diameter and
+        host after it is changed."""
+        name = rebar.Name
+        base_rebar = getBaseRebar(rebar)
+        index = self.getSnapshotIndex(rebar)
+        if index is None:
+            mark = getRebarMark(rebar, base_rebar)
+            diameter = getRebarDiameter(rebar)
+            host = rebar.Host
+        else:
+            mark = str(self.snapshot.marks[index])
+            diameter = FreeCAD.Units.Quantity(
+                "{} mm".format(self.snapshot.diameters[index])
+            )
+            host_name = str(self.snapshot.hosts[index])
+            host = rebar.Document.getObject(host_name) if host_name else None
+        key = self.getGroupKey(mark, host)
+        diameter_value = None if diameter is None else diameter.Value
+        host_name = host.Name if host else None
+        base_rebar_name = None if base_rebar is rebar else base_rebar.Name
+        record = (key, diameter_value, host_name, base_rebar_name)
+
+        old_record = self.rebar_keys.get(name)
+        if old_record is None:
+            order = self.next_rebar_order
+            self.next_rebar_order += 1
+        elif old_record == record:
+            self.dirty_keys.add(key)
+            return
+        else:
+            order = self.rebar_order[name]
+            self.removeReinforcement(name)
+
+        group = self.groups.get(key)
+        if group is None:
+            if self.reinforcement_group_by == "Host":
+                host, mark = key
+            else:
+                host, mark = None, key
+            group = self.groups[key] = {
+                "host": host,
+                "mark": mark,
+                "members": {},
+            }
+            self.structure_changed = True
+        group["members"][name] = rebar
+        self.rebars[name] = rebar
+        self.rebar_order[name] = order
+        self.rebar_keys[name] = record
+        self.dirty_keys.add(key)
+
+        if diameter_value is not None:
+            if diameter_value not in self.diameter_counts:
+                self.diameter_counts[diameter_value] = 0
+                self.diameter_quantities[diameter_value] = diameter
+                self.structure_changed = True
+            self.diameter_counts[diameter_value] += 1
+        if host_name:
+            self.host_rebars.setdefault(host_name, set()).add(name)
+        if base_rebar_name:
+            self.base_rebar_rebars.setdefault(base_rebar_name, set()).add(name)
+
+    def removeReinforcement(self, name: str) -> None:
+        """Remove reinforcement object with name from table, if present."""
+        record = self.rebar_keys.pop(name, None)
+        if record is None:
+            return
+        key, diameter_value, host_name, base_rebar_name = record
+        del self.rebars[name]
+        del self.rebar_order[name]
+
+        members = self.groups[key]["members"]
+        del members[name]
+        if members:
+            self.dirty_keys.add(key)
+        else:
+            del self.groups[key]
+            self.dirty_keys.discard(key)
+            self.structure_changed = True
+
+        if diameter_value is not None:
+            self.diameter_counts[diameter_value] -= 1
+            if not self.diameter_counts[diameter_value]:
+                del self.diameter_counts[diameter_value]
+                del self.diameter_quantities[diameter_value]
+                self.structure_changed = True
+        if host_name:
+            self.host_rebars[host_name].discard(name)
+        if base_rebar_name:
+            self.base_rebar_rebars[base_rebar_name].discard(name)
+
+    def refreshObject(self, obj) -> None:
+        """Update groups affected by change of obj, which is host or base
+        rebar of reinforcement objects in table."""
+        for name in list(self.base_rebar_rebars.get(obj.Name, ())):
+            self.setReinforcement(self.rebars[name])
+        host_rebars = self.host_rebars.get(obj.Name)
+        if host_rebars:
+            # Rows are sorted by host label
+            if self.reinforcement_group_by == "Host":
+                self.structure_changed = True
+            for name in host_rebars:
+                self.dirty_keys.add(self.rebar_keys[name][0])
+
+    def refreshGroup(self, group) -> None:
+        """Recompute aggregated values of group from its members."""
+        members = group["members"]
+        first_name = min(members, key=self.rebar_order.__getitem__)
+        base_rebar = getBaseRebar(members[first_name])
+        members = members.values()
+        group["base_rebar"] = base_rebar
+        group["count"] = 0
+        for rebar in members:
+            index = self.getSnapshotIndex(rebar)
+            if index is None:
+                group["count"] += rebar.Amount
+            else:
+                group["count"] += int(self.snapshot.amounts[index])
+        group["host_labels"] = ",".join(
+            sorted({rebar.Host.Label for rebar in members if rebar.Host})
+        )
+        # Diameter of rebar is diameter of its base rebar
+        group["diameter"] = self.rebar_keys[first_name][1]
+        group["unit_length"] = self.getBaseRebarLength(base_rebar)
+
+    def updateRows(self) -> Optional[List[int]]:
+        """Apply changes made by setReinforcement(), removeReinforcement() and
+        refreshObject() to row data.
+
+        Returns
+        -------
+        list of int or None
+            The sorted indices of changed rows, or None if rows were added,
+            removed or reordered or if diameter list changed, so that whole
+            table must be rendered again.
+        """
+        dirty_groups = [self.groups[key] for key in self.dirty_keys]
+        self.dirty_keys = set()
+        for group in dirty_groups:
+            self.refreshGroup(group)
+
+        if self.structure_changed:
+            self.structure_changed = False
+            self.buildRows()
+            return None
+
+        changed_rows = []
+        for group in dirty_groups:
+            row = self.row_index[group["key"]]
+            count = group["count"]
+            unit_length = group["unit_length"]
+            dia_index = int(
+                np.searchsorted(self.diameter_values, group["diameter"])
+            )
+            old_dia_index = self.diameter_indices[row]
+            self.diameter_total_lengths[old_dia_index] -= self.total_lengths[
+                row
+            ]
+            self.diameter_total_lengths[dia_index] += count * unit_length
+
+            if self.reinforcement_group_by != "Host":
+                self.hosts[row] = group["host_labels"]
+            self.base_rebars[row] = group["base_rebar"]
+            self.counts[row] = count
+            self.diameters[row] = group["diameter"]
+            self.unit_lengths[row] = unit_length
+            self.total_lengths[row] = count * unit_length
+            self.diameter_indices[row] = dia_index
+            self.weights[row] = (
+                self.diameter_weights[dia_index] * count * unit_length / 1000
+            )
+            changed_rows.append(row)
+        self.diameter_total_weights = (
+            self.diameter_weights * self.diameter_total_lengths / 1000
+        )
+        return sorted(changed_rows)
+
+    def buildRows(self) -> None:
+        """Build all row and diameter data from groups."""
+        group_by_host = self.reinforcement_group_by == "Host"
+        for key, group in self.groups.items():
+            group["key"] = key
+        mark_keys = {}
+
+        def getMarkKey(mark):
+            if mark not in mark_keys:
+                mark_keys[mark] = naturalKey((mark,))
+            return mark_keys[mark]
+
+        if group_by_host:
+
+            def getSortKey(group):
+                host = group["host"]
+                host_label = host.Label if hasattr(host, "Label") else host
+                return (
+                    host_label,
+                    self.host_order[host],
+                    getMarkKey(group["mark"]),
+                )
+
+        else:
+
+            def getSortKey(group):
+                return getMarkKey(group["mark"])
+
+        rows = sorted(self.groups.values(), key=getSortKey)
+        self.row_index = {row["key"]: index for index, row in enumerate(rows)}
+
+        # Row data
+        self.marks = [row["mark"] for row in rows]
+        self.base_rebars = [row["base_rebar"] for row in rows]
+        if group_by_host:
+            self.hosts = [
+                row["host"].Label
+                if hasattr(row["host"], "Label")
+                else str(row["host"])
+                for row in rows
+            ]
+            self.first_host_rows = np.array(
+                [
+                    index == 0 or row["host"] is not rows[index - 1]["host"]
+                    for index, row in enumerate(rows)
+                ],
+                dtype=bool,
+            )
+        else:
+            self.hosts = [row["host_labels"] for row in rows]
+            self.first_host_rows = np.ones(len(rows), dtype=bool)
+        self.counts = np.array([row["count"] for row in rows], dtype=int)
+        self.diameters = np.array(
+            [row["diameter"] for row in rows], dtype=float
+        )
+        self.unit_lengths = np.array(
+            [row["unit_length"] for row in rows], dtype=float
+        )
+        self.total_lengths = self.counts * self.unit_lengths
+
+        # Diameter data
+        self.diameter_values = np.array(
+            sorted(self.diameter_quantities), dtype=float
+        )
+        self.diameter_list = [
+            self.diameter_quantities[value] for value in self.diameter_values
+        ]
+        self.diameter_indices = np.searchsorted(
+            self.diameter_values, self.diameters
+        )
+        self.diameter_total_lengths = np.bincount(
+            self.diameter_indices,
+            weights=self.total_lengths,
+            minlength=len(self.diameter_list),
+        )[: len(self.diameter_list)]
+        self.diameter_weights = np.array(
+            [
+                self.dia_weight_map[dia.Value].getValueAs("kg/m").Value
+                if dia.Value in self.dia_weight_map
+                else np.nan
+                for dia in self.diameter_list
+            ],
+            dtype=float,
+        )
+        self.diameter_total_weights = (
+            self.diameter_weights * self.diameter_total_lengths / 1000
+        )
+        if len(self.diameter_list):
+            self.weights = (
+                self.diameter_weights[
+                    np.minimum(
+                        self.diameter_indices, len(self.diameter_list) - 1
+                    )
+                ]
+                * self.total_lengths
+                / 1000
+            )
+        else:
+            self.weights = np.full(len(rows), np.nan)
+
+    def getBaseRebarLength(self, base_rebar) -> float:
+        """Returns length of base_rebar in mm as per rebar_length_type."""
+        if self.rebar_length_type == "RealLength":
+            index = self.getSnapshotIndex(base_rebar)
+            if index is not None:
+                return float(self.snapshot.lengths[index])
+            return base_rebar.Length.Value
+        return FreeCAD.Units.Quantity(
+            getRebarSharpEdgedLength(base_rebar)
+        ).Value
+
+    def hasDiameterWeight(self, dia_index: int) -> bool:
+        """Returns True if weight per length is known for diameter at dia_index
+        in diameter_list."""
+        return not np.isnan(self.diameter_weights[dia_index])
@@ -42,34 +42,45 @@ def getBaseRebar(reinforcement_obj):
         return reinforcement_obj
 
 
-def getReinforcementRebarObjects(objects_list=None):
-    """getReinforcementRebarObjects(ObjectsList):
+def getReinforcementRebarObjects(objects_list=None, document=None):
+    """getReinforcementRebarObjects(ObjectsList, [Document]):
     objects_list is the list of ArchRebar, rebar2 and/or structural objects.
 
+    document is the document to look for rebars into. It defaults to active
+    document.
+
     Returns list of ArchRebar and reinforcement objects that belongs to passed
     structural elements and reinforcement objects that are derived from
     passed base rebar2 objects, if objects_list is provided. Otherwise
-    returns list of ArchRebar and reinforcement objects from active document.
+    returns list of ArchRebar and reinforcement objects from document.
     """
+    if document is None:
+        document = FreeCAD.ActiveDocument
     if not objects_list:
-        # Get all objects in active document
-        objects_list = FreeCAD.ActiveDocument.Objects
+        # Get all objects in document
+        objects_list = document.Objects
 
     # Get ArchRebar objects
     rebars_list = Draft.get_objects_of_type(objects_list, "Rebar")
 
-    # Add all ArchRebar objects present in active document having host present
+    # Add all ArchRebar objects present in document having host present
     # in objects_list
-    if objects_list != FreeCAD.ActiveDocument.Objects:
+    # Use sets for membership tests, as objects_list may have thousands of
+    # rebars
+    is_document_objects = objects_list == document.Objects
+    if not is_document_objects:
+        objects_set = set(objects_list)
+        rebars_set = set(rebars_list)
         all_arch_rebar_objects = Draft.get_objects_of_type(
-            FreeCAD.ActiveDocument.Objects, "Rebar"
+            document.Objects, "Rebar"
         )
         for arch_rebar_object in all_arch_rebar_objects:
             if (
-                arch_rebar_object.Host in objects_list
-                and arch_rebar_object not in rebars_list
+                arch_rebar_object.Host in objects_set
+                and arch_rebar_object not in rebars_set
             ):
                 rebars_list.append(arch_rebar_object)
+                rebars_set.add(arch_rebar_object)
 
     # Get Rebar2 objects
     reinforcement_obj_types = [
@@ -85,31 +96,30 @@ def getReinforcementRebarObjects(objects_list=None):
             Draft.get_objects_of_type(objects_list, reinforcement_obj_type)
         )
 
-    # Add all reinforcement elements present in active document derived from
+    # Add all reinforcement elements present in document derived from
     # base rebar objects in objects_list
-    # And all reinforcement elements present in active document having Host
+    # And all reinforcement elements present in document having Host
     # present in objects_list
-    if objects_list != FreeCAD.ActiveDocument.Objects:
-        all_objects = FreeCAD.ActiveDocument.Objects
+    if not is_document_objects:
+        all_objects = document.Objects
         all_reinforcement_obj = []
         for reinforcement_obj_type in reinforcement_obj_types:
             all_reinforcement_obj.extend(
                 Draft.get_objects_of_type(all_objects, reinforcement_obj_type)
             )
-        base_rebar_objects = Draft.get_objects_of_type(
-            objects_list, "RebarShape"
+        base_rebar_objects = set(
+            Draft.get_objects_of_type(objects_list, "RebarShape")
         )
+        reinforcement_set = set(reinforcement_list)
         for reinforcement in all_reinforcement_obj:
+            if reinforcement in reinforcement_set:
+                continue
             if (
                 reinforcement.BaseRebar in base_rebar_objects
-                and reinforcement not in reinforcement_list
-            ):
-                reinforcement_list.append(reinforcement)
-            elif (
-                reinforcement.Host in objects_list
-                and reinforcement not in reinforcement_list
+                or reinforcement.Host in objects_set
             ):
                 reinforcement_list.append(reinforcement)
+                reinforcement_set.add(reinforcement)
 
     rebars_list.extend(reinforcement_list)
     return rebars_list
@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2020 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Live Bill Of Material Object"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, OrderedDict as OrderedDictType
+
+import Draft
+import FreeCAD
+from PySide2.QtCore import QT_TRANSLATE_NOOP
+
+from .BOMPreferences import BOMPreferences
+from .BOMTable import BOMTable
+from .BOMfunc import (
+    fixColumnUnits,
+    getBaseRebar,
+    getReinforcementRebarObjects,
+)
+from .BillOfMaterial_Spreadsheet import (
+    fillBillOfMaterial,
+    updateBillOfMaterialRows,
+)
+
+
+# TODO: Use(Uncomment) typing.Literal for minimum python3.8
+
+REINFORCEMENT_TYPES = {
+    "Rebar",
+    "ReinforcementGeneric",
+    "ReinforcementLattice",
+    "ReinforcementCustom",
+    "ReinforcementIndividual",
+    "ReinforcementLinear",
+}
+
+# Properties of reinforcement objects, their base rebars and hosts affecting
+# bill of material. Changes of other properties are ignored.
+WATCHED_PROPERTIES = {
+    "Amount",
+    "Base",
+    "BaseRebar",
+    "Diameter",
+    "Host",
+    "Label",
+    "Length",
+    "Mark",
+    "MarkNumber",
+    "Proxy",
+    "Rounding",
+}
+
+# Proxies of LiveBillOfMaterial objects with document name as key and
+# dictionary of object name and proxy as value
+_LIVE_BILL_OF_MATERIALS = {}
+_LIVE_BILL_OF_MATERIAL_OBSERVER = None
+
+
+class LiveBillOfMaterialObserver:
+    """Document observer to notify LiveBillOfMaterial objects about changes of
+    objects in their document."""
+
+    @staticmethod
+    def notify(obj, deleted: bool = False):
+        live_boms = _LIVE_BILL_OF_MATERIALS.get(obj.Document.Name)
+        if live_boms and obj.Name not in live_boms:
+            for live_bom in live_boms.values():
+                live_bom.markChanged(obj.Name)
+                if deleted:
+                    live_bom.unlinkReinforcement(obj.Name)
+                else:
+                    live_bom.linkReinforcement(obj)
+
+    def slotCreatedObject(self, obj):
+        self.notify(obj)
+
+    def slotDeletedObject(self, obj):
+        live_boms = _LIVE_BILL_OF_MATERIALS.get(obj.Document.Name)
+        if live_boms and obj.Name in live_boms:
+            del live_boms[obj.Name]
+        else:
+            self.notify(obj, deleted=True)
+
+    def slotChangedObject(self, obj, prop):
+        if prop in WATCHED_PROPERTIES:
+            self.notify(obj)
+
+    def slotRecomputedDocument(self, document):
+        # Changes recorded during recompute are not applied yet, if they are
+        # of objects which Bill of Material does not depend on
+        live_boms = _LIVE_BILL_OF_MATERIALS.get(document.Name, {})
+        for live_bom in live_boms.values():
+            if live_bom.changed_names:
+                live_bom.Object.touch()
+
+    def slotDeletedDocument(self, document):
+        _LIVE_BILL_OF_MATERIALS.pop(document.Name, None)
+
+
+def registerLiveBillOfMaterial(live_bom) -> None:
+    """registerLiveBillOfMaterial(LiveBillOfMaterial):
+    Register proxy of LiveBillOfMaterial object to be notified about changes of
+    objects in its document.
+    """
+    global _LIVE_BILL_OF_MATERIAL_OBSERVER
+    if _LIVE_BILL_OF_MATERIAL_OBSERVER is None:
+        _LIVE_BILL_OF_MATERIAL_OBSERVER = LiveBillOfMaterialObserver()
+        FreeCAD.addDocumentObserver(_LIVE_BILL_OF_MATERIAL_OBSERVER)
+    obj = live_bom.Object
+    _LIVE_BILL_OF_MATERIALS.setdefault(obj.Document.Name, {})[
+        obj.Name
+    ] = live_bom
+
+
+class LiveBillOfMaterial:
+    """A Rebars Bill of Material object, which keeps its spreadsheet up to date
+    with reinforcement objects.
+
+    Rows aggregated by mark, or by host and mark, are kept in a BOMTable. Only
+    rows of reinforcement objects whose watched properties are changed, and
+    totals, are rewritten on recompute. If nothing relevant is changed,
+    recompute returns without any work.
+
+    Reinforcement objects in table are linked by hidden ReinforcementObjects
+    property, so that LiveBillOfMaterial object is recomputed after them.
+    Reinforcement objects created or moved into its scope are linked by
+    document observer as soon as their type and scope are known, before
+    document is recomputed.
+    """
+
+    def __init__(self, obj_name):
+        """Initialize LiveBillOfMaterial object."""
+        live_bom = FreeCAD.ActiveDocument.addObject(
+            "App::FeaturePython", obj_name
+        )
+        self.Object = live_bom
+        self.resetTable()
+        self.setProperties(live_bom)
+        live_bom.Proxy = self
+        registerLiveBillOfMaterial(self)
+
+    def setProperties(self, obj):
+        """Add properties to LiveBillOfMaterial object."""
+        self.Type = "LiveBillOfMaterial"
+
+        if not hasattr(obj, "Spreadsheet"):
+            obj.addProperty(
+                "App::PropertyLink",
+                "Spreadsheet",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The spreadsheet to show Bill of Material",
+                ),
+            )
+
+        if not hasattr(obj, "Objects"):
+            obj.addProperty(
+                "App::PropertyLinkList",
+                "Objects",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The rebar and structural objects to include in Bill of "
+                    "Material. All rebars of document are included if empty",
+                ),
+            )
+
+        if not hasattr(obj, "Columns"):
+            obj.addProperty(
+                "App::PropertyStringList",
+                "Columns",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The columns of Bill of Material",
+                ),
+            )
+
+        if not hasattr(obj, "ColumnHeaders"):
+            obj.addProperty(
+                "App::PropertyStringList",
+                "ColumnHeaders",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The display headers of columns of Bill of Material",
+                ),
+            )
+
+        if not hasattr(obj, "ColumnUnits"):
+            obj.addProperty(
+                "App::PropertyMap",
+                "ColumnUnits",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The units of Diameter, RebarLength and RebarsTotalLength "
+                    "columns",
+                ),
+            )
+
+        if not hasattr(obj, "RebarLengthType"):
+            obj.addProperty(
+                "App::PropertyEnumeration",
+                "RebarLengthType",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The rebar length type used in Bill of Material",
+                ),
+            ).RebarLengthType = ["RealLength", "LengthWithSharpEdges"]
+            obj.RebarLengthType = "RealLength"
+
+        if not hasattr(obj, "ReinforcementGroupBy"):
+            obj.addProperty(
+                "App::PropertyEnumeration",
+                "ReinforcementGroupBy",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Specifies if rebars are grouped by mark or by host and "
+                    "mark",
+                ),
+            ).ReinforcementGroupBy = ["Mark", "Host"]
+            obj.ReinforcementGroupBy = "Mark"
+
+        if not hasattr(obj, "ReinforcementObjects"):
+            obj.addProperty(
+                "App::PropertyLinkListHidden",
+                "ReinforcementObjects",
+                "LiveBillOfMaterial",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The reinforcement objects in Bill of Material",
+                ),
+            )
+            obj.setEditorMode("ReinforcementObjects", 2)
+
+    def onDocumentRestored(self, obj):
+        """Upgrade LiveBillOfMaterial object and rebuild its table on next
+        recompute."""
+        self.Object = obj
+        self.resetTable()
+        self.setProperties(obj)
+        registerLiveBillOfMaterial(self)
+
+    def onChanged(self, obj, prop):
+        """Rebuild table on next recompute, if its configuration is
+        changed."""
+        if prop in (
+            "Spreadsheet",
+            "Objects",
+            "Columns",
+            "ColumnHeaders",
+            "ColumnUnits",
+            "RebarLengthType",
+            "ReinforcementGroupBy",
+        ):
+            self.bom_table = None
+
+    def resetTable(self):
+        """Drop table, so that it is rebuilt from scratch on next
+        recompute."""
+        self.bom_table = None
+        self.scope = None
+        self.changed_names = set()
+        # Names of objects linked by ReinforcementObjects property, read from
+        # property on first use
+        self.linked_names = None
+
+    def markChanged(self, obj_name: str):
+        """Record change of object with name obj_name, to be applied to table
+        on next recompute.
+
+        LiveBillOfMaterial object is touched only outside of document
+        recompute. During recompute, it is executed after changed
+        reinforcement objects as it links them, and remaining changes are
+        handled once recompute is finished.
+        """
+        obj = self.Object
+        if not self.changed_names and not obj.Document.Recomputing:
+            obj.touch()
+        self.changed_names.add(obj_name)
+
+    def getLinkedNames(self) -> set:
+        """Returns names of objects linked by ReinforcementObjects property."""
+        if self.linked_names is None:
+            self.linked_names = {
+                o.Name for o in self.Object.ReinforcementObjects
+            }
+        return self.linked_names
+
+    def linkReinforcement(self, obj):
+        """Link reinforcement object obj by ReinforcementObjects property, if
+        it belongs to Bill of Material and is not linked yet, so that
+        LiveBillOfMaterial object is recomputed after it.
+
+        Links are changed only outside of document recompute and once table
+        is built. Otherwise, ReinforcementObjects property is synchronized
+        with table by execute().
+        """
+        live_bom = self.Object
+        if (
+            self.bom_table is None
+            or live_bom.Document.Recomputing
+            or Draft.get_type(obj) not in REINFORCEMENT_TYPES
+            or obj.Name in self.getLinkedNames()
+            or not self.isInScope(obj)
+        ):
+            return
+        live_bom.ReinforcementObjects = live_bom.ReinforcementObjects + [obj]
+        self.linked_names.add(obj.Name)
+
+    def unlinkReinforcement(self, obj_name: str):
+        """Forget link to deleted object with name obj_name. Link property
+        drops deleted objects by itself."""
+        if self.linked_names is not None:
+            self.linked_names.discard(obj_name)
+
+    def isInScope(self, rebar) -> bool:
+        """Returns True if reinforcement object rebar belongs to objects of
+        LiveBillOfMaterial object."""
+        if self.scope is None:
+            return True
+        host = rebar.Host
+        base_rebar = getBaseRebar(rebar)
+        return (
+            rebar.Name in self.scope
+            or (host is not None and host.Name in self.scope)
+            or (base_rebar is not None and base_rebar.Name in self.scope)
+        )
+
+    @staticmethod
+    def getColumnHeaders(obj) -> OrderedDictType[str, str]:
+        """Returns column headers configuration of LiveBillOfMaterial
+        object."""
+        return OrderedDict(zip(obj.Columns, obj.ColumnHeaders))
+
+    def execute(self, obj):
+        """This function is executed to recompute LiveBillOfMaterial
+        object."""
+        if self.bom_table is not None and not self.changed_names:
+            return
+        if not obj.Spreadsheet:
+            return
+
+        column_headers = self.getColumnHeaders(obj)
+        column_units = fixColumnUnits(dict(obj.ColumnUnits))
+        changed_rows = None
+        if self.bom_table is None:
+            self.resetTable()
+            if obj.Objects:
+                self.scope = {o.Name for o in obj.Objects}
+            self.bom_table = BOMTable(
+                getReinforcementRebarObjects(obj.Objects, obj.Document),
+                obj.RebarLengthType,
+                obj.ReinforcementGroupBy,
+                BOMPreferences().getDiaWeightMap(),
+            )
+        else:
+            changed_names = self.changed_names
+            self.changed_names = set()
+            for name in changed_names:
+                changed_obj = obj.Document.getObject(name)
+                if changed_obj is None:
+                    self.bom_table.removeReinforcement(name)
+                elif Draft.get_type(changed_obj) not in REINFORCEMENT_TYPES:
+                    self.bom_table.refreshObject(changed_obj)
+                elif self.isInScope(changed_obj):
+                    self.bom_table.setReinforcement(changed_obj)
+                else:
+                    self.bom_table.removeReinforcement(name)
+            changed_rows = self.bom_table.updateRows()
+
+        if self.getLinkedNames() != set(self.bom_table.rebars):
+            obj.ReinforcementObjects = self.bom_table.reinforcement_objects
+            self.linked_names = set(self.bom_table.rebars)
+
+        if not len(self.bom_table):
+            obj.Spreadsheet.clearAll()
+        elif changed_rows is None:
+            fillBillOfMaterial(
+                obj.Spreadsheet, self.bom_table, column_headers, column_units
+            )
+        else:
+            updateBillOfMaterialRows(
+                obj.Spreadsheet,
+                self.bom_table,
+                changed_rows,
+                column_headers,
+                column_units,
+            )
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        return None
+
+
+def makeLiveBillOfMaterial(
+    # column_headers: Optional[
+    #     OrderedDictType[
+    #         Literal[
+    #             "Host",
+    #             "Mark",
+    #             "RebarsCount",
+    #             "Diameter",
+    #             "RebarLength",
+    #             "RebarsTotalLength",
+    #         ],
+    #         str,
+    #     ]
+    # ] = None,
+    column_headers: Optional[OrderedDictType[str, str]] = None,
+    # column_units: Optional[
+    #     Dict[Literal["Diameter", "RebarLength", "RebarsTotalLength"], str]
+    # ] = None,
+    column_units: Optional[Dict[str, str]] = None,
+    # rebar_length_type: Optional[
+    #     Literal["RealLength", "LengthWithSharpEdges"]
+    # ] = None,
+    rebar_length_type: Optional[str] = None,
+    rebar_objects: Optional[List] = None,
+    # reinforcement_group_by: Optional[Literal["Mark", "Host"]] = None,
+    reinforcement_group_by: Optional[str] = None,
+    obj_name: str = "LiveBillOfMaterial",
+):
+    """makeLiveBillOfMaterial(ColumnHeadersConfig, ColumnUnitsDict,
+    RebarLengthType, RebarObjects, ReinforcementGroupBy, ObjectName):
+    Generates Rebars Material Bill spreadsheet, which is updated whenever
+    reinforcement objects are changed.
+
+    Arguments are the same as of makeBillOfMaterial(). Rebar objects and
+    structural objects in rebar_objects are stored as scope of Bill of
+    Material, all reinforcement objects of document are included if it is
+    empty.
+
+    Returns LiveBillOfMaterial object.
+    """
+    bom_preferences = BOMPreferences()
+    if not column_headers:
+        column_headers = bom_preferences.getColumnHeaders()
+    if not column_units:
+        column_units = bom_preferences.getColumnUnits()
+    if not rebar_length_type:
+        rebar_length_type = bom_preferences.getRebarLengthType()
+    if not reinforcement_group_by:
+        reinforcement_group_by = bom_preferences.getReinforcementGroupBy()
+
+    live_bom = LiveBillOfMaterial(obj_name).Object
+    live_bom.Spreadsheet = FreeCAD.ActiveDocument.addObject(
+        "Spreadsheet::Sheet", "RebarBillOfMaterial"
+    )
+    live_bom.Objects = rebar_objects or []
+    live_bom.Columns = list(column_headers.keys())
+    live_bom.ColumnHeaders = list(column_headers.values())
+    live_bom.ColumnUnits = fixColumnUnits(column_units)
+    live_bom.RebarLengthType = rebar_length_type
+    live_bom.ReinforcementGroupBy = reinforcement_group_by
+    FreeCAD.ActiveDocument.recompute()
+    return live_bom
+
+
+def CommandLiveBillOfMaterial():
+    """Create LiveBillOfMaterial object for selected, or all, reinforcement
+    objects."""
+    import FreeCADGui
+
+    selected_objects = [
+        selection.Object for selection in FreeCADGui.Selection.getSelectionEx()
+    ]
+    makeLiveBillOfMaterial(rebar_objects=selected_objects)
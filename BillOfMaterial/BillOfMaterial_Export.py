@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2020 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Bill Of Material Export"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+import csv
+import json
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    OrderedDict as OrderedDictType,
+    TextIO,
+    Union,
+)
+
+import FreeCAD
+import numpy as np
+
+from .BOMPreferences import BOMPreferences
+from .BOMTable import BOMTable, getUnitFactor
+from .BOMfunc import fixColumnUnits, getReinforcementRebarObjects
+
+
+# TODO: Use(Uncomment) typing.Literal for minimum python3.8
+
+EXPORT_FILE_FORMATS = {
+    ".csv": "csv",
+    ".json": "jsonl",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def getBillOfMaterialRows(
+    bom_table: BOMTable,
+    column_headers: OrderedDictType[str, str],
+    column_units: Dict[str, str],
+    precision: int,
+) -> Iterator[tuple]:
+    """Yields values of each bill of material row, in order of column_headers.
+
+    Unlike spreadsheet and svg, host is repeated for each row and total length
+    is given in a single column, so that each row is a complete record.
+
+    Parameters
+    ----------
+    bom_table: BOMTable
+        The aggregated bill of material table.
+    column_headers: OrderedDict of (str, str)
+        The ordered dictionary with keys "Host", "Mark", "RebarsCount",
+        "Diameter", "RebarLength" and/or "RebarsTotalLength".
+    column_units: dict of (str, str)
+        The dictionary having keys "Diameter", "RebarLength" and
+        "RebarsTotalLength" and their corresponding unit as value.
+    precision: int
+        The number of decimals of length values.
+
+    Yields
+    ------
+    tuple
+        The row values. Lengths are floats in column_units.
+    """
+    columns = []
+    for column_header in column_headers:
+        if column_header == "Host":
+            columns.append(bom_table.hosts)
+        elif column_header == "Mark":
+            columns.append(bom_table.marks)
+        elif column_header == "RebarsCount":
+            columns.append(bom_table.counts.tolist())
+        else:
+            values = {
+                "Diameter": bom_table.diameters,
+                "RebarLength": bom_table.unit_lengths,
+                "RebarsTotalLength": bom_table.total_lengths,
+            }[column_header]
+            columns.append(
+                np.round(
+                    values / getUnitFactor(column_units[column_header]),
+                    precision,
+                ).tolist()
+            )
+    yield from zip(*columns)
+
+
+def exportBillOfMaterial(
+    output_file: Union[str, Path, TextIO],
+    # file_format: Optional[Literal["csv", "jsonl"]] = None,
+    file_format: Optional[str] = None,
+    # column_headers: Optional[
+    #     OrderedDictType[
+    #         Literal[
+    #             "Host",
+    #             "Mark",
+    #             "RebarsCount",
+    #             "Diameter",
+    #             "RebarLength",
+    #             "RebarsTotalLength",
+    #         ],
+    #         str,
+    #     ]
+    # ] = None,
+    column_headers: Optional[OrderedDictType[str, str]] = None,
+    # column_units: Optional[
+    #     Dict[Literal["Diameter", "RebarLength", "RebarsTotalLength"], str]
+    # ] = None,
+    column_units: Optional[Dict[str, str]] = None,
+    # rebar_length_type: Optional[
+    #     Literal["RealLength", "LengthWithSharpEdges"]
+    # ] = None,
+    rebar_length_type: Optional[str] = None,
+    rebar_objects: Optional[List] = None,
+    # reinforcement_group_by: Optional[Literal["Mark", "Host"]] = None,
+    reinforcement_group_by: Optional[str] = None,
+    precision: Optional[int] = None,
+) -> int:
+    """Streams bill of material rows to csv or line-delimited json, without
+    creating any document object. It works in FreeCAD console mode as well.
+
+    Parameters
+    ----------
+    output_file: str or Path or file object
+        The output file path or the text file object to write rows to.
+    file_format: {"csv", "jsonl"}, optional
+        The output format. If it is None, then it is derived from output_file
+        extension: ".json", ".jsonl" and ".ndjson" export line-delimited json,
+        others export csv.
+    column_headers: OrderedDict of (str, str), optional
+        The ordered dictionary with keys "Host", "Mark", "RebarsCount",
+        "Diameter", "RebarLength" and/or "RebarsTotalLength" and their display
+        header as value. The display headers are used as csv header row and as
+        json keys.
+        Default is taken from BOMPreferences.
+    column_units: dict of (str, str), optional
+        The dictionary having keys "Diameter", "RebarLength" and
+        "RebarsTotalLength" and their corresponding unit as value.
+        Default is taken from BOMPreferences.
+    rebar_length_type: {"RealLength", "LengthWithSharpEdges"}, optional
+        Default is taken from BOMPreferences.
+    rebar_objects: list of <ArchRebar._Rebar, rebar2 and rebar.Host>, optional
+        The list of ArchRebar, rebar2 and/or structural objects. If it is None,
+        then reinforcement objects from active document are exported.
+    reinforcement_group_by: {"Mark", "Host"}, optional
+        Default is taken from BOMPreferences.
+    precision: int, optional
+        The number of decimals of length values. Default is user preferred
+        unit precision from FreeCAD unit preferences.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    reinforcement_objects = getReinforcementRebarObjects(rebar_objects)
+    if not reinforcement_objects:
+        FreeCAD.Console.PrintWarning(
+            "No rebar object in current selection/document. "
+            "Exporting empty BillOfMaterial.\n"
+        )
+
+    bom_preferences = BOMPreferences()
+    column_headers = column_headers or bom_preferences.getColumnHeaders()
+    column_units = fixColumnUnits(
+        column_units or bom_preferences.getColumnUnits()
+    )
+    rebar_length_type = (
+        rebar_length_type or bom_preferences.getRebarLengthType()
+    )
+    reinforcement_group_by = (
+        reinforcement_group_by or bom_preferences.getReinforcementGroupBy()
+    )
+    if precision is None:
+        precision = FreeCAD.ParamGet(
+            "User parameter:BaseApp/Preferences/Units"
+        ).GetInt("Decimals")
+
+    if file_format is None:
+        if isinstance(output_file, (str, Path)):
+            file_format = EXPORT_FILE_FORMATS.get(
+                Path(output_file).suffix.lower(), "csv"
+            )
+        else:
+            file_format = "csv"
+    if file_format not in ("csv", "jsonl"):
+        FreeCAD.Console.PrintError(
+            "Unsupported BillOfMaterial export format `{}`. Supported formats "
+            "are `csv` and `jsonl`.\n".format(file_format)
+        )
+        return 0
+
+    bom_table = BOMTable(
+        reinforcement_objects, rebar_length_type, reinforcement_group_by
+    )
+    rows = getBillOfMaterialRows(
+        bom_table, column_headers, column_units, precision
+    )
+
+    def writeRows(stream: TextIO) -> None:
+        if file_format == "csv":
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(column_headers.values())
+            writer.writerows(rows)
+        else:
+            keys = list(column_headers.values())
+            encoder = json.JSONEncoder(ensure_ascii=False)
+            stream.writelines(
+                encoder.encode(dict(zip(keys, row))) + "\n" for row in rows
+            )
+
+    if isinstance(output_file, (str, Path)):
+        with open(output_file, "w", newline="", encoding="utf-8") as stream:
+            writeRows(stream)
+    else:
+        writeRows(output_file)
+    return len(bom_table)
+
+
+def CommandExportBillOfMaterial() -> None:
+    """Asks for output file and exports bill of material of selected, or all,
+    reinforcement objects to csv or line-delimited json."""
+    import FreeCADGui
+    from PySide2 import QtWidgets
+
+    selected_objects = [
+        selection.Object for selection in FreeCADGui.Selection.getSelectionEx()
+    ]
+    reinforcement_objs = getReinforcementRebarObjects(selected_objects)
+    if not reinforcement_objs:
+        reinforcement_objs = getReinforcementRebarObjects(
+            FreeCAD.ActiveDocument.Objects
+        )
+
+    output_file, file_filter = QtWidgets.QFileDialog.getSaveFileName(
+        None,
+        "Export Bill of Material",
+        FreeCAD.ConfigGet("UserAppData"),
+        "CSV (*.csv);;JSON Lines (*.jsonl)",
+    )
+    if not output_file:
+        return
+    if not Path(output_file).suffix:
+        output_file += ".jsonl" if "jsonl" in file_filter else ".csv"
+
+    rows_count = exportBillOfMaterial(
+        output_file, rebar_objects=reinforcement_objs
+    )
+    FreeCAD.Console.PrintMessage(
+        "Exported {} BillOfMaterial rows to {}\n".format(
+            rows_count, output_file
+        )
+    )
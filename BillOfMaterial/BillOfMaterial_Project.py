@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2020 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Project Bill Of Material"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+import multiprocessing
+import multiprocessing.spawn
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+    OrderedDict as OrderedDictType,
+    Tuple,
+    Union,
+)
+
+import FreeCAD
+
+from .BOMPreferences import BOMPreferences
+from .BOMTable import BOMTable
+from .BOMfunc import fixColumnUnits, getReinforcementRebarObjects
+from .BillOfMaterial_Spreadsheet import fillBillOfMaterial
+
+
+# TODO: Use(Uncomment) typing.Literal for minimum python3.8
+
+# Maximum difference in mm between unit lengths of rebars with same mark and
+# diameter in different documents, to treat them as same rebar
+LENGTH_TOLERANCE = 0.01
+
+
+def getDocumentBOMRows(
+    file_path: Union[str, Path],
+    # rebar_length_type: Literal[
+    #     "RealLength", "LengthWithSharpEdges"
+    # ] = "RealLength",
+    rebar_length_type: str = "RealLength",
+) -> List[Tuple[str, float, int, float, str]]:
+    """Returns bill of material rows of reinforcement objects of document
+    file_path, grouped by mark.
+
+    It is run in worker processes, so it only returns picklable values.
+
+    Parameters
+    ----------
+    file_path: str or Path
+        The path of FreeCAD document.
+    rebar_length_type: {"RealLength", "LengthWithSharpEdges"}, optional
+        The rebar length type used for unit length.
+        Default is "RealLength".
+
+    Returns
+    -------
+    list of tuple of (str, float, int, float, str)
+        The list of (mark, diameter, count, unit_length, host_labels), with
+        diameter and unit length in mm.
+    """
+    file_path = str(Path(file_path).resolve())
+    active_document = FreeCAD.ActiveDocument
+    # Keep document open if it is already opened by user
+    document = None
+    for open_document in FreeCAD.listDocuments().values():
+        if (
+            open_document.FileName
+            and Path(open_document.FileName).resolve() == Path(file_path)
+        ):
+            document = open_document
+    close_document = document is None
+    if close_document:
+        document = FreeCAD.openDocument(file_path, True)
+    try:
+        reinforcement_objects = getReinforcementRebarObjects(
+            document.Objects, document
+        )
+        bom_table = BOMTable(reinforcement_objects, rebar_length_type, "Mark")
+        return list(
+            zip(
+                bom_table.marks,
+                bom_table.diameters.tolist(),
+                bom_table.counts.tolist(),
+                bom_table.unit_lengths.tolist(),
+                bom_table.hosts,
+            )
+        )
+    finally:
+        if close_document:
+            FreeCAD.closeDocument(document.Name)
+        if active_document:
+            FreeCAD.setActiveDocument(active_document.Name)
+
+
+def getWorkerExecutable() -> Optional[str]:
+    """Returns python interpreter to start worker processes with, or None if
+    it is not found.
+
+    Inside FreeCAD, sys.executable is FreeCAD itself, so python interpreter
+    shipped with FreeCAD is looked up in its bin directory.
+    """
+    if Path(sys.executable).stem.lower().startswith("python"):
+        return sys.executable
+    bin_dir = Path(FreeCAD.getHomePath()) / "bin"
+    for executable in ("python3", "python", "python.exe"):
+        if (bin_dir / executable).is_file():
+            return str(bin_dir / executable)
+    return None
+
+
+def getProjectBOMRows(
+    files: List[Union[str, Path]],
+    # rebar_length_type: Literal[
+    #     "RealLength", "LengthWithSharpEdges"
+    # ] = "RealLength",
+    rebar_length_type: str = "RealLength",
+    processes: Optional[int] = None,
+) -> Dict[str, List[Tuple[str, float, int, float, str]]]:
+    """Returns bill of material rows of each document in files, extracted in
+    parallel by pool of worker processes.
+
+    Parameters
+    ----------
+    files: list of str or Path
+        The list of paths of FreeCAD documents.
+    rebar_length_type: {"RealLength", "LengthWithSharpEdges"}, optional
+        The rebar length type used for unit length.
+        Default is "RealLength".
+    processes: int, optional
+        The maximum number of worker processes. Default is number of cores.
+
+    Returns
+    -------
+    dict of (str, list of tuple)
+        The dictionary with file path as key and its rows, as returned by
+        getDocumentBOMRows(), as value, in order of files. Files which can't
+        be read are left out.
+
+    Notes
+    -----
+    Documents are read one by one, with a warning, if python interpreter of
+    FreeCAD is not found by getWorkerExecutable(). It is the case for Linux
+    builds without bin/python3, e.g. distribution packages using system
+    python, so there is no speedup from several cores there.
+    """
+    files = [str(file_path) for file_path in files]
+    processes = min(processes or os.cpu_count() or 1, len(files))
+    executable = getWorkerExecutable()
+    if processes <= 1 or executable is None:
+        if processes > 1:
+            FreeCAD.Console.PrintWarning(
+                "Python interpreter for worker processes not found. Reading "
+                "documents one by one.\n"
+            )
+        results = {}
+        for file_path in files:
+            try:
+                results[file_path] = getDocumentBOMRows(
+                    file_path, rebar_length_type
+                )
+            except Exception as error:
+                FreeCAD.Console.PrintError(
+                    "Unable to read {}: {}\n".format(file_path, error)
+                )
+        return results
+
+    # Worker processes are spawned, as forking FreeCAD is not safe. Spawned
+    # processes get sys.path of this process, so they can import FreeCAD and
+    # this module.
+    # Executable of spawned processes is global setting of multiprocessing,
+    # so it is restored once workers are done.
+    context = multiprocessing.get_context("spawn")
+    previous_executable = multiprocessing.spawn.get_executable()
+    context.set_executable(executable)
+    try:
+        with ProcessPoolExecutor(processes, mp_context=context) as executor:
+            futures = {
+                file_path: executor.submit(
+                    getDocumentBOMRows, file_path, rebar_length_type
+                )
+                for file_path in files
+            }
+            results = {}
+            for file_path, future in futures.items():
+                try:
+                    results[file_path] = future.result()
+                except Exception as error:
+                    FreeCAD.Console.PrintError(
+                        "Unable to read {}: {}\n".format(file_path, error)
+                    )
+    finally:
+        context.set_executable(previous_executable)
+    return results
+
+
+def getDocumentNames(files: List[Union[str, Path]]) -> Dict[str, str]:
+    """Returns dictionary with file path as key and unique document name as
+    value.
+
+    Document name is the file name without extension. If several files have
+    the same name, their paths relative to their common directory, without
+    extension, are used instead e.g. "Block1/Floor2".
+
+    Raises ValueError, if names are still not unique e.g. the same file is
+    given by different paths.
+    """
+    stems = {}
+    for file_path in files:
+        stems.setdefault(Path(file_path).stem, []).append(str(file_path))
+
+    document_names = {}
+    for stem, stem_files in stems.items():
+        if len(stem_files) == 1:
+            document_names[stem_files[0]] = stem
+            continue
+        common_dir = os.path.commonpath(
+            [str(Path(file_path).parent) for file_path in stem_files]
+        )
+        for file_path in stem_files:
+            document_names[file_path] = (
+                Path(os.path.relpath(file_path, common_dir))
+                .with_suffix("")
+                .as_posix()
+            )
+
+    if len(set(document_names.values())) != len(document_names):
+        raise ValueError(
+            "Documents of project are not unique: "
+            + ", ".join(str(file_path) for file_path in files)
+        )
+    return document_names
+
+
+class ProjectBOMTable(BOMTable):
+    """Bill of material table of rebars of several documents, merged by mark
+    and diameter.
+
+    Rows have the same attributes as of BOMTable grouped by mark, except that
+    hosts are names of documents having the mark and base_rebars are None.
+    """
+
+    def __init__(
+        self,
+        document_rows: Dict[str, List[Tuple[str, float, int, float, str]]],
+        # mark_collision: Literal["Rename", "Merge", "Error"] = "Rename",
+        mark_collision: str = "Rename",
+        dia_weight_map: Optional[Dict[float, FreeCAD.Units.Quantity]] = None,
+    ):
+        """Merge rows of documents into project BOM table.
+
+        Rows of different documents with same mark, diameter and unit length
+        are merged into one row. Same mark with different diameter or unit
+        length is a mark collision.
+
+        Parameters
+        ----------
+        document_rows: dict of (str, list of tuple)
+            The dictionary with file path as key and its rows, as returned by
+            getProjectBOMRows().
+        mark_collision: {"Rename", "Merge", "Error"}, optional
+            Specifies how mark collisions are handled:
+            "Rename": Collided marks of later documents are suffixed with
+                document name e.g. "3 (Floor2)", as returned by
+                getDocumentNames(). ValueError is raised, if renamed mark
+                still exists.
+            "Merge": Rows with same mark and diameter are merged anyway, with
+                unit length averaged over rebars. Same mark with different
+                diameters is kept in separate rows.
+            "Error": ValueError is raised, listing collided marks.
+            Default is "Rename".
+        dia_weight_map: dict of (float, FreeCAD.Units.Quantity), optional
+            The dictionary with diameter as key and corresponding weight (kg/m)
+            as value.
+        """
+        self.rebar_length_type = None
+        self.reinforcement_group_by = "Mark"
+        self.dia_weight_map = dia_weight_map or {}
+        self.mark_collisions = []
+
+        # Groups of each mark, with (mark, diameter) as key
+        mark_groups = {}
+        self.groups = {}
+        self.diameter_quantities = {}
+        document_names = getDocumentNames(list(document_rows))
+        for file_path, rows in document_rows.items():
+            document_name = document_names[str(file_path)]
+            for mark, diameter, count, unit_length, _ in rows:
+                group_mark = mark
+                groups = mark_groups.setdefault(mark, [])
+                group = None
+                for mark_group in groups:
+                    if mark_group["diameter"] == diameter and (
+                        mark_collision == "Merge"
+                        or abs(mark_group["first_unit_length"] - unit_length)
+                        <= LENGTH_TOLERANCE
+                    ):
+                        group = mark_group
+                        break
+                if group is None and groups:
+                    self.mark_collisions.append((mark, file_path))
+                    if mark_collision == "Rename":
+                        mark = "{} ({})".format(mark, document_name)
+                        if mark in mark_groups:
+                            raise ValueError(
+                                'Unable to rename collided mark to "{}", as '
+                                "it already exists in project".format(mark)
+                            )
+                if group is None:
+                    group = {
+                        "host": None,
+                        "mark": mark,
+                        "base_rebar": None,
+                        "count": 0,
+                        "total_length": 0,
+                        "host_labels": [],
+                        "diameter": diameter,
+                        "first_unit_length": unit_length,
+                    }
+                    groups.append(group)
+                    if mark != group_mark:
+                        # Renamed mark is collided by later rows with it
+                        mark_groups[mark] = [group]
+                    self.groups[(mark, diameter)] = group
+                elif abs(group["first_unit_length"] - unit_length) > (
+                    LENGTH_TOLERANCE
+                ):
+                    self.mark_collisions.append((mark, file_path))
+                group["count"] += count
+                group["total_length"] += count * unit_length
+                group["unit_length"] = group["total_length"] / group["count"]
+                if document_name not in group["host_labels"]:
+                    group["host_labels"].append(document_name)
+                if diameter not in self.diameter_quantities:
+                    self.diameter_quantities[
+                        diameter
+                    ] = FreeCAD.Units.Quantity("{} mm".format(diameter))
+
+        if self.mark_collisions and mark_collision == "Error":
+            raise ValueError(
+                "Mark collision in project: "
+                + ", ".join(
+                    "{} in {}".format(mark, Path(file_path).name)
+                    for mark, file_path in self.mark_collisions
+                )
+            )
+        for group in self.groups.values():
+            group["host_labels"] = ",".join(group["host_labels"])
+        self.buildRows()
+
+
+def makeProjectBillOfMaterial(
+    files: List[Union[str, Path]],
+    # column_headers: Optional[
+    #     OrderedDictType[
+    #         Literal[
+    #             "Host",
+    #             "Mark",
+    #             "RebarsCount",
+    #             "Diameter",
+    #             "RebarLength",
+    #             "RebarsTotalLength",
+    #         ],
+    #         str,
+    #     ]
+    # ] = None,
+    column_headers: Optional[OrderedDictType[str, str]] = None,
+    # column_units: Optional[
+    #     Dict[Literal["Diameter", "RebarLength", "RebarsTotalLength"], str]
+    # ] = None,
+    column_units: Optional[Dict[str, str]] = None,
+    dia_weight_map: Optional[Dict[float, FreeCAD.Units.Quantity]] = None,
+    # rebar_length_type: Optional[
+    #     Literal["RealLength", "LengthWithSharpEdges"]
+    # ] = None,
+    rebar_length_type: Optional[str] = None,
+    # mark_collision: Optional[Literal["Rename", "Merge", "Error"]] = None,
+    mark_collision: Optional[str] = None,
+    processes: Optional[int] = None,
+    obj_name: str = "ProjectBillOfMaterial",
+):
+    """makeProjectBillOfMaterial(Files, ColumnHeadersConfig, ColumnUnitsDict,
+    DiaWeightMap, RebarLengthType, MarkCollision, Processes, ObjectName):
+    Generates Rebars Material Bill of all documents in files, in active
+    document.
+
+    Documents are read in parallel by pool of worker processes and their rows
+    are merged by mark and diameter. Host column lists names of documents
+    having the mark.
+
+    column_headers, column_units, dia_weight_map and rebar_length_type are the
+    same as of makeBillOfMaterial().
+
+    mark_collision can be "Rename", "Merge" or "Error". Refer to
+    ProjectBOMTable for details.
+
+    processes is the maximum number of worker processes, default is number of
+    cores.
+
+    Returns Bill Of Material spreadsheet object.
+    """
+    bom_preferences = BOMPreferences()
+    if not column_headers:
+        column_headers = bom_preferences.getColumnHeaders()
+    if not column_units:
+        column_units = bom_preferences.getColumnUnits()
+    if not dia_weight_map:
+        dia_weight_map = bom_preferences.getDiaWeightMap()
+    if not rebar_length_type:
+        rebar_length_type = bom_preferences.getRebarLengthType()
+    if not mark_collision:
+        mark_collision = bom_preferences.getMarkCollision()
+
+    # Fix column units
+    column_units = fixColumnUnits(column_units)
+
+    document_rows = getProjectBOMRows(files, rebar_length_type, processes)
+    try:
+        bom_table = ProjectBOMTable(
+            document_rows, mark_collision, dia_weight_map
+        )
+    except ValueError as error:
+        FreeCAD.Console.PrintError(
+            "{}\nReturning without BillOfMaterial Spreadsheet.\n".format(error)
+        )
+        return
+    if not len(bom_table):
+        FreeCAD.Console.PrintWarning(
+            "No rebar object in project documents. "
+            "Returning without BillOfMaterial Spreadsheet.\n"
+        )
+        return
+    for mark, file_path in bom_table.mark_collisions:
+        FreeCAD.Console.PrintWarning(
+            "Mark {} of {} collides with same mark of other document.\n".format(
+                mark, file_path
+            )
+        )
+
+    if FreeCAD.ActiveDocument is None:
+        FreeCAD.newDocument()
+    bill_of_material = FreeCAD.ActiveDocument.addObject(
+        "Spreadsheet::Sheet", obj_name
+    )
+    fillBillOfMaterial(
+        bill_of_material, bom_table, column_headers, column_units
+    )
+    FreeCAD.ActiveDocument.recompute()
+    return bill_of_material
+
+
+def CommandProjectBillOfMaterial() -> None:
+    """Asks for project documents and generates their merged bill of
+    material."""
+    from PySide2 import QtWidgets
+
+    files, _ = QtWidgets.QFileDialog.getOpenFileNames(
+        None,
+        "Select project documents",
+        FreeCAD.ConfigGet("UserHomePath"),
+        "FreeCAD document (*.FCStd)",
+    )
+    if files:
+        makeProjectBillOfMaterial(files)
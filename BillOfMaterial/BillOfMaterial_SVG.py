@@ -45,14 +45,10 @@ from SVGfunc import (
 )
 from .BOMPreferences import BOMPreferences
 from .BOMfunc import (
-    getMarkReinforcementsDict,
-    getUniqueDiameterList,
-    getRebarSharpEdgedLength,
     fixColumnUnits,
     getReinforcementRebarObjects,
-    getHostReinforcementsDict,
-    getBaseRebar,
 )
+from .BOMTable import BOMTable, getUnitFactor
 from .BillOfMaterialContent import makeBOMObject
 
 
@@ -219,12 +215,13 @@ def makeBillOfMaterialSVG(
     # reinforcement_group_by: Optional[Literal["Mark", "Host"]] = None,
     reinforcement_group_by: Optional[str] = None,
     return_svg_only: bool = False,
+    bom_table: Optional[BOMTable] = None,
 ):
     """makeBillOfMaterialSVG([ColumnHeaders, ColumnUnits, DiaWeightMap,
     RebarLengthType, FontFamily, FontSize, FontFilename, ColumnWidth, RowHeight,
     BOMLeftOffset, BOMTopOffset, BOMMinRightOffset, BOMMinBottomOffset,
     BOMTableSVGMaxWidth, BOMTableSVGMaxHeight, TemplateFile, OutputFile,
-    RebarObjects, ReinforcementGroupBy, ReturnSVGOnly]):
+    RebarObjects, ReinforcementGroupBy, ReturnSVGOnly, BOMTable]):
     Generates the Rebars Material Bill SVG.
 
     column_headers is an ordered dictionary with keys: "Host", "Mark",
@@ -270,9 +267,16 @@ def makeBillOfMaterialSVG(
     svg is written to output_file. And it returns svg element.
     Default is False.
 
+    bom_table is the already aggregated BOMTable to render. If it is provided,
+    then rebar_objects, dia_weight_map, rebar_length_type and
+    reinforcement_group_by are not used to aggregate rebars again.
+
     Returns Bill Of Material svg code.
     """
-    reinforcement_objects = getReinforcementRebarObjects(rebar_objects)
+    if bom_table is not None:
+        reinforcement_objects = bom_table.reinforcement_objects
+    else:
+        reinforcement_objects = getReinforcementRebarObjects(rebar_objects)
     if not reinforcement_objects:
         FreeCAD.Console.PrintWarning(
             "No rebar object in current selection/document. "
@@ -327,8 +331,14 @@ def makeBillOfMaterialSVG(
     bom_table_svg = ElementTree.Element("g")
     bom_table_svg.set("id", "BOM_table")
 
-    # Get unique diameter list
-    diameter_list = getUniqueDiameterList(reinforcement_objects)
+    if bom_table is None:
+        bom_table = BOMTable(
+            reinforcement_objects,
+            rebar_length_type,
+            reinforcement_group_by,
+            dia_weight_map,
+        )
+    diameter_list = bom_table.diameter_list
 
     y_offset = 0
     column_headers_svg = getColumnHeadersSVG(
@@ -343,160 +353,64 @@ def makeBillOfMaterialSVG(
     )
     bom_table_svg.append(column_headers_svg)
 
-    # Dictionary to store total length of rebars corresponding to its dia
-    dia_total_length_dict = {
-        dia.Value: FreeCAD.Units.Quantity("0 mm") for dia in diameter_list
-    }
-
     if "RebarsTotalLength" in column_headers:
-        first_row = 3
-        current_row = 3
         y_offset += 2 * row_height
     else:
-        first_row = 2
-        current_row = 2
         y_offset += row_height
 
-    def getHostCellSVG(_host_label: str) -> ElementTree.Element:
-        host_column_number = getColumnNumber(
-            column_headers, diameter_list, "Host"
-        )
-        host_column_offset = column_width * (host_column_number - 1)
-        return getSVGDataCell(
-            _host_label,
-            host_column_offset,
-            y_offset,
-            column_width,
-            row_height,
-            font_family,
-            font_size,
-            "bom_table_cell_column_{}".format(host_column_number),
-        )
-
-    def getMarkCellSVG(rebar_mark: Union[str, float]) -> ElementTree.Element:
-        mark_column_number = getColumnNumber(
-            column_headers, diameter_list, "Mark"
-        )
-        mark_column_offset = column_width * (mark_column_number - 1)
-        return getSVGDataCell(
-            rebar_mark,
-            mark_column_offset,
-            y_offset,
-            column_width,
-            row_height,
-            font_family,
-            font_size,
-            "bom_table_cell_column_{}".format(mark_column_number),
+    def getDisplayValue(value: float, unit: str, base_unit: str) -> str:
+        disp_value = str(
+            round(float(value / getUnitFactor(unit, base_unit)), precision)
         )
+        if "." in disp_value:
+            disp_value = disp_value.rstrip("0").rstrip(".")
+        return disp_value
 
-    def getDiameterCellSVG(
-        rebar_diameter: FreeCAD.Units.Quantity,
-    ) -> ElementTree.Element:
-        disp_diameter = str(
-            round(
-                rebar_diameter.getValueAs(column_units["Diameter"]).Value,
-                precision,
-            )
-        )
-        if "." in disp_diameter:
-            disp_diameter = disp_diameter.rstrip("0").rstrip(".")
-        disp_diameter += " " + column_units["Diameter"]
-        diameter_column_number = getColumnNumber(
-            column_headers, diameter_list, "Diameter"
-        )
-        diameter_column_offset = column_width * (diameter_column_number - 1)
-        return getSVGDataCell(
-            disp_diameter,
-            diameter_column_offset,
-            y_offset,
-            column_width,
-            row_height,
-            font_family,
-            font_size,
-            "bom_table_cell_column_{}".format(diameter_column_number),
-        )
-
-    def getRebarsCountCellSVG(reinforcement_objs: List) -> ElementTree.Element:
-        rebars_count_column_number = getColumnNumber(
-            column_headers, diameter_list, "RebarsCount"
-        )
-        rebars_count_column_offset = column_width * (
-            rebars_count_column_number - 1
-        )
-        return getSVGDataCell(
-            sum(map(lambda x: x.Amount, reinforcement_objs)),
-            rebars_count_column_offset,
-            y_offset,
-            column_width,
-            row_height,
-            font_family,
-            font_size,
-            "bom_table_cell_column_{}".format(rebars_count_column_number),
+    column_numbers = {
+        column_header: getColumnNumber(
+            column_headers, diameter_list, column_header
         )
+        for column_header in column_headers
+    }
 
-    def getRebarLengthCellSVG(
-        rebar_length: FreeCAD.Units.Quantity,
+    def getDataCellSVG(
+        column_header: str, value: Union[str, float]
     ) -> ElementTree.Element:
-        disp_base_rebar_length = str(
-            round(
-                rebar_length.getValueAs(column_units["RebarLength"]).Value,
-                precision,
-            )
-        )
-        if "." in disp_base_rebar_length:
-            disp_base_rebar_length = disp_base_rebar_length.rstrip("0").rstrip(
-                "."
-            )
-        disp_base_rebar_length += " " + column_units["RebarLength"]
-
-        rebar_length_column_number = getColumnNumber(
-            column_headers, diameter_list, "RebarLength"
-        )
-        rebar_length_column_offset = column_width * (
-            rebar_length_column_number - 1
-        )
+        column_number = column_numbers[column_header]
         return getSVGDataCell(
-            disp_base_rebar_length,
-            rebar_length_column_offset,
+            value,
+            column_width * (column_number - 1),
             y_offset,
             column_width,
             row_height,
             font_family,
             font_size,
-            "bom_table_cell_column_{}".format(rebar_length_column_number),
+            "bom_table_cell_column_{}".format(column_number),
         )
 
     def getRebarTotalLengthCellsSVG(
-        _rebar_total_length: FreeCAD.Units.Quantity,
+        _rebar_total_length: float, rebar_dia_index: int
     ) -> List[ElementTree.Element]:
-        disp_rebar_total_length = str(
-            round(
-                _rebar_total_length.getValueAs(
-                    column_units["RebarsTotalLength"]
-                ).Value,
-                precision,
+        disp_rebar_total_length = (
+            getDisplayValue(
+                _rebar_total_length, column_units["RebarsTotalLength"], "mm"
             )
+            + " "
+            + column_units["RebarsTotalLength"]
         )
-        if "." in disp_rebar_total_length:
-            disp_rebar_total_length = disp_rebar_total_length.rstrip(
-                "0"
-            ).rstrip(".")
-        disp_rebar_total_length += " " + column_units["RebarsTotalLength"]
-
-        rebar_total_length_column_number = getColumnNumber(
-            column_headers, diameter_list, "RebarsTotalLength"
-        )
+
+        rebar_total_length_column_number = column_numbers["RebarsTotalLength"]
         rebar_total_length_column_offset = column_width * (
             rebar_total_length_column_number - 1
         )
         rebar_total_length_cells_svg = []
-        for dia_index, dia in enumerate(diameter_list):
-            if dia == base_rebar.Diameter:
+        for dia_index in range(len(diameter_list)):
+            if dia_index == rebar_dia_index:
                 rebar_total_length_cells_svg.append(
                     getSVGDataCell(
                         disp_rebar_total_length,
                         rebar_total_length_column_offset
-                        + (diameter_list.index(dia)) * column_width,
+                        + dia_index * column_width,
                         y_offset,
                         column_width,
                         row_height,
@@ -511,7 +425,7 @@ def makeBillOfMaterialSVG(
                 rebar_total_length_cells_svg.append(
                     getSVGRectangle(
                         rebar_total_length_column_offset
-                        + diameter_list.index(dia) * column_width,
+                        + dia_index * column_width,
                         y_offset,
                         column_width,
                         row_height,
@@ -522,133 +436,66 @@ def makeBillOfMaterialSVG(
                 )
         return rebar_total_length_cells_svg
 
-    if reinforcement_group_by == "Mark":
-        mark_reinforcements_dict = getMarkReinforcementsDict(rebar_objects)
-        for mark_number in mark_reinforcements_dict:
-            base_rebar = getBaseRebar(mark_reinforcements_dict[mark_number][0])
-
-            bom_row_svg = ElementTree.Element("g")
-            # TODO: Modify logic of str(current_row - first_row + 1)
-            # first_row variable maybe eliminated
-            bom_row_svg.set(
-                "id", "BOM_table_row" + str(current_row - first_row + 1)
+    for row in range(len(bom_table)):
+        bom_row_svg = ElementTree.Element("g")
+        bom_row_svg.set("id", "BOM_table_row" + str(row + 1))
+
+        if "Host" in column_headers:
+            bom_row_svg.append(
+                getDataCellSVG(
+                    "Host",
+                    bom_table.hosts[row]
+                    if bom_table.first_host_rows[row]
+                    else "",
+                )
             )
 
-            if "Host" in column_headers:
-                host_label = []
-                for reinforcement in mark_reinforcements_dict[mark_number]:
-                    if (
-                        reinforcement.Host
-                        and reinforcement.Host.Label not in host_label
-                    ):
-                        host_label.append(reinforcement.Host.Label)
-                bom_row_svg.append(getHostCellSVG(",".join(sorted(host_label))))
-
-            if "Mark" in column_headers:
-                bom_row_svg.append(getMarkCellSVG(mark_number))
-
-            if "RebarsCount" in column_headers:
-                bom_row_svg.append(
-                    getRebarsCountCellSVG(mark_reinforcements_dict[mark_number])
-                )
+        if "Mark" in column_headers:
+            bom_row_svg.append(getDataCellSVG("Mark", bom_table.marks[row]))
 
-            if "Diameter" in column_headers:
-                bom_row_svg.append(getDiameterCellSVG(base_rebar.Diameter))
+        if "RebarsCount" in column_headers:
+            bom_row_svg.append(
+                getDataCellSVG("RebarsCount", int(bom_table.counts[row]))
+            )
 
-            base_rebar_length = FreeCAD.Units.Quantity("0 mm")
-            if "RebarLength" in column_headers:
-                if rebar_length_type == "RealLength":
-                    base_rebar_length = base_rebar.Length
-                else:
-                    base_rebar_length = getRebarSharpEdgedLength(base_rebar)
-                bom_row_svg.append(getRebarLengthCellSVG(base_rebar_length))
-
-            if "RebarsTotalLength" in column_headers:
-                rebar_total_length = FreeCAD.Units.Quantity("0 mm")
-                for reinforcement in mark_reinforcements_dict[mark_number]:
-                    rebar_total_length += (
-                        reinforcement.Amount * base_rebar_length
+        if "Diameter" in column_headers:
+            bom_row_svg.append(
+                getDataCellSVG(
+                    "Diameter",
+                    getDisplayValue(
+                        bom_table.diameters[row],
+                        column_units["Diameter"],
+                        "mm",
                     )
-                dia_total_length_dict[
-                    base_rebar.Diameter.Value
-                ] += rebar_total_length
-
-                bom_row_svg.extend(
-                    getRebarTotalLengthCellsSVG(rebar_total_length)
+                    + " "
+                    + column_units["Diameter"],
                 )
-
-            bom_table_svg.append(bom_row_svg)
-            y_offset += row_height
-            current_row += 1
-    else:
-        host_reinforcements_dict = getHostReinforcementsDict(rebar_objects)
-        for rebar_host, reinforcement_list in host_reinforcements_dict.items():
-            mark_reinforcements_dict = getMarkReinforcementsDict(
-                reinforcement_list
             )
-            add_host_in_column = True
-            for mark_number in mark_reinforcements_dict:
-                base_rebar = getBaseRebar(
-                    mark_reinforcements_dict[mark_number][0]
-                )
-
-                bom_row_svg = ElementTree.Element("g")
-                # TODO: Modify logic of str(current_row - first_row + 1)
-                # first_row variable maybe eliminated
-                bom_row_svg.set(
-                    "id", "BOM_table_row" + str(current_row - first_row + 1)
-                )
 
-                if "Host" in column_headers:
-                    if add_host_in_column:
-                        add_host_in_column = False
-                        host_label = (
-                            rebar_host.Label
-                            if hasattr(rebar_host, "Label")
-                            else str(rebar_host)
-                        )
-                    else:
-                        host_label = ""
-                    bom_row_svg.append(getHostCellSVG(host_label))
-
-                if "Mark" in column_headers:
-                    bom_row_svg.append(getMarkCellSVG(mark_number))
-
-                if "RebarsCount" in column_headers:
-                    bom_row_svg.append(
-                        getRebarsCountCellSVG(
-                            mark_reinforcements_dict[mark_number]
-                        )
-                    )
-
-                if "Diameter" in column_headers:
-                    bom_row_svg.append(getDiameterCellSVG(base_rebar.Diameter))
-
-                base_rebar_length = FreeCAD.Units.Quantity("0 mm")
-                if "RebarLength" in column_headers:
-                    if rebar_length_type == "RealLength":
-                        base_rebar_length = base_rebar.Length
-                    else:
-                        base_rebar_length = getRebarSharpEdgedLength(base_rebar)
-                    bom_row_svg.append(getRebarLengthCellSVG(base_rebar_length))
-
-                rebar_total_length = FreeCAD.Units.Quantity("0 mm")
-                for reinforcement in mark_reinforcements_dict[mark_number]:
-                    rebar_total_length += (
-                        reinforcement.Amount * base_rebar_length
+        if "RebarLength" in column_headers:
+            bom_row_svg.append(
+                getDataCellSVG(
+                    "RebarLength",
+                    getDisplayValue(
+                        bom_table.unit_lengths[row],
+                        column_units["RebarLength"],
+                        "mm",
                     )
-                dia_total_length_dict[
-                    base_rebar.Diameter.Value
-                ] += rebar_total_length
+                    + " "
+                    + column_units["RebarLength"],
+                )
+            )
 
-                if "RebarsTotalLength" in column_headers:
-                    bom_row_svg.extend(
-                        getRebarTotalLengthCellsSVG(rebar_total_length)
-                    )
+        if "RebarsTotalLength" in column_headers:
+            bom_row_svg.extend(
+                getRebarTotalLengthCellsSVG(
+                    bom_table.total_lengths[row],
+                    bom_table.diameter_indices[row],
+                )
+            )
 
-                bom_table_svg.append(bom_row_svg)
-                y_offset += row_height
-                current_row += 1
+        bom_table_svg.append(bom_row_svg)
+        y_offset += row_height
 
     if "RebarsTotalLength" in column_headers:
         bom_table_svg.append(
@@ -714,20 +561,16 @@ def makeBillOfMaterialSVG(
                 )
             )
 
-            for i, dia in enumerate(diameter_list):
-                disp_dia_total_length = str(
-                    round(
-                        dia_total_length_dict[dia.Value]
-                        .getValueAs(column_units["RebarsTotalLength"])
-                        .Value,
-                        precision,
+            for i in range(len(diameter_list)):
+                disp_dia_total_length = (
+                    getDisplayValue(
+                        bom_table.diameter_total_lengths[i],
+                        column_units["RebarsTotalLength"],
+                        "mm",
                     )
+                    + " "
+                    + column_units["RebarsTotalLength"]
                 )
-                if "." in disp_dia_total_length:
-                    disp_dia_total_length = disp_dia_total_length.rstrip(
-                        "0"
-                    ).rstrip(".")
-                disp_dia_total_length += " " + column_units["RebarsTotalLength"]
 
                 bom_data_total_svg.append(
                     getSVGDataCell(
@@ -742,23 +585,15 @@ def makeBillOfMaterialSVG(
                     )
                 )
 
-                if dia.Value in dia_weight_map:
-                    disp_dia_weight = str(
-                        round(
-                            dia_weight_map[dia.Value]
-                            .getValueAs(
-                                "kg/" + column_units["RebarsTotalLength"]
-                            )
-                            .Value,
-                            precision,
-                        )
-                    )
-                    if "." in disp_dia_weight:
-                        disp_dia_weight = disp_dia_weight.rstrip("0").rstrip(
-                            "."
+                if bom_table.hasDiameterWeight(i):
+                    disp_dia_weight = (
+                        getDisplayValue(
+                            bom_table.diameter_weights[i],
+                            "kg/" + column_units["RebarsTotalLength"],
+                            "kg/m",
                         )
-                    disp_dia_weight += (
-                        " kg/" + column_units["RebarsTotalLength"]
+                        + " kg/"
+                        + column_units["RebarsTotalLength"]
                     )
 
                     bom_data_total_svg.append(
@@ -775,19 +610,9 @@ def makeBillOfMaterialSVG(
                             ),
                         )
                     )
-                    disp_total_weight = str(
-                        round(
-                            (
-                                dia_weight_map[dia.Value]
-                                * dia_total_length_dict[dia.Value]
-                            ).Value,
-                            precision,
-                        )
+                    disp_total_weight = getDisplayValue(
+                        bom_table.diameter_total_weights[i], "kg", "kg"
                     )
-                    if "." in disp_total_weight:
-                        disp_total_weight = disp_total_weight.rstrip(
-                            "0"
-                        ).rstrip(".")
                     bom_data_total_svg.append(
                         getSVGDataCell(
                             disp_total_weight + " kg",
@@ -851,20 +676,16 @@ def makeBillOfMaterialSVG(
                         )
                     )
         else:
-            for i, dia in enumerate(diameter_list):
-                disp_dia_total_length = str(
-                    round(
-                        dia_total_length_dict[dia.Value]
-                        .getValueAs(column_units["RebarsTotalLength"])
-                        .Value,
-                        precision,
+            for i in range(len(diameter_list)):
+                disp_dia_total_length = (
+                    getDisplayValue(
+                        bom_table.diameter_total_lengths[i],
+                        column_units["RebarsTotalLength"],
+                        "mm",
                     )
+                    + " "
+                    + column_units["RebarsTotalLength"]
                 )
-                if "." in disp_dia_total_length:
-                    disp_dia_total_length = disp_dia_total_length.rstrip(
-                        "0"
-                    ).rstrip(".")
-                disp_dia_total_length += " " + column_units["RebarsTotalLength"]
 
                 bom_data_total_svg.append(
                     getSVGDataCell(
@@ -879,23 +700,15 @@ def makeBillOfMaterialSVG(
                     )
                 )
 
-                if dia.Value in dia_weight_map:
-                    disp_dia_weight = str(
-                        round(
-                            dia_weight_map[dia.Value]
-                            .getValueAs(
-                                "kg/" + column_units["RebarsTotalLength"]
-                            )
-                            .Value,
-                            precision,
+                if bom_table.hasDiameterWeight(i):
+                    disp_dia_weight = (
+                        getDisplayValue(
+                            bom_table.diameter_weights[i],
+                            "kg/" + column_units["RebarsTotalLength"],
+                            "kg/m",
                         )
-                    )
-                    if "." in disp_dia_weight:
-                        disp_dia_weight = disp_dia_weight.rstrip("0").rstrip(
-                            "."
-                        )
-                    disp_dia_weight += (
-                        " kg/" + column_units["RebarsTotalLength"]
+                        + " kg/"
+                        + column_units["RebarsTotalLength"]
                     )
 
                     bom_data_total_svg.append(
@@ -910,19 +723,9 @@ def makeBillOfMaterialSVG(
                             "bom_table_cell_column_{}".format(i + 1),
                         )
                     )
-                    disp_total_weight = str(
-                        round(
-                            (
-                                dia_weight_map[dia.Value]
-                                * dia_total_length_dict[dia.Value]
-                            ).Value,
-                            precision,
-                        )
+                    disp_total_weight = getDisplayValue(
+                        bom_table.diameter_total_weights[i], "kg", "kg"
                     )
-                    if "." in disp_total_weight:
-                        disp_total_weight = disp_total_weight.rstrip(
-                            "0"
-                        ).rstrip(".")
                     bom_data_total_svg.append(
                         getSVGDataCell(
                             disp_total_weight + " kg",
@@ -25,26 +25,25 @@ __title__ = "Bill Of Material Spreadsheet"
 __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
+import csv
+import os
+import string
+import tempfile
 from typing import (
     Optional,
     Dict,
     List,
     OrderedDict as OrderedDictType,
-    Union,
 )
 
 import FreeCAD
 
 from .BOMPreferences import BOMPreferences
 from .BOMfunc import (
-    getMarkReinforcementsDict,
-    getRebarSharpEdgedLength,
     getReinforcementRebarObjects,
-    getUniqueDiameterList,
     fixColumnUnits,
-    getBaseRebar,
-    getHostReinforcementsDict,
 )
+from .BOMTable import BOMTable
 
 
 # TODO: Use(Uncomment) typing.Literal for minimum python3.8
@@ -126,6 +125,297 @@ def getHeaderColumn(column_headers, diameter_list, column_header):
     return column
 
 
+def setSheetCells(spreadsheet, cells: Dict[str, str]) -> None:
+    """setSheetCells(Spreadsheet, Cells):
+    cells is a dictionary with cell address as key and cell content as value.
+    e.g. {
+            "A3": "'Beam",
+            "B3": "'1",
+            "C3": "'4",
+            "D3": "12.0 mm",
+        }
+
+    Writes all cells to spreadsheet through a single Spreadsheet.importFile()
+    call, instead of setting them one by one. Spreadsheet is cleared before
+    cells are written, so cells must be written before setting any header,
+    merged cells or display units.
+
+    importFile() reads one row per line, so newlines in cell contents are
+    replaced with spaces. Tabs, quotes and backslashes are kept: cells are
+    quoted as required, and quotes and backslashes are escaped by backslash,
+    which importFile() splits back the same way.
+    """
+    columns = {}
+    cell_rows = []
+    for address, content in cells.items():
+        row = address.lstrip(string.ascii_uppercase)
+        column_letters = address[: len(address) - len(row)]
+        column = columns.get(column_letters)
+        if column is None:
+            column = 0
+            for letter in column_letters:
+                column = 26 * column + ord(letter) - ord("A") + 1
+            columns[column_letters] = column
+        row = int(row) - 1
+        if len(cell_rows) <= row:
+            cell_rows.extend([] for _ in range(row + 1 - len(cell_rows)))
+        cell_row = cell_rows[row]
+        if len(cell_row) < column:
+            cell_row.extend([""] * (column - len(cell_row)))
+        cell_row[column - 1] = content.replace("\n", " ")
+
+    # Sheet.importFile() reads one row per line
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".csv", newline="", encoding="utf-8", delete=False
+    ) as csv_file:
+        csv.writer(
+            csv_file,
+            delimiter="\t",
+            quotechar='"',
+            escapechar="\\",
+            doublequote=False,
+            lineterminator="\n",
+        ).writerows(cell_rows)
+    try:
+        spreadsheet.importFile(csv_file.name, "\t", '"', "\\")
+    finally:
+        os.remove(csv_file.name)
+
+
+def getDataColumns(column_headers, diameter_list) -> Dict[str, str]:
+    """getDataColumns(ColumnHeadersConfig, DiameterList):
+    Returns dictionary with keys of column_headers as key and their spreadsheet
+    column as value.
+    """
+    return {
+        column_header: getHeaderColumn(
+            column_headers, diameter_list, column_header
+        )
+        for column_header in column_headers
+    }
+
+
+def getFirstDataRow(column_headers) -> int:
+    """getFirstDataRow(ColumnHeadersConfig):
+    Returns number of first spreadsheet row below column headers.
+    """
+    if "RebarsTotalLength" in column_headers:
+        return 3
+    return 2
+
+
+def getTotalColumns(column_headers, diameter_list, data_columns):
+    """getTotalColumns(ColumnHeadersConfig, DiameterList, DataColumns):
+    Returns first diameter column, first text column and last text column of
+    total length, weight/m and total weight rows.
+    """
+    if list(column_headers.keys()).index("RebarsTotalLength") != 0:
+        first_dia_column = data_columns["RebarsTotalLength"]
+        first_txt_column = "A"
+        last_txt_column = chr(ord(first_dia_column) - 1)
+    else:
+        first_dia_column = "A"
+        first_txt_column = chr(ord("A") + len(diameter_list))
+        last_txt_column = chr(ord(first_txt_column) + len(column_headers) - 2)
+    return first_dia_column, first_txt_column, last_txt_column
+
+
+def getRowCells(
+    bom_table: BOMTable,
+    row: int,
+    column_headers: OrderedDictType[str, str],
+    data_columns: Dict[str, str],
+) -> Dict[str, str]:
+    """getRowCells(BOMTable, Row, ColumnHeadersConfig, DataColumns):
+    Returns dictionary with cell address as key and cell content as value for
+    row of bom_table.
+    """
+    row_number = str(getFirstDataRow(column_headers) + row)
+    cells = {}
+    if "Host" in column_headers:
+        if bom_table.first_host_rows[row]:
+            host_label = bom_table.hosts[row]
+        else:
+            host_label = ""
+        cells[data_columns["Host"] + row_number] = "'" + host_label
+
+    if "Mark" in column_headers:
+        cells[data_columns["Mark"] + row_number] = "'" + bom_table.marks[row]
+
+    if "RebarsCount" in column_headers:
+        cells[data_columns["RebarsCount"] + row_number] = "'" + str(
+            bom_table.counts[row]
+        )
+
+    if "Diameter" in column_headers:
+        cells[data_columns["Diameter"] + row_number] = "{} mm".format(
+            bom_table.diameters[row]
+        )
+
+    if "RebarLength" in column_headers:
+        cells[data_columns["RebarLength"] + row_number] = "{} mm".format(
+            bom_table.unit_lengths[row]
+        )
+
+    if "RebarsTotalLength" in column_headers:
+        dia_column = chr(
+            ord(data_columns["RebarsTotalLength"])
+            + int(bom_table.diameter_indices[row])
+        )
+        cells[dia_column + row_number] = "{} mm".format(
+            bom_table.total_lengths[row]
+        )
+    return cells
+
+
+def getTotalCells(
+    bom_table: BOMTable,
+    column_headers: OrderedDictType[str, str],
+    column_units: Dict[str, str],
+    data_columns: Dict[str, str],
+) -> Dict[str, str]:
+    """getTotalCells(BOMTable, ColumnHeadersConfig, ColumnUnitsDict,
+    DataColumns):
+    Returns dictionary with cell address as key and cell content as value for
+    total length, weight/m and total weight of all rebars.
+    """
+    cells = {}
+    if "RebarsTotalLength" not in column_headers:
+        return cells
+    total_row = getFirstDataRow(column_headers) + len(bom_table) + 3
+    first_dia_column, first_txt_column, _ = getTotalColumns(
+        column_headers, bom_table.diameter_list, data_columns
+    )
+    cells[first_txt_column + str(total_row)] = (
+        "Total length in " + column_units["RebarsTotalLength"] + "/Diameter"
+    )
+    cells[first_txt_column + str(total_row + 1)] = (
+        "Weight in Kg/" + column_units["RebarsTotalLength"]
+    )
+    cells[
+        first_txt_column + str(total_row + 2)
+    ] = "Total Weight in Kg/Diameter"
+    for i in range(len(bom_table.diameter_list)):
+        dia_column = chr(ord(first_dia_column) + i)
+        cells[dia_column + str(total_row)] = "{} mm".format(
+            bom_table.diameter_total_lengths[i]
+        )
+        if bom_table.hasDiameterWeight(i):
+            cells[dia_column + str(total_row + 1)] = "{} kg/m".format(
+                bom_table.diameter_weights[i]
+            )
+            cells[dia_column + str(total_row + 2)] = "{} kg".format(
+                bom_table.diameter_total_weights[i]
+            )
+    return cells
+
+
+def fillBillOfMaterial(
+    spreadsheet,
+    bom_table: BOMTable,
+    column_headers: OrderedDictType[str, str],
+    column_units: Dict[str, str],
+) -> None:
+    """fillBillOfMaterial(Spreadsheet, BOMTable, ColumnHeadersConfig,
+    ColumnUnitsDict):
+    Clears spreadsheet and writes headers, rows and totals of bom_table to it.
+    """
+    diameter_list = bom_table.diameter_list
+    first_row = getFirstDataRow(column_headers)
+    last_row = first_row + len(bom_table)
+    data_columns = getDataColumns(column_headers, diameter_list)
+
+    # Prepare contents of all data cells, to write them to spreadsheet at once
+    cells = {}
+    for row in range(len(bom_table)):
+        cells.update(getRowCells(bom_table, row, column_headers, data_columns))
+    cells.update(
+        getTotalCells(bom_table, column_headers, column_units, data_columns)
+    )
+    setSheetCells(spreadsheet, cells)
+
+    # Add column headers
+    addSheetHeaders(column_headers, diameter_list, spreadsheet)
+
+    # Set display units
+    if "Diameter" in column_headers:
+        column = data_columns["Diameter"]
+        spreadsheet.setDisplayUnit(
+            column + str(first_row) + ":" + column + str(last_row),
+            column_units["Diameter"],
+        )
+    if "RebarLength" in column_headers:
+        column = data_columns["RebarLength"]
+        spreadsheet.setDisplayUnit(
+            column + str(first_row) + ":" + column + str(last_row),
+            column_units["RebarLength"],
+        )
+    if "RebarsTotalLength" in column_headers:
+        start_column = data_columns["RebarsTotalLength"]
+        end_column = chr(ord(start_column) + len(diameter_list) - 1)
+        spreadsheet.setDisplayUnit(
+            start_column + str(first_row) + ":" + end_column + str(last_row),
+            column_units["RebarsTotalLength"],
+        )
+
+        # Format total length, weight/m and total weight of all rebars
+        total_row = last_row + 3
+        first_dia_column, first_txt_column, last_txt_column = getTotalColumns(
+            column_headers, diameter_list, data_columns
+        )
+        for row in range(total_row, total_row + 3):
+            spreadsheet.mergeCells(
+                first_txt_column + str(row) + ":" + last_txt_column + str(row)
+            )
+        for i in range(len(diameter_list)):
+            dia_column = chr(ord(first_dia_column) + i)
+            spreadsheet.setDisplayUnit(
+                dia_column + str(total_row),
+                column_units["RebarsTotalLength"],
+            )
+            if bom_table.hasDiameterWeight(i):
+                spreadsheet.setDisplayUnit(
+                    dia_column + str(total_row + 1),
+                    "kg/" + column_units["RebarsTotalLength"],
+                )
+                spreadsheet.setDisplayUnit(
+                    dia_column + str(total_row + 2), "kg"
+                )
+
+
+def updateBillOfMaterialRows(
+    spreadsheet,
+    bom_table: BOMTable,
+    rows: List[int],
+    column_headers: OrderedDictType[str, str],
+    column_units: Dict[str, str],
+) -> None:
+    """updateBillOfMaterialRows(Spreadsheet, BOMTable, Rows,
+    ColumnHeadersConfig, ColumnUnitsDict):
+    Rewrites only given rows and totals of bom_table in spreadsheet, previously
+    filled by fillBillOfMaterial(). rows is the list of row indices returned by
+    BOMTable.updateRows(), so rows, diameters and their order must be unchanged
+    since spreadsheet was filled.
+    """
+    data_columns = getDataColumns(column_headers, bom_table.diameter_list)
+    first_row = getFirstDataRow(column_headers)
+    for row in rows:
+        if "RebarsTotalLength" in column_headers:
+            # Clear total length of previous diameter of row
+            row_number = str(first_row + row)
+            for i in range(len(bom_table.diameter_list)):
+                dia_column = chr(ord(data_columns["RebarsTotalLength"]) + i)
+                spreadsheet.set(dia_column + row_number, "")
+        for address, content in getRowCells(
+            bom_table, row, column_headers, data_columns
+        ).items():
+            spreadsheet.set(address, content)
+    for address, content in getTotalCells(
+        bom_table, column_headers, column_units, data_columns
+    ).items():
+        spreadsheet.set(address, content)
+
+
 def makeBillOfMaterial(
     # column_headers: Optional[
     #     OrderedDictType[
@@ -224,337 +514,15 @@ def makeBillOfMaterial(
         "Spreadsheet::Sheet", obj_name
     )
 
-    # Get unique diameter list
-    diameter_list = getUniqueDiameterList(reinforcement_objects)
-
-    # Add column headers
-    addSheetHeaders(column_headers, diameter_list, bill_of_material)
-
-    # Dictionary to store total length of rebars corresponding to its dia
-    dia_total_length_dict = {
-        dia.Value: FreeCAD.Units.Quantity("0 mm") for dia in diameter_list
-    }
-
-    # Add data to spreadsheet
-    if "RebarsTotalLength" in column_headers:
-        first_row = 3
-        current_row = 3
-    else:
-        first_row = 2
-        current_row = 2
-
-    def addHostCellData(_host_label: str) -> None:
-        bill_of_material.set(
-            getHeaderColumn(column_headers, diameter_list, "Host")
-            + str(current_row),
-            "'" + _host_label,
-        )
-
-    def addMarkCellData(rebar_mark: Union[str, float]) -> None:
-        bill_of_material.set(
-            getHeaderColumn(column_headers, diameter_list, "Mark")
-            + str(current_row),
-            "'" + str(rebar_mark),
-        )
-
-    def addRebarsCountCellData(reinforcement_objs: List) -> None:
-        bill_of_material.set(
-            getHeaderColumn(column_headers, diameter_list, "RebarsCount")
-            + str(current_row),
-            "'" + str(sum(map(lambda x: x.Amount, reinforcement_objs))),
-        )
-
-    def addDiameterCellData(rebar_diameter: FreeCAD.Units.Quantity) -> None:
-        bill_of_material.set(
-            getHeaderColumn(column_headers, diameter_list, "Diameter")
-            + str(current_row),
-            str(rebar_diameter),
-        )
-
-    def addRebarLengthCellData(rebar_length: FreeCAD.Units.Quantity) -> None:
-        bill_of_material.set(
-            getHeaderColumn(column_headers, diameter_list, "RebarLength")
-            + str(current_row),
-            str(rebar_length),
-        )
-
-    def addRebarTotalLengthCellData(
-        _rebar_total_length: FreeCAD.Units.Quantity,
-    ) -> None:
-        bill_of_material.set(
-            chr(
-                ord(
-                    getHeaderColumn(
-                        column_headers, diameter_list, "RebarsTotalLength"
-                    )
-                )
-                + diameter_list.index(base_rebar.Diameter)
-            )
-            + str(current_row),
-            str(_rebar_total_length),
-        )
-
-    if reinforcement_group_by == "Mark":
-        mark_reinforcements_dict = getMarkReinforcementsDict(rebar_objects)
-        for mark_number in mark_reinforcements_dict:
-            base_rebar = getBaseRebar(mark_reinforcements_dict[mark_number][0])
-
-            if "Host" in column_headers:
-                host_label = []
-                for reinforcement in mark_reinforcements_dict[mark_number]:
-                    if (
-                        reinforcement.Host
-                        and reinforcement.Host.Label not in host_label
-                    ):
-                        host_label.append(reinforcement.Host.Label)
-                addHostCellData(",".join(sorted(host_label)))
-
-            if "Mark" in column_headers:
-                addMarkCellData(mark_number)
-
-            if "RebarsCount" in column_headers:
-                addRebarsCountCellData(mark_reinforcements_dict[mark_number])
-
-            if "Diameter" in column_headers:
-                addDiameterCellData(base_rebar.Diameter)
-
-            base_rebar_length = FreeCAD.Units.Quantity("0 mm")
-            if "RebarLength" in column_headers:
-                if rebar_length_type == "RealLength":
-                    base_rebar_length = base_rebar.Length
-                else:
-                    base_rebar_length = getRebarSharpEdgedLength(base_rebar)
-                addRebarLengthCellData(base_rebar_length)
-
-            if "RebarsTotalLength" in column_headers:
-                rebar_total_length = FreeCAD.Units.Quantity("0 mm")
-                for reinforcement in mark_reinforcements_dict[mark_number]:
-                    rebar_total_length += (
-                        reinforcement.Amount * base_rebar_length
-                    )
-                dia_total_length_dict[
-                    base_rebar.Diameter.Value
-                ] += rebar_total_length
-
-                addRebarTotalLengthCellData(rebar_total_length)
-
-            current_row += 1
-    else:
-        host_reinforcements_dict = getHostReinforcementsDict(rebar_objects)
-        for rebar_host, reinforcement_list in host_reinforcements_dict.items():
-            mark_reinforcements_dict = getMarkReinforcementsDict(
-                reinforcement_list
-            )
-            add_host_in_column = True
-            for mark_number in mark_reinforcements_dict:
-                base_rebar = getBaseRebar(
-                    mark_reinforcements_dict[mark_number][0]
-                )
-
-                if "Host" in column_headers:
-                    if add_host_in_column:
-                        add_host_in_column = False
-                        host_label = (
-                            rebar_host.Label
-                            if hasattr(rebar_host, "Label")
-                            else str(rebar_host)
-                        )
-                    else:
-                        host_label = ""
-                    addHostCellData(host_label)
-
-                if "Mark" in column_headers:
-                    addMarkCellData(mark_number)
-
-                if "RebarsCount" in column_headers:
-                    addRebarsCountCellData(
-                        mark_reinforcements_dict[mark_number]
-                    )
-
-                if "Diameter" in column_headers:
-                    addDiameterCellData(base_rebar.Diameter)
-
-                base_rebar_length = FreeCAD.Units.Quantity("0 mm")
-                if "RebarLength" in column_headers:
-                    if rebar_length_type == "RealLength":
-                        base_rebar_length = base_rebar.Length
-                    else:
-                        base_rebar_length = getRebarSharpEdgedLength(base_rebar)
-                    addRebarLengthCellData(base_rebar_length)
-
-                if "RebarsTotalLength" in column_headers:
-                    rebar_total_length = FreeCAD.Units.Quantity("0 mm")
-                    for reinforcement in mark_reinforcements_dict[mark_number]:
-                        rebar_total_length += (
-                            reinforcement.Amount * base_rebar_length
-                        )
-                    dia_total_length_dict[
-                        base_rebar.Diameter.Value
-                    ] += rebar_total_length
-
-                    addRebarTotalLengthCellData(rebar_total_length)
-
-                current_row += 1
-
-    # Set display units
-    if "Diameter" in column_headers:
-        column = getHeaderColumn(column_headers, diameter_list, "Diameter")
-        bill_of_material.setDisplayUnit(
-            column + str(first_row) + ":" + column + str(current_row),
-            column_units["Diameter"],
-        )
-    if "RebarLength" in column_headers:
-        column = getHeaderColumn(column_headers, diameter_list, "RebarLength")
-        bill_of_material.setDisplayUnit(
-            column + str(first_row) + ":" + column + str(current_row),
-            column_units["RebarLength"],
-        )
-    if "RebarsTotalLength" in column_headers:
-        start_column = getHeaderColumn(
-            column_headers, diameter_list, "RebarsTotalLength"
-        )
-        end_column = chr(ord(start_column) + len(diameter_list) - 1)
-        bill_of_material.setDisplayUnit(
-            start_column + str(first_row) + ":" + end_column + str(current_row),
-            column_units["RebarsTotalLength"],
-        )
-
-    current_row += 3
-    # Display total length, weight/m and total weight of all rebars
-    if "RebarsTotalLength" in column_headers:
-        if list(column_headers.keys()).index("RebarsTotalLength") != 0:
-            first_dia_column = getHeaderColumn(
-                column_headers, diameter_list, "RebarsTotalLength"
-            )
-            bill_of_material.mergeCells(
-                "A"
-                + str(current_row)
-                + ":"
-                + chr(ord(first_dia_column) - 1)
-                + str(current_row)
-            )
-            bill_of_material.mergeCells(
-                "A"
-                + str(current_row + 1)
-                + ":"
-                + chr(ord(first_dia_column) - 1)
-                + str(current_row + 1)
-            )
-            bill_of_material.mergeCells(
-                "A"
-                + str(current_row + 2)
-                + ":"
-                + chr(ord(first_dia_column) - 1)
-                + str(current_row + 2)
-            )
-            bill_of_material.set(
-                "A" + str(current_row),
-                "Total length in "
-                + column_units["RebarsTotalLength"]
-                + "/Diameter",
-            )
-            bill_of_material.set(
-                "A" + str(current_row + 1),
-                "Weight in Kg/" + column_units["RebarsTotalLength"],
-            )
-            bill_of_material.set(
-                "A" + str(current_row + 2), "Total Weight in Kg/Diameter"
-            )
-            for i, dia in enumerate(diameter_list):
-                bill_of_material.set(
-                    chr(ord(first_dia_column) + i) + str(current_row),
-                    str(dia_total_length_dict[dia.Value]),
-                )
-                bill_of_material.setDisplayUnit(
-                    chr(ord(first_dia_column) + i) + str(current_row),
-                    column_units["RebarsTotalLength"],
-                )
-                if dia.Value in dia_weight_map:
-                    bill_of_material.set(
-                        chr(ord(first_dia_column) + i) + str(current_row + 1),
-                        str(dia_weight_map[dia.Value]),
-                    )
-                    bill_of_material.set(
-                        chr(ord(first_dia_column) + i) + str(current_row + 2),
-                        str(
-                            dia_weight_map[dia.Value]
-                            * dia_total_length_dict[dia.Value]
-                        ),
-                    )
-                    bill_of_material.setDisplayUnit(
-                        chr(ord(first_dia_column) + i) + str(current_row + 1),
-                        "kg/" + column_units["RebarsTotalLength"],
-                    )
-                    bill_of_material.setDisplayUnit(
-                        chr(ord(first_dia_column) + i) + str(current_row + 2),
-                        "kg",
-                    )
-        else:
-            for i, dia in enumerate(diameter_list):
-                bill_of_material.set(
-                    chr(ord("A") + i) + str(current_row),
-                    str(dia_total_length_dict[dia.Value]),
-                )
-                bill_of_material.setDisplayUnit(
-                    chr(ord("A") + i) + str(current_row),
-                    column_units["RebarsTotalLength"],
-                )
-                if dia.Value in dia_weight_map:
-                    bill_of_material.set(
-                        chr(ord("A") + i) + str(current_row + 1),
-                        str(dia_weight_map[dia.Value]),
-                    )
-                    bill_of_material.set(
-                        chr(ord("A") + i) + str(current_row + 2),
-                        str(
-                            dia_weight_map[dia.Value]
-                            * dia_total_length_dict[dia.Value]
-                        ),
-                    )
-                    bill_of_material.setDisplayUnit(
-                        chr(ord("A") + i) + str(current_row + 1),
-                        "kg/" + column_units["RebarsTotalLength"],
-                    )
-                    bill_of_material.setDisplayUnit(
-                        chr(ord("A") + i) + str(current_row + 2), "kg"
-                    )
-
-            first_txt_column = chr(ord("A") + len(diameter_list))
-            bill_of_material.mergeCells(
-                first_txt_column
-                + str(current_row)
-                + ":"
-                + chr(ord(first_txt_column) + len(column_headers) - 2)
-                + str(current_row)
-            )
-            bill_of_material.mergeCells(
-                first_txt_column
-                + str(current_row + 1)
-                + ":"
-                + chr(ord(first_txt_column) + len(column_headers) - 2)
-                + str(current_row + 1)
-            )
-            bill_of_material.mergeCells(
-                first_txt_column
-                + str(current_row + 2)
-                + ":"
-                + chr(ord(first_txt_column) + len(column_headers) - 2)
-                + str(current_row + 2)
-            )
-            bill_of_material.set(
-                first_txt_column + str(current_row),
-                "Total length in "
-                + column_units["RebarsTotalLength"]
-                + "/Diameter",
-            )
-            bill_of_material.set(
-                first_txt_column + str(current_row + 1),
-                "Weight in Kg/" + column_units["RebarsTotalLength"],
-            )
-            bill_of_material.set(
-                first_txt_column + str(current_row + 2),
-                "Total Weight in Kg/Diameter",
-            )
+    bom_table = BOMTable(
+        reinforcement_objects,
+        rebar_length_type,
+        reinforcement_group_by,
+        dia_weight_map,
+    )
+    fillBillOfMaterial(
+        bill_of_material, bom_table, column_headers, column_units
+    )
 
     FreeCAD.ActiveDocument.recompute()
     return bill_of_material
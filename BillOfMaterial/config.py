@@ -84,6 +84,11 @@ REBAR_LENGTH_TYPE = "RealLength"
 # It can be "Mark" or "Host"
 REINFORCEMENT_GROUP_BY = "Mark"
 
+# Specifies how same mark with different diameter or length in different
+# documents of project is handled in project BOM
+# It can be "Rename", "Merge" or "Error"
+MARK_COLLISION = "Rename"
+
 
 # ---------------------------------SVG Config---------------------------------
 
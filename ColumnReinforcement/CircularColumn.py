@@ -30,13 +30,13 @@ import math
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 import FreeCAD
-import ArchCommands
 
 from HelicalRebar import makeHelicalRebar, editHelicalRebar
 from Rebarfunc import (
     showWarning,
     getFaceNumber,
     getParametersOfFace,
+    getShapeExtent,
     setGroupProperties,
     setGroupPropertiesValues,
 )
@@ -199,9 +199,7 @@ def makeStraightRebars(
     """
     face = structure.Shape.Faces[(getFaceNumber(facename) - 1)]
     FacePRM = getParametersOfFace(structure, facename, False)
-    column_size = ArchCommands.projectToVector(
-        structure.Shape.copy(), face.normalAt(0, 0)
-    ).Length
+    column_size = getShapeExtent(structure, face.normalAt(0, 0))
     points_list = getPointsOfStraightRebars(
         FacePRM,
         s_cover,
@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from DraftTools import translate
@@ -41,6 +40,7 @@ from Rebarfunc import (
     getSelectedFace,
     getFaceNumber,
     getParametersOfFace,
+    getShapeExtent,
     showWarning,
     check_selected_face,
     facenormalDirection,
@@ -285,11 +285,7 @@ def makeHelicalRebar(
             "element is derived\n"
         )
         return
-    size = (
-        ArchCommands.projectToVector(
-            structure.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getShapeExtent(structure, face.normalAt(0, 0))
     normal = face.normalAt(0, 0)
     # normal = face.Placement.Rotation.inverted().multVec(normal)
     import Arch
@@ -390,11 +386,7 @@ def editHelicalRebar(
     # StructurePRM = getTrueParametersOfStructure(structure)
     # Get parameters of the face where sketch of rebar is drawn
     FacePRM = getParametersOfFace(structure, facename, False)
-    size = (
-        ArchCommands.projectToVector(
-            structure.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getShapeExtent(structure, face.normalAt(0, 0))
     normal = face.normalAt(0, 0)
     # normal = face.Placement.Rotation.inverted().multVec(normal)
     createHelicalWire(
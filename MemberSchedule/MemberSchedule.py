@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Member Schedule Reinforcement"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+import time
+from typing import Dict, List, Tuple
+
+import FreeCAD
+
+from BeamReinforcement import TwoLeggedBeam
+from ColumnReinforcement import CircularColumn
+from ColumnReinforcement.SingleTieMultipleRebars import (
+    makeSingleTieMultipleRebars,
+)
+from Rebarfunc import (
+    getFaceNumber,
+    getParametersOfFace,
+    print_in_freecad_console,
+)
+
+
+# Tolerance in mm for comparing centres and normals of faces of congruent
+# members.
+GEOMETRY_TOLERANCE = 1e-3
+
+# Functions to create reinforcement from template of each type. Each function
+# accepts template parameters as keyword arguments along with structure and
+# facename.
+TEMPLATE_TYPES = {
+    "TwoLeggedBeam": TwoLeggedBeam.makeReinforcement,
+    "SingleTieMultipleRebars": makeSingleTieMultipleRebars,
+    "CircularColumn": CircularColumn.makeReinforcement,
+}
+
+
+def getMemberSectionKey(structure, facename: str) -> Tuple:
+    """getMemberSectionKey(Structure, Facename):
+    Returns key which is same for the structural members which are congruent
+    i.e. members differ only in placement.
+    """
+    shape = structure.Shape
+    face_length, face_width = getParametersOfFace(structure, facename)[0]
+    return (
+        round(shape.Volume, 3),
+        round(shape.Area, 3),
+        len(shape.Faces),
+        round(face_length, 3),
+        round(face_width, 3),
+    )
+
+
+def getFaceEdgePlacement(face, edge, reverse: bool = False):
+    """getFaceEdgePlacement(Face, Edge, [Reverse]):
+    Returns placement of local coordinate system of face, with origin at start
+    of edge, x-axis along its tangent and z-axis along face normal. If reverse
+    is True, edge is traversed from its end to its start.
+    """
+    parameter = edge.LastParameter if reverse else edge.FirstParameter
+    origin = edge.valueAt(parameter)
+    x_axis = edge.tangentAt(parameter).normalize()
+    if reverse:
+        x_axis = x_axis.negative()
+    z_axis = face.normalAt(0, 0).normalize()
+    y_axis = z_axis.cross(x_axis)
+    return FreeCAD.Placement(
+        FreeCAD.Matrix(
+            x_axis.x,
+            y_axis.x,
+            z_axis.x,
+            origin.x,
+            x_axis.y,
+            y_axis.y,
+            z_axis.y,
+            origin.y,
+            x_axis.z,
+            y_axis.z,
+            z_axis.z,
+            origin.z,
+            0,
+            0,
+            0,
+            1,
+        )
+    )
+
+
+def getMemberFacePlacement(structure, facename: str):
+    """getMemberFacePlacement(Structure, Facename):
+    Returns placement of local coordinate system of face facename of
+    structure, with origin at start of first edge of face, x-axis along its
+    tangent and z-axis along face normal.
+
+    It is derived from shape of structure, so that it follows geometry of
+    structure no matter if it is placed by Placement of structure or of its
+    base object.
+    """
+    face = structure.Shape.Faces[getFaceNumber(facename) - 1]
+    return getFaceEdgePlacement(face, face.Edges[0])
+
+
+def getFaceGeometry(face) -> Tuple:
+    """getFaceGeometry(Face):
+    Returns tuple of centre of mass of face and face normal at middle of its
+    parameter range.
+    """
+    u_min, u_max, v_min, v_max = face.ParameterRange
+    return (
+        face.CenterOfMass,
+        face.normalAt((u_min + u_max) / 2, (v_min + v_max) / 2).normalize(),
+    )
+
+
+def getFacesMap(prototype_faces: List, faces: List, placement) -> Dict:
+    """getFacesMap(PrototypeFaces, Faces, Placement):
+    Returns dictionary with face name of prototype as key and name of face
+    with the same centre and normal, after prototype face is transformed by
+    placement, as value. prototype_faces and faces are lists of tuples
+    returned by getFaceGeometry().
+
+    Returns None if any prototype face has no matching face.
+    """
+    faces_map = {}
+    for prototype_index, (centre, normal) in enumerate(prototype_faces):
+        centre = placement.multVec(centre)
+        normal = placement.Rotation.multVec(normal)
+        for index, (face_centre, face_normal) in enumerate(faces):
+            if (face_centre - centre).Length < GEOMETRY_TOLERANCE and (
+                face_normal - normal
+            ).Length < GEOMETRY_TOLERANCE:
+                faces_map["Face" + str(prototype_index + 1)] = "Face" + str(
+                    index + 1
+                )
+                break
+        else:
+            return None
+    return faces_map
+
+
+def getMemberPlacementAndFacesMap(
+    prototype_structure, structure, facename: str
+) -> Tuple:
+    """getMemberPlacementAndFacesMap(PrototypeStructure, Structure, Facename):
+    Returns tuple of placement mapping prototype_structure onto congruent
+    structure and dictionary mapping face names of prototype_structure to face
+    names of structure, as returned by getFacesMap().
+
+    Face facename of prototype_structure is mapped to face facename of
+    structure, trying local coordinate system of face on each edge of face of
+    structure, in both directions. The first placement under which all faces
+    of prototype_structure match faces of structure by centre and normal is
+    returned, so that neither order of faces nor order of edges of face need
+    to be same in both structures.
+
+    Returns (None, None) if faces of structures do not match.
+    """
+    prototype_placement_inverse = getMemberFacePlacement(
+        prototype_structure, facename
+    ).inverse()
+    prototype_faces = [
+        getFaceGeometry(face) for face in prototype_structure.Shape.Faces
+    ]
+    faces = [getFaceGeometry(face) for face in structure.Shape.Faces]
+    face = structure.Shape.Faces[getFaceNumber(facename) - 1]
+    for edge in face.Edges:
+        for reverse in (False, True):
+            placement = getFaceEdgePlacement(face, edge, reverse).multiply(
+                prototype_placement_inverse
+            )
+            faces_map = getFacesMap(prototype_faces, faces, placement)
+            if faces_map is not None:
+                return placement, faces_map
+    return None, None
+
+
+def getReinforcementGroupObjects(group) -> Tuple[List, List]:
+    """getReinforcementGroupObjects(Group):
+    Returns tuple of list of group objects and list of rebar objects present in
+    group and its sub-groups.
+    """
+    groups = [group]
+    rebars = []
+    for obj in group.Group:
+        if obj.isDerivedFrom("App::DocumentObjectGroup"):
+            sub_groups, sub_rebars = getReinforcementGroupObjects(obj)
+            groups.extend(sub_groups)
+            rebars.extend(sub_rebars)
+        else:
+            rebars.append(obj)
+    return groups, rebars
+
+
+def mapLinkedObjects(value, objects_map: Dict):
+    """mapLinkedObjects(Value, ObjectsMap):
+    Returns value of link/link list property with document objects replaced
+    by their mapped objects from objects_map.
+    """
+    if isinstance(value, (list, tuple)):
+        return [mapLinkedObjects(x, objects_map) for x in value]
+    if isinstance(value, FreeCAD.DocumentObject):
+        return objects_map.get(value.Name, value)
+    return value
+
+
+def instantiateRebar(rebar, structure, placement, faces_map: Dict):
+    """instantiateRebar(Rebar, Structure, Placement, FacesMap):
+    Creates copy of rebar and its base in structure. Base of rebar attached to
+    faces of prototype structure is re-attached to faces of structure mapped
+    by faces_map, otherwise base is detached and transformed by placement.
+
+    Returns the new rebar.
+    """
+    document = structure.Document
+    base = document.copyObject(rebar.Base)
+    support_property = (
+        "Support" if hasattr(base, "Support") else "AttachmentSupport"
+    )
+    support = getattr(base, support_property, None)
+    if (
+        support
+        and getattr(base, "MapMode", "Deactivated") != "Deactivated"
+        and all(
+            sub_name in faces_map
+            for _, sub_names in support
+            for sub_name in sub_names
+        )
+    ):
+        setattr(
+            base,
+            support_property,
+            [
+                (
+                    structure,
+                    tuple(faces_map[sub_name] for sub_name in sub_names),
+                )
+                for _, sub_names in support
+            ],
+        )
+    else:
+        if support:
+            setattr(base, support_property, [])
+            base.MapMode = "Deactivated"
+        base.Placement = placement.multiply(base.Placement)
+    new_rebar = document.copyObject(rebar)
+    new_rebar.Base = base
+    new_rebar.Host = structure
+    return new_rebar
+
+
+def instantiateReinforcement(
+    prototype_group, structure, placement, faces_map: Dict
+):
+    """instantiateReinforcement(PrototypeGroup, Structure, Placement,
+    FacesMap):
+    Creates copy of reinforcement group prototype_group of prototype structure
+    in congruent structure, without recomputing document. placement and
+    faces_map are returned by getMemberPlacementAndFacesMap() for both
+    structures.
+
+    Returns the new reinforcement group.
+    """
+    document = structure.Document
+    groups, rebars = getReinforcementGroupObjects(prototype_group)
+    objects_map = {}
+    for rebar in rebars:
+        objects_map[rebar.Name] = instantiateRebar(
+            rebar, structure, placement, faces_map
+        )
+    for group in groups:
+        if group == prototype_group:
+            new_group = document.addObject(group.TypeId, group.Name)
+        else:
+            new_group = objects_map[group.getParentGroup().Name].newObject(
+                group.TypeId, group.Name
+            )
+        new_group.Label = group.Label
+        objects_map[group.Name] = new_group
+
+    for group in groups:
+        new_group = objects_map[group.Name]
+        new_group.addObjects(
+            [
+                objects_map[obj.Name]
+                for obj in group.Group
+                if obj.Name in objects_map and obj not in groups
+            ]
+        )
+        for prop in group.PropertiesList:
+            if group.getGroupOfProperty(prop) != "RebarDialog":
+                continue
+            new_group.addProperty(
+                group.getTypeIdOfProperty(prop),
+                prop,
+                "RebarDialog",
+                group.getDocumentationOfProperty(prop),
+            )
+            new_group.setEditorMode(prop, group.getEditorMode(prop))
+            setattr(
+                new_group,
+                prop,
+                mapLinkedObjects(getattr(group, prop), objects_map),
+            )
+        if FreeCAD.GuiUp and group.ViewObject and group.ViewObject.Proxy:
+            group.ViewObject.Proxy.__class__(new_group.ViewObject)
+    return objects_map[prototype_group.Name]
+
+
+def makeReinforcementFromMemberSchedule(member_schedule, templates):
+    """makeReinforcementFromMemberSchedule(MemberSchedule, Templates):
+    Creates reinforcement in all structural members of member_schedule.
+
+    member_schedule is the list of (structure, template_name) tuples.
+
+    templates is the dictionary with template name as key and template
+    dictionary as value. Syntax of template dictionary:
+    {
+        "type": "TwoLeggedBeam" or "SingleTieMultipleRebars" or
+            "CircularColumn",
+        "facename": <facename of structure to create reinforcement>,
+        "parameters": <dictionary of keyword arguments of make function of
+            template type, except structure and facename>,
+    }
+
+    Reinforcement is created from template only once for each group of
+    congruent members sharing the same template, with the first member of the
+    group as prototype. Reinforcement of other members is copied from the
+    prototype and transformed to their placement, and then document is
+    recomputed once. Member whose faces do not match faces of prototype by
+    geometry gets reinforcement created from template.
+
+    Returns tuple of dictionary with structure name as key and reinforcement
+    group as value, and timing summary dictionary.
+    """
+    start_time = time.perf_counter()
+    prototypes = {}
+    reinforcement_groups = {}
+    instances = []
+    prototypes_count = 0
+    prototypes_time = 0
+    for structure, template_name in member_schedule:
+        template = templates[template_name]
+        facename = template["facename"]
+        key = (template_name,) + getMemberSectionKey(structure, facename)
+        if key in prototypes:
+            if prototypes[key] is None:
+                FreeCAD.Console.PrintWarning(
+                    "Skipping {}, as reinforcement of congruent member with "
+                    'template "{}" could not be created.\n'.format(
+                        structure.Label, template_name
+                    )
+                )
+                continue
+            prototype_structure, prototype_group = prototypes[key]
+            placement, faces_map = getMemberPlacementAndFacesMap(
+                prototype_structure, structure, facename
+            )
+            if faces_map is not None:
+                instances.append(
+                    (structure, prototype_group, placement, faces_map)
+                )
+                continue
+            FreeCAD.Console.PrintWarning(
+                "Faces of {} do not match faces of {}, creating its "
+                'reinforcement from template "{}".\n'.format(
+                    structure.Label, prototype_structure.Label, template_name
+                )
+            )
+        prototype_start_time = time.perf_counter()
+        reinforcement = TEMPLATE_TYPES[template["type"]](
+            **template["parameters"],
+            structure=structure,
+            facename=facename,
+        )
+        prototypes_time += time.perf_counter() - prototype_start_time
+        reinforcement_group = getattr(reinforcement, "Object", reinforcement)
+        if reinforcement_group is None:
+            if key in prototypes:
+                FreeCAD.Console.PrintWarning(
+                    'Unable to create reinforcement of {} from template "{}",'
+                    " skipping it.\n".format(structure.Label, template_name)
+                )
+            else:
+                FreeCAD.Console.PrintWarning(
+                    'Unable to create reinforcement of {} from template "{}",'
+                    " skipping it and its congruent members.\n".format(
+                        structure.Label, template_name
+                    )
+                )
+                prototypes[key] = None
+            continue
+        prototypes_count += 1
+        prototypes.setdefault(key, (structure, reinforcement_group))
+        reinforcement_groups[structure.Name] = reinforcement_group
+
+    instances_start_time = time.perf_counter()
+    for structure, prototype_group, placement, faces_map in instances:
+        reinforcement_groups[structure.Name] = instantiateReinforcement(
+            prototype_group, structure, placement, faces_map
+        )
+    instances_time = time.perf_counter() - instances_start_time
+
+    recompute_start_time = time.perf_counter()
+    FreeCAD.ActiveDocument.recompute()
+    recompute_time = time.perf_counter() - recompute_start_time
+
+    timing_summary = {
+        "Members": len(reinforcement_groups),
+        "Prototypes": prototypes_count,
+        "Instances": len(instances),
+        "PrototypesTime": prototypes_time,
+        "InstancesTime": instances_time,
+        "RecomputeTime": recompute_time,
+        "TotalTime": time.perf_counter() - start_time,
+    }
+    print_in_freecad_console(
+        *(
+            "{}: {}".format(key, round(value, 3))
+            for key, value in timing_summary.items()
+        )
+    )
+    return reinforcement_groups, timing_summary
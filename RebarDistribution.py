@@ -28,12 +28,16 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
 
-from Rebarfunc import getFaceNumber
+from Rebarfunc import (
+    getFaceNumber,
+    getShapeExtent,
+    getSpacingString,
+    parseSpacingString,
+)
 
 
 class _RebarDistributionDialog:
@@ -78,7 +82,11 @@ class _RebarDistributionDialog:
         self.form.buttonBox.accepted.connect(self.accept)
         self.form.buttonBox.rejected.connect(lambda: self.form.close())
         if custom_spacing:
-            spacinglist = getTupleOfCustomSpacing(custom_spacing)
+            try:
+                spacinglist = getTupleOfCustomSpacing(custom_spacing)
+            except ValueError as error:
+                FreeCAD.Console.PrintError(str(error) + "\n")
+                spacinglist = []
             if len(spacinglist) >= 1:
                 self.form.amount1.setValue(spacinglist[0][0])
                 self.form.spacing1.setText(f"{spacinglist[0][1]} mm")
@@ -121,18 +129,17 @@ def getCustomSpacingString(
             spacing2 = seg2_area / amount2
         elif amount1 and amount2 and amount3:
             spacing2 = math.floor(seg2_area / amount2)
-    custom_spacing = (
-        str(amount1)
-        + "@"
-        + str(spacing1)
-        + "+"
-        + str(int(amount2))
-        + "@"
-        + str(spacing2)
-        + "+"
-        + str(amount3)
-        + "@"
-        + str(spacing3)
+    # Zones without rebars are left out, as count of zone must be at least 1
+    custom_spacing = getSpacingString(
+        [
+            (amount, spacing)
+            for amount, spacing in (
+                (amount1, spacing1),
+                (int(amount2), spacing2),
+                (amount3, spacing3),
+            )
+            if amount
+        ]
     )
     return custom_spacing
 
@@ -142,17 +149,10 @@ def getTupleOfCustomSpacing(span_string):
     in specific syntax and return output in the form of list. For eg.
     Input: "3@100+2@200+3@100"
     Output: [(3, 100), (2, 200), (3, 100)]"""
-
-    span_st = span_string.strip()
-    span_sp = span_st.split("+")
-    index = 0
-    spacinglist = []
-    while index < len(span_sp):
-        # Find "@" recursively in span_sp array.
-        in_sp = span_sp[index].split("@")
-        spacinglist.append((int(in_sp[0]), float(in_sp[1])))
-        index += 1
-    return spacinglist
+    return [
+        (count or 1, spacing)
+        for count, spacing in parseSpacingString(span_string)
+    ]
 
 
 def runRebarDistribution(self, front_cover=None):
@@ -160,11 +160,7 @@ def runRebarDistribution(self, front_cover=None):
         front_cover = self.form.frontCover.text()
         front_cover = FreeCAD.Units.Quantity(front_cover).Value
     face = self.SelectedObj.Shape.Faces[getFaceNumber(self.FaceName) - 1]
-    size = (
-        ArchCommands.projectToVector(
-            self.SelectedObj.Shape.copy(), face.normalAt(0, 0)
-        )
-    ).Length
+    size = getShapeExtent(self.SelectedObj, face.normalAt(0, 0))
     dialog = _RebarDistributionDialog(front_cover, size)
     dialog.setupUi(self.CustomSpacing)
     dialog.form.exec_()
@@ -0,0 +1,593 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Rebar Geometry Snapshot"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
+
+import Draft
+import DraftGeomUtils
+import DraftVecUtils
+import FreeCAD
+import Part
+import numpy as np
+
+
+# Revision number of each open document and of each object with
+# (document name, object name) as key, incremented whenever any object of
+# document or the object is created, changed or deleted
+_DOCUMENT_REVISIONS = {}
+_OBJECT_REVISIONS = {}
+_DOCUMENT_REVISION_OBSERVER = None
+
+# Maximum deflection of chords from non circular curved edges of base wire
+# e.g. helix, stored as segments in snapshot
+CURVE_DISCRETIZE_DEFLECTION = 1
+
+# Snapshots cache with (document name, rebar names) as key and
+# (revisions of rebars and their base objects, snapshot) as value, in least
+# recently used first order
+_SNAPSHOTS_CACHE = OrderedDict()
+_SNAPSHOTS_CACHE_SIZE = 32
+
+# Derived geometry cache with (document name, rebar name) as key and
+# (signature, derived geometry) as value
+_DERIVED_GEOMETRY_CACHE = {}
+_DERIVED_GEOMETRY_CACHE_STATS = {"Hits": 0, "Misses": 0}
+
+
+class DocumentRevisionObserver:
+    """Document observer to keep track of revision of open documents."""
+
+    @staticmethod
+    def bumpRevision(obj):
+        document = obj.Document
+        _DOCUMENT_REVISIONS[document.Name] = (
+            _DOCUMENT_REVISIONS.get(document.Name, 0) + 1
+        )
+        key = (document.Name, obj.Name)
+        _OBJECT_REVISIONS[key] = _OBJECT_REVISIONS.get(key, 0) + 1
+
+    def slotCreatedObject(self, obj):
+        self.bumpRevision(obj)
+
+    def slotDeletedObject(self, obj):
+        self.bumpRevision(obj)
+
+    def slotChangedObject(self, obj, prop):
+        self.bumpRevision(obj)
+        _DERIVED_GEOMETRY_CACHE.pop((obj.Document.Name, obj.Name), None)
+
+    def slotDeletedDocument(self, document):
+        _DOCUMENT_REVISIONS.pop(document.Name, None)
+        for cache in (
+            _OBJECT_REVISIONS,
+            _SNAPSHOTS_CACHE,
+            _DERIVED_GEOMETRY_CACHE,
+        ):
+            for key in [key for key in cache if key[0] == document.Name]:
+                del cache[key]
+
+
+def getDocumentRevision(document) -> int:
+    """getDocumentRevision(Document):
+    Returns revision number of document. Revision number is changed whenever
+    any object of document is created, changed or deleted.
+    """
+    global _DOCUMENT_REVISION_OBSERVER
+    if _DOCUMENT_REVISION_OBSERVER is None:
+        _DOCUMENT_REVISION_OBSERVER = DocumentRevisionObserver()
+        FreeCAD.addDocumentObserver(_DOCUMENT_REVISION_OBSERVER)
+    return _DOCUMENT_REVISIONS.get(document.Name, 0)
+
+
+def getObjectRevision(obj) -> int:
+    """getObjectRevision(Object):
+    Returns revision number of object. Revision number is changed whenever
+    object is created, changed or deleted.
+    """
+    getDocumentRevision(obj.Document)
+    return _OBJECT_REVISIONS.get((obj.Document.Name, obj.Name), 0)
+
+
+class RebarGeometrySnapshot:
+    """Columnar snapshot of geometry and attributes of list of rebars.
+
+    Rebar attributes are stored in arrays with one row per rebar, in order of
+    rebars list:
+        names, labels, marks, hosts, rebar_shapes: array of str
+        diameters, roundings, lengths: array of float
+        amounts: array of int
+        bounds: (R, 6) array of (xmin, ymin, zmin, xmax, ymax, zmax) of rebar
+            shape
+
+    Centerline of base wire of rebars is stored as segments and arcs:
+        segments_start, segments_end: (S, 3) array of end points of line edges
+            and of chords of other non circular edges e.g. helix
+        arcs_start, arcs_end: (A, 3) array of end points of circular edges
+        arcs_center, arcs_axis: (A, 3) array of center and axis of circle
+        arcs_radius: (A,) array of radius of circle
+
+    Placements of all rebars are stored as (P, 4, 4) array of transformation
+    matrices in placements.
+
+    Rows of segments, arcs and placements of rebar at index i are from
+    *_offsets[i] to *_offsets[i + 1].
+    """
+
+    def __init__(self, rebars_list: List):
+        self.names = np.array([rebar.Name for rebar in rebars_list], dtype=str)
+        self.index = {rebar.Name: i for i, rebar in enumerate(rebars_list)}
+        self.labels = np.array(
+            [rebar.Label for rebar in rebars_list], dtype=str
+        )
+        self.marks = np.array(
+            [
+                str(rebar.Mark) if hasattr(rebar, "Mark") else str(rebar.Label)
+                for rebar in rebars_list
+            ],
+            dtype=str,
+        )
+        self.hosts = np.array(
+            [
+                rebar.Host.Name if getattr(rebar, "Host", None) else ""
+                for rebar in rebars_list
+            ],
+            dtype=str,
+        )
+        self.rebar_shapes = np.array(
+            [getattr(rebar, "RebarShape", "") for rebar in rebars_list],
+            dtype=str,
+        )
+        self.diameters = np.array(
+            [rebar.Diameter.Value for rebar in rebars_list], dtype=float
+        )
+        self.roundings = np.array(
+            [rebar.Rounding for rebar in rebars_list], dtype=float
+        )
+        self.lengths = np.array(
+            [
+                rebar.Length.Value if hasattr(rebar, "Length") else 0
+                for rebar in rebars_list
+            ],
+            dtype=float,
+        )
+        self.amounts = np.array(
+            [rebar.Amount for rebar in rebars_list], dtype=int
+        )
+        self.bounds = np.array(
+            [
+                (
+                    bound_box.XMin,
+                    bound_box.YMin,
+                    bound_box.ZMin,
+                    bound_box.XMax,
+                    bound_box.YMax,
+                    bound_box.ZMax,
+                )
+                for bound_box in (rebar.Shape.BoundBox for rebar in rebars_list)
+            ],
+            dtype=float,
+        ).reshape(-1, 6)
+
+        segments = []
+        arcs = []
+        placements = []
+        self.segments_offsets = np.zeros(len(rebars_list) + 1, dtype=int)
+        self.arcs_offsets = np.zeros(len(rebars_list) + 1, dtype=int)
+        self.placements_offsets = np.zeros(len(rebars_list) + 1, dtype=int)
+        for i, rebar in enumerate(rebars_list):
+            if rebar.Base and rebar.Base.Shape.Wires:
+                for edge in rebar.Base.Shape.Wires[0].Edges:
+                    if DraftGeomUtils.geomType(edge) == "Line":
+                        segments.append(
+                            tuple(edge.Vertexes[0].Point)
+                            + tuple(edge.Vertexes[-1].Point)
+                        )
+                    elif DraftGeomUtils.geomType(edge) == "Circle":
+                        arcs.append(
+                            tuple(edge.Vertexes[0].Point)
+                            + tuple(edge.Vertexes[-1].Point)
+                            + tuple(edge.Curve.Center)
+                            + tuple(edge.Curve.Axis)
+                            + (edge.Curve.Radius,)
+                        )
+                    else:
+                        points = edge.discretize(
+                            Deflection=CURVE_DISCRETIZE_DEFLECTION
+                        )
+                        segments.extend(
+                            tuple(start) + tuple(end)
+                            for start, end in zip(points, points[1:])
+                        )
+            placements.extend(
+                placement.toMatrix().A for placement in rebar.PlacementList
+            )
+            self.segments_offsets[i + 1] = len(segments)
+            self.arcs_offsets[i + 1] = len(arcs)
+            self.placements_offsets[i + 1] = len(placements)
+
+        segments = np.array(segments, dtype=float).reshape(-1, 6)
+        self.segments_start = segments[:, 0:3]
+        self.segments_end = segments[:, 3:6]
+        arcs = np.array(arcs, dtype=float).reshape(-1, 13)
+        self.arcs_start = arcs[:, 0:3]
+        self.arcs_end = arcs[:, 3:6]
+        self.arcs_center = arcs[:, 6:9]
+        self.arcs_axis = arcs[:, 9:12]
+        self.arcs_radius = arcs[:, 12]
+        self.placements = np.array(placements, dtype=float).reshape(-1, 4, 4)
+
+    def __len__(self):
+        return len(self.names)
+
+    def getRebarIndex(self, rebar) -> int:
+        """getRebarIndex(Rebar):
+        Returns row index of rebar or rebar name in snapshot.
+        """
+        return self.index[getattr(rebar, "Name", rebar)]
+
+    def getSegments(self, rebar) -> Tuple[np.ndarray, np.ndarray]:
+        """getSegments(Rebar):
+        Returns tuple of (N, 3) arrays of start and end points of line
+        segments of base wire of rebar.
+        """
+        i = self.getRebarIndex(rebar)
+        rows = slice(self.segments_offsets[i], self.segments_offsets[i + 1])
+        return self.segments_start[rows], self.segments_end[rows]
+
+    def getArcs(self, rebar) -> Dict[str, np.ndarray]:
+        """getArcs(Rebar):
+        Returns dictionary of arrays of start and end points, center, axis and
+        radius of circular edges of base wire of rebar.
+        """
+        i = self.getRebarIndex(rebar)
+        rows = slice(self.arcs_offsets[i], self.arcs_offsets[i + 1])
+        return {
+            "start": self.arcs_start[rows],
+            "end": self.arcs_end[rows],
+            "center": self.arcs_center[rows],
+            "axis": self.arcs_axis[rows],
+            "radius": self.arcs_radius[rows],
+        }
+
+    def getPlacementMatrices(self, rebar) -> np.ndarray:
+        """getPlacementMatrices(Rebar):
+        Returns (N, 4, 4) array of transformation matrices of placements of
+        rebar.
+        """
+        i = self.getRebarIndex(rebar)
+        return self.placements[
+            self.placements_offsets[i] : self.placements_offsets[i + 1]
+        ]
+
+    def getUniformSpacing(
+        self, rebar, tolerance: float = 1e-3
+    ) -> Union[np.ndarray, None]:
+        """getUniformSpacing(Rebar, [Tolerance]):
+        Returns (3,) array of translation between consecutive placements of
+        rebar if rebar has at least three placements with same rotation and
+        equal translation between them, otherwise None.
+        """
+        matrices = self.getPlacementMatrices(rebar)
+        if len(matrices) < 3 or not np.allclose(
+            matrices[:, :3, :3], matrices[0, :3, :3], atol=tolerance
+        ):
+            return None
+        spacings = np.diff(matrices[:, :3, 3], axis=0)
+        if not np.allclose(spacings, spacings[0], atol=tolerance):
+            return None
+        return spacings[0]
+
+    def getPlacedSegments(
+        self, rebars_list=None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """getPlacedSegments([RebarsList]):
+        Returns tuple of (K, 3) arrays of start and end points of segments of
+        rebars_list, or of all rebars in snapshot if rebars_list is not
+        provided, transformed by each placement of rebar, and (K,) array of
+        row index of rebar of each segment.
+        """
+        if rebars_list is None:
+            rebars_index = range(len(self))
+        else:
+            rebars_index = [self.getRebarIndex(rebar) for rebar in rebars_list]
+        placements_rows = [np.zeros(0, dtype=int)]
+        segments_rows = [np.zeros(0, dtype=int)]
+        rebars_rows = [np.zeros(0, dtype=int)]
+        for i in rebars_index:
+            segments = np.arange(
+                self.segments_offsets[i], self.segments_offsets[i + 1]
+            )
+            placements = np.arange(
+                self.placements_offsets[i], self.placements_offsets[i + 1]
+            )
+            placements_rows.append(np.repeat(placements, len(segments)))
+            segments_rows.append(np.tile(segments, len(placements)))
+            rebars_rows.append(
+                np.full(len(segments) * len(placements), i, dtype=int)
+            )
+        placements_rows = np.concatenate(placements_rows)
+        segments_rows = np.concatenate(segments_rows)
+        matrices = self.placements[placements_rows]
+        rotations = matrices[:, :3, :3]
+        translations = matrices[:, :3, 3]
+        starts = (
+            np.einsum(
+                "kij,kj->ki", rotations, self.segments_start[segments_rows]
+            )
+            + translations
+        )
+        ends = (
+            np.einsum("kij,kj->ki", rotations, self.segments_end[segments_rows])
+            + translations
+        )
+        return starts, ends, np.concatenate(rebars_rows)
+
+    def getBoundBox(self, rebars_list=None) -> FreeCAD.BoundBox:
+        """getBoundBox([RebarsList]):
+        Returns bounding box of shapes of rebars_list, or of all rebars in
+        snapshot if rebars_list is not provided.
+        """
+        if rebars_list is None:
+            bounds = self.bounds
+        else:
+            bounds = self.bounds[
+                [self.getRebarIndex(rebar) for rebar in rebars_list]
+            ]
+        bound_box = FreeCAD.BoundBox()
+        if len(bounds):
+            bound_box = FreeCAD.BoundBox(
+                *bounds[:, :3].min(axis=0).tolist(),
+                *bounds[:, 3:].max(axis=0).tolist(),
+            )
+        return bound_box
+
+
+def getRebarGeometrySnapshot(rebars_list: List) -> RebarGeometrySnapshot:
+    """getRebarGeometrySnapshot(RebarsList):
+    Returns RebarGeometrySnapshot of rebars_list. Snapshot is created once and
+    reused until any rebar of rebars_list or its base object is modified, so
+    that changes to unrelated objects of document e.g. drawing views do not
+    invalidate it.
+    """
+    if not rebars_list:
+        return RebarGeometrySnapshot([])
+    document = rebars_list[0].Document
+    key = (document.Name, tuple(rebar.Name for rebar in rebars_list))
+    revision = tuple(
+        (
+            getObjectRevision(rebar),
+            getObjectRevision(rebar.Base) if rebar.Base else 0,
+        )
+        for rebar in rebars_list
+    )
+    cached = _SNAPSHOTS_CACHE.get(key)
+    if cached and cached[0] == revision:
+        _SNAPSHOTS_CACHE.move_to_end(key)
+        return cached[1]
+    snapshot = RebarGeometrySnapshot(rebars_list)
+    _SNAPSHOTS_CACHE[key] = (revision, snapshot)
+    _SNAPSHOTS_CACHE.move_to_end(key)
+    # Evict least recently used snapshots only, so that snapshot of a whole
+    # view survives lookups of other rebars lists
+    while len(_SNAPSHOTS_CACHE) > _SNAPSHOTS_CACHE_SIZE:
+        _SNAPSHOTS_CACHE.popitem(last=False)
+    return snapshot
+
+
+def getPlaneSegmentsIntersection(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    plane_point,
+    plane_normal,
+    depth: float = 0,
+    tolerance: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """getPlaneSegmentsIntersection(Starts, Ends, PlanePoint, PlaneNormal,
+    [Depth, Tolerance]):
+    Intersects plane passing through plane_point with normal plane_normal with
+    segments from (K, 3) arrays starts to ends.
+
+    Returns tuple of:
+        cut: (K,) boolean array, True for segments crossing plane
+        points: (C, 3) array of intersection points of crossing segments
+        in_plane: (K,) boolean array, True for segments lying in plane or
+            behind plane within depth i.e. opposite to plane_normal
+
+    A segment touching plane only at one of its end points is counted as
+    crossing plane only if the other end point is in front of plane, so that
+    shared vertex of two consecutive crossing segments is returned only once.
+    """
+    normal = np.array(tuple(plane_normal), dtype=float)
+    normal /= np.linalg.norm(normal)
+    point = np.array(tuple(plane_point), dtype=float)
+    start_distances = (starts - point) @ normal
+    end_distances = (ends - point) @ normal
+    in_plane = (
+        (start_distances >= -depth - tolerance)
+        & (start_distances <= tolerance)
+        & (end_distances >= -depth - tolerance)
+        & (end_distances <= tolerance)
+    )
+    cut = (
+        (start_distances > tolerance) != (end_distances > tolerance)
+    ) & ~in_plane
+    t = start_distances[cut] / (start_distances[cut] - end_distances[cut])
+    points = starts[cut] + t[:, np.newaxis] * (ends[cut] - starts[cut])
+    return cut, points, in_plane
+
+
+def calculateRebarsSpanAxis(rebar) -> FreeCAD.Vector:
+    """calculateRebarsSpanAxis(Rebar):
+    Returns span axis of rebars, without using derived geometry cache.
+    """
+    if (
+        Draft.getType(rebar.Base) == "Wire"
+        or rebar.Base.Shape.ShapeType == "Wire"
+    ) and len(
+        rebar.Base.Shape.Wires[0].Edges
+    ) != 1:  # Draft Wires can have "wrong" placement
+        # This works fine instead for straight rebars i.e. for rebars having
+        # base wire with only one edge
+        axis = DraftGeomUtils.getNormal(rebar.Base.Shape)
+    else:
+        axis = rebar.Base.Placement.Rotation.multVec(FreeCAD.Vector(0, 0, -1))
+    if hasattr(rebar, "Direction"):
+        if not DraftVecUtils.isNull(rebar.Direction):
+            axis = FreeCAD.Vector(rebar.Direction)
+            axis.normalize()
+    return axis
+
+
+def getPlacedEdges(edges: List[Part.Edge], placement) -> List[Part.Edge]:
+    """getPlacedEdges(Edges, Placement):
+    Returns copy of edges transformed by placement.
+    """
+    placed_edges = []
+    for edge in edges:
+        placed_edge = edge.copy()
+        placed_edge.Placement = placement.multiply(edge.Placement)
+        placed_edges.append(placed_edge)
+    return placed_edges
+
+
+class RebarDerivedGeometry:
+    """Geometry derived from base wire of rebar, computed on first access:
+        fillet_wire: base wire filleted with radius rounding * diameter
+        sorted_edges: sorted edges of fillet_wire
+        edge_types: geometry type of each of sorted_edges e.g. "Line",
+            "Circle"
+        base_sorted_edges: sorted edges of base wire
+        span_axis: span axis of rebars
+
+    Geometry is in coordinates of base wire i.e. without rebar placements.
+    Returned shapes are shared, so copy them before modifying.
+    """
+
+    def __init__(self, rebar):
+        self.Rebar = rebar
+        self._fillet_wire = None
+        self._sorted_edges = None
+        self._edge_types = None
+        self._base_sorted_edges = None
+        self._span_axis = None
+
+    @property
+    def fillet_wire(self) -> Part.Wire:
+        if self._fillet_wire is None:
+            self._fillet_wire = DraftGeomUtils.filletWire(
+                self.Rebar.Base.Shape.Wires[0],
+                self.Rebar.Rounding * self.Rebar.Diameter.Value,
+            )
+        return self._fillet_wire
+
+    @property
+    def sorted_edges(self) -> List[Part.Edge]:
+        if self._sorted_edges is None:
+            self._sorted_edges = Part.__sortEdges__(self.fillet_wire.Edges)
+        return self._sorted_edges
+
+    @property
+    def edge_types(self) -> List[str]:
+        if self._edge_types is None:
+            self._edge_types = [
+                DraftGeomUtils.geomType(edge) for edge in self.sorted_edges
+            ]
+        return self._edge_types
+
+    @property
+    def base_sorted_edges(self) -> List[Part.Edge]:
+        if self._base_sorted_edges is None:
+            self._base_sorted_edges = Part.__sortEdges__(
+                self.Rebar.Base.Shape.Wires[0].Edges
+            )
+        return self._base_sorted_edges
+
+    @property
+    def span_axis(self) -> FreeCAD.Vector:
+        if self._span_axis is None:
+            self._span_axis = calculateRebarsSpanAxis(self.Rebar)
+        return FreeCAD.Vector(self._span_axis)
+
+    def getPlacedSortedEdges(self, placement) -> List[Part.Edge]:
+        """getPlacedSortedEdges(Placement):
+        Returns copy of sorted_edges transformed by placement.
+        """
+        return getPlacedEdges(self.sorted_edges, placement)
+
+
+def getRebarDerivedGeometrySignature(rebar) -> Tuple:
+    """getRebarDerivedGeometrySignature(Rebar):
+    Returns signature of properties of rebar from which its derived geometry
+    is computed.
+    """
+    return (
+        rebar.Base.Name,
+        rebar.Base.Shape.hashCode(),
+        rebar.Rounding,
+        rebar.Diameter.Value,
+        tuple(getattr(rebar, "Direction", ())),
+    )
+
+
+def getRebarDerivedGeometry(rebar) -> RebarDerivedGeometry:
+    """getRebarDerivedGeometry(Rebar):
+    Returns RebarDerivedGeometry of rebar from cache. Cached geometry is
+    reused until rebar is changed or its base shape, rounding or diameter is
+    modified.
+    """
+    # Register document observer, which removes rebar from cache on its
+    # property change
+    getDocumentRevision(rebar.Document)
+    key = (rebar.Document.Name, rebar.Name)
+    signature = getRebarDerivedGeometrySignature(rebar)
+    cached = _DERIVED_GEOMETRY_CACHE.get(key)
+    if cached and cached[0] == signature:
+        _DERIVED_GEOMETRY_CACHE_STATS["Hits"] += 1
+        return cached[1]
+    _DERIVED_GEOMETRY_CACHE_STATS["Misses"] += 1
+    derived_geometry = RebarDerivedGeometry(rebar)
+    _DERIVED_GEOMETRY_CACHE[key] = (signature, derived_geometry)
+    return derived_geometry
+
+
+def getRebarDerivedGeometryCacheStats() -> Dict[str, int]:
+    """getRebarDerivedGeometryCacheStats():
+    Returns dictionary of hits, misses and size of derived geometry cache.
+    """
+    return dict(
+        _DERIVED_GEOMETRY_CACHE_STATS, Size=len(_DERIVED_GEOMETRY_CACHE)
+    )
+
+
+def clearRebarDerivedGeometryCache():
+    """clearRebarDerivedGeometryCache():
+    Removes all rebars from derived geometry cache and resets its statistics.
+    """
+    _DERIVED_GEOMETRY_CACHE.clear()
+    _DERIVED_GEOMETRY_CACHE_STATS["Hits"] = 0
+    _DERIVED_GEOMETRY_CACHE_STATS["Misses"] = 0
@@ -42,9 +42,11 @@ from ReinforcementDrawing.ReinforcementDrawingfunc import (
     getRebarsSpanAxis,
     getSVGPlaneFromAxis,
     getProjectionToSVGPlane,
+    getProjectionsToSVGPlane,
     getRoundEdgeSVG,
     getRebarColor,
 )
+from RebarGeometry import getRebarDerivedGeometry
 from SVGfunc import (
     getSVGRootElement,
     getPointSVG,
@@ -176,17 +178,11 @@ def getVertexesMinMaxXY(
         The maximum y_coordinate value when each vertex is projected on
         view_plane.
     """
-    point = getProjectionToSVGPlane(vertex_list[0].Point, view_plane)
-    min_x = point.x
-    min_y = point.y
-    max_x = point.x
-    max_y = point.y
-    for vertex in vertex_list[1:]:
-        point = getProjectionToSVGPlane(vertex.Point, view_plane)
-        min_x = min(point.x, min_x)
-        min_y = min(point.y, min_y)
-        max_x = max(point.x, max_x)
-        max_y = max(point.y, max_y)
+    points = getProjectionsToSVGPlane(
+        [tuple(vertex.Point) for vertex in vertex_list], view_plane
+    )
+    min_x, min_y = points.min(axis=0).tolist()
+    max_x, max_y = points.max(axis=0).tolist()
     return min_x, min_y, max_x, max_y
 
 
@@ -553,7 +549,7 @@ def getRebarShapeSVG(
     basewire = rebar.Base.Shape.Wires[0].copy()
     fillet_radius = rebar.Rounding * rebar.Diameter.Value
     if fillet_radius:
-        fillet_basewire = DraftGeomUtils.filletWire(basewire, fillet_radius)
+        fillet_basewire = getRebarDerivedGeometry(rebar).fillet_wire
     else:
         fillet_basewire = basewire
 
@@ -892,10 +888,11 @@ def getRebarShapeSVG(
                 fillet_basewire = basewire
 
         edges = Part.__sortEdges__(fillet_basewire.Edges)
-        straight_edges = Part.__sortEdges__(rebar.Base.Shape.Wires[0].Edges)
-        for edge in list(straight_edges):
-            if DraftGeomUtils.geomType(edge) != "Line":
-                straight_edges.remove(edge)
+        straight_edges = [
+            edge
+            for edge in getRebarDerivedGeometry(rebar).base_sorted_edges
+            if DraftGeomUtils.geomType(edge) == "Line"
+        ]
 
         current_straight_edge_index = 0
         for edge_index, edge in enumerate(edges):
@@ -373,6 +373,94 @@ class BillOfMaterialTool:
         MainBillOfMaterial.CommandBillOfMaterial()
 
 
+class BillOfMaterialExportTool:
+    @staticmethod
+    def GetResources():
+        return {
+            "Pixmap": str(
+                Path(__file__).parent / "icons" / "dropdown_list" / "BOM.svg"
+            ),
+            "MenuText": QT_TRANSLATE_NOOP(
+                "Reinforcement_BillOfMaterialExport",
+                "Export Rebar Bill Of Material",
+            ),
+            "ToolTip": QT_TRANSLATE_NOOP(
+                "Reinforcement_BillOfMaterialExport",
+                "Export Rebars Bill Of Material to CSV or JSON Lines file",
+            ),
+        }
+
+    @staticmethod
+    def IsActive():
+        return True if FreeCADGui.activeDocument() else False
+
+    @staticmethod
+    def Activated():
+        from BillOfMaterial import BillOfMaterial_Export
+
+        # Call to CommandExportBillOfMaterial() function
+        BillOfMaterial_Export.CommandExportBillOfMaterial()
+
+
+class LiveBillOfMaterialTool:
+    @staticmethod
+    def GetResources():
+        return {
+            "Pixmap": str(
+                Path(__file__).parent / "icons" / "dropdown_list" / "BOM.svg"
+            ),
+            "MenuText": QT_TRANSLATE_NOOP(
+                "Reinforcement_LiveBillOfMaterial",
+                "Live Rebar Bill Of Material",
+            ),
+            "ToolTip": QT_TRANSLATE_NOOP(
+                "Reinforcement_LiveBillOfMaterial",
+                "Prepare Rebars Bill Of Material spreadsheet, which is updated"
+                " when rebars are changed",
+            ),
+        }
+
+    @staticmethod
+    def IsActive():
+        return True if FreeCADGui.activeDocument() else False
+
+    @staticmethod
+    def Activated():
+        from BillOfMaterial import BillOfMaterialLive
+
+        # Call to CommandLiveBillOfMaterial() function
+        BillOfMaterialLive.CommandLiveBillOfMaterial()
+
+
+class ProjectBillOfMaterialTool:
+    @staticmethod
+    def GetResources():
+        return {
+            "Pixmap": str(
+                Path(__file__).parent / "icons" / "dropdown_list" / "BOM.svg"
+            ),
+            "MenuText": QT_TRANSLATE_NOOP(
+                "Reinforcement_ProjectBillOfMaterial",
+                "Project Rebar Bill Of Material",
+            ),
+            "ToolTip": QT_TRANSLATE_NOOP(
+                "Reinforcement_ProjectBillOfMaterial",
+                "Prepare Rebars Bill Of Material of several project documents",
+            ),
+        }
+
+    @staticmethod
+    def IsActive():
+        return True
+
+    @staticmethod
+    def Activated():
+        from BillOfMaterial import BillOfMaterial_Project
+
+        # Call to CommandProjectBillOfMaterial() function
+        BillOfMaterial_Project.CommandProjectBillOfMaterial()
+
+
 class RebarShapeCutListTool:
     @staticmethod
     def GetResources():
@@ -484,6 +572,15 @@ FreeCADGui.addCommand("Reinforcement_BeamRebars", BeamReinforcementTool())
 FreeCADGui.addCommand("Reinforcement_SlabRebars", SlabReinforcementTool())
 FreeCADGui.addCommand("Reinforcement_FootingRebars", FootingReinforcementTool())
 FreeCADGui.addCommand("Reinforcement_BillOfMaterial", BillOfMaterialTool())
+FreeCADGui.addCommand(
+    "Reinforcement_BillOfMaterialExport", BillOfMaterialExportTool()
+)
+FreeCADGui.addCommand(
+    "Reinforcement_LiveBillOfMaterial", LiveBillOfMaterialTool()
+)
+FreeCADGui.addCommand(
+    "Reinforcement_ProjectBillOfMaterial", ProjectBillOfMaterialTool()
+)
 FreeCADGui.addCommand("Reinforcement_BarShapeCutList", RebarShapeCutListTool())
 FreeCADGui.addCommand(
     "Reinforcement_BarBendingSchedule", BarBendingScheduleTool()
@@ -521,6 +618,9 @@ ReinforcementCommands = [
     "Reinforcement_FootingRebars",
     "Arch_Rebar",
     "Reinforcement_BillOfMaterial",
+    "Reinforcement_BillOfMaterialExport",
+    "Reinforcement_LiveBillOfMaterial",
+    "Reinforcement_ProjectBillOfMaterial",
     "Reinforcement_BarShapeCutList",
     "Reinforcement_BarBendingSchedule",
     "Reinforcement_DrawingDimensioning",
@@ -30,7 +30,12 @@ from PySide.QtCore import QT_TRANSLATE_NOOP
 from DraftGeomUtils import vec, isCubic
 import FreeCAD
 import FreeCADGui
+import functools
 import math
+import re
+
+from RebarGeometry import getObjectRevision
+
 
 # --------------------------------------------------------------------------
 # Generic functions
@@ -101,23 +106,111 @@ def facenormalDirection(structure=None, facename=None):
     return normal
 
 
+_SPACING_TOKENS_CACHE = {}
+
+
+def getSpacingTokensRegex(separator):
+    """getSpacingTokensRegex(Separator):
+    Returns compiled regular expression to tokenize spacing string having
+    count and value separated by separator. Regular expression is compiled
+    once for each separator.
+    """
+    tokens_regex = _SPACING_TOKENS_CACHE.get(separator)
+    if tokens_regex is None:
+        tokens_regex = re.compile(
+            (
+                r"\s*(?:(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+                r"(?P<unit>\s*mm)?|(?P<separator>{})|(?P<plus>\+)|(?P<end>$))"
+            ).format(re.escape(separator))
+        )
+        _SPACING_TOKENS_CACHE[separator] = tokens_regex
+    return tokens_regex
+
+
+@functools.lru_cache(maxsize=1024)
+def parseSpacingString(spacing_string, separator="@", optional_count=True):
+    """parseSpacingString(SpacingString, Separator, OptionalCount):
+    Parse spacing string with syntax "<count><separator><value>+..." and
+    returns tuple of (count, value) tuples. Value can have "mm" as unit and
+    count must be at least 1. If optional_count is True, item can also be
+    just "<value>" and its count is None. For eg.
+    Input: "3@100+2@200+50", "@"
+    Output: ((3, 100.0), (2, 200.0), (None, 50.0))
+
+    Raises ValueError with position of first invalid character, if spacing
+    string is not valid.
+    """
+    tokens_regex = getSpacingTokensRegex(separator)
+
+    def nextToken(pos):
+        # Returns token name, start position of token, match and end
+        # position of token
+        match = tokens_regex.match(spacing_string, pos)
+        if not match:
+            start = len(spacing_string) - len(spacing_string[pos:].lstrip())
+            return None, start, None, start
+        token = "number" if match.group("number") else match.lastgroup
+        return token, match.start(token), match, match.end()
+
+    def error(expected, start):
+        raise ValueError(
+            'Invalid spacing string "{}": expected {} at position {}.'.format(
+                spacing_string, expected, start
+            )
+        )
+
+    zones = []
+    pos = 0
+    while True:
+        token, start, number_match, pos = nextToken(pos)
+        if token != "number":
+            error("number", start)
+        count_start = start
+        token, start, match, pos = nextToken(pos)
+        if token == "separator":
+            count = number_match.group("number")
+            if number_match.group("unit") or not count.isdigit():
+                error("integer count", count_start)
+            if int(count) < 1:
+                error("count of at least 1", count_start)
+            token, start, match, pos = nextToken(pos)
+            if token != "number":
+                error("number", start)
+            zones.append((int(count), float(match.group("number"))))
+            token, start, match, pos = nextToken(pos)
+        elif optional_count:
+            zones.append((None, float(number_match.group("number"))))
+        else:
+            error('"{}"'.format(separator), start)
+        if token == "end":
+            return tuple(zones)
+        if token != "plus":
+            error('"+" or end of string', start)
+
+
+def getSpacingString(zones, separator="@"):
+    """getSpacingString(Zones, Separator):
+    Returns spacing string from list of (count, value) tuples. This is inverse
+    of parseSpacingString(). For eg.
+    Input: [(3, 100), (2, 200.0), (None, 50)], "@"
+    Output: "3@100+2@200.0+50"
+    """
+    return "+".join(
+        str(value)
+        if count is None
+        else "{}{}{}".format(count, separator, value)
+        for count, value in zones
+    )
+
+
 def gettupleOfNumberDiameter(diameter_string):
     """gettupleOfNumberDiameter(diameter_string): This function take input in
     specific syntax and return output in the form of list. For eg.
     Input: "3#100+2#200+3#100"
     Output: [(3, 100), (2, 200), (3, 100)]"""
-    diameter_st = diameter_string.strip()
-    diameter_sp = diameter_st.split("+")
-    index = 0
-    number_diameter_list = []
-    while index < len(diameter_sp):
-        # Find "#" recursively in diameter_sp array.
-        in_sp = diameter_sp[index].split("#")
-        number_diameter_list.append(
-            (int(in_sp[0]), float(in_sp[1].replace("mm", "")))
-        )
-        index += 1
-    return number_diameter_list
+    return list(
+        parseSpacingString(diameter_string, separator="#", optional_count=False)
+    )
 
 
 # --------------------------------------------------------------------------
@@ -163,6 +256,49 @@ def getTrueParametersOfStructure(obj):
     return [length, width, height]
 
 
+# Cache of extents of shapes of objects along directions. Key of cache is
+# tuple of document name, object name, object revision and rounded direction,
+# so cache entry is invalidated automatically when object is changed.
+_SHAPE_EXTENT_CACHE = {}
+_SHAPE_EXTENT_CACHE_SIZE = 1024
+
+
+def getShapeExtent(obj, direction):
+    """getShapeExtent(Object, Direction):
+    Returns extent of shape of obj along direction i.e. length of projection
+    of shape on direction.
+
+    It gives same result as ArchCommands.projectToVector(obj.Shape.copy(),
+    direction).Length, without copying shape. Extent is computed from
+    projection of vertexes of shape and cached with object name, object
+    revision and direction as key.
+    """
+    direction = FreeCAD.Vector(direction)
+    if direction.Length == 0:
+        return 0
+    direction.normalize()
+    key = (
+        obj.Document.Name,
+        obj.Name,
+        getObjectRevision(obj),
+        round(direction.x, 9),
+        round(direction.y, 9),
+        round(direction.z, 9),
+    )
+    if key not in _SHAPE_EXTENT_CACHE:
+        if len(_SHAPE_EXTENT_CACHE) >= _SHAPE_EXTENT_CACHE_SIZE:
+            _SHAPE_EXTENT_CACHE.clear()
+        projections = [
+            vertex.Point.dot(direction) for vertex in obj.Shape.Vertexes
+        ]
+        if projections:
+            extent = max(projections) - min(projections)
+        else:
+            extent = 0
+        _SHAPE_EXTENT_CACHE[key] = extent
+    return _SHAPE_EXTENT_CACHE[key]
+
+
 def getParametersOfFace(structure, facename, sketch=True):
     """getParametersOfFace(structure, facename, sketch = True):
     This function will return length, width and points of center of mass of a
@@ -771,8 +907,6 @@ def gettupleOfNumberDiameterOffset(number_diameter_offset_string):
     Input: "2#20@50+3#16@100+2#20@50"
     Output: [(2, 20, 50), (3, 16, 100), (2, 20, 50)]
     """
-    import re
-
     number_diameter_offset_st = number_diameter_offset_string.strip()
     number_diameter_offset_sp = number_diameter_offset_st.split("+")
     index = 0
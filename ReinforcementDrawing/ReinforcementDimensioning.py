@@ -30,14 +30,22 @@ from PySide2.QtCore import QT_TRANSLATE_NOOP
 from xml.etree import ElementTree
 
 import FreeCAD
-from Draft import getrgb
+from Draft import getrgb, getType
 
 from RebarData import RebarTypes
-from .ReinforcementDrawingfunc import getViewPlane, getDrawingMinMaxXY
+from RebarGeometry import getObjectRevision, getRebarGeometrySnapshot
+from .ReinforcementDrawingfunc import (
+    getViewPlane,
+    getDrawingMinMaxXY,
+    getDrawingClipRectangle,
+)
 from .ReinforcementDimensioningfunc import (
     getRebarDimensionLabel,
     getDimensionLineSVG,
     getRebarDimensionData,
+    getDimensionLabelPlacer,
+    LabelPlacementRecorder,
+    RecordedLabelPlacer,
 )
 from SVGfunc import getSVGRootElement, getSVGTextElement
 from .config import (
@@ -61,6 +69,7 @@ from .config import (
     DIMENSION_MULTI_REBAR_OUTER_DIM,
     DIMENSION_SINGLE_REBAR_TEXT_POSITION_TYPE,
     DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE,
+    DIMENSION_LABEL_PLACEMENT,
 )
 
 
@@ -103,16 +112,20 @@ class ReinforcementDimensioning:
             parent_drawing_view.DimensionBottomOffset
         )
 
-        # This will be used to increment
-        # ParentDrawing.DimensionLeft/Right/Top/Bottom offset as required only
-        # first time when object is being recomputed
-        self.FirstExecute = True
-        self.DimensionLeftOffsetIncrement = dimension_left_offset_increment
-        self.DimensionRightOffsetIncrement = dimension_right_offset_increment
-        self.DimensionTopOffsetIncrement = dimension_top_offset_increment
-        self.DimensionBottomOffsetIncrement = dimension_bottom_offset_increment
-        reinforcement_dimensioning.recompute(True)
-        parent_drawing_view.recompute(True)
+        # These will be used as distance between dimension tracks by
+        # layoutReinforcementDimensionings()
+        reinforcement_dimensioning.DimensionLeftOffsetIncrement = (
+            dimension_left_offset_increment
+        )
+        reinforcement_dimensioning.DimensionRightOffsetIncrement = (
+            dimension_right_offset_increment
+        )
+        reinforcement_dimensioning.DimensionTopOffsetIncrement = (
+            dimension_top_offset_increment
+        )
+        reinforcement_dimensioning.DimensionBottomOffsetIncrement = (
+            dimension_bottom_offset_increment
+        )
 
     def setProperties(self, obj):
         """Add properties to RebarDimensioning object."""
@@ -367,6 +380,70 @@ class ReinforcementDimensioning:
                 ),
             )
 
+        if not hasattr(obj, "DimensionLeftOffsetIncrement"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DimensionLeftOffsetIncrement",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The distance between left dimension tracks",
+                ),
+            )
+            obj.DimensionLeftOffsetIncrement = DIMENSION_LEFT_OFFSET_INCREMENT
+
+        if not hasattr(obj, "DimensionRightOffsetIncrement"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DimensionRightOffsetIncrement",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The distance between right dimension tracks",
+                ),
+            )
+            obj.DimensionRightOffsetIncrement = DIMENSION_RIGHT_OFFSET_INCREMENT
+
+        if not hasattr(obj, "DimensionTopOffsetIncrement"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DimensionTopOffsetIncrement",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The distance between top dimension tracks",
+                ),
+            )
+            obj.DimensionTopOffsetIncrement = DIMENSION_TOP_OFFSET_INCREMENT
+
+        if not hasattr(obj, "DimensionBottomOffsetIncrement"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DimensionBottomOffsetIncrement",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The distance between bottom dimension tracks",
+                ),
+            )
+            obj.DimensionBottomOffsetIncrement = (
+                DIMENSION_BOTTOM_OFFSET_INCREMENT
+            )
+
+        if not hasattr(obj, "ManualOffsets"):
+            obj.addProperty(
+                "App::PropertyBool",
+                "ManualOffsets",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "True if left, right, top and bottom offsets are set by "
+                    "user and are not laid out with other dimensionings of "
+                    "ParentDrawingView",
+                ),
+            )
+            obj.ManualOffsets = False
+
         if not hasattr(obj, "SingleRebar_LineStartSymbol"):
             obj.addProperty(
                 "App::PropertyEnumeration",
@@ -511,9 +588,32 @@ class ReinforcementDimensioning:
                 DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
             )
 
+        if not hasattr(obj, "LabelPlacement"):
+            obj.addProperty(
+                "App::PropertyEnumeration",
+                "LabelPlacement",
+                "AutomaticDimensioning",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The placement of dimension labels. AvoidOverlap moves "
+                    "each label to nearby position free of rebars, dimension "
+                    "lines and other labels",
+                ),
+            ).LabelPlacement = ["Fixed", "AvoidOverlap"]
+            obj.LabelPlacement = DIMENSION_LABEL_PLACEMENT
+
     def onDocumentRestored(self, obj):
         """Upgrade ReinforcementDimensioning object."""
+        # Labels and offsets of objects saved before LabelPlacement and
+        # ManualOffsets properties were added are kept as they are,
+        # AvoidOverlap and automatic layout are default for new objects only
+        add_label_placement = not hasattr(obj, "LabelPlacement")
+        add_manual_offsets = not hasattr(obj, "ManualOffsets")
         self.setProperties(obj)
+        if add_label_placement:
+            obj.LabelPlacement = "Fixed"
+        if add_manual_offsets:
+            obj.ManualOffsets = True
 
     def execute(self, obj):
         """This function is executed to recompute ReinforcementDimensioning
@@ -561,95 +661,40 @@ class ReinforcementDimensioning:
             )
             return
 
+        if getattr(obj.ParentDrawingView, "SectionView", False):
+            FreeCAD.Console.PrintError(
+                "Dimensioning of section view is not supported, return "
+                "without a reinforcement dimensioning for {}.\n".format(
+                    obj.Name
+                )
+            )
+            return
+
         obj.Scale = obj.ParentDrawingView.Scale
         obj.X = obj.ParentDrawingView.X
         obj.Y = obj.ParentDrawingView.Y
         root_svg = getSVGRootElement()
+        symbol_defs = ElementTree.SubElement(root_svg, "defs")
 
         view_plane = getViewPlane(obj.ParentDrawingView.View)
-        min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
+        min_x, min_y, max_x, max_y = getDrawingClipRectangle(
+            obj.ParentDrawingView, view_plane
+        ) or getDrawingMinMaxXY(
             obj.ParentDrawingView.Structure,
             obj.ParentDrawingView.Rebars,
             view_plane,
         )
 
         if obj.WayPointsType == "Automatic":
-            dimension_data_list, dimension_align = getRebarDimensionData(
-                obj.Rebar,
-                obj.DimensionFormat,
-                view_plane,
-                obj.DimensionLeftOffset.Value / obj.Scale,
-                obj.DimensionRightOffset.Value / obj.Scale,
-                obj.DimensionTopOffset.Value / obj.Scale,
-                obj.DimensionBottomOffset.Value / obj.Scale,
-                min_x,
-                min_y,
-                max_x,
-                max_y,
-                obj.Scale,
-                obj.SingleRebar_OuterDimension,
-                obj.MultiRebar_OuterDimension,
-            )
-            if hasattr(self, "FirstExecute") and self.FirstExecute is True:
-                self.FirstExecute = False
-                parent_drawing = obj.ParentDrawingView
-                if dimension_align == "Left":
-                    parent_drawing.DimensionLeftOffset.Value += (
-                        self.DimensionLeftOffsetIncrement
-                    )
-                elif dimension_align == "Right":
-                    parent_drawing.DimensionRightOffset.Value += (
-                        self.DimensionRightOffsetIncrement
-                    )
-                elif dimension_align == "Top":
-                    parent_drawing.DimensionTopOffset.Value += (
-                        self.DimensionTopOffsetIncrement
-                    )
-                elif dimension_align == "Bottom":
-                    parent_drawing.DimensionBottomOffset.Value += (
-                        self.DimensionBottomOffsetIncrement
-                    )
-            for dimension_data in dimension_data_list:
-                if (
-                    "LabelOnly" in dimension_data
-                    and dimension_data["LabelOnly"] is True
-                ):
-                    dimensions_svg = getSVGTextElement(
-                        dimension_data["DimensionLabel"],
-                        dimension_data["LabelPosition"].x,
-                        dimension_data["LabelPosition"].y,
-                        obj.Font,
-                        obj.FontSize.Value / obj.Scale,
-                        "middle",
-                    )
-                    dimensions_svg.set("fill", getrgb(obj.TextColor))
-                else:
-                    way_points = dimension_data["WayPoints"]
-                    dimension_label = dimension_data["DimensionLabel"]
-                    if dimension_data["VisibleRebars"] == "Single":
-                        line_start_symbol = obj.SingleRebar_LineStartSymbol
-                        line_end_symbol = obj.SingleRebar_LineEndSymbol
-                        text_position_type = obj.SingleRebar_TextPositionType
-                    elif dimension_data["VisibleRebars"] == "Multiple":
-                        line_start_symbol = obj.MultiRebar_LineStartSymbol
-                        line_end_symbol = obj.MultiRebar_LineEndSymbol
-                        text_position_type = obj.MultiRebar_TextPositionType
-
-                    dimensions_svg = getDimensionLineSVG(
-                        [(point.x, point.y) for point in way_points],
-                        dimension_label,
-                        obj.Font,
-                        obj.FontSize.Value / obj.Scale,
-                        getrgb(obj.TextColor),
-                        text_position_type,
-                        obj.StrokeWidth.Value / obj.Scale,
-                        obj.LineStyle,
-                        getrgb(obj.LineColor),
-                        line_start_symbol,
-                        obj.LineMidPointSymbol,
-                        line_end_symbol,
-                    )
-
+            dimension_data_list, _ = self.getDimensionData(
+                obj, view_plane, min_x, min_y, max_x, max_y
+            )
+            label_placer = self.getLabelPlacer(
+                obj, view_plane, [dimension_data_list]
+            )
+            for dimensions_svg in self.getAutomaticDimensionsSVG(
+                obj, dimension_data_list, symbol_defs, label_placer
+            ):
                 # Apply translation so that (0,0) in dimensioning corresponds to
                 # (0,0) in ParentDrawingView
                 dimensions_svg.set(
@@ -677,6 +722,7 @@ class ReinforcementDimensioning:
                 obj.LineStartSymbol,
                 obj.LineMidPointSymbol,
                 obj.LineEndSymbol,
+                symbol_defs=symbol_defs,
             )
             # Apply translation so that (0,0) in dimensioning corresponds to
             # (0,0) in ParentDrawingView
@@ -686,6 +732,168 @@ class ReinforcementDimensioning:
             )
             root_svg.append(dimensions_svg)
 
+        self.setDimensioningSymbol(obj, root_svg, symbol_defs)
+
+    def getDimensionData(self, obj, view_plane, min_x, min_y, max_x, max_y):
+        """getDimensionData(Object, ViewPlane, MinX, MinY, MaxX, MaxY):
+        Returns (dimension_data_list, dimension_align) of automatic dimensions
+        of obj, as returned by getRebarDimensionData().
+
+        Result is reused until rebar, its base or any argument of
+        getRebarDimensionData() is changed, so that dimension data computed by
+        layoutReinforcementDimensionings() is reused by execute().
+        """
+        drawing_view = obj.ParentDrawingView
+        rebar = obj.Rebar
+        scale = drawing_view.Scale
+        offsets = (
+            obj.DimensionLeftOffset.Value / scale,
+            obj.DimensionRightOffset.Value / scale,
+            obj.DimensionTopOffset.Value / scale,
+            obj.DimensionBottomOffset.Value / scale,
+        )
+        key = (
+            rebar.Name,
+            getObjectRevision(rebar),
+            getObjectRevision(rebar.Base) if rebar.Base else 0,
+            drawing_view.View,
+            obj.DimensionFormat,
+            offsets,
+            (min_x, min_y, max_x, max_y),
+            scale,
+            obj.SingleRebar_OuterDimension,
+            obj.MultiRebar_OuterDimension,
+        )
+        dimension_data = getattr(self, "dimension_data", None)
+        if dimension_data is None or dimension_data[0] != key:
+            dimension_data = (
+                key,
+                getRebarDimensionData(
+                    rebar,
+                    obj.DimensionFormat,
+                    view_plane,
+                    *offsets,
+                    min_x,
+                    min_y,
+                    max_x,
+                    max_y,
+                    scale,
+                    obj.SingleRebar_OuterDimension,
+                    obj.MultiRebar_OuterDimension,
+                    getRebarGeometrySnapshot(drawing_view.VisibleRebars),
+                ),
+            )
+            self.dimension_data = dimension_data
+        return dimension_data[1]
+
+    def getLabelPlacer(self, obj, view_plane, dimension_data_lists):
+        """getLabelPlacer(Object, ViewPlane, DimensionDataLists):
+        Returns DimensionLabelPlacer with visible rebars of ParentDrawingView
+        and dimension lines of each dimension data list of
+        dimension_data_lists added as obstacles, or None if LabelPlacement of
+        obj is not "AvoidOverlap".
+
+        If labels of obj are placed by layoutReinforcementDimensionings()
+        along with labels of other dimensionings of ParentDrawingView,
+        RecordedLabelPlacer replaying their shifts is returned instead.
+        """
+        if obj.LabelPlacement != "AvoidOverlap":
+            return None
+
+        def getObjectLabelPlacer():
+            label_placer = getDimensionLabelPlacer(
+                obj.ParentDrawingView.VisibleRebars,
+                view_plane,
+                obj.FontSize.Value / obj.Scale,
+            )
+            label_placer.addPaths(
+                [(point.x, point.y) for point in dimension_data["WayPoints"]]
+                for dimension_data_list in dimension_data_lists
+                for dimension_data in dimension_data_list
+                if "WayPoints" in dimension_data
+            )
+            return label_placer
+
+        label_shifts = getattr(self, "label_shifts", None)
+        if label_shifts is None:
+            return getObjectLabelPlacer()
+        return RecordedLabelPlacer(label_shifts, getObjectLabelPlacer)
+
+    def getAutomaticDimensionsSVG(
+        self, obj, dimension_data_list, symbol_defs, label_placer=None
+    ):
+        """getAutomaticDimensionsSVG(Object, DimensionDataList, SymbolDefs,
+        [LabelPlacer]):
+        Returns list of svg elements of dimension_data_list, as returned by
+        getRebarDimensionData(), styled as per properties of obj.
+
+        label_placer is the DimensionLabelPlacer used to move labels to
+        positions free of overlap, if given.
+        """
+        dimensions_svg_list = []
+        for dimension_data in dimension_data_list:
+            if (
+                "LabelOnly" in dimension_data
+                and dimension_data["LabelOnly"] is True
+            ):
+                label_x = dimension_data["LabelPosition"].x
+                label_y = dimension_data["LabelPosition"].y
+                if label_placer:
+                    along_shift, normal_shift = label_placer.placeLabel(
+                        dimension_data["DimensionLabel"],
+                        label_x,
+                        label_y,
+                        obj.FontSize.Value / obj.Scale,
+                    )
+                    label_x += along_shift
+                    label_y -= normal_shift
+                dimensions_svg = getSVGTextElement(
+                    dimension_data["DimensionLabel"],
+                    label_x,
+                    label_y,
+                    obj.Font,
+                    obj.FontSize.Value / obj.Scale,
+                    "middle",
+                )
+                dimensions_svg.set("fill", getrgb(obj.TextColor))
+            else:
+                way_points = dimension_data["WayPoints"]
+                dimension_label = dimension_data["DimensionLabel"]
+                if dimension_data["VisibleRebars"] == "Single":
+                    line_start_symbol = obj.SingleRebar_LineStartSymbol
+                    line_end_symbol = obj.SingleRebar_LineEndSymbol
+                    text_position_type = obj.SingleRebar_TextPositionType
+                elif dimension_data["VisibleRebars"] == "Multiple":
+                    line_start_symbol = obj.MultiRebar_LineStartSymbol
+                    line_end_symbol = obj.MultiRebar_LineEndSymbol
+                    text_position_type = obj.MultiRebar_TextPositionType
+
+                dimensions_svg = getDimensionLineSVG(
+                    [(point.x, point.y) for point in way_points],
+                    dimension_label,
+                    obj.Font,
+                    obj.FontSize.Value / obj.Scale,
+                    getrgb(obj.TextColor),
+                    text_position_type,
+                    obj.StrokeWidth.Value / obj.Scale,
+                    obj.LineStyle,
+                    getrgb(obj.LineColor),
+                    line_start_symbol,
+                    obj.LineMidPointSymbol,
+                    line_end_symbol,
+                    symbol_defs=symbol_defs,
+                    label_placer=label_placer,
+                )
+            dimensions_svg_list.append(dimensions_svg)
+        return dimensions_svg_list
+
+    def setDimensioningSymbol(self, obj, root_svg, symbol_defs):
+        """setDimensioningSymbol(Object, RootSVG, SymbolDefs):
+        Sets root_svg, sized same as ParentDrawingView, as Symbol of obj.
+        """
+        if not len(symbol_defs):
+            root_svg.remove(symbol_defs)
+
         # Set svg height and width same as ParentDrawingView
         root_svg.set("width", "{}mm".format(obj.ParentDrawingView.Width.Value))
         root_svg.set(
@@ -711,6 +919,205 @@ class ReinforcementDimensioning:
         return None
 
 
+def getDimensionLayoutTracks(intervals, gap=0):
+    """getDimensionLayoutTracks(Intervals, [Gap]):
+    Assigns track to each (start, end) interval of intervals such that
+    intervals on same track are separated by at least gap, using greedy
+    interval partitioning in order of start of intervals. Each interval is
+    assigned the innermost track available.
+
+    Returns list of track index of each interval, in order of intervals.
+    """
+    tracks_end = []
+    intervals_track = [0] * len(intervals)
+    for i in sorted(range(len(intervals)), key=lambda i: intervals[i]):
+        start, end = intervals[i][:2]
+        for track, track_end in enumerate(tracks_end):
+            if track_end + gap <= start:
+                break
+        else:
+            track = len(tracks_end)
+            tracks_end.append(end)
+        tracks_end[track] = end
+        intervals_track[i] = track
+    return intervals_track
+
+
+def getDimensionLayoutInterval(
+    dimension_data_list,
+    dimension_align,
+    min_x,
+    min_y,
+    max_x,
+    max_y,
+    padding=0,
+):
+    """getDimensionLayoutInterval(DimensionDataList, DimensionAlign, MinX,
+    MinY, MaxX, MaxY, [Padding]):
+    Returns (start, end) extent along dimension_align side of dimensions of
+    dimension_data_list, extended by padding on both ends.
+
+    Returns None if dimension_align is not a side or dimensions are not
+    outside of drawing bounded by min_x, min_y, max_x and max_y, as only outer
+    dimensions need a layout track.
+    """
+    if dimension_align not in ("Left", "Right", "Top", "Bottom"):
+        return None
+    points = [
+        (point.x, point.y)
+        for dimension_data in dimension_data_list
+        for point in dimension_data.get(
+            "WayPoints", [dimension_data.get("LabelPosition")]
+        )
+        if point is not None
+    ]
+    is_outer_dimension = {
+        "Left": any(x < min_x for x, _ in points),
+        "Right": any(x > max_x for x, _ in points),
+        "Top": any(y < min_y for _, y in points),
+        "Bottom": any(y > max_y for _, y in points),
+    }[dimension_align]
+    if not is_outer_dimension:
+        return None
+    along_side = [
+        point[1 if dimension_align in ("Left", "Right") else 0]
+        for point in points
+    ]
+    return (min(along_side) - padding, max(along_side) + padding)
+
+
+def layoutReinforcementDimensionings(drawing_view):
+    """layoutReinforcementDimensionings(DrawingView):
+    Assigns left, right, top and bottom offsets of all automatic
+    ReinforcementDimensioning objects of drawing_view in single pass.
+    Objects with ManualOffsets set to True are left as they are. It must be
+    called after drawing_view is recomputed and before its dimensioning
+    objects are recomputed.
+
+    Outer dimensions of each side are packed on tracks so that no two
+    dimensions on same track overlap, starting from offset of drawing_view for
+    that side and placing tracks apart by the largest offset increment of
+    dimensioning objects on that side. Layout depends only on dimension
+    geometry, not on order of creation or recompute of objects. Extent of
+    dimensions along side does not depend on their offsets, so dimension data
+    is taken at current offsets of each object and is reused by its
+    execute(), if its offsets are not changed. Offsets are only set if
+    changed.
+
+    Labels of laid out objects with LabelPlacement "AvoidOverlap" are then
+    placed using one label placer shared by all of them, so that they avoid
+    each other, and their shifts are replayed by execute() of each object.
+
+    Returns list of laid out ReinforcementDimensioning objects.
+    """
+    dimensionings = sorted(
+        (
+            obj
+            for obj in drawing_view.InList
+            if getType(obj) == "ReinforcementDimensioning"
+            and obj.ParentDrawingView == drawing_view
+            and obj.WayPointsType == "Automatic"
+            and not obj.ManualOffsets
+            and obj.Rebar in drawing_view.VisibleRebars
+            and getattr(obj.Rebar, "RebarShape", None) in RebarTypes.tolist()
+        ),
+        key=lambda obj: obj.Name,
+    )
+    if not dimensionings or getattr(drawing_view, "SectionView", False):
+        return []
+
+    view_plane = getViewPlane(drawing_view.View)
+    min_x, min_y, max_x, max_y = getDrawingClipRectangle(
+        drawing_view, view_plane
+    ) or getDrawingMinMaxXY(
+        drawing_view.Structure, drawing_view.Rebars, view_plane
+    )
+    scale = drawing_view.Scale
+    sides = ("Left", "Right", "Top", "Bottom")
+    base_offsets = {
+        side: getattr(drawing_view, "Dimension{}Offset".format(side)).Value
+        for side in sides
+    }
+    requests = {side: [] for side in sides}
+    offsets = {obj.Name: dict(base_offsets) for obj in dimensionings}
+    for obj in dimensionings:
+        dimension_data_list, dimension_align = obj.Proxy.getDimensionData(
+            obj, view_plane, min_x, min_y, max_x, max_y
+        )
+        interval = getDimensionLayoutInterval(
+            dimension_data_list,
+            dimension_align,
+            min_x,
+            min_y,
+            max_x,
+            max_y,
+            obj.FontSize.Value / scale,
+        )
+        if interval:
+            requests[dimension_align].append(
+                interval + (obj.Rebar.Name, obj.Name)
+            )
+
+    dimensionings_dict = {obj.Name: obj for obj in dimensionings}
+    for side, side_requests in requests.items():
+        if not side_requests:
+            continue
+        increment = max(
+            getattr(
+                dimensionings_dict[request[3]],
+                "Dimension{}OffsetIncrement".format(side),
+            ).Value
+            for request in side_requests
+        )
+        for request, track in zip(
+            side_requests, getDimensionLayoutTracks(side_requests)
+        ):
+            offsets[request[3]][side] = base_offsets[side] + track * increment
+
+    for obj in dimensionings:
+        for side, offset in offsets[obj.Name].items():
+            prop = "Dimension{}Offset".format(side)
+            if getattr(obj, prop).Value != offset:
+                setattr(obj, prop, offset)
+
+    # Dimension data at new offsets is reused by execute() of objects
+    dimension_data_lists = {
+        obj.Name: obj.Proxy.getDimensionData(
+            obj, view_plane, min_x, min_y, max_x, max_y
+        )[0]
+        for obj in dimensionings
+    }
+    label_dimensionings = [
+        obj for obj in dimensionings if obj.LabelPlacement == "AvoidOverlap"
+    ]
+    if label_dimensionings:
+        label_placer = getDimensionLabelPlacer(
+            drawing_view.VisibleRebars,
+            view_plane,
+            max(obj.FontSize.Value for obj in label_dimensionings) / scale,
+        )
+        label_placer.addPaths(
+            [(point.x, point.y) for point in dimension_data["WayPoints"]]
+            for dimension_data_list in dimension_data_lists.values()
+            for dimension_data in dimension_data_list
+            if "WayPoints" in dimension_data
+        )
+        for obj in label_dimensionings:
+            # Labels are sized by scale of object, which is otherwise set
+            # from drawing_view only on its execute()
+            if obj.Scale != scale:
+                obj.Scale = scale
+            label_placement_recorder = LabelPlacementRecorder(label_placer)
+            obj.Proxy.getAutomaticDimensionsSVG(
+                obj,
+                dimension_data_lists[obj.Name],
+                ElementTree.Element("defs"),
+                label_placement_recorder,
+            )
+            obj.Proxy.label_shifts = label_placement_recorder.shifts
+    return dimensionings
+
+
 def makeReinforcementDimensioningObject(
     rebar,
     parent_drawing_view,
@@ -747,7 +1154,19 @@ def makeReinforcementDimensioningObject(
     dimension_multi_rebar_text_position_type=(
         DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
     ),
+    layout_dimensionings=True,
 ):
+    """makeReinforcementDimensioningObject(Rebar, ParentDrawingView,
+    [DrawingPage, ..., LayoutDimensionings]):
+    Creates and returns ReinforcementDimensioning object for rebar in
+    parent_drawing_view.
+
+    If layout_dimensionings is True, offsets of all dimensioning objects of
+    parent_drawing_view are laid out using layoutReinforcementDimensionings()
+    and then drawing_page, or dimensioning object if drawing_page is not
+    given, is recomputed. Set it to False to create multiple dimensioning
+    objects and then lay out and recompute them once.
+    """
     dimension_obj = ReinforcementDimensioning(
         rebar,
         parent_drawing_view,
@@ -788,5 +1207,10 @@ def makeReinforcementDimensioningObject(
     )
     if drawing_page:
         drawing_page.addView(dimension_obj)
-        drawing_page.recompute(True)
+    if layout_dimensionings:
+        layoutReinforcementDimensionings(parent_drawing_view)
+        if drawing_page:
+            drawing_page.recompute(True)
+        else:
+            dimension_obj.recompute(True)
     return dimension_obj
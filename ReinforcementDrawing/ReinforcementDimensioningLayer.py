@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2020 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Rebar Dimensioning Layer Object"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+
+from PySide2.QtCore import QT_TRANSLATE_NOOP
+from xml.etree import ElementTree
+
+import FreeCAD
+
+from RebarData import RebarTypes
+from RebarGeometry import getRebarGeometrySnapshot
+from .ReinforcementDrawingfunc import (
+    getViewPlane,
+    getDrawingMinMaxXY,
+    getDrawingClipRectangle,
+)
+from .ReinforcementDimensioningfunc import getRebarDimensionData
+from .ReinforcementDimensioning import (
+    ReinforcementDimensioning,
+    getDimensionLayoutInterval,
+    getDimensionLayoutTracks,
+)
+from SVGfunc import getSVGRootElement
+from .config import (
+    DIMENSION_LABEL_FORMAT,
+    DIMENSION_FONT_FAMILY,
+    DIMENSION_FONT_SIZE,
+    DIMENSION_STROKE_WIDTH,
+    DIMENSION_LINE_STYLE,
+    DIMENSION_LINE_COLOR,
+    DIMENSION_TEXT_COLOR,
+    DIMENSION_SINGLE_REBAR_LINE_START_SYMBOL,
+    DIMENSION_SINGLE_REBAR_LINE_END_SYMBOL,
+    DIMENSION_MULTI_REBAR_LINE_START_SYMBOL,
+    DIMENSION_LINE_MID_POINT_SYMBOL,
+    DIMENSION_MULTI_REBAR_LINE_END_SYMBOL,
+    DIMENSION_LEFT_OFFSET_INCREMENT,
+    DIMENSION_RIGHT_OFFSET_INCREMENT,
+    DIMENSION_TOP_OFFSET_INCREMENT,
+    DIMENSION_BOTTOM_OFFSET_INCREMENT,
+    DIMENSION_SINGLE_REBAR_OUTER_DIM,
+    DIMENSION_MULTI_REBAR_OUTER_DIM,
+    DIMENSION_SINGLE_REBAR_TEXT_POSITION_TYPE,
+    DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE,
+)
+
+
+class ReinforcementDimensioningLayer(ReinforcementDimensioning):
+    """A Rebars Dimensioning Layer SVG View object, holding automatic
+    dimensions of all rebars of a ReinforcementDrawingView."""
+
+    def __init__(
+        self,
+        parent_drawing_view,
+        dimension_left_offset_increment,
+        dimension_right_offset_increment,
+        dimension_top_offset_increment,
+        dimension_bottom_offset_increment,
+        obj_name="ReinforcementDimensioningLayer",
+    ):
+        """Initialize Rebars Dimensioning Layer SVG View object."""
+        super().__init__(
+            None,
+            parent_drawing_view,
+            dimension_left_offset_increment,
+            dimension_right_offset_increment,
+            dimension_top_offset_increment,
+            dimension_bottom_offset_increment,
+            obj_name,
+        )
+
+    def setProperties(self, obj):
+        """Add properties to ReinforcementDimensioningLayer object."""
+        super().setProperties(obj)
+        self.Type = "ReinforcementDimensioningLayer"
+
+        # Properties of single custom dimension line are not used by layer
+        for prop in (
+            "Rebar",
+            "WayPointsType",
+            "WayPoints",
+            "TextPositionType",
+            "LineStartSymbol",
+            "LineEndSymbol",
+            "ManualOffsets",
+        ):
+            obj.setEditorMode(prop, 2)
+
+        if not hasattr(obj, "Rebars"):
+            obj.addProperty(
+                "App::PropertyLinkList",
+                "Rebars",
+                "ReinforcementDimensioningLayer",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The list of rebars to generate dimensioning. Leave empty "
+                    "to dimension all visible rebars of ParentDrawingView",
+                ),
+            )
+
+        if not hasattr(obj, "ExcludedRebars"):
+            obj.addProperty(
+                "App::PropertyLinkList",
+                "ExcludedRebars",
+                "ReinforcementDimensioningLayer",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The list of rebars to be excluded from dimensioning",
+                ),
+            )
+
+        if not hasattr(obj, "OverrideRebars"):
+            obj.addProperty(
+                "App::PropertyLinkList",
+                "OverrideRebars",
+                "ReinforcementDimensioningLayer",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The list of rebars with overridden dimensioning "
+                    "properties",
+                ),
+            )
+
+        if not hasattr(obj, "OverrideDimensionFormats"):
+            obj.addProperty(
+                "App::PropertyStringList",
+                "OverrideDimensionFormats",
+                "ReinforcementDimensioningLayer",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The dimension label format of each rebar of "
+                    "OverrideRebars. Leave empty to use DimensionFormat",
+                ),
+            )
+
+        if not hasattr(obj, "OverrideOuterDimensions"):
+            obj.addProperty(
+                "App::PropertyStringList",
+                "OverrideOuterDimensions",
+                "ReinforcementDimensioningLayer",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    'The dimension lines position, "Outer" or "Inner", of each '
+                    "rebar of OverrideRebars. Leave empty to use "
+                    "SingleRebar_OuterDimension and MultiRebar_OuterDimension",
+                ),
+            )
+
+    def onDocumentRestored(self, obj):
+        """Upgrade ReinforcementDimensioningLayer object."""
+        super().onDocumentRestored(obj)
+
+    def getDimensionedRebars(self, obj):
+        """getDimensionedRebars(Object):
+        Returns list of visible rebars of ParentDrawingView to be dimensioned by
+        obj, sorted by name.
+        """
+        visible_rebars = obj.ParentDrawingView.VisibleRebars
+        rebars = obj.Rebars or visible_rebars
+        dimensioned_rebars = []
+        unsupported_rebars = []
+        for rebar in rebars:
+            if rebar not in visible_rebars or rebar in obj.ExcludedRebars:
+                continue
+            if getattr(rebar, "RebarShape", None) in RebarTypes.tolist():
+                dimensioned_rebars.append(rebar)
+            else:
+                unsupported_rebars.append(rebar.Name)
+        if unsupported_rebars:
+            FreeCAD.Console.PrintWarning(
+                "Automatic dimensioning is only supported for: {}. Skipping "
+                "dimensioning of {} in {}.\n".format(
+                    ", ".join(RebarTypes.tolist()),
+                    ", ".join(sorted(unsupported_rebars)),
+                    obj.Name,
+                )
+            )
+        return sorted(dimensioned_rebars, key=lambda rebar: rebar.Name)
+
+    def getRebarOverrides(self, obj):
+        """getRebarOverrides(Object):
+        Returns dictionary with name of each rebar of OverrideRebars as key and
+        (dimension_format, single_rebar_outer_dimension,
+        multi_rebar_outer_dimension) as value, filled from properties of obj
+        where rebar has no override.
+        """
+        rebar_overrides = {}
+        for i, rebar in enumerate(obj.OverrideRebars):
+            dimension_format = obj.DimensionFormat
+            if i < len(obj.OverrideDimensionFormats):
+                dimension_format = (
+                    obj.OverrideDimensionFormats[i] or dimension_format
+                )
+            single_rebar_outer_dimension = obj.SingleRebar_OuterDimension
+            multi_rebar_outer_dimension = obj.MultiRebar_OuterDimension
+            if i < len(obj.OverrideOuterDimensions):
+                outer_dimension = obj.OverrideOuterDimensions[i]
+                if outer_dimension in ("Outer", "Inner"):
+                    single_rebar_outer_dimension = outer_dimension == "Outer"
+                    multi_rebar_outer_dimension = outer_dimension == "Outer"
+            rebar_overrides[rebar.Name] = (
+                dimension_format,
+                single_rebar_outer_dimension,
+                multi_rebar_outer_dimension,
+            )
+        return rebar_overrides
+
+    def execute(self, obj):
+        """This function is executed to recompute
+        ReinforcementDimensioningLayer object."""
+        if not obj.ParentDrawingView:
+            FreeCAD.Console.PrintError(
+                "No ParentDrawingView, return without a reinforcement "
+                "dimensioning for {}.\n".format(obj.Name)
+            )
+            return
+
+        if getattr(obj.ParentDrawingView, "SectionView", False):
+            FreeCAD.Console.PrintError(
+                "Dimensioning of section view is not supported, return "
+                "without a reinforcement dimensioning for {}.\n".format(
+                    obj.Name
+                )
+            )
+            return
+
+        obj.Scale = obj.ParentDrawingView.Scale
+        obj.X = obj.ParentDrawingView.X
+        obj.Y = obj.ParentDrawingView.Y
+        root_svg = getSVGRootElement()
+        symbol_defs = ElementTree.SubElement(root_svg, "defs")
+
+        # View plane and drawing bounds are computed once and shared by
+        # dimensions of all rebars
+        view_plane = getViewPlane(obj.ParentDrawingView.View)
+        min_x, min_y, max_x, max_y = getDrawingClipRectangle(
+            obj.ParentDrawingView, view_plane
+        ) or getDrawingMinMaxXY(
+            obj.ParentDrawingView.Structure,
+            obj.ParentDrawingView.Rebars,
+            view_plane,
+        )
+        sides = ("Left", "Right", "Top", "Bottom")
+        base_offsets = {
+            side: getattr(obj, "Dimension{}Offset".format(side)).Value
+            / obj.Scale
+            for side in sides
+        }
+        increments = {
+            side: getattr(obj, "Dimension{}OffsetIncrement".format(side)).Value
+            / obj.Scale
+            for side in sides
+        }
+        rebar_overrides = self.getRebarOverrides(obj)
+        # Placements of rebars are read from snapshot of visible rebars of
+        # view, shared with other dimensionings of view
+        snapshot = getRebarGeometrySnapshot(
+            obj.ParentDrawingView.VisibleRebars
+        )
+
+        def getDimensionData(rebar, offsets):
+            dimension_format, single_outer_dim, multi_outer_dim = (
+                rebar_overrides.get(
+                    rebar.Name,
+                    (
+                        obj.DimensionFormat,
+                        obj.SingleRebar_OuterDimension,
+                        obj.MultiRebar_OuterDimension,
+                    ),
+                )
+            )
+            return getRebarDimensionData(
+                rebar,
+                dimension_format,
+                view_plane,
+                *(offsets[side] for side in sides),
+                min_x,
+                min_y,
+                max_x,
+                max_y,
+                obj.Scale,
+                single_outer_dim,
+                multi_outer_dim,
+                snapshot,
+            )
+
+        # Compute dimensions of all rebars at base offsets and collect extent
+        # of outer dimensions along each side
+        rebars = {
+            rebar.Name: rebar for rebar in self.getDimensionedRebars(obj)
+        }
+        rebars_dimension_data = {}
+        requests = {side: [] for side in sides}
+        for rebar in rebars.values():
+            dimension_data_list, dimension_align = getDimensionData(
+                rebar, base_offsets
+            )
+            rebars_dimension_data[rebar.Name] = dimension_data_list
+            interval = getDimensionLayoutInterval(
+                dimension_data_list,
+                dimension_align,
+                min_x,
+                min_y,
+                max_x,
+                max_y,
+                obj.FontSize.Value / obj.Scale,
+            )
+            if interval:
+                requests[dimension_align].append(interval + (rebar.Name,))
+
+        # Pack outer dimensions of each side on tracks and recompute only
+        # dimensions moved away from base track
+        for side, side_requests in requests.items():
+            for request, track in zip(
+                side_requests, getDimensionLayoutTracks(side_requests)
+            ):
+                if not track:
+                    continue
+                offsets = dict(base_offsets)
+                offsets[side] += track * increments[side]
+                rebars_dimension_data[request[2]] = getDimensionData(
+                    rebars[request[2]], offsets
+                )[0]
+
+        # Apply translation so that (0,0) in dimensioning corresponds to (0,0)
+        # in ParentDrawingView
+        dimensions_svg = ElementTree.SubElement(
+            root_svg,
+            "g",
+            transform="translate({}, {})".format(-min_x, -min_y),
+        )
+        # Labels of all rebars share one label placer, so that they avoid
+        # each other
+        label_placer = self.getLabelPlacer(
+            obj, view_plane, rebars_dimension_data.values()
+        )
+        for rebar_name in sorted(rebars_dimension_data):
+            rebar_dimensions_svg = ElementTree.SubElement(
+                dimensions_svg, "g", id=rebar_name
+            )
+            rebar_dimensions_svg.extend(
+                self.getAutomaticDimensionsSVG(
+                    obj,
+                    rebars_dimension_data[rebar_name],
+                    symbol_defs,
+                    label_placer,
+                )
+            )
+
+        self.setDimensioningSymbol(obj, root_svg, symbol_defs)
+
+
+def makeReinforcementDimensioningLayerObject(
+    parent_drawing_view,
+    drawing_page=None,
+    rebars=None,
+    dimension_label_format=DIMENSION_LABEL_FORMAT,
+    dimension_font_family=DIMENSION_FONT_FAMILY,
+    dimension_font_size=DIMENSION_FONT_SIZE,
+    dimension_stroke_width=DIMENSION_STROKE_WIDTH,
+    dimension_line_style=DIMENSION_LINE_STYLE,
+    dimension_line_color=DIMENSION_LINE_COLOR,
+    dimension_text_color=DIMENSION_TEXT_COLOR,
+    dimension_single_rebar_line_start_symbol=(
+        DIMENSION_SINGLE_REBAR_LINE_START_SYMBOL
+    ),
+    dimension_single_rebar_line_end_symbol=(
+        DIMENSION_SINGLE_REBAR_LINE_END_SYMBOL
+    ),
+    dimension_multi_rebar_line_start_symbol=(
+        DIMENSION_MULTI_REBAR_LINE_START_SYMBOL
+    ),
+    dimension_multi_rebar_line_end_symbol=(
+        DIMENSION_MULTI_REBAR_LINE_END_SYMBOL
+    ),
+    dimension_line_mid_point_symbol=DIMENSION_LINE_MID_POINT_SYMBOL,
+    dimension_left_offset_increment=DIMENSION_LEFT_OFFSET_INCREMENT,
+    dimension_right_offset_increment=DIMENSION_RIGHT_OFFSET_INCREMENT,
+    dimension_top_offset_increment=DIMENSION_TOP_OFFSET_INCREMENT,
+    dimension_bottom_offset_increment=DIMENSION_BOTTOM_OFFSET_INCREMENT,
+    dimension_single_rebar_outer_dim=DIMENSION_SINGLE_REBAR_OUTER_DIM,
+    dimension_multi_rebar_outer_dim=DIMENSION_MULTI_REBAR_OUTER_DIM,
+    dimension_single_rebar_text_position_type=(
+        DIMENSION_SINGLE_REBAR_TEXT_POSITION_TYPE
+    ),
+    dimension_multi_rebar_text_position_type=(
+        DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
+    ),
+    recompute=True,
+):
+    """makeReinforcementDimensioningLayerObject(ParentDrawingView,
+    [DrawingPage, Rebars, ..., Recompute]):
+    Creates and returns ReinforcementDimensioningLayer object holding automatic
+    dimensions of rebars in parent_drawing_view.
+
+    rebars is the list of rebars to be dimensioned. Set it to None to dimension
+    all visible rebars of parent_drawing_view.
+
+    If recompute is True, drawing_page is recomputed, or created object if
+    drawing_page is None. Set it to False to create multiple objects and then
+    recompute drawing_page once.
+    """
+    dimension_obj = ReinforcementDimensioningLayer(
+        parent_drawing_view,
+        dimension_left_offset_increment,
+        dimension_right_offset_increment,
+        dimension_top_offset_increment,
+        dimension_bottom_offset_increment,
+        "ReinforcementDimensioningLayer",
+    ).Object
+    dimension_obj.Label = ""
+    dimension_obj.Rebars = rebars or []
+    dimension_obj.DimensionFormat = dimension_label_format
+    dimension_obj.Font = dimension_font_family
+    dimension_obj.FontSize = dimension_font_size
+    dimension_obj.StrokeWidth = dimension_stroke_width
+    dimension_obj.LineStyle = dimension_line_style
+    dimension_obj.LineColor = dimension_line_color
+    dimension_obj.TextColor = dimension_text_color
+    dimension_obj.SingleRebar_LineStartSymbol = (
+        dimension_single_rebar_line_start_symbol
+    )
+    dimension_obj.SingleRebar_LineEndSymbol = (
+        dimension_single_rebar_line_end_symbol
+    )
+    dimension_obj.MultiRebar_LineStartSymbol = (
+        dimension_multi_rebar_line_start_symbol
+    )
+    dimension_obj.MultiRebar_LineEndSymbol = (
+        dimension_multi_rebar_line_end_symbol
+    )
+    dimension_obj.LineMidPointSymbol = dimension_line_mid_point_symbol
+    dimension_obj.SingleRebar_OuterDimension = dimension_single_rebar_outer_dim
+    dimension_obj.MultiRebar_OuterDimension = dimension_multi_rebar_outer_dim
+    dimension_obj.SingleRebar_TextPositionType = (
+        dimension_single_rebar_text_position_type
+    )
+    dimension_obj.MultiRebar_TextPositionType = (
+        dimension_multi_rebar_text_position_type
+    )
+    if drawing_page:
+        drawing_page.addView(dimension_obj)
+    if recompute:
+        if drawing_page:
+            drawing_page.recompute(True)
+        else:
+            dimension_obj.recompute(True)
+    return dimension_obj
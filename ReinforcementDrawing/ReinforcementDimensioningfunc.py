@@ -26,6 +26,9 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import bisect
+from collections import OrderedDict, defaultdict
+import itertools
 import math
 from xml.etree import ElementTree
 import random
@@ -33,14 +36,84 @@ import random
 import FreeCAD
 import DraftGeomUtils
 import DraftVecUtils
-import Part
+
+import numpy as np
 
 from .ReinforcementDrawingfunc import (
+    getPlacedProjectionsToSVGPlane,
+    getProjectionsToSVGPlane,
     getProjectionToSVGPlane,
+    getPlacedStirrupsProjections,
     getRebarsSpanAxis,
-    getStirrupSVGPoints,
 )
-from SVGfunc import getSVGTextElement, getLinePathElement
+from RebarGeometry import (
+    getPlacedEdges,
+    getRebarDerivedGeometry,
+    getRebarGeometrySnapshot,
+)
+from Rebarfunc import parseSpacingString
+from SVGfunc import (
+    clipLineToRectangle,
+    getSVGTextElement,
+    getLinePathElement,
+)
+
+
+def getPathCumulativeLengths(points_list):
+    """getPathCumulativeLengths(PointsList):
+    Returns list of distance of each point of points_list from start of path
+    defined by points_list, measured along path. It is the prefix sum of
+    segment lengths of path and is used for arc length queries on path.
+
+    points_list is a list of points (x, y) defining path.
+    """
+    return [0.0] + list(
+        itertools.accumulate(
+            math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+            for p1, p2 in zip(points_list, points_list[1:])
+        )
+    )
+
+
+def getPathPointAtDistance(
+    points_list, distance, cumulative_lengths=None, return_segment_index=False
+):
+    """getPathPointAtDistance(PointsList, Distance, [CumulativeLengths,
+    ReturnSegmentIndex]):
+    Returns point (x, y) of path defined by points_list at distance from start
+    of path, measured along path. distance is clamped between 0 and path
+    length.
+
+    cumulative_lengths is the list returned by getPathCumulativeLengths() for
+    points_list. It is computed, if not given.
+
+    if return_segment_index is True, then index i of segment from
+    points_list[i] to points_list[i + 1] containing point is also returned:
+    (point, i)
+    """
+    if cumulative_lengths is None:
+        cumulative_lengths = getPathCumulativeLengths(points_list)
+    i = min(
+        max(bisect.bisect_right(cumulative_lengths, distance) - 1, 0),
+        len(points_list) - 2,
+    )
+    p1 = points_list[i]
+    p2 = points_list[i + 1]
+    segment_length = cumulative_lengths[i + 1] - cumulative_lengths[i]
+    if segment_length > 0:
+        fraction = min(
+            max((distance - cumulative_lengths[i]) / segment_length, 0), 1
+        )
+    else:
+        fraction = 0
+    point = (
+        p1[0] + (p2[0] - p1[0]) * fraction,
+        p1[1] + (p2[1] - p1[1]) * fraction,
+    )
+    if return_segment_index:
+        return point, i
+    else:
+        return point
 
 
 def getPathMidPoint(points_list, return_left_right_points=False):
@@ -50,46 +123,316 @@ def getPathMidPoint(points_list, return_left_right_points=False):
     if return_left_right_points is True, then left and right points of mid_point
     are also returned: (left_point, mid_point, right_point)
     """
-    import math
-
-    points_dist = [
-        math.hypot(p1[0] - p2[0], p1[1] - p2[1])
-        for p1, p2 in zip(points_list, points_list[1:])
-    ]
-    path_length = sum(points_dist)
-
-    if len(points_list) == 2:
-        p1, p2 = points_list
-        segment_length = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-        rem_dist = path_length / 2
-        mid_point = (
-            p1[0] + (p2[0] - p1[0]) * rem_dist / segment_length,
-            p1[1] + (p2[1] - p1[1]) * rem_dist / segment_length,
+    cumulative_lengths = getPathCumulativeLengths(points_list)
+    half_path_length = cumulative_lengths[-1] / 2
+
+    # Use intermediate point as mid point, if its distance from start is same
+    # as half of path length, ignoring fractional part
+    if len(points_list) > 2:
+        i = bisect.bisect_left(
+            cumulative_lengths, math.floor(half_path_length), 1
         )
-        if return_left_right_points:
-            return p1, mid_point, p2
-        else:
-            return mid_point
-
-    for i, point in enumerate(points_list[1:], start=1):
-        if int(sum(points_dist[:i])) == int(path_length / 2):
+        if i < len(points_list) - 1 and math.floor(
+            cumulative_lengths[i]
+        ) == math.floor(half_path_length):
             if return_left_right_points:
-                return points_list[i - 1], point, points_list[i + 1]
+                return points_list[i - 1], points_list[i], points_list[i + 1]
             else:
-                return point
-        elif int(sum(points_dist[:i])) > int(path_length / 2):
-            p1 = points_list[i - 1]
-            p2 = point
-            segment_length = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
-            rem_dist = path_length / 2 - sum(points_dist[: i - 1])
-            mid_point = (
-                p1[0] + (p2[0] - p1[0]) * rem_dist / segment_length,
-                p1[1] + (p2[1] - p1[1]) * rem_dist / segment_length,
+                return points_list[i]
+
+    mid_point, i = getPathPointAtDistance(
+        points_list,
+        half_path_length,
+        cumulative_lengths,
+        return_segment_index=True,
+    )
+    if return_left_right_points:
+        return points_list[i], mid_point, points_list[i + 1]
+    else:
+        return mid_point
+
+
+class DimensionLabelPlacer:
+    """Places dimension labels at positions free of obstacles.
+
+    Obstacles are line segments e.g. of rebars and dimension lines, and boxes
+    of already placed labels. They are indexed in a uniform grid of
+    cell_size, so that checking a label position only tests obstacles in
+    cells covered by label box.
+
+    Obstacles of base label placer, if given, are also checked, but new
+    obstacles are only added to this label placer. So base label placer
+    with obstacles common to many label placers e.g. rebars of a drawing view
+    is built once and shared by them.
+    """
+
+    # Approximate width of a character, relative to font size
+    CHAR_WIDTH_FACTOR = 0.6
+
+    def __init__(self, cell_size, base=None):
+        self.cell_size = float(cell_size)
+        self.base = base
+        self.grid = defaultdict(list)
+        self.segments = []
+        self.boxes = []
+
+    def getCells(self, min_x, min_y, max_x, max_y):
+        """getCells(MinX, MinY, MaxX, MaxY):
+        Returns list of grid cells covering box.
+        """
+        min_i = math.floor(min_x / self.cell_size)
+        min_j = math.floor(min_y / self.cell_size)
+        max_i = math.floor(max_x / self.cell_size)
+        max_j = math.floor(max_y / self.cell_size)
+        return [
+            (i, j)
+            for i in range(min_i, max_i + 1)
+            for j in range(min_j, max_j + 1)
+        ]
+
+    def addSegments(self, segments):
+        """addSegments(Segments):
+        Adds line segments (x1, y1, x2, y2) to obstacles.
+        """
+        for x1, y1, x2, y2 in segments:
+            segment_id = ("Segment", len(self.segments))
+            self.segments.append((x1, y1, x2, y2))
+            # Sample points at most cell_size apart, so that each part of
+            # segment between consecutive samples lies in at most 2x2 cells
+            samples = max(
+                int(math.hypot(x2 - x1, y2 - y1) / self.cell_size) + 1, 1
             )
-            if return_left_right_points:
-                return p1, mid_point, p2
-            else:
-                return mid_point
+            cells = set()
+            px, py = x1, y1
+            for k in range(1, samples + 1):
+                qx = x1 + (x2 - x1) * k / samples
+                qy = y1 + (y2 - y1) * k / samples
+                cells.update(
+                    self.getCells(
+                        min(px, qx), min(py, qy), max(px, qx), max(py, qy)
+                    )
+                )
+                px, py = qx, qy
+            for cell in cells:
+                self.grid[cell].append(segment_id)
+
+    def addPaths(self, points_lists):
+        """addPaths(PointsLists):
+        Adds segments of each path defined by list of points (x, y) to
+        obstacles.
+        """
+        self.addSegments(
+            (p1[0], p1[1], p2[0], p2[1])
+            for points_list in points_lists
+            for p1, p2 in zip(points_list, points_list[1:])
+        )
+
+    def addBox(self, box):
+        """addBox(Box):
+        Adds box (min_x, min_y, max_x, max_y) to obstacles.
+        """
+        box_id = ("Box", len(self.boxes))
+        self.boxes.append(box)
+        for cell in self.getCells(*box):
+            self.grid[cell].append(box_id)
+
+    def isBoxFree(self, box):
+        """isBoxFree(Box):
+        Returns True if box (min_x, min_y, max_x, max_y) does not overlap any
+        obstacle, False otherwise. Obstacles only touching box are ignored.
+        """
+        if self.base is not None and not self.base.isBoxFree(box):
+            return False
+        min_x, min_y, max_x, max_y = box
+        checked_ids = set()
+        for cell in self.getCells(*box):
+            for obstacle_id in self.grid.get(cell, ()):
+                if obstacle_id in checked_ids:
+                    continue
+                checked_ids.add(obstacle_id)
+                if obstacle_id[0] == "Box":
+                    b_min_x, b_min_y, b_max_x, b_max_y = self.boxes[
+                        obstacle_id[1]
+                    ]
+                    if (
+                        b_min_x < max_x
+                        and min_x < b_max_x
+                        and b_min_y < max_y
+                        and min_y < b_max_y
+                    ):
+                        return False
+                elif clipLineToRectangle(
+                    *self.segments[obstacle_id[1]], box
+                ):
+                    return False
+        return True
+
+    def placeLabel(
+        self, label, x, y, font_size, anchor="middle", angle=0, clearance=0
+    ):
+        """placeLabel(Label, X, Y, FontSize, [Anchor, Angle, Clearance]):
+        Returns shift (along_shift, normal_shift) of label with baseline
+        anchored at (x, y) and rotated by angle in degrees, to the nearest
+        candidate position free of obstacles, and adds label box at that
+        position to obstacles.
+
+        Candidate positions are shifted by half and full label width along
+        baseline, above label by font size and to other side of dimension line
+        below label, which is clearance below baseline. If no candidate is
+        free, label is kept at (x, y).
+
+        anchor can be "start", "middle" or "end", as text-anchor of label.
+
+        along_shift is along baseline and normal_shift is perpendicular to
+        baseline towards top of label, so label shifted in its unrotated
+        coordinates is at (x + along_shift, y - normal_shift).
+        """
+        width = len(label) * font_size * self.CHAR_WIDTH_FACTOR
+        height = font_size
+        direction = (
+            math.cos(math.radians(angle)),
+            math.sin(math.radians(angle)),
+        )
+        normal = (direction[1], -direction[0])
+        start = {"start": 0, "middle": -width / 2, "end": -width}.get(
+            anchor, -width / 2
+        )
+        # Shrink box slightly, so that obstacles only touching label e.g. its
+        # own dimension line are ignored
+        tolerance = min(width, height) * 0.05
+
+        def getBox(along_shift, normal_shift):
+            xs = []
+            ys = []
+            for s in (start + tolerance, start + width - tolerance):
+                for t in (tolerance, height - tolerance):
+                    xs.append(
+                        x
+                        + (along_shift + s) * direction[0]
+                        + (normal_shift + t) * normal[0]
+                    )
+                    ys.append(
+                        y
+                        + (along_shift + s) * direction[1]
+                        + (normal_shift + t) * normal[1]
+                    )
+            return (min(xs), min(ys), max(xs), max(ys))
+
+        normal_shifts = (0, -(height + 2 * clearance), height)
+        along_shifts = (0, -width / 2, width / 2, -width, width)
+        candidates = sorted(
+            (
+                (along_shift, normal_shift)
+                for normal_shift in normal_shifts
+                for along_shift in along_shifts
+            ),
+            key=lambda shift: normal_shifts.index(shift[1])
+            + 2 * abs(shift[0]) / (width or 1),
+        )
+        for along_shift, normal_shift in candidates:
+            box = getBox(along_shift, normal_shift)
+            if self.isBoxFree(box):
+                self.addBox(box)
+                return along_shift, normal_shift
+        self.addBox(getBox(0, 0))
+        return 0, 0
+
+
+class LabelPlacementRecorder:
+    """Places labels with label_placer and records shift of each label by
+    arguments of its placeLabel() call, to be replayed by
+    RecordedLabelPlacer."""
+
+    def __init__(self, label_placer):
+        self.label_placer = label_placer
+        self.shifts = defaultdict(list)
+
+    def placeLabel(self, *args):
+        """placeLabel(Label, X, Y, FontSize, [Anchor, Angle, Clearance]):
+        Returns shift (along_shift, normal_shift) of label, as returned by
+        DimensionLabelPlacer.placeLabel().
+        """
+        shift = self.label_placer.placeLabel(*args)
+        self.shifts[args].append(shift)
+        return shift
+
+
+class RecordedLabelPlacer:
+    """Places labels at shifts recorded by LabelPlacementRecorder.
+
+    Shifts are replayed for labels placed with same arguments, in order of
+    recording. Other labels e.g. of dimensions changed after recording are
+    placed by fallback label placer, returned by getFallbackPlacer() on first
+    use.
+    """
+
+    def __init__(self, shifts, getFallbackPlacer):
+        self.shifts = shifts
+        self.getFallbackPlacer = getFallbackPlacer
+        self.fallback_placer = None
+        self.replay_counts = defaultdict(int)
+
+    def placeLabel(self, *args):
+        """placeLabel(Label, X, Y, FontSize, [Anchor, Angle, Clearance]):
+        Returns shift (along_shift, normal_shift) of label, as returned by
+        DimensionLabelPlacer.placeLabel().
+        """
+        shifts = self.shifts.get(args, ())
+        replay_count = self.replay_counts[args]
+        if replay_count < len(shifts):
+            self.replay_counts[args] = replay_count + 1
+            return shifts[replay_count]
+        if self.fallback_placer is None:
+            self.fallback_placer = self.getFallbackPlacer()
+        return self.fallback_placer.placeLabel(*args)
+
+
+# Label placers with obstacles of placed rebars. Key of cache is tuple of
+# document name, names of rebars, view plane axes and cell size. Value is
+# tuple of rebars geometry snapshot, which is replaced whenever any rebar is
+# modified, and label placer created from it.
+_REBARS_LABEL_PLACERS_CACHE = OrderedDict()
+_REBARS_LABEL_PLACERS_CACHE_SIZE = 16
+
+
+def getDimensionLabelPlacer(rebars_list, view_plane, font_size):
+    """getDimensionLabelPlacer(RebarsList, ViewPlane, FontSize):
+    Returns new DimensionLabelPlacer with projection on view_plane of
+    segments of all placements of rebars_list as obstacles.
+
+    Obstacles of rebars are held by base label placer, which is built once
+    and shared by label placers of same rebars, view plane and font size
+    until any rebar is modified.
+    """
+    cell_size = font_size * 2
+    if not rebars_list:
+        return DimensionLabelPlacer(cell_size)
+    snapshot = getRebarGeometrySnapshot(rebars_list)
+    key = (
+        rebars_list[0].Document.Name,
+        tuple(rebar.Name for rebar in rebars_list),
+        tuple(view_plane.u),
+        tuple(view_plane.v),
+        cell_size,
+    )
+    cached = _REBARS_LABEL_PLACERS_CACHE.get(key)
+    if cached is None or cached[0] is not snapshot:
+        rebars_label_placer = DimensionLabelPlacer(cell_size)
+        starts, ends, _ = snapshot.getPlacedSegments(rebars_list)
+        rebars_label_placer.addSegments(
+            np.hstack(
+                (
+                    getProjectionsToSVGPlane(starts, view_plane),
+                    getProjectionsToSVGPlane(ends, view_plane),
+                )
+            ).tolist()
+        )
+        cached = (snapshot, rebars_label_placer)
+        _REBARS_LABEL_PLACERS_CACHE[key] = cached
+    _REBARS_LABEL_PLACERS_CACHE.move_to_end(key)
+    while len(_REBARS_LABEL_PLACERS_CACHE) > _REBARS_LABEL_PLACERS_CACHE_SIZE:
+        _REBARS_LABEL_PLACERS_CACHE.popitem(last=False)
+    return DimensionLabelPlacer(cell_size, cached[1])
 
 
 def getDimensionLineSVG(
@@ -106,12 +449,14 @@ def getDimensionLineSVG(
     line_mid_points_symbol,
     line_end_symbol,
     label_offset_from_mid_of_line=None,
+    symbol_defs=None,
+    label_placer=None,
 ):
     """getDimensionLineSVG(PointsList, DimensionLabel, FontFamily, FontSize,
     DimensionLabelColor, DimensionLabelPositionType, DimensionLineStrokeWidth,
     DimensionLineStyle, DimensionLineColor, DimensionLineStartSymbol,
     DimensionLineMidPointsSymbol, DimensionLineEndSymbol,
-    LabelOffsetFromMidOfLine):
+    LabelOffsetFromMidOfLine, SymbolDefs, LabelPlacer):
     Return dimension line and label svg.
 
     points_list is a list of points (x, y) defining line path.
@@ -128,6 +473,13 @@ def getDimensionLineSVG(
 
     label_offset_from_mid_of_line is the offset of label from dimension line,
     when label_position_type is "MidOfLine".
+
+    symbol_defs is the <defs> element of dimensioning svg. If given, line
+    symbols are defined once in symbol_defs and referenced from dimension
+    line.
+
+    label_placer is the DimensionLabelPlacer. If given, label is moved to
+    nearby position free of obstacles of label_placer.
     """
     if label_offset_from_mid_of_line is None:
         label_offset_from_mid_of_line = line_stroke_width * 2
@@ -140,21 +492,20 @@ def getDimensionLineSVG(
         line_start_symbol,
         line_mid_points_symbol,
         line_end_symbol,
+        symbol_defs,
     )
     dimension_svg.append(line_svg)
 
+    label_rotation = None
+    label_clearance = 0
     if label_position_type == "MidOfLine":
         left_point, mid_point, right_point = getPathMidPoint(
             points_list, return_left_right_points=True
         )
-        label_svg = getSVGTextElement(
-            label,
-            mid_point[0],
-            mid_point[1] - label_offset_from_mid_of_line,
-            font_family,
-            font_size,
-            "middle",
-        )
+        label_x = mid_point[0]
+        label_y = mid_point[1] - label_offset_from_mid_of_line
+        label_anchor = "middle"
+        label_clearance = label_offset_from_mid_of_line
         if DraftVecUtils.isColinear(
             [
                 FreeCAD.Vector(left_point[0], left_point[1], 0),
@@ -162,20 +513,15 @@ def getDimensionLineSVG(
                 FreeCAD.Vector(right_point[0], right_point[1], 0),
             ]
         ):
-            label_svg.set(
-                "transform",
-                "rotate({} {} {})".format(
-                    math.degrees(
-                        math.atan(
-                            (right_point[1] - left_point[1])
-                            / (right_point[0] - left_point[0])
-                        )
+            label_rotation = (
+                math.degrees(
+                    math.atan(
+                        (right_point[1] - left_point[1])
+                        / (right_point[0] - left_point[0])
                     )
-                    if right_point[0] - left_point[0] != 0
-                    else -90,
-                    mid_point[0],
-                    mid_point[1],
-                ),
+                )
+                if right_point[0] - left_point[0] != 0
+                else -90
             )
     elif label_position_type in ("StartOfLine", "EndOfLine"):
         if label_position_type == "StartOfLine":
@@ -185,50 +531,68 @@ def getDimensionLineSVG(
             p1 = points_list[-2]
             p2 = points_list[-1]
 
+        label_x = p2[0]
         if abs(p2[0] - p1[0]) <= abs(p2[1] - p1[1]):
             # Line is more vertical
+            label_anchor = "middle"
             if p2[1] - p1[1] < 0:
                 # Line is from downward to upward
-                label_svg = getSVGTextElement(
-                    label,
-                    p2[0],
-                    p2[1],
-                    font_family,
-                    font_size,
-                    "middle",
-                )
+                label_y = p2[1]
             else:
                 # Line is from upward to downward
-                label_svg = getSVGTextElement(
-                    label,
-                    p2[0],
-                    p2[1] + font_size / 2,
-                    font_family,
-                    font_size,
-                    "middle",
-                )
+                label_y = p2[1] + font_size / 2
         else:
             # Line is more horizontal
+            label_y = p2[1] + font_size / 2
             if p2[0] - p1[0] < 0:
                 # Line is from right to left
-                label_svg = getSVGTextElement(
-                    label,
-                    p2[0],
-                    p2[1] + font_size / 2,
-                    font_family,
-                    font_size,
-                    "end",
-                )
+                label_anchor = "end"
             else:
                 # Line is from left to right
-                label_svg = getSVGTextElement(
-                    label,
-                    p2[0],
-                    p2[1] + font_size / 2,
-                    font_family,
-                    font_size,
-                    "start",
-                )
+                label_anchor = "start"
+
+    if label_placer:
+        # Label is rotated about mid point, so its baseline is at mid point
+        # offset along normal of rotated label
+        if label_rotation is None:
+            baseline_x, baseline_y = label_x, label_y
+        else:
+            angle = math.radians(label_rotation)
+            baseline_x = (
+                mid_point[0] + label_offset_from_mid_of_line * math.sin(angle)
+            )
+            baseline_y = (
+                mid_point[1] - label_offset_from_mid_of_line * math.cos(angle)
+            )
+        along_shift, normal_shift = label_placer.placeLabel(
+            label,
+            baseline_x,
+            baseline_y,
+            font_size,
+            label_anchor,
+            label_rotation or 0,
+            label_clearance,
+        )
+        label_x += along_shift
+        label_y -= normal_shift
+
+    label_svg = getSVGTextElement(
+        label,
+        label_x,
+        label_y,
+        font_family,
+        font_size,
+        label_anchor,
+    )
+    if label_rotation is not None:
+        label_svg.set(
+            "transform",
+            "rotate({} {} {})".format(
+                label_rotation,
+                mid_point[0],
+                mid_point[1],
+            ),
+        )
     label_svg.set("fill", label_color)
     dimension_svg.append(label_svg)
     return dimension_svg
@@ -266,6 +630,121 @@ def getRebarDimensionLabel(rebar, dimension_format):
     return dimension_label
 
 
+def getRebarPlacementMatrices(rebar, snapshot=None):
+    """getRebarPlacementMatrices(Rebar, [Snapshot]):
+    Returns (M, 4, 4) array of transformation matrices of M placements of
+    rebar.
+
+    snapshot is the RebarGeometrySnapshot already built for rebars of drawing
+    view. Matrices are taken from it if it has rebar, otherwise they are built
+    from PlacementList of rebar, without creating snapshot of single rebar.
+    """
+    if snapshot is not None and rebar.Name in snapshot.index:
+        return snapshot.getPlacementMatrices(rebar)
+    return np.array(
+        [placement.toMatrix().A for placement in rebar.PlacementList],
+        dtype=float,
+    ).reshape(-1, 4, 4)
+
+
+def getPlacedRebarPointPairs(rebar, point_pairs, view_plane, snapshot=None):
+    """getPlacedRebarPointPairs(Rebar, PointPairs, ViewPlane, [Snapshot]):
+    Returns (M, 2, 2) array of projection on view_plane of pair of points for
+    each of M placements of rebar, computed for all placements together.
+    snapshot is passed to getRebarPlacementMatrices().
+
+    point_pairs is list of candidate (point1, point2) pairs of rebar. For
+    each placement, first pair whose projection is not a single point is
+    selected, or last pair if projection of every pair is a single point.
+    """
+    matrices = getRebarPlacementMatrices(rebar, snapshot)
+    points = getPlacedProjectionsToSVGPlane(
+        [tuple(point) for point_pair in point_pairs for point in point_pair],
+        matrices,
+        view_plane,
+    ).reshape(len(matrices), len(point_pairs), 2, 2)
+    is_visible = np.any(
+        np.round(points[:, :, 0] - points[:, :, 1]) != 0, axis=2
+    )
+    pair_index = np.where(
+        is_visible.any(axis=1), is_visible.argmax(axis=1), len(point_pairs) - 1
+    )
+    return points[np.arange(len(matrices)), pair_index]
+
+
+def getRebarZonesDimensionPoints(
+    rebar, dimension_format, end_points, mid_points=None
+):
+    """getRebarZonesDimensionPoints(Rebar, DimensionFormat, EndPoints,
+    [MidPoints]):
+    Splits rebars of rebar in zones of its CustomSpacing, or in single zone
+    if rebar has no custom spacing.
+
+    end_points and mid_points are (M, 2, 2) arrays of pair of projected
+    points of rebar for each of M placements of rebar, used for first/last
+    and intermediate rebars of zones respectively. mid_points defaults to
+    end_points.
+
+    Returns tuple of lists with one item per zone:
+        rebar_start_end_points: tuple (start_p1, start_p2, end_p1, end_p2)
+        rebar_mid_points: list of (p1, p2) of intermediate rebars of zone
+        dimension_labels: dimension label of zone
+    """
+    if mid_points is None:
+        mid_points = end_points
+
+    zones = []
+    if rebar.CustomSpacing:
+        rebar_diameter = str(rebar.Diameter.Value)
+        if "." in rebar_diameter:
+            rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
+        for rebars_count, rebars_spacing in parseSpacingString(
+            rebar.CustomSpacing
+        ):
+            if rebars_count:
+                rebars_span_length = str(round(rebars_count * rebars_spacing))
+                if "." in rebars_span_length:
+                    rebars_span_length = rebars_span_length.rstrip("0").rstrip(
+                        "."
+                    )
+            else:
+                rebars_count = 1
+                rebars_span_length = ""
+            dimension_label = dimension_format.replace("%M", str(rebar.Mark))
+            dimension_label = dimension_label.replace("%C", str(rebars_count))
+            dimension_label = dimension_label.replace("%D", rebar_diameter)
+            dimension_label = dimension_label.replace(
+                "%S", rebars_span_length
+            ).strip()
+            zones.append((rebars_count, dimension_label))
+    else:
+        zones.append(
+            (len(end_points), getRebarDimensionLabel(rebar, dimension_format))
+        )
+
+    def getVectors(points):
+        return tuple(FreeCAD.Vector(x, y, 0) for x, y in points)
+
+    mid_vectors = [getVectors(points) for points in mid_points.tolist()]
+    end_points = end_points.tolist()
+    rebar_start_end_points = []
+    rebar_mid_points = []
+    dimension_labels = []
+    start_rebar_index = 0
+    for rebars_count, dimension_label in zones:
+        end_rebar_index = start_rebar_index + rebars_count - 1
+        rebar_start_end_points.append(
+            getVectors(end_points[start_rebar_index])
+            + getVectors(end_points[end_rebar_index])
+        )
+        rebar_mid_points.append(
+            mid_vectors[start_rebar_index + 1 : end_rebar_index]  # noqa: E203
+        )
+        dimension_labels.append(dimension_label)
+        start_rebar_index += rebars_count
+    return rebar_start_end_points, rebar_mid_points, dimension_labels
+
+
 def getStirrupDimensionData(
     rebar,
     dimension_format,
@@ -281,11 +760,12 @@ def getStirrupDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     drawing_plane_normal = view_plane.axis
     stirrup_span_axis = getRebarsSpanAxis(rebar)
     if round(drawing_plane_normal.cross(stirrup_span_axis).Length) == 0:
-        edges = Part.__sortEdges__(rebar.Base.Shape.Edges)
+        edges = getRebarDerivedGeometry(rebar).base_sorted_edges
         mid_edge = edges[int(len(edges) / 2)]
         mid_point = getProjectionToSVGPlane(
             DraftGeomUtils.findMidpoint(mid_edge), view_plane
@@ -309,113 +789,21 @@ def getStirrupDimensionData(
         else:
             stirrup_alignment = "H"
 
-        basewire = DraftGeomUtils.filletWire(
-            rebar.Base.Shape.Wires[0], rebar.Rounding * rebar.Diameter.Value
+        basewire = getRebarDerivedGeometry(rebar).fillet_wire
+        (
+            rebar_start_end_points,
+            rebar_mid_points,
+            dimension_labels,
+        ) = getRebarZonesDimensionPoints(
+            rebar,
+            dimension_format,
+            getPlacedStirrupsProjections(
+                basewire,
+                getRebarPlacementMatrices(rebar, snapshot),
+                stirrup_alignment,
+                view_plane,
+            ),
         )
-        rebar_start_end_points = []
-        rebar_mid_points = []
-        dimension_labels = []
-        if rebar.CustomSpacing:
-            rebar_diameter = str(rebar.Diameter.Value)
-            if "." in rebar_diameter:
-                rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
-
-            start_rebar_index = 0
-            for rebar_spacing_str in rebar.CustomSpacing.split("+"):
-                startwire = basewire.copy()
-                startwire.Placement = rebar.PlacementList[
-                    start_rebar_index
-                ].multiply(basewire.Placement)
-                start_p1, start_p2 = getStirrupSVGPoints(
-                    startwire, stirrup_alignment, view_plane
-                )
-
-                if "@" in rebar_spacing_str:
-                    rebars_count = int(rebar_spacing_str.split("@")[0])
-                    rebars_span_length = str(
-                        round(
-                            rebars_count
-                            * float(rebar_spacing_str.split("@")[1])
-                        )
-                    )
-                    if "." in rebars_span_length:
-                        rebars_span_length = rebars_span_length.rstrip(
-                            "0"
-                        ).rstrip(".")
-                else:
-                    rebars_count = 1
-                    rebars_span_length = ""
-
-                rebar_mid_points.append([])
-                for placement in rebar.PlacementList[
-                    start_rebar_index
-                    + 1 : start_rebar_index  # noqa: E203
-                    + rebars_count
-                    - 1
-                ]:
-                    mid_wire = basewire.copy()
-                    mid_wire.Placement = placement.multiply(basewire.Placement)
-                    mid_p1, mid_p2 = getStirrupSVGPoints(
-                        mid_wire, stirrup_alignment, view_plane
-                    )
-                    rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-                endwire = basewire.copy()
-                endwire.Placement = rebar.PlacementList[
-                    start_rebar_index + rebars_count - 1
-                ].multiply(basewire.Placement)
-                end_p1, end_p2 = getStirrupSVGPoints(
-                    endwire, stirrup_alignment, view_plane
-                )
-                start_rebar_index += rebars_count
-                rebar_start_end_points.append(
-                    (start_p1, start_p2, end_p1, end_p2)
-                )
-
-                dimension_label = dimension_format.replace(
-                    "%M", str(rebar.Mark)
-                )
-                dimension_label = dimension_label.replace(
-                    "%C", str(rebars_count)
-                )
-                dimension_label = dimension_label.replace("%D", rebar_diameter)
-                dimension_label = dimension_label.replace(
-                    "%S", rebars_span_length
-                ).strip()
-                dimension_labels.append(dimension_label)
-        else:
-            basewire = DraftGeomUtils.filletWire(
-                rebar.Base.Shape.Wires[0], rebar.Rounding * rebar.Diameter.Value
-            )
-            startwire = basewire.copy()
-            startwire.Placement = rebar.PlacementList[0].multiply(
-                basewire.Placement
-            )
-            start_p1, start_p2 = getStirrupSVGPoints(
-                startwire, stirrup_alignment, view_plane
-            )
-            endwire = basewire.copy()
-            endwire.Placement = rebar.PlacementList[-1].multiply(
-                basewire.Placement
-            )
-            end_p1, end_p2 = getStirrupSVGPoints(
-                endwire, stirrup_alignment, view_plane
-            )
-
-            rebar_mid_points.append([])
-            for placement in rebar.PlacementList[1:-1]:
-                mid_wire = basewire.copy()
-                mid_wire.Placement = placement.multiply(basewire.Placement)
-                mid_p1, mid_p2 = getStirrupSVGPoints(
-                    mid_wire, stirrup_alignment, view_plane
-                )
-                rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-            rebar_start_end_points.append((start_p1, start_p2, end_p1, end_p2))
-            dimension_labels.append(
-                getRebarDimensionLabel(rebar, dimension_format)
-            )
-
         dimension_data_list = []
         start_p1, start_p2, end_p1, end_p2 = rebar_start_end_points[0]
         if stirrup_alignment == "V":
@@ -633,6 +1021,7 @@ def getStraightRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -716,127 +1105,20 @@ def getStraightRebarDimensionData(
         )
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        rebar_start_end_points = []
-        rebar_mid_points = []
-        dimension_labels = []
-        if rebar.CustomSpacing:
-            rebar_diameter = str(rebar.Diameter.Value)
-            if "." in rebar_diameter:
-                rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
-
-            start_rebar_index = 0
-            for rebar_spacing_str in rebar.CustomSpacing.split("+"):
-                startwire = basewire.copy()
-                startwire.Placement = rebar.PlacementList[
-                    start_rebar_index
-                ].multiply(basewire.Placement)
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Vertexes[0].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Vertexes[1].Point, view_plane
-                )
-
-                if "@" in rebar_spacing_str:
-                    rebars_count = int(rebar_spacing_str.split("@")[0])
-                    rebars_span_length = str(
-                        round(
-                            rebars_count
-                            * float(rebar_spacing_str.split("@")[1])
-                        )
-                    )
-                    if "." in rebars_span_length:
-                        rebars_span_length = rebars_span_length.rstrip(
-                            "0"
-                        ).rstrip(".")
-                else:
-                    rebars_count = 1
-                    rebars_span_length = ""
-
-                rebar_mid_points.append([])
-                for placement in rebar.PlacementList[
-                    start_rebar_index
-                    + 1 : start_rebar_index  # noqa: E203
-                    + rebars_count
-                    - 1
-                ]:
-                    mid_wire = basewire.copy()
-                    mid_wire.Placement = placement.multiply(basewire.Placement)
-                    mid_p1 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[0].Point, view_plane
-                    )
-                    mid_p2 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[1].Point, view_plane
-                    )
-                    rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-                endwire = basewire.copy()
-                endwire.Placement = rebar.PlacementList[
-                    start_rebar_index + rebars_count - 1
-                ].multiply(basewire.Placement)
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Vertexes[0].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Vertexes[1].Point, view_plane
-                )
-                start_rebar_index += rebars_count
-                rebar_start_end_points.append(
-                    (start_p1, start_p2, end_p1, end_p2)
-                )
-
-                dimension_label = dimension_format.replace(
-                    "%M", str(rebar.Mark)
-                )
-                dimension_label = dimension_label.replace(
-                    "%C", str(rebars_count)
-                )
-                dimension_label = dimension_label.replace("%D", rebar_diameter)
-                dimension_label = dimension_label.replace(
-                    "%S", rebars_span_length
-                ).strip()
-                dimension_labels.append(dimension_label)
-        else:
-            basewire = rebar.Base.Shape.Wires[0]
-            startwire = basewire.copy()
-            startwire.Placement = rebar.PlacementList[0].multiply(
-                basewire.Placement
-            )
-            start_p1 = getProjectionToSVGPlane(
-                startwire.Vertexes[0].Point, view_plane
-            )
-            start_p2 = getProjectionToSVGPlane(
-                startwire.Vertexes[1].Point, view_plane
-            )
-
-            rebar_mid_points.append([])
-            for placement in rebar.PlacementList[1:-1]:
-                mid_wire = basewire.copy()
-                mid_wire.Placement = placement.multiply(basewire.Placement)
-                mid_p1 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[0].Point, view_plane
-                )
-                mid_p2 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[1].Point, view_plane
-                )
-                rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-            endwire = basewire.copy()
-            endwire.Placement = rebar.PlacementList[-1].multiply(
-                basewire.Placement
-            )
-            end_p1 = getProjectionToSVGPlane(
-                endwire.Vertexes[0].Point, view_plane
-            )
-            end_p2 = getProjectionToSVGPlane(
-                endwire.Vertexes[1].Point, view_plane
-            )
-
-            rebar_start_end_points.append((start_p1, start_p2, end_p1, end_p2))
-            dimension_labels.append(
-                getRebarDimensionLabel(rebar, dimension_format)
-            )
-
+        (
+            rebar_start_end_points,
+            rebar_mid_points,
+            dimension_labels,
+        ) = getRebarZonesDimensionPoints(
+            rebar,
+            dimension_format,
+            getPlacedRebarPointPairs(
+                rebar,
+                [(basewire.Vertexes[0].Point, basewire.Vertexes[1].Point)],
+                view_plane,
+                snapshot,
+            ),
+        )
         dimension_data_list = []
         for i, (start_p1, start_p2, end_p1, end_p2) in enumerate(
             rebar_start_end_points
@@ -1005,6 +1287,7 @@ def getLShapeRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1090,168 +1373,29 @@ def getLShapeRebarDimensionData(
         )
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        rebar_start_end_points = []
-        rebar_mid_points = []
-        dimension_labels = []
-        if rebar.CustomSpacing:
-            rebar_diameter = str(rebar.Diameter.Value)
-            if "." in rebar_diameter:
-                rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
-
-            start_rebar_index = 0
-            for rebar_spacing_str in rebar.CustomSpacing.split("+"):
-                startwire = basewire.copy()
-                startwire.Placement = rebar.PlacementList[
-                    start_rebar_index
-                ].multiply(basewire.Placement)
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Vertexes[0].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Vertexes[1].Point, view_plane
-                )
-                if (
-                    round(start_p1.x - start_p2.x) == 0
-                    and round(start_p1.y - start_p2.y) == 0
-                ):
-                    start_p1 = getProjectionToSVGPlane(
-                        startwire.Vertexes[-1].Point, view_plane
-                    )
-                    start_p2 = getProjectionToSVGPlane(
-                        startwire.Vertexes[-2].Point, view_plane
-                    )
-
-                if "@" in rebar_spacing_str:
-                    rebars_count = int(rebar_spacing_str.split("@")[0])
-                    rebars_span_length = str(
-                        round(
-                            rebars_count
-                            * float(rebar_spacing_str.split("@")[1])
-                        )
-                    )
-                    if "." in rebars_span_length:
-                        rebars_span_length = rebars_span_length.rstrip(
-                            "0"
-                        ).rstrip(".")
-                else:
-                    rebars_count = 1
-                    rebars_span_length = ""
-
-                rebar_mid_points.append([])
-                for placement in rebar.PlacementList[
-                    start_rebar_index
-                    + 1 : start_rebar_index  # noqa: E203
-                    + rebars_count
-                    - 1
-                ]:
-                    mid_wire = basewire.copy()
-                    mid_wire.Placement = placement.multiply(basewire.Placement)
-                    mid_p1 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[0].Point, view_plane
-                    )
-                    mid_p2 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[1].Point, view_plane
-                    )
-                    rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-                endwire = basewire.copy()
-                endwire.Placement = rebar.PlacementList[
-                    start_rebar_index + rebars_count - 1
-                ].multiply(basewire.Placement)
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Vertexes[0].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Vertexes[1].Point, view_plane
-                )
-                if (
-                    round(end_p1.x - end_p2.x) == 0
-                    and round(end_p1.y - end_p2.y) == 0
-                ):
-                    end_p1 = getProjectionToSVGPlane(
-                        endwire.Vertexes[-1].Point, view_plane
-                    )
-                    end_p2 = getProjectionToSVGPlane(
-                        endwire.Vertexes[-2].Point, view_plane
-                    )
-
-                start_rebar_index += rebars_count
-                rebar_start_end_points.append(
-                    (start_p1, start_p2, end_p1, end_p2)
-                )
-
-                dimension_label = dimension_format.replace(
-                    "%M", str(rebar.Mark)
-                )
-                dimension_label = dimension_label.replace(
-                    "%C", str(rebars_count)
-                )
-                dimension_label = dimension_label.replace("%D", rebar_diameter)
-                dimension_label = dimension_label.replace(
-                    "%S", rebars_span_length
-                ).strip()
-                dimension_labels.append(dimension_label)
-        else:
-            basewire = rebar.Base.Shape.Wires[0]
-            startwire = basewire.copy()
-            startwire.Placement = rebar.PlacementList[0].multiply(
-                basewire.Placement
-            )
-            start_p1 = getProjectionToSVGPlane(
-                startwire.Vertexes[0].Point, view_plane
-            )
-            start_p2 = getProjectionToSVGPlane(
-                startwire.Vertexes[1].Point, view_plane
-            )
-            if (
-                round(start_p1.x - start_p2.x) == 0
-                and round(start_p1.y - start_p2.y) == 0
-            ):
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Vertexes[-1].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Vertexes[-2].Point, view_plane
-                )
-
-            rebar_mid_points.append([])
-            for placement in rebar.PlacementList[1:-1]:
-                mid_wire = basewire.copy()
-                mid_wire.Placement = placement.multiply(basewire.Placement)
-                mid_p1 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[0].Point, view_plane
-                )
-                mid_p2 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[1].Point, view_plane
-                )
-                rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-            endwire = basewire.copy()
-            endwire.Placement = rebar.PlacementList[-1].multiply(
-                basewire.Placement
-            )
-            end_p1 = getProjectionToSVGPlane(
-                endwire.Vertexes[0].Point, view_plane
-            )
-            end_p2 = getProjectionToSVGPlane(
-                endwire.Vertexes[1].Point, view_plane
-            )
-            if (
-                round(end_p1.x - end_p2.x) == 0
-                and round(end_p1.y - end_p2.y) == 0
-            ):
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Vertexes[-1].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Vertexes[-2].Point, view_plane
-                )
-
-            rebar_start_end_points.append((start_p1, start_p2, end_p1, end_p2))
-            dimension_labels.append(
-                getRebarDimensionLabel(rebar, dimension_format)
-            )
-
+        (
+            rebar_start_end_points,
+            rebar_mid_points,
+            dimension_labels,
+        ) = getRebarZonesDimensionPoints(
+            rebar,
+            dimension_format,
+            getPlacedRebarPointPairs(
+                rebar,
+                [
+                    (basewire.Vertexes[0].Point, basewire.Vertexes[1].Point),
+                    (basewire.Vertexes[-1].Point, basewire.Vertexes[-2].Point),
+                ],
+                view_plane,
+                snapshot,
+            ),
+            getPlacedRebarPointPairs(
+                rebar,
+                [(basewire.Vertexes[0].Point, basewire.Vertexes[1].Point)],
+                view_plane,
+                snapshot,
+            ),
+        )
         dimension_data_list = []
         for i, (start_p1, start_p2, end_p1, end_p2) in enumerate(
             rebar_start_end_points
@@ -1420,6 +1564,7 @@ def getUShapeRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1429,9 +1574,10 @@ def getUShapeRebarDimensionData(
         round(drawing_plane_normal.cross(rebar_span_axis).Length) == 0
         or rebar.Amount == 1
     ):
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(basewire.Edges)
+        edges = getPlacedEdges(
+            getRebarDerivedGeometry(rebar).base_sorted_edges,
+            rebar.PlacementList[0],
+        )
         mid_edge = edges[int(len(edges) / 2)]
         p1 = getProjectionToSVGPlane(mid_edge.Vertexes[0].Point, view_plane)
         p2 = getProjectionToSVGPlane(mid_edge.Vertexes[1].Point, view_plane)
@@ -1505,172 +1651,29 @@ def getUShapeRebarDimensionData(
         )
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        rebar_start_end_points = []
-        rebar_mid_points = []
-        dimension_labels = []
-        if rebar.CustomSpacing:
-            rebar_diameter = str(rebar.Diameter.Value)
-            if "." in rebar_diameter:
-                rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
-
-            start_rebar_index = 0
-            for rebar_spacing_str in rebar.CustomSpacing.split("+"):
-                startwire = basewire.copy()
-                startwire.Placement = rebar.PlacementList[
-                    start_rebar_index
-                ].multiply(basewire.Placement)
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Edges[0].Vertexes[0].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Edges[0].Vertexes[1].Point, view_plane
-                )
-                for edge in startwire.Edges[1:]:
-                    if (
-                        round(start_p1.x - start_p2.x) == 0
-                        and round(start_p1.y - start_p2.y) == 0
-                    ):
-                        start_p1 = getProjectionToSVGPlane(
-                            edge.Vertexes[0].Point, view_plane
-                        )
-                        start_p2 = getProjectionToSVGPlane(
-                            edge.Vertexes[1].Point, view_plane
-                        )
-
-                if "@" in rebar_spacing_str:
-                    rebars_count = int(rebar_spacing_str.split("@")[0])
-                    rebars_span_length = str(
-                        round(
-                            rebars_count
-                            * float(rebar_spacing_str.split("@")[1])
-                        )
-                    )
-                    if "." in rebars_span_length:
-                        rebars_span_length = rebars_span_length.rstrip(
-                            "0"
-                        ).rstrip(".")
-                else:
-                    rebars_count = 1
-                    rebars_span_length = ""
-
-                rebar_mid_points.append([])
-                for placement in rebar.PlacementList[
-                    start_rebar_index
-                    + 1 : start_rebar_index  # noqa: E203
-                    + rebars_count
-                    - 1
-                ]:
-                    mid_wire = basewire.copy()
-                    mid_wire.Placement = placement.multiply(basewire.Placement)
-                    mid_p1 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[0].Point, view_plane
-                    )
-                    mid_p2 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[1].Point, view_plane
-                    )
-                    rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-                endwire = basewire.copy()
-                endwire.Placement = rebar.PlacementList[
-                    start_rebar_index + rebars_count - 1
-                ].multiply(basewire.Placement)
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Edges[0].Vertexes[0].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Edges[0].Vertexes[1].Point, view_plane
-                )
-                for edge in endwire.Edges[1:]:
-                    if (
-                        round(end_p1.x - end_p2.x) == 0
-                        and round(end_p1.y - end_p2.y) == 0
-                    ):
-                        end_p1 = getProjectionToSVGPlane(
-                            edge.Vertexes[0].Point, view_plane
-                        )
-                        end_p2 = getProjectionToSVGPlane(
-                            edge.Vertexes[1].Point, view_plane
-                        )
-
-                start_rebar_index += rebars_count
-                rebar_start_end_points.append(
-                    (start_p1, start_p2, end_p1, end_p2)
-                )
-
-                dimension_label = dimension_format.replace(
-                    "%M", str(rebar.Mark)
-                )
-                dimension_label = dimension_label.replace(
-                    "%C", str(rebars_count)
-                )
-                dimension_label = dimension_label.replace("%D", rebar_diameter)
-                dimension_label = dimension_label.replace(
-                    "%S", rebars_span_length
-                ).strip()
-                dimension_labels.append(dimension_label)
-        else:
-            basewire = rebar.Base.Shape.Wires[0]
-            startwire = basewire.copy()
-            startwire.Placement = rebar.PlacementList[0].multiply(
-                basewire.Placement
-            )
-            start_p1 = getProjectionToSVGPlane(
-                startwire.Edges[0].Vertexes[0].Point, view_plane
-            )
-            start_p2 = getProjectionToSVGPlane(
-                startwire.Edges[0].Vertexes[1].Point, view_plane
-            )
-            for edge in startwire.Edges[1:]:
-                if (
-                    round(start_p1.x - start_p2.x) == 0
-                    and round(start_p1.y - start_p2.y) == 0
-                ):
-                    start_p1 = getProjectionToSVGPlane(
-                        edge.Vertexes[0].Point, view_plane
-                    )
-                    start_p2 = getProjectionToSVGPlane(
-                        edge.Vertexes[1].Point, view_plane
-                    )
-
-            rebar_mid_points.append([])
-            for placement in rebar.PlacementList[1:-1]:
-                mid_wire = basewire.copy()
-                mid_wire.Placement = placement.multiply(basewire.Placement)
-                mid_p1 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[0].Point, view_plane
-                )
-                mid_p2 = getProjectionToSVGPlane(
-                    mid_wire.Vertexes[1].Point, view_plane
-                )
-                rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-            endwire = basewire.copy()
-            endwire.Placement = rebar.PlacementList[-1].multiply(
-                basewire.Placement
-            )
-            end_p1 = getProjectionToSVGPlane(
-                endwire.Edges[0].Vertexes[0].Point, view_plane
-            )
-            end_p2 = getProjectionToSVGPlane(
-                endwire.Edges[0].Vertexes[1].Point, view_plane
-            )
-            for edge in endwire.Edges[1:]:
-                if (
-                    round(end_p1.x - end_p2.x) == 0
-                    and round(end_p1.y - end_p2.y) == 0
-                ):
-                    end_p1 = getProjectionToSVGPlane(
-                        edge.Vertexes[0].Point, view_plane
-                    )
-                    end_p2 = getProjectionToSVGPlane(
-                        edge.Vertexes[1].Point, view_plane
-                    )
-
-            rebar_start_end_points.append((start_p1, start_p2, end_p1, end_p2))
-            dimension_labels.append(
-                getRebarDimensionLabel(rebar, dimension_format)
-            )
-
+        (
+            rebar_start_end_points,
+            rebar_mid_points,
+            dimension_labels,
+        ) = getRebarZonesDimensionPoints(
+            rebar,
+            dimension_format,
+            getPlacedRebarPointPairs(
+                rebar,
+                [
+                    (edge.Vertexes[0].Point, edge.Vertexes[1].Point)
+                    for edge in basewire.Edges
+                ],
+                view_plane,
+                snapshot,
+            ),
+            getPlacedRebarPointPairs(
+                rebar,
+                [(basewire.Vertexes[0].Point, basewire.Vertexes[1].Point)],
+                view_plane,
+                snapshot,
+            ),
+        )
         dimension_data_list = []
         for i, (start_p1, start_p2, end_p1, end_p2) in enumerate(
             rebar_start_end_points
@@ -1839,6 +1842,7 @@ def getBentRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     drawing_plane_normal = view_plane.axis
     rebar_span_axis = getRebarsSpanAxis(rebar)
@@ -1848,9 +1852,10 @@ def getBentRebarDimensionData(
         round(drawing_plane_normal.cross(rebar_span_axis).Length) == 0
         or rebar.Amount == 1
     ):
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(basewire.Edges)
+        edges = getPlacedEdges(
+            getRebarDerivedGeometry(rebar).base_sorted_edges,
+            rebar.PlacementList[0],
+        )
         mid_edge = edges[int(len(edges) / 2)]
         p1 = getProjectionToSVGPlane(mid_edge.Vertexes[0].Point, view_plane)
         p2 = getProjectionToSVGPlane(mid_edge.Vertexes[1].Point, view_plane)
@@ -1923,186 +1928,37 @@ def getBentRebarDimensionData(
         )
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        _basewire = basewire.copy()
-        _basewire.Placement = rebar.PlacementList[0].multiply(
-            basewire.Placement
+        edges = getPlacedEdges(
+            getRebarDerivedGeometry(rebar).base_sorted_edges,
+            rebar.PlacementList[0],
         )
-        edges = Part.__sortEdges__(_basewire.Edges)
         mid_edge = edges[int(len(edges) / 2)]
         if round(mid_edge.Curve.Direction.cross(view_plane.axis).Length) == 0:
             full_length_visible = False
         else:
             full_length_visible = True
 
-        rebar_start_end_points = []
-        rebar_mid_points = []
-        dimension_labels = []
-        if rebar.CustomSpacing:
-            rebar_diameter = str(rebar.Diameter.Value)
-            if "." in rebar_diameter:
-                rebar_diameter = rebar_diameter.rstrip("0").rstrip(".")
-
-            start_rebar_index = 0
-            for rebar_spacing_str in rebar.CustomSpacing.split("+"):
-                startwire = basewire.copy()
-                startwire.Placement = rebar.PlacementList[
-                    start_rebar_index
-                ].multiply(basewire.Placement)
-                if full_length_visible:
-                    start_p1 = getProjectionToSVGPlane(
-                        startwire.Vertexes[0].Point, view_plane
-                    )
-                    start_p2 = getProjectionToSVGPlane(
-                        startwire.Vertexes[-1].Point, view_plane
-                    )
-                else:
-                    start_p1 = getProjectionToSVGPlane(
-                        startwire.Edges[1].Vertexes[0].Point, view_plane
-                    )
-                    start_p2 = getProjectionToSVGPlane(
-                        startwire.Edges[1].Vertexes[1].Point, view_plane
-                    )
-
-                if "@" in rebar_spacing_str:
-                    rebars_count = int(rebar_spacing_str.split("@")[0])
-                    rebars_span_length = str(
-                        round(
-                            rebars_count
-                            * float(rebar_spacing_str.split("@")[1])
-                        )
-                    )
-                    if "." in rebars_span_length:
-                        rebars_span_length = rebars_span_length.rstrip(
-                            "0"
-                        ).rstrip(".")
-                else:
-                    rebars_count = 1
-                    rebars_span_length = ""
-
-                rebar_mid_points.append([])
-                for placement in rebar.PlacementList[
-                    start_rebar_index
-                    + 1 : start_rebar_index  # noqa: E203
-                    + rebars_count
-                    - 1
-                ]:
-                    mid_wire = basewire.copy()
-                    mid_wire.Placement = placement.multiply(basewire.Placement)
-                    if full_length_visible:
-                        mid_p1 = getProjectionToSVGPlane(
-                            mid_wire.Vertexes[0].Point, view_plane
-                        )
-                        mid_p2 = getProjectionToSVGPlane(
-                            mid_wire.Vertexes[-1].Point, view_plane
-                        )
-                    else:
-                        mid_p1 = getProjectionToSVGPlane(
-                            mid_wire.Edges[1].Vertexes[0].Point, view_plane
-                        )
-                        mid_p2 = getProjectionToSVGPlane(
-                            mid_wire.Edges[1].Vertexes[1].Point, view_plane
-                        )
-                    rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-                endwire = basewire.copy()
-                endwire.Placement = rebar.PlacementList[
-                    start_rebar_index + rebars_count - 1
-                ].multiply(basewire.Placement)
-                if full_length_visible:
-                    end_p1 = getProjectionToSVGPlane(
-                        endwire.Vertexes[0].Point, view_plane
-                    )
-                    end_p2 = getProjectionToSVGPlane(
-                        endwire.Vertexes[-1].Point, view_plane
-                    )
-                else:
-                    end_p1 = getProjectionToSVGPlane(
-                        endwire.Edges[1].Vertexes[0].Point, view_plane
-                    )
-                    end_p2 = getProjectionToSVGPlane(
-                        endwire.Edges[1].Vertexes[1].Point, view_plane
-                    )
-
-                start_rebar_index += rebars_count
-                rebar_start_end_points.append(
-                    (start_p1, start_p2, end_p1, end_p2)
-                )
-
-                dimension_label = dimension_format.replace(
-                    "%M", str(rebar.Mark)
-                )
-                dimension_label = dimension_label.replace(
-                    "%C", str(rebars_count)
-                )
-                dimension_label = dimension_label.replace("%D", rebar_diameter)
-                dimension_label = dimension_label.replace(
-                    "%S", rebars_span_length
-                ).strip()
-                dimension_labels.append(dimension_label)
-        else:
-            startwire = basewire.copy()
-            startwire.Placement = rebar.PlacementList[0].multiply(
-                basewire.Placement
-            )
-            if full_length_visible:
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Vertexes[0].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Vertexes[-1].Point, view_plane
-                )
-            else:
-                start_p1 = getProjectionToSVGPlane(
-                    startwire.Edges[1].Vertexes[0].Point, view_plane
-                )
-                start_p2 = getProjectionToSVGPlane(
-                    startwire.Edges[1].Vertexes[1].Point, view_plane
-                )
-
-            rebar_mid_points.append([])
-            for placement in rebar.PlacementList[1:-1]:
-                mid_wire = basewire.copy()
-                mid_wire.Placement = placement.multiply(basewire.Placement)
-                if full_length_visible:
-                    mid_p1 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[0].Point, view_plane
-                    )
-                    mid_p2 = getProjectionToSVGPlane(
-                        mid_wire.Vertexes[-1].Point, view_plane
-                    )
-                else:
-                    mid_p1 = getProjectionToSVGPlane(
-                        mid_wire.Edges[1].Vertexes[0].Point, view_plane
-                    )
-                    mid_p2 = getProjectionToSVGPlane(
-                        mid_wire.Edges[1].Vertexes[1].Point, view_plane
-                    )
-                rebar_mid_points[-1].append((mid_p1, mid_p2))
-
-            endwire = basewire.copy()
-            endwire.Placement = rebar.PlacementList[-1].multiply(
-                basewire.Placement
+        if full_length_visible:
+            point_pair = (
+                basewire.Vertexes[0].Point,
+                basewire.Vertexes[-1].Point,
             )
-            if full_length_visible:
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Vertexes[0].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Vertexes[-1].Point, view_plane
-                )
-            else:
-                end_p1 = getProjectionToSVGPlane(
-                    endwire.Edges[1].Vertexes[0].Point, view_plane
-                )
-                end_p2 = getProjectionToSVGPlane(
-                    endwire.Edges[1].Vertexes[1].Point, view_plane
-                )
-
-            rebar_start_end_points.append((start_p1, start_p2, end_p1, end_p2))
-            dimension_labels.append(
-                getRebarDimensionLabel(rebar, dimension_format)
+        else:
+            point_pair = (
+                basewire.Edges[1].Vertexes[0].Point,
+                basewire.Edges[1].Vertexes[1].Point,
             )
-
+        (
+            rebar_start_end_points,
+            rebar_mid_points,
+            dimension_labels,
+        ) = getRebarZonesDimensionPoints(
+            rebar,
+            dimension_format,
+            getPlacedRebarPointPairs(
+                rebar, [point_pair], view_plane, snapshot
+            ),
+        )
         dimension_data_list = []
         for i, (start_p1, start_p2, end_p1, end_p2) in enumerate(
             rebar_start_end_points
@@ -2438,6 +2294,7 @@ def getRebarDimensionData(
     scale,
     single_rebar_outer_dimension,
     multi_rebar_outer_dimension,
+    snapshot=None,
 ):
     if rebar.RebarShape == "Stirrup":
         dimension_data = getStirrupDimensionData(
@@ -2455,6 +2312,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            snapshot,
         )
     elif rebar.RebarShape == "StraightRebar":
         dimension_data = getStraightRebarDimensionData(
@@ -2472,6 +2330,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            snapshot,
         )
     elif rebar.RebarShape == "LShapeRebar":
         dimension_data = getLShapeRebarDimensionData(
@@ -2489,6 +2348,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            snapshot,
         )
     elif rebar.RebarShape == "UShapeRebar":
         dimension_data = getUShapeRebarDimensionData(
@@ -2506,6 +2366,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            snapshot,
         )
     elif rebar.RebarShape == "BentShapeRebar":
         dimension_data = getBentRebarDimensionData(
@@ -2523,6 +2384,7 @@ def getRebarDimensionData(
             scale,
             single_rebar_outer_dimension,
             multi_rebar_outer_dimension,
+            snapshot,
         )
     elif rebar.RebarShape == "HelicalRebar":
         dimension_data = getHelicalRebarDimensionData(
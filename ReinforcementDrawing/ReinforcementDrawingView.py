@@ -35,7 +35,10 @@ from Draft import getrgb
 from .ReinforcementDrawingfunc import (
     getViewPlane,
     getSVGWidthHeight,
+    getDrawingClipRectangle,
     getReinforcementDrawingSVGData,
+    getReinforcementSectionData,
+    getReinforcementSectionSVGData,
 )
 from SVGfunc import getTechdrawViewScalingFactor
 from .config import (
@@ -180,6 +183,32 @@ class ReinforcementDrawingView:
             )
             obj.StructureColor = (0.3, 0.9, 0.91)
 
+        if not hasattr(obj, "CompactSVG"):
+            obj.addProperty(
+                "App::PropertyBool",
+                "CompactSVG",
+                "ReinforcementDrawingView",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Merge rebars edges with same style into single svg path "
+                    "to reduce Reinforcement Drawing svg size",
+                ),
+            )
+            obj.CompactSVG = False
+
+        if not hasattr(obj, "SVGPrecision"):
+            obj.addProperty(
+                "App::PropertyInteger",
+                "SVGPrecision",
+                "ReinforcementDrawingView",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The number of decimal places of coordinates in compact "
+                    "Reinforcement Drawing svg",
+                ),
+            )
+            obj.SVGPrecision = 1
+
         if not hasattr(obj, "Template"):
             obj.addProperty(
                 "App::PropertyLink",
@@ -302,6 +331,125 @@ class ReinforcementDrawingView:
             )
         obj.setEditorMode("VisibleRebars", 2)
 
+        if not hasattr(obj, "LODMode"):
+            obj.addProperty(
+                "App::PropertyEnumeration",
+                "LODMode",
+                "LevelOfDetail",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The level of detail mode for uniformly spaced rebars "
+                    "closer than LODMinSpacing on drawing",
+                ),
+            ).LODMode = ["None", "FirstLast", "Subset"]
+            obj.LODMode = "None"
+
+        if not hasattr(obj, "LODMinSpacing"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "LODMinSpacing",
+                "LevelOfDetail",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The minimum spacing on drawing between uniformly spaced "
+                    "rebars to draw all of them",
+                ),
+            )
+            obj.LODMinSpacing = 1
+
+        if not hasattr(obj, "SectionView"):
+            obj.addProperty(
+                "App::PropertyBool",
+                "SectionView",
+                "Section",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "Generate section of structure and rebars by section plane "
+                    "instead of elevation view",
+                ),
+            )
+
+        if not hasattr(obj, "SectionPoint"):
+            obj.addProperty(
+                "App::PropertyVector",
+                "SectionPoint",
+                "Section",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The point on section plane",
+                ),
+            )
+
+        if not hasattr(obj, "SectionDirection"):
+            obj.addProperty(
+                "App::PropertyVector",
+                "SectionDirection",
+                "Section",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The normal of section plane, pointing towards viewer",
+                ),
+            )
+            obj.SectionDirection = FreeCAD.Vector(1, 0, 0)
+
+        if not hasattr(obj, "SectionDepth"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "SectionDepth",
+                "Section",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The depth behind section plane upto which rebars lying "
+                    "parallel to section plane are shown",
+                ),
+            )
+
+        if not hasattr(obj, "DetailWindowX"):
+            obj.addProperty(
+                "App::PropertyDistance",
+                "DetailWindowX",
+                "DetailWindow",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The x offset of detail window from left of complete "
+                    "drawing",
+                ),
+            )
+
+        if not hasattr(obj, "DetailWindowY"):
+            obj.addProperty(
+                "App::PropertyDistance",
+                "DetailWindowY",
+                "DetailWindow",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The y offset of detail window from top of complete "
+                    "drawing",
+                ),
+            )
+
+        if not hasattr(obj, "DetailWindowWidth"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DetailWindowWidth",
+                "DetailWindow",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The width of detail window, 0 to disable detail window",
+                ),
+            )
+
+        if not hasattr(obj, "DetailWindowHeight"):
+            obj.addProperty(
+                "App::PropertyLength",
+                "DetailWindowHeight",
+                "DetailWindow",
+                QT_TRANSLATE_NOOP(
+                    "App::Property",
+                    "The height of detail window, 0 to disable detail window",
+                ),
+            )
+
         # These offsets are used by ReinforcementDimensioning objects to
         # auto-calculate rebars dimension points to align dimension text to
         # left, right, top or bottom line
@@ -312,8 +460,8 @@ class ReinforcementDrawingView:
                 "ReinforcementDimensioning",
                 QT_TRANSLATE_NOOP(
                     "App::Property",
-                    "The left offset for each new ReinforcementDimensioning "
-                    "object",
+                    "The left offset of innermost track of "
+                    "ReinforcementDimensioning objects",
                 ),
                 8,
             )
@@ -327,8 +475,8 @@ class ReinforcementDrawingView:
                 "ReinforcementDimensioning",
                 QT_TRANSLATE_NOOP(
                     "App::Property",
-                    "The right offset for each new ReinforcementDimensioning "
-                    "object",
+                    "The right offset of innermost track of "
+                    "ReinforcementDimensioning objects",
                 ),
                 8,
             )
@@ -342,8 +490,8 @@ class ReinforcementDrawingView:
                 "ReinforcementDimensioning",
                 QT_TRANSLATE_NOOP(
                     "App::Property",
-                    "The top offset for each new ReinforcementDimensioning "
-                    "object",
+                    "The top offset of innermost track of "
+                    "ReinforcementDimensioning objects",
                 ),
                 8,
             )
@@ -357,8 +505,8 @@ class ReinforcementDrawingView:
                 "ReinforcementDimensioning",
                 QT_TRANSLATE_NOOP(
                     "App::Property",
-                    "The bottom offset for each new ReinforcementDimensioning "
-                    "object",
+                    "The bottom offset of innermost track of "
+                    "ReinforcementDimensioning objects",
                 ),
                 8,
             )
@@ -393,10 +541,28 @@ class ReinforcementDrawingView:
             obj.setEditorMode("X", 0)
             obj.setEditorMode("Y", 0)
 
-        view_plane = getViewPlane(obj.View)
-        obj.Width, obj.Height = getSVGWidthHeight(
-            obj.Structure, obj.Rebars, view_plane
-        )
+        if obj.SectionView:
+            section_data = getReinforcementSectionData(
+                obj.Structure,
+                obj.Rebars,
+                obj.SectionPoint,
+                obj.SectionDirection,
+                obj.SectionDepth.Value,
+            )
+            min_x, min_y, max_x, max_y = section_data["min_max_xy"]
+            obj.Width = round(max_x - min_x)
+            obj.Height = round(max_y - min_y)
+        else:
+            view_plane = getViewPlane(obj.View)
+            clip_rectangle = getDrawingClipRectangle(obj, view_plane)
+            if clip_rectangle:
+                min_x, min_y, max_x, max_y = clip_rectangle
+                obj.Width = round(max_x - min_x)
+                obj.Height = round(max_y - min_y)
+            else:
+                obj.Width, obj.Height = getSVGWidthHeight(
+                    obj.Structure, obj.Rebars, view_plane
+                )
 
         if obj.ScaleType == "Automatic":
             scaling_factor = getTechdrawViewScalingFactor(
@@ -436,15 +602,32 @@ class ReinforcementDrawingView:
         else:
             rebars_color_style = getrgb(obj.RebarsColor)
 
-        reinforcement_drawing_data = getReinforcementDrawingSVGData(
-            obj.Structure,
-            obj.Rebars,
-            view_plane,
-            obj.RebarsStrokeWidth.Value / obj.Scale,
-            rebars_color_style,
-            obj.StructureStrokeWidth.Value / obj.Scale,
-            struct_fill_style,
-        )
+        svg_precision = max(obj.SVGPrecision, 0) if obj.CompactSVG else None
+        if obj.SectionView:
+            reinforcement_drawing_data = getReinforcementSectionSVGData(
+                obj.Structure,
+                section_data,
+                obj.RebarsStrokeWidth.Value / obj.Scale,
+                rebars_color_style,
+                obj.StructureStrokeWidth.Value / obj.Scale,
+                struct_fill_style,
+                svg_precision,
+            )
+        else:
+            reinforcement_drawing_data = getReinforcementDrawingSVGData(
+                obj.Structure,
+                obj.Rebars,
+                view_plane,
+                obj.RebarsStrokeWidth.Value / obj.Scale,
+                rebars_color_style,
+                obj.StructureStrokeWidth.Value / obj.Scale,
+                struct_fill_style,
+                clip_rectangle,
+                svg_precision,
+                obj.LODMode,
+                obj.Scale,
+                obj.LODMinSpacing.Value,
+            )
         obj.Symbol = ElementTree.tostring(
             reinforcement_drawing_data["svg"], encoding="unicode"
         )
@@ -26,46 +26,49 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import copy
 import math
 from xml.etree import ElementTree
 
 import FreeCAD
-import Part
+import numpy as np
 import Draft
 import DraftGeomUtils
 import DraftVecUtils
 import WorkingPlane
 from importSVG import getcolor
 
+from RebarGeometry import (
+    getObjectRevision,
+    getPlaneSegmentsIntersection,
+    getRebarDerivedGeometry,
+    getRebarGeometrySnapshot,
+)
 from SVGfunc import (
+    clipSVGElement,
+    compactSVGElement,
     getSVGRootElement,
+    setSVGFillOpacity,
     getPointSVG,
     isPointInSVG,
     getLineSVG,
     isLineInSVG,
+    getSVGTextElement,
 )
+from .config import DIMENSION_FONT_FAMILY, DIMENSION_FONT_SIZE
+
+# Structure svg cache with (document name, structure name, structure
+# revision, view plane, stroke width, fill style) as key and structure svg
+# element as value
+_STRUCTURE_SVG_CACHE = {}
+_STRUCTURE_SVG_CACHE_SIZE = 32
 
 
 def getRebarsSpanAxis(rebar):
     """getRebarsSpanAxis(Rebar):
     Returns span axis of rebars.
     """
-    if (
-        Draft.getType(rebar.Base) == "Wire"
-        or rebar.Base.Shape.ShapeType == "Wire"
-    ) and len(
-        rebar.Base.Shape.Wires[0].Edges
-    ) != 1:  # Draft Wires can have "wrong" placement
-        # This works fine instead for straight rebars i.e. for rebars having
-        # base wire with only one edge
-        axis = DraftGeomUtils.getNormal(rebar.Base.Shape)
-    else:
-        axis = rebar.Base.Placement.Rotation.multVec(FreeCAD.Vector(0, 0, -1))
-    if hasattr(rebar, "Direction"):
-        if not DraftVecUtils.isNull(rebar.Direction):
-            axis = FreeCAD.Vector(rebar.Direction)
-            axis.normalize()
-    return axis
+    return getRebarDerivedGeometry(rebar).span_axis
 
 
 def getViewPlane(view):
@@ -139,19 +142,61 @@ def getSVGPlaneFromAxis(axis=FreeCAD.Vector(0, -1, 0)):
     return view_plane
 
 
+def getProjectionsToSVGPlane(points, plane):
+    """getProjectionsToSVGPlane(Points, Plane):
+    Returns (N, 2) numpy array of projection of points on plane, where points
+    is list of FreeCAD.Vector or (N, 3) array like of point coordinates.
+    Projection along plane.u and plane.v are x and y coordinates respectively.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    axes = np.array([tuple(plane.u), tuple(plane.v)], dtype=float)
+    axes /= np.linalg.norm(axes, axis=1)[:, np.newaxis]
+    # Adding 0.0 converts -0.0 to 0.0
+    return points @ axes.T + 0.0
+
+
+def getPlacedProjectionsToSVGPlane(points, placements, plane):
+    """getPlacedProjectionsToSVGPlane(Points, Placements, Plane):
+    Returns (M, N, 2) numpy array of projection of N points on plane, after
+    transforming points by each of M placements. placements can be list of
+    FreeCAD.Placement or (M, 4, 4) array of transformation matrices e.g. from
+    RebarGeometrySnapshot.getPlacementMatrices().
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    if isinstance(placements, np.ndarray):
+        matrices = placements.reshape(-1, 4, 4)
+    else:
+        matrices = np.array(
+            [placement.toMatrix().A for placement in placements], dtype=float
+        ).reshape(-1, 4, 4)
+    placed_points = (
+        np.einsum("mij,nj->mni", matrices[:, :3, :3], points)
+        + matrices[:, np.newaxis, :3, 3]
+    )
+    return getProjectionsToSVGPlane(placed_points, plane).reshape(
+        len(matrices), len(points), 2
+    )
+
+
+def getPlacedSVGPoints(points, placements, plane):
+    """getPlacedSVGPoints(Points, Placements, Plane):
+    Returns list of tuples of projection of points on plane, after
+    transforming points by each placement.
+    """
+    return [
+        tuple(FreeCAD.Vector(x, y, 0) for x, y in placed_points)
+        for placed_points in getPlacedProjectionsToSVGPlane(
+            points, placements, plane
+        ).tolist()
+    ]
+
+
 def getProjectionToSVGPlane(vec, plane):
     """getProjectionToSVGPlane(Vector, Plane):
     Returns projection of vector on plane.
     """
-    nx = DraftVecUtils.project(vec, plane.u)
-    lx = nx.Length
-    if abs(nx.getAngle(plane.u)) > 0.1:
-        lx = -lx
-    ny = DraftVecUtils.project(vec, plane.v)
-    ly = ny.Length
-    if abs(ny.getAngle(plane.v)) > 0.1:
-        ly = -ly
-    return FreeCAD.Vector(lx, ly, 0)
+    x, y = getProjectionsToSVGPlane([tuple(vec)], plane)[0].tolist()
+    return FreeCAD.Vector(x, y, 0)
 
 
 def getDrawingMinMaxXY(structure, rebars_list, view_plane):
@@ -171,23 +216,73 @@ def getDrawingMinMaxXY(structure, rebars_list, view_plane):
     else:
         pts = [0, 3, 4, 7]
 
-    bounding_box = Part.Compound(
-        [rebar.Shape for rebar in rebars_list] + [structure.Shape]
-    ).BoundBox
-    point = getProjectionToSVGPlane(bounding_box.getPoint(pts[0]), view_plane)
-    min_x = point.x
-    min_y = point.y
-    max_x = point.x
-    max_y = point.y
-    for pt in pts[1:]:
-        point = getProjectionToSVGPlane(bounding_box.getPoint(pt), view_plane)
-        min_x = min(min_x, point.x)
-        min_y = min(min_y, point.y)
-        max_x = max(max_x, point.x)
-        max_y = max(max_y, point.y)
+    bounding_box = getRebarGeometrySnapshot(rebars_list).getBoundBox()
+    bounding_box.add(structure.Shape.BoundBox)
+    points = getProjectionsToSVGPlane(
+        [tuple(bounding_box.getPoint(pt)) for pt in pts], view_plane
+    )
+    min_x, min_y = points.min(axis=0).tolist()
+    max_x, max_y = points.max(axis=0).tolist()
     return min_x, min_y, max_x, max_y
 
 
+def getDrawingClipRectangle(drawing_view, view_plane):
+    """getDrawingClipRectangle(DrawingView, ViewPlane):
+    Returns (min_x, min_y, max_x, max_y) of detail window of drawing_view
+    intersected with drawing extents, or None if detail window is disabled.
+    """
+    width = getattr(drawing_view, "DetailWindowWidth", None)
+    height = getattr(drawing_view, "DetailWindowHeight", None)
+    if not width or not height or not width.Value or not height.Value:
+        return None
+    min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
+        drawing_view.Structure, drawing_view.Rebars, view_plane
+    )
+    clip_min_x = max(min_x, min_x + drawing_view.DetailWindowX.Value)
+    clip_min_y = max(min_y, min_y + drawing_view.DetailWindowY.Value)
+    clip_max_x = min(max_x, clip_min_x + width.Value)
+    clip_max_y = min(max_y, clip_min_y + height.Value)
+    if clip_max_x <= clip_min_x or clip_max_y <= clip_min_y:
+        return None
+    return clip_min_x, clip_min_y, clip_max_x, clip_max_y
+
+
+def getRebarsSVGBounds(rebars_list, view_plane):
+    """getRebarsSVGBounds(RebarsList, ViewPlane):
+    Returns (R, 4) numpy array of (min_x, min_y, max_x, max_y) of projection
+    of bounding box of each rebar on view_plane.
+    """
+    snapshot = getRebarGeometrySnapshot(rebars_list)
+    bounds = snapshot.bounds[
+        [snapshot.getRebarIndex(rebar) for rebar in rebars_list]
+    ].reshape(-1, 2, 3)
+    # Corners of bounding box as combinations of min/max of each coordinate
+    corners_index = np.array(
+        [(i, j, k) for i in (0, 1) for j in (0, 1) for k in (0, 1)]
+    )
+    corners = bounds[:, corners_index, np.arange(3)]
+    points = getProjectionsToSVGPlane(corners, view_plane).reshape(-1, 8, 2)
+    return np.hstack((points.min(axis=1), points.max(axis=1)))
+
+
+def getRebarsInClipRectangle(rebars_list, view_plane, clip_rectangle):
+    """getRebarsInClipRectangle(RebarsList, ViewPlane, ClipRectangle):
+    Returns list of rebars whose projected bounding box on view_plane overlaps
+    clip_rectangle (min_x, min_y, max_x, max_y).
+    """
+    if not rebars_list:
+        return []
+    rebars_bounds = getRebarsSVGBounds(rebars_list, view_plane)
+    min_x, min_y, max_x, max_y = clip_rectangle
+    overlap = (
+        (rebars_bounds[:, 0] <= max_x)
+        & (rebars_bounds[:, 2] >= min_x)
+        & (rebars_bounds[:, 1] <= max_y)
+        & (rebars_bounds[:, 3] >= min_y)
+    )
+    return [rebar for rebar, inside in zip(rebars_list, overlap) if inside]
+
+
 def getSVGWidthHeight(structure, rebars_list, view_plane):
     """getSVGWidthHeight(Structure, RebarsList, ViewPlane):
     Returns a tuple of width and height of svg.
@@ -296,49 +391,81 @@ def getRebarColor(rebar, rebar_color_style="shape color"):
     return rebar_color
 
 
-def getStirrupSVGPoints(stirrup_wire, stirrup_alignment, view_plane):
-    """getStirrupSVGPoints(StirrupWire, StirrupAlignment, ViewPlane):
+def getPlacedStirrupsProjections(
+    stirrup_wire, placements, stirrup_alignment, view_plane
+):
+    """getPlacedStirrupsProjections(StirrupWire, Placements,
+    StirrupAlignment, ViewPlane):
     stirrup_alignment can be "V" for vertical, horizontal otherwise.
-    Returns points corresponding to line representation of stirrup in
-    view_plane.
+    Returns (M, 2, 2) numpy array of end points of line representation of
+    stirrup in view_plane, after transforming stirrup_wire by each of M
+    placements. placements can be list of FreeCAD.Placement or (M, 4, 4)
+    array of transformation matrices.
     """
-    first_point = getProjectionToSVGPlane(
-        stirrup_wire.Vertexes[0].Point, view_plane
+    points = getPlacedProjectionsToSVGPlane(
+        [tuple(vertex.Point) for vertex in stirrup_wire.Vertexes],
+        placements,
+        view_plane,
     )
-    min_x = first_point.x
-    min_y = first_point.y
-    max_x = first_point.x
-    max_y = first_point.y
-    for vertex in stirrup_wire.Vertexes[1:]:
-        point = getProjectionToSVGPlane(vertex.Point, view_plane)
-        min_x = min(min_x, point.x)
-        min_y = min(min_y, point.y)
-        max_x = max(max_x, point.x)
-        max_y = max(max_y, point.y)
+    min_xy = points.min(axis=1)
+    max_xy = points.max(axis=1)
+    mid_xy = (min_xy + max_xy) / 2
     if stirrup_alignment == "V":
-        x_cord = (min_x + max_x) / 2
-        return (
-            FreeCAD.Vector(x_cord, min_y, 0),
-            FreeCAD.Vector(x_cord, max_y, 0),
+        lines = np.stack(
+            (mid_xy[:, 0], min_xy[:, 1], mid_xy[:, 0], max_xy[:, 1]), axis=1
         )
     else:
-        y_cord = (min_y + max_y) / 2
-        return (
-            FreeCAD.Vector(min_x, y_cord, 0),
-            FreeCAD.Vector(max_x, y_cord, 0),
+        lines = np.stack(
+            (min_xy[:, 0], mid_xy[:, 1], max_xy[:, 0], mid_xy[:, 1]), axis=1
         )
+    return lines.reshape(-1, 2, 2)
+
+
+def getPlacedStirrupsSVGPoints(
+    stirrup_wire, placements, stirrup_alignment, view_plane
+):
+    """getPlacedStirrupsSVGPoints(StirrupWire, Placements, StirrupAlignment,
+    ViewPlane):
+    stirrup_alignment can be "V" for vertical, horizontal otherwise.
+    Returns list of tuples of points corresponding to line representation of
+    stirrup in view_plane, after transforming stirrup_wire by each placement.
+    """
+    return [
+        (FreeCAD.Vector(x1, y1, 0), FreeCAD.Vector(x2, y2, 0))
+        for (x1, y1), (x2, y2) in getPlacedStirrupsProjections(
+            stirrup_wire, placements, stirrup_alignment, view_plane
+        ).tolist()
+    ]
+
+
+def getStirrupSVGPoints(stirrup_wire, stirrup_alignment, view_plane):
+    """getStirrupSVGPoints(StirrupWire, StirrupAlignment, ViewPlane):
+    stirrup_alignment can be "V" for vertical, horizontal otherwise.
+    Returns points corresponding to line representation of stirrup in
+    view_plane.
+    """
+    return getPlacedStirrupsSVGPoints(
+        stirrup_wire, [FreeCAD.Placement()], stirrup_alignment, view_plane
+    )[0]
 
 
 def getStirrupSVGData(
-    rebar, view_plane, rebars_svg, rebars_stroke_width, rebars_color_style
+    rebar,
+    view_plane,
+    rebars_svg,
+    rebars_stroke_width,
+    rebars_color_style,
+    placements=None,
 ):
     """getStirrupSVGData(StirrupRebar, ViewPlane, RebarsSVG, RebarsStrokeWidth,
-    RebarsColorStyle):
+    RebarsColorStyle, [Placements]):
     Returns dictionary containing stirrup svg data.
 
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
+    placements is list of placements of rebar to be drawn, default is
+    PlacementList of rebar.
 
     Returns dictionary format:
     {
@@ -346,6 +473,8 @@ def getStirrupSVGData(
         "visibility": is_rebar_visible,
     }
     """
+    if placements is None:
+        placements = rebar.PlacementList
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
     stirrup_svg = ElementTree.Element("g", attrib={"id": str(rebar.Name)})
@@ -353,13 +482,8 @@ def getStirrupSVGData(
     drawing_plane_normal = view_plane.axis
     stirrup_span_axis = getRebarsSpanAxis(rebar)
     if round(drawing_plane_normal.cross(stirrup_span_axis).Length) == 0:
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(
-            DraftGeomUtils.filletWire(
-                basewire,
-                rebar.Rounding * rebar.Diameter.Value,
-            ).Edges
+        edges = getRebarDerivedGeometry(rebar).getPlacedSortedEdges(
+            rebar.PlacementList[0]
         )
         for edge in edges:
             if DraftGeomUtils.geomType(edge) == "Line":
@@ -387,13 +511,10 @@ def getStirrupSVGData(
             stirrup_alignment = "V"
         else:
             stirrup_alignment = "H"
-        basewire = DraftGeomUtils.filletWire(
-            rebar.Base.Shape.Wires[0], rebar.Rounding * rebar.Diameter.Value
-        )
-        for placement in rebar.PlacementList:
-            wire = basewire.copy()
-            wire.Placement = placement.multiply(basewire.Placement)
-            p1, p2 = getStirrupSVGPoints(wire, stirrup_alignment, view_plane)
+        basewire = getRebarDerivedGeometry(rebar).fillet_wire
+        for p1, p2 in getPlacedStirrupsSVGPoints(
+            basewire, placements, stirrup_alignment, view_plane
+        ):
             rebar_svg = getLineSVG(p1, p2, rebars_stroke_width, rebars_color)
             if not isLineInSVG(p1, p2, rebars_svg):
                 is_rebar_visible = True
@@ -412,14 +533,17 @@ def getUShapeRebarSVGData(
     rebars_stroke_width,
     rebars_color_style,
     longitudinal_line_dia=None,
+    placements=None,
 ):
     """getUShapeRebarSVGData(UShapeRebar, ViewPlane, RebarsSVG,
-    RebarsStrokeWidth, RebarsColorStyle, longitudinal_line_dia):
+    RebarsStrokeWidth, RebarsColorStyle, [LongitudinalLineDia, Placements]):
     Returns dictionary containing UShape rebar svg data.
 
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
+    placements is list of placements of rebar to be drawn, default is
+    PlacementList of rebar.
 
     Returns dictionary format:
     {
@@ -429,6 +553,8 @@ def getUShapeRebarSVGData(
     """
     if longitudinal_line_dia is None:
         longitudinal_line_dia = 2 * 2 * rebars_stroke_width
+    if placements is None:
+        placements = rebar.PlacementList
 
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
@@ -436,13 +562,8 @@ def getUShapeRebarSVGData(
     is_rebar_visible = False
     drawing_plane_normal = view_plane.axis
     if round(drawing_plane_normal.cross(getRebarsSpanAxis(rebar)).Length) == 0:
-        basewire = rebar.Base.Shape.Wires[0].copy()
-        basewire.Placement = rebar.PlacementList[0].multiply(basewire.Placement)
-        edges = Part.__sortEdges__(
-            DraftGeomUtils.filletWire(
-                basewire,
-                rebar.Rounding * rebar.Diameter.Value,
-            ).Edges
+        edges = getRebarDerivedGeometry(rebar).getPlacedSortedEdges(
+            rebar.PlacementList[0]
         )
         for edge in edges:
             if DraftGeomUtils.geomType(edge) == "Line":
@@ -484,17 +605,9 @@ def getUShapeRebarSVGData(
                 if is_rebar_visible:
                     u_rebar_svg.append(edge_svg)
     else:
-        basewire = rebar.Base.Shape.Wires[0]
-        for placement in rebar.PlacementList:
-            wire = basewire.copy()
-            wire.Placement = placement.multiply(basewire.Placement)
-
-            edges = Part.__sortEdges__(
-                DraftGeomUtils.filletWire(
-                    wire,
-                    rebar.Rounding * rebar.Diameter.Value,
-                ).Edges
-            )
+        derived_geometry = getRebarDerivedGeometry(rebar)
+        for placement in placements:
+            edges = derived_geometry.getPlacedSortedEdges(placement)
             for edge in edges:
                 if DraftGeomUtils.geomType(edge) == "Line":
                     p1 = getProjectionToSVGPlane(
@@ -558,14 +671,17 @@ def getStraightRebarSVGData(
     rebars_svg,
     rebars_stroke_width,
     rebars_color_style,
+    placements=None,
 ):
     """getStraightRebarSVGData(StraightRebar, ViewPlane, RebarsSVG,
-    RebarsStrokeWidth, RebarsColorStyle):
+    RebarsStrokeWidth, RebarsColorStyle, [Placements]):
     Returns dictionary containing straight rebar svg data.
 
     rebars_color_style can be:
         - "shape color" to select color of rebar shape
         - color name or hex value of color
+    placements is list of placements of rebar to be drawn, default is
+    PlacementList of rebar.
 
     Returns dictionary format:
     {
@@ -573,6 +689,8 @@ def getStraightRebarSVGData(
         "visibility": is_rebar_visible,
     }
     """
+    if placements is None:
+        placements = rebar.PlacementList
     rebars_color = getRebarColor(rebar, rebars_color_style)
 
     straight_rebar_svg = ElementTree.Element(
@@ -599,7 +717,7 @@ def getStraightRebarSVGData(
             straight_rebar_svg.append(rebar_svg)
     else:
         basewire = rebar.Base.Shape.Wires[0]
-        for placement in rebar.PlacementList:
+        for placement in placements:
             wire = basewire.copy()
             wire.Placement = placement.multiply(basewire.Placement)
             p1 = getProjectionToSVGPlane(wire.Vertexes[0].Point, view_plane)
@@ -630,6 +748,161 @@ def getStraightRebarSVGData(
     }
 
 
+def getRebarLODData(
+    rebar,
+    view_plane,
+    snapshot,
+    lod_mode="None",
+    lod_scale=1,
+    lod_min_spacing=1,
+):
+    """getRebarLODData(Rebar, ViewPlane, Snapshot, [LODMode, LODScale,
+    LODMinSpacing]):
+    Returns level of detail data of rebar for drawing at scale lod_scale.
+    snapshot is the RebarGeometrySnapshot of rebars of drawing, having rebar.
+
+    If placements of rebar are uniformly spaced and spacing between rebars
+    projected on view_plane and scaled by lod_scale is less than
+    lod_min_spacing, rebars are drawn as per lod_mode:
+        - "FirstLast" to draw first and last rebar with annotation of number,
+          diameter and spacing of rebars
+        - "Subset" to draw every n-th rebar so that spacing between drawn
+          rebars is at least lod_min_spacing
+        - "None" to draw all rebars
+
+    Returns dictionary format:
+    {
+        "placements": placements of rebar to be drawn or None to draw all,
+        "svg": annotation svg element or None,
+    }
+    """
+    lod_data = {"placements": None, "svg": None}
+    if lod_mode == "None":
+        return lod_data
+    spacing = snapshot.getUniformSpacing(rebar)
+    if spacing is None:
+        return lod_data
+    drawing_spacing = np.linalg.norm(
+        getProjectionsToSVGPlane(spacing, view_plane)
+    )
+    if drawing_spacing == 0 or drawing_spacing * lod_scale >= lod_min_spacing:
+        return lod_data
+
+    placements = rebar.PlacementList
+    if lod_mode == "Subset":
+        step = math.ceil(lod_min_spacing / (drawing_spacing * lod_scale))
+        lod_data["placements"] = placements[::step]
+        if (len(placements) - 1) % step:
+            lod_data["placements"].append(placements[-1])
+    elif lod_mode == "FirstLast":
+        lod_data["placements"] = [placements[0], placements[-1]]
+        x, y = (
+            getPlacedProjectionsToSVGPlane(
+                [tuple(rebar.Base.Shape.BoundBox.Center)],
+                snapshot.getPlacementMatrices(rebar)[[0, -1]],
+                view_plane,
+            )
+            .mean(axis=0)[0]
+            .tolist()
+        )
+        lod_data["svg"] = getSVGTextElement(
+            "{} Ø{} @ {}".format(
+                len(placements),
+                round(rebar.Diameter.Value),
+                round(float(np.linalg.norm(spacing))),
+            ),
+            x,
+            y,
+            DIMENSION_FONT_FAMILY,
+            DIMENSION_FONT_SIZE / lod_scale,
+            text_anchor="middle",
+            dominant_baseline="central",
+        )
+    return lod_data
+
+
+def getStructureSVG(structure, view_plane, stroke_width, fill_style):
+    """getStructureSVG(Structure, ViewPlane, StrokeWidth, FillStyle):
+    Returns svg element of structure projected on view_plane, with
+    fill-opacity 0.2 if fill_style is not "none".
+
+    Structure svg is cached per structure revision, view plane, stroke width
+    and fill style, so it is reused across recomputes and by all drawing views
+    sharing same view plane until structure is changed.
+    """
+    fill_key = fill_style
+    if fill_style == "shape color" and FreeCAD.GuiUp:
+        view_object = structure.ViewObject
+        fill_key = (
+            fill_style,
+            tuple(view_object.ShapeColor),
+            view_object.Transparency,
+        )
+    key = (
+        structure.Document.Name,
+        structure.Name,
+        getObjectRevision(structure),
+        tuple(
+            round(coordinate, 9)
+            for vector in (view_plane.u, view_plane.v, view_plane.axis)
+            for coordinate in vector
+        ),
+        round(stroke_width, 9),
+        fill_key,
+    )
+    structure_svg = _STRUCTURE_SVG_CACHE.get(key)
+    if structure_svg is None:
+        structure_svg = ElementTree.Element("g", attrib={"id": "structure"})
+        structure_svg.extend(
+            ElementTree.fromstring(
+                "<g>{}</g>".format(
+                    Draft.get_svg(
+                        structure,
+                        direction=view_plane,
+                        linewidth=stroke_width,
+                        fillstyle=fill_style,
+                    )
+                )
+            )
+        )
+        # Fix structure transparency (useful in console mode where
+        # obj.ViewObject.Transparency is not available OR in gui mode if
+        # structure transparency is ~0)
+        if fill_style != "none":
+            setSVGFillOpacity(structure_svg, 0.2)
+        if len(_STRUCTURE_SVG_CACHE) >= _STRUCTURE_SVG_CACHE_SIZE:
+            _STRUCTURE_SVG_CACHE.clear()
+        _STRUCTURE_SVG_CACHE[key] = structure_svg
+    return copy.deepcopy(structure_svg)
+
+
+def getShapeRebarsDict(rebars_list):
+    """getShapeRebarsDict(RebarsList):
+    Returns dictionary with rebar shape as key and list of rebars of that shape
+    as value. Rebar shape can be "Stirrup", "BentShapeRebar", "UShapeRebar",
+    "LShapeRebar", "StraightRebar", "HelicalRebar" or "CustomRebar" for rebars
+    not created using Reinforcement Workbench.
+    """
+    shape_rebars_dict = {
+        rebar_shape: []
+        for rebar_shape in (
+            "Stirrup",
+            "BentShapeRebar",
+            "UShapeRebar",
+            "LShapeRebar",
+            "StraightRebar",
+            "HelicalRebar",
+            "CustomRebar",
+        )
+    }
+    snapshot = getRebarGeometrySnapshot(rebars_list)
+    for rebar, rebar_shape in zip(rebars_list, snapshot.rebar_shapes):
+        shape_rebars_dict.get(
+            rebar_shape, shape_rebars_dict["CustomRebar"]
+        ).append(rebar)
+    return shape_rebars_dict
+
+
 def getReinforcementDrawingSVGData(
     structure,
     rebars_list,
@@ -638,10 +911,16 @@ def getReinforcementDrawingSVGData(
     rebars_color_style,
     structure_stroke_width,
     structure_fill_style,
+    clip_rectangle=None,
+    svg_precision=None,
+    lod_mode="None",
+    lod_scale=1,
+    lod_min_spacing=1,
 ):
     """getReinforcementDrawingSVGData(Structure, RebarsList, ViewDirection,
     RebarsStrokeWidth, RebarsFillStyle, StructureStrokeWidth,
-    StructureFillStyle):
+    StructureFillStyle, [ClipRectangle, SVGPrecision, LODMode, LODScale,
+    LODMinSpacing]):
     Generates Reinforcement Drawing View.
 
     view_direction is FreeCAD.Vector() or WorkingPlane.plane() corresponding to
@@ -654,6 +933,16 @@ def getReinforcementDrawingSVGData(
         - "shape color" to select color of rebar shape
         - color name or hex value of color
         - "none" to not fill structure shape
+    clip_rectangle is (min_x, min_y, max_x, max_y) of detail window in view
+    plane coordinates. Rebars whose bounding box lies entirely outside it are
+    skipped before generating their svg, and lines of partially visible
+    rebars are clipped to it. If None, complete drawing is generated.
+    svg_precision is number of decimal places of coordinates in compact svg.
+    If not None, lines, round corners and points of each rebar with same style
+    are merged into single path element. If None, each edge of rebar is
+    generated as separate svg element.
+    lod_mode, lod_scale and lod_min_spacing are level of detail settings for
+    uniformly spaced rebars, as described in getRebarLODData().
 
     Returns dictionary format:
     {
@@ -667,9 +956,15 @@ def getReinforcementDrawingSVGData(
     elif isinstance(view_direction, WorkingPlane.Plane):
         view_plane = view_direction
 
-    min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
-        structure, rebars_list, view_plane
-    )
+    if clip_rectangle:
+        rebars_list = getRebarsInClipRectangle(
+            rebars_list, view_plane, clip_rectangle
+        )
+        min_x, min_y, max_x, max_y = clip_rectangle
+    else:
+        min_x, min_y, max_x, max_y = getDrawingMinMaxXY(
+            structure, rebars_list, view_plane
+        )
 
     svg = getSVGRootElement()
 
@@ -679,107 +974,47 @@ def getReinforcementDrawingSVGData(
     svg.append(reinforcement_drawing)
 
     # Filter rebars created using Reinforcement Workbench
-    stirrups = []
-    bent_rebars = []
-    u_rebars = []
-    l_rebars = []
-    straight_rebars = []
-    helical_rebars = []
-    custom_rebars = []
-    for rebar in rebars_list:
-        if not hasattr(rebar, "RebarShape"):
-            custom_rebars.append(rebar)
-        elif rebar.RebarShape == "Stirrup":
-            stirrups.append(rebar)
-        elif rebar.RebarShape == "BentShapeRebar":
-            bent_rebars.append(rebar)
-        elif rebar.RebarShape == "UShapeRebar":
-            u_rebars.append(rebar)
-        elif rebar.RebarShape == "LShapeRebar":
-            l_rebars.append(rebar)
-        elif rebar.RebarShape == "StraightRebar":
-            straight_rebars.append(rebar)
-        elif rebar.RebarShape == "HelicalRebar":
-            helical_rebars.append(rebar)
-        else:
-            custom_rebars.append(rebar)
+    shape_rebars_dict = getShapeRebarsDict(rebars_list)
+    # Same cached snapshot as of getShapeRebarsDict(), shared by all rebars
+    snapshot = getRebarGeometrySnapshot(rebars_list)
+    helical_rebars = shape_rebars_dict["HelicalRebar"]
+    custom_rebars = shape_rebars_dict["CustomRebar"]
 
     rebars_svg = ElementTree.Element("g", attrib={"id": "Rebars"})
     reinforcement_drawing.append(rebars_svg)
 
     visible_rebars = []
-    stirrups_svg = ElementTree.Element("g", attrib={"id": "Stirrup"})
-    rebars_svg.append(stirrups_svg)
-    for rebar in stirrups:
-        rebar_data = getStirrupSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            stirrups_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    bent_rebars_svg = ElementTree.Element("g", attrib={"id": "BentShapeRebar"})
-    rebars_svg.append(bent_rebars_svg)
-    for rebar in bent_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            bent_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    u_rebars_svg = ElementTree.Element("g", attrib={"id": "UShapeRebar"})
-    rebars_svg.append(u_rebars_svg)
-    for rebar in u_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            u_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    l_rebars_svg = ElementTree.Element("g", attrib={"id": "LShapeRebar"})
-    rebars_svg.append(l_rebars_svg)
-    for rebar in l_rebars:
-        rebar_data = getUShapeRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            l_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
-
-    straight_rebars_svg = ElementTree.Element(
-        "g", attrib={"id": "StraightRebar"}
-    )
-    rebars_svg.append(straight_rebars_svg)
-
-    for rebar in straight_rebars:
-        rebar_data = getStraightRebarSVGData(
-            rebar,
-            view_plane,
-            rebars_svg,
-            rebars_stroke_width,
-            rebars_color_style,
-        )
-        if rebar_data["visibility"]:
-            straight_rebars_svg.append(rebar_data["svg"])
-            visible_rebars.append(rebar)
+    for rebar_shape, get_rebar_svg_data in (
+        ("Stirrup", getStirrupSVGData),
+        ("BentShapeRebar", getUShapeRebarSVGData),
+        ("UShapeRebar", getUShapeRebarSVGData),
+        ("LShapeRebar", getUShapeRebarSVGData),
+        ("StraightRebar", getStraightRebarSVGData),
+    ):
+        shape_rebars_svg = ElementTree.Element("g", attrib={"id": rebar_shape})
+        rebars_svg.append(shape_rebars_svg)
+        for rebar in shape_rebars_dict[rebar_shape]:
+            lod_data = getRebarLODData(
+                rebar,
+                view_plane,
+                snapshot,
+                lod_mode,
+                lod_scale,
+                lod_min_spacing,
+            )
+            rebar_data = get_rebar_svg_data(
+                rebar,
+                view_plane,
+                rebars_svg,
+                rebars_stroke_width,
+                rebars_color_style,
+                placements=lod_data["placements"],
+            )
+            if rebar_data["visibility"]:
+                if lod_data["svg"] is not None:
+                    rebar_data["svg"].append(lod_data["svg"])
+                shape_rebars_svg.append(rebar_data["svg"])
+                visible_rebars.append(rebar)
 
     helical_rebars_svg = ElementTree.Element("g", attrib={"id": "HelicalRebar"})
     rebars_svg.append(helical_rebars_svg)
@@ -817,33 +1052,203 @@ def getReinforcementDrawingSVGData(
         if rebar_svg_draft:
             custom_rebars_svg.append(ElementTree.fromstring(rebar_svg_draft))
 
+    if clip_rectangle:
+        clipSVGElement(rebars_svg, clip_rectangle)
+
     # Create Structure SVG
-    _structure_svg = '<g id="structure">{}</g>'.format(
-        Draft.get_svg(
-            structure,
-            direction=view_plane,
-            linewidth=structure_stroke_width,
-            fillstyle=structure_fill_style,
+    structure_svg = getStructureSVG(
+        structure, view_plane, structure_stroke_width, structure_fill_style
+    )
+    reinforcement_drawing.append(structure_svg)
+    if svg_precision is not None:
+        compactSVGElement(reinforcement_drawing, svg_precision)
+    reinforcement_drawing.set(
+        "transform",
+        "translate({}, {})".format(round(-min_x), round(-min_y)),
+    )
+
+    svg_width = round(max_x - min_x)
+    svg_height = round(max_y - min_y)
+
+    svg.set("width", "{}mm".format(svg_width))
+    svg.set("height", "{}mm".format(svg_height))
+    svg.set("viewBox", "0 0 {} {}".format(svg_width, svg_height))
+
+    return {"svg": svg, "rebars": visible_rebars}
+
+
+def getReinforcementSectionData(
+    structure, rebars_list, section_point, section_direction, section_depth=0
+):
+    """getReinforcementSectionData(Structure, RebarsList, SectionPoint,
+    SectionDirection, [SectionDepth]):
+    Returns geometry of section of structure and rebars_list by plane passing
+    through section_point with normal section_direction, projected on view
+    plane looking against section_direction.
+
+    Centerlines of rebars from all placements are intersected with section
+    plane in single vectorized computation, without OCC boolean sections.
+    Rebars segments lying in section plane or behind it within section_depth
+    are returned as lines.
+
+    Returns dictionary format:
+    {
+        "view_plane": view_plane,
+        "rebars": list of rebars cut by or lying in section plane,
+        "cut_points": {rebar_name: (N, 2) array of center of cut rebars},
+        "radius": {rebar_name: radius of cut rebars},
+        "lines": {rebar_name: (L, 2, 2) array of end points of lines},
+        "structure": list of (N, 2) arrays of points of structure section,
+        "min_max_xy": (min_x, min_y, max_x, max_y) of section,
+    }
+    """
+    section_direction = FreeCAD.Vector(section_direction)
+    section_direction.normalize()
+    view_plane = getSVGPlaneFromAxis(section_direction)
+
+    snapshot = getRebarGeometrySnapshot(rebars_list)
+    starts, ends, rebars_rows = snapshot.getPlacedSegments()
+    cut, points, in_plane = getPlaneSegmentsIntersection(
+        starts, ends, section_point, section_direction, section_depth
+    )
+    cut_points = getProjectionsToSVGPlane(points, view_plane)
+    cut_rebars_rows = rebars_rows[cut]
+    lines = np.stack(
+        (
+            getProjectionsToSVGPlane(starts[in_plane], view_plane),
+            getProjectionsToSVGPlane(ends[in_plane], view_plane),
+        ),
+        axis=1,
+    )
+    lines_rebars_rows = rebars_rows[in_plane]
+
+    section_data = {
+        "view_plane": view_plane,
+        "rebars": [],
+        "cut_points": {},
+        "radius": {},
+        "lines": {},
+        "structure": [],
+    }
+    xy_bounds = []
+    for i, rebar in enumerate(rebars_list):
+        rebar_cut_points = np.unique(
+            cut_points[cut_rebars_rows == i].round(3), axis=0
+        )
+        rebar_lines = lines[lines_rebars_rows == i]
+        if not len(rebar_cut_points) and not len(rebar_lines):
+            continue
+        radius = snapshot.diameters[i] / 2
+        section_data["rebars"].append(rebar)
+        section_data["cut_points"][rebar.Name] = rebar_cut_points
+        section_data["radius"][rebar.Name] = radius
+        section_data["lines"][rebar.Name] = rebar_lines
+        xy_bounds.extend((rebar_cut_points - radius, rebar_cut_points + radius))
+        xy_bounds.append(rebar_lines.reshape(-1, 2))
+
+    for wire in structure.Shape.slice(
+        section_direction, section_direction.dot(FreeCAD.Vector(section_point))
+    ):
+        wire_points = getProjectionsToSVGPlane(
+            [tuple(point) for point in wire.discretize(Deflection=1)],
+            view_plane,
         )
+        section_data["structure"].append(wire_points)
+        xy_bounds.append(wire_points)
+
+    xy_bounds = np.concatenate([np.zeros((0, 2))] + xy_bounds)
+    if len(xy_bounds):
+        section_data["min_max_xy"] = tuple(
+            xy_bounds.min(axis=0).tolist() + xy_bounds.max(axis=0).tolist()
+        )
+    else:
+        section_data["min_max_xy"] = (0, 0, 0, 0)
+    return section_data
+
+
+def getReinforcementSectionSVGData(
+    structure,
+    section_data,
+    rebars_stroke_width,
+    rebars_color_style,
+    structure_stroke_width,
+    structure_fill_style,
+    svg_precision=None,
+):
+    """getReinforcementSectionSVGData(Structure, SectionData,
+    RebarsStrokeWidth, RebarsColorStyle, StructureStrokeWidth,
+    StructureFillStyle, [SVGPrecision]):
+    Generates Reinforcement Section Drawing View from section_data returned by
+    getReinforcementSectionData(). Cut rebars are drawn as filled circles of
+    rebar diameter and rebars lying in section plane as lines.
+
+    rebars_color_style, structure_fill_style and svg_precision are same as
+    in getReinforcementDrawingSVGData().
+
+    Returns dictionary format:
+    {
+        "svg": reinforcement_section_svg,
+        "rebars": visible_rebars,
+    }
+    """
+    min_x, min_y, max_x, max_y = section_data["min_max_xy"]
+
+    svg = getSVGRootElement()
+    reinforcement_drawing = ElementTree.Element(
+        "g", attrib={"id": "reinforcement_drawing"}
     )
+    svg.append(reinforcement_drawing)
 
-    # Fix structure transparency (useful in console mode where
-    # obj.ViewObject.Transparency is not available OR in gui mode if
-    # structure transparency is ~0)
-    if structure_fill_style != "none":
-        if _structure_svg.find("fill-opacity") == -1:
-            _structure_svg = _structure_svg.replace(
-                ";fill:", ";fill-opacity:0.2;fill:"
+    rebars_svg = ElementTree.Element("g", attrib={"id": "Rebars"})
+    reinforcement_drawing.append(rebars_svg)
+    for rebar in section_data["rebars"]:
+        rebars_color = getRebarColor(rebar, rebars_color_style)
+        rebar_svg = ElementTree.Element("g", attrib={"id": str(rebar.Name)})
+        radius = section_data["radius"][rebar.Name]
+        for x, y in section_data["cut_points"][rebar.Name].tolist():
+            rebar_svg.append(
+                getPointSVG(
+                    FreeCAD.Vector(x, y, 0), radius=radius, fill=rebars_color
+                )
             )
-        else:
-            import re
-
-            _structure_svg = re.sub(
-                '(fill-opacity:)([^:]+)(;|")', r"\1 0.2\3", _structure_svg
+        for (x1, y1), (x2, y2) in section_data["lines"][rebar.Name].tolist():
+            rebar_svg.append(
+                getLineSVG(
+                    FreeCAD.Vector(x1, y1, 0),
+                    FreeCAD.Vector(x2, y2, 0),
+                    rebars_stroke_width,
+                    rebars_color,
+                )
             )
+        rebars_svg.append(rebar_svg)
 
-    structure_svg = ElementTree.fromstring(_structure_svg)
+    if structure_fill_style == "shape color":
+        structure_fill_style = (
+            Draft.getrgb(structure.ViewObject.ShapeColor)
+            if FreeCAD.GuiUp
+            else "none"
+        )
+    structure_svg = ElementTree.Element("g", attrib={"id": "structure"})
+    for wire_points in section_data["structure"]:
+        structure_svg.append(
+            ElementTree.Element(
+                "path",
+                d="M"
+                + " L".join(
+                    "{} {}".format(x, y) for x, y in wire_points.tolist()
+                )
+                + " Z",
+                style="stroke:#000000;stroke-width:{};fill:{}".format(
+                    structure_stroke_width, structure_fill_style
+                ),
+            )
+        )
+    if structure_fill_style != "none":
+        setSVGFillOpacity(structure_svg, 0.2)
     reinforcement_drawing.append(structure_svg)
+
+    if svg_precision is not None:
+        compactSVGElement(reinforcement_drawing, svg_precision)
     reinforcement_drawing.set(
         "transform",
         "translate({}, {})".format(round(-min_x), round(-min_y)),
@@ -856,4 +1261,4 @@ def getReinforcementDrawingSVGData(
     svg.set("height", "{}mm".format(svg_height))
     svg.set("viewBox", "0 0 {} {}".format(svg_width, svg_height))
 
-    return {"svg": svg, "rebars": visible_rebars}
+    return {"svg": svg, "rebars": section_data["rebars"]}
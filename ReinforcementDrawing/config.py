@@ -167,3 +167,9 @@ DIMENSION_SINGLE_REBAR_TEXT_POSITION_TYPE = "StartOfLine"
 # The dimension label position type, in case of multiple rebars are visible
 # Supported values: "StartOfLine", "MidOfLine" or "EndOfLine"
 DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE = "MidOfLine"
+
+# The dimension label placement
+# - set it to "AvoidOverlap" to move each dimension label to nearby position
+#   free of rebars, dimension lines and other labels, if any
+# - set it to "Fixed" to place dimension labels at their default position
+DIMENSION_LABEL_PLACEMENT = "AvoidOverlap"
@@ -26,11 +26,23 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import math
+
 import FreeCAD
 import Draft
 
-from .ReinforcementDrawingView import makeReinforcementDrawingObject
-from .ReinforcementDimensioning import makeReinforcementDimensioningObject
+from RebarGeometry import getRebarGeometrySnapshot
+from .ReinforcementDrawingView import (
+    ReinforcementDrawingView,
+    makeReinforcementDrawingObject,
+)
+from .ReinforcementDimensioning import (
+    layoutReinforcementDimensionings,
+    makeReinforcementDimensioningObject,
+)
+from .ReinforcementDimensioningLayer import (
+    makeReinforcementDimensioningLayerObject,
+)
 
 from .config import (
     REBARS_STROKE_WIDTH,
@@ -105,6 +117,64 @@ def getStructureRebarsDict(structure_list=None, rebars_list=None):
     return struct_rebars_dict
 
 
+def setReinforcementDrawingViewProperties(
+    drawing_page,
+    drawing_view,
+    structure,
+    rebars_list,
+    view,
+    rebars_stroke_width,
+    rebars_color_style,
+    rebars_color,
+    structure_stroke_width,
+    structure_color_style,
+    structure_color,
+    drawing_left_offset,
+    drawing_top_offset,
+    drawing_min_right_offset,
+    drawing_min_bottom_offset,
+    drawing_max_width,
+    drawing_max_height,
+    dimension_left_offset,
+    dimension_right_offset,
+    dimension_top_offset,
+    dimension_bottom_offset,
+):
+    """setReinforcementDrawingViewProperties(DrawingPage, DrawingView,
+    Structure, RebarsList, View, RebarsStrokeWidth, RebarsColorStyle,
+    RebarsColor, StructureStrokeWidth, StructureColorStyle, StructureColor,
+    DrawingLeftOffset, DrawingTopOffset, DrawingMinRightOffset,
+    DrawingMinBottomOffset, DrawingMaxWidth, DrawingMaxHeight,
+    DimensionLeftOffset, DimensionRightOffset, DimensionTopOffset,
+    DimensionBottomOffset):
+    Set properties of ReinforcementDrawingView object drawing_view added to
+    drawing_page.
+    """
+    drawing_view.Label = view + " View"
+    drawing_view.Structure = structure
+    drawing_view.Rebars = rebars_list
+    drawing_view.View = view
+    drawing_view.ScaleType = "Automatic"
+    drawing_view.PositionType = "Automatic"
+    drawing_view.RebarsStrokeWidth = rebars_stroke_width
+    drawing_view.RebarsColorStyle = rebars_color_style
+    drawing_view.RebarsColor = rebars_color
+    drawing_view.StructureStrokeWidth = structure_stroke_width
+    drawing_view.StructureColorStyle = structure_color_style
+    drawing_view.StructureColor = structure_color
+    drawing_view.Template = drawing_page.Template
+    drawing_view.LeftOffset = drawing_left_offset
+    drawing_view.TopOffset = drawing_top_offset
+    drawing_view.MinRightOffset = drawing_min_right_offset
+    drawing_view.MinBottomOffset = drawing_min_bottom_offset
+    drawing_view.MaxWidth = drawing_max_width
+    drawing_view.MaxHeight = drawing_max_height
+    drawing_view.DimensionLeftOffset = dimension_left_offset
+    drawing_view.DimensionRightOffset = dimension_right_offset
+    drawing_view.DimensionTopOffset = dimension_top_offset
+    drawing_view.DimensionBottomOffset = dimension_bottom_offset
+
+
 def makeReinforcementDrawing(
     structure,
     rebars_list,
@@ -151,35 +221,180 @@ def makeReinforcementDrawing(
     reinforcement_drawing_page = makeReinforcementDrawingObject(template_file)
     reinforcement_drawing_page.Label = structure.Label + " Drawing"
     drawing_content_obj = reinforcement_drawing_page.Views[0]
-    drawing_content_obj.Label = view + " View"
-    drawing_content_obj.Structure = structure
-    drawing_content_obj.Rebars = rebars_list
-    drawing_content_obj.View = view
-    drawing_content_obj.ScaleType = "Automatic"
-    drawing_content_obj.PositionType = "Automatic"
-    drawing_content_obj.RebarsStrokeWidth = rebars_stroke_width
-    drawing_content_obj.RebarsColorStyle = rebars_color_style
-    drawing_content_obj.RebarsColor = rebars_color
-    drawing_content_obj.StructureStrokeWidth = structure_stroke_width
-    drawing_content_obj.StructureColorStyle = structure_color_style
-    drawing_content_obj.StructureColor = structure_color
-    drawing_content_obj.Template = reinforcement_drawing_page.Template
-    drawing_content_obj.LeftOffset = drawing_left_offset
-    drawing_content_obj.TopOffset = drawing_top_offset
-    drawing_content_obj.MinRightOffset = drawing_min_right_offset
-    drawing_content_obj.MinBottomOffset = drawing_min_bottom_offset
-    drawing_content_obj.MaxWidth = drawing_max_width
-    drawing_content_obj.MaxHeight = drawing_max_height
-    drawing_content_obj.DimensionLeftOffset = dimension_left_offset
-    drawing_content_obj.DimensionRightOffset = dimension_right_offset
-    drawing_content_obj.DimensionTopOffset = dimension_top_offset
-    drawing_content_obj.DimensionBottomOffset = dimension_bottom_offset
+    setReinforcementDrawingViewProperties(
+        reinforcement_drawing_page,
+        drawing_content_obj,
+        structure,
+        rebars_list,
+        view,
+        rebars_stroke_width,
+        rebars_color_style,
+        rebars_color,
+        structure_stroke_width,
+        structure_color_style,
+        structure_color,
+        drawing_left_offset,
+        drawing_top_offset,
+        drawing_min_right_offset,
+        drawing_min_bottom_offset,
+        drawing_max_width,
+        drawing_max_height,
+        dimension_left_offset,
+        dimension_right_offset,
+        dimension_top_offset,
+        dimension_bottom_offset,
+    )
     drawing_content_obj.recompute()
     reinforcement_drawing_page.recompute(True)
 
     return reinforcement_drawing_page
 
 
+def makeMultiViewReinforcementDrawing(
+    structure,
+    rebars_list,
+    views,
+    rebars_stroke_width,
+    rebars_color_style,
+    rebars_color,
+    structure_stroke_width,
+    structure_color_style,
+    structure_color,
+    drawing_left_offset,
+    drawing_top_offset,
+    drawing_min_right_offset,
+    drawing_min_bottom_offset,
+    drawing_max_width,
+    drawing_max_height,
+    template_file,
+    dimension_left_offset,
+    dimension_right_offset,
+    dimension_top_offset,
+    dimension_bottom_offset,
+    single_page=True,
+):
+    """makeMultiViewReinforcementDrawing(Structure, RebarsList, Views,
+    RebarsStrokeWidth, RebarsColorStyle, RebarsColor, StructureStrokeWidth,
+    StructureColorStyle, StructureColor, DrawingLeftOffset, DrawingTopOffset,
+    DrawingMinRightOffset, DrawingMinBottomOffset, DrawingMaxWidth,
+    DrawingMaxHeight, TemplateFile, DimensionLeftOffset, DimensionRightOffset,
+    DimensionTopOffset, DimensionBottomOffset, [SinglePage]):
+    Generates Reinforcement Drawing SVG views for structure, one for each view
+    in views.
+
+    views is the list of views, where each view can be "Front", "Rear",
+    "Left", "Right", "Top" or "Bottom".
+
+    If single_page is True, then all views are laid out in grid on single
+    drawing page, with each view scaled to fit in its grid cell. Otherwise,
+    each view is created on separate drawing page.
+
+    Geometry of structure and rebars is extracted once and shared by all
+    views. Refer makeReinforcementDrawing() for description of other
+    parameters.
+
+    Returns list of reinforcement drawing pages of type TechDraw::DrawPage.
+    """
+    if not single_page:
+        return [
+            makeReinforcementDrawing(
+                structure,
+                rebars_list,
+                view,
+                rebars_stroke_width,
+                rebars_color_style,
+                rebars_color,
+                structure_stroke_width,
+                structure_color_style,
+                structure_color,
+                drawing_left_offset,
+                drawing_top_offset,
+                drawing_min_right_offset,
+                drawing_min_bottom_offset,
+                drawing_max_width,
+                drawing_max_height,
+                template_file,
+                dimension_left_offset,
+                dimension_right_offset,
+                dimension_top_offset,
+                dimension_bottom_offset,
+            )
+            for view in views
+        ]
+
+    reinforcement_drawing_page = makeReinforcementDrawingObject(template_file)
+    reinforcement_drawing_page.Label = structure.Label + " Drawing"
+    drawing_views = [reinforcement_drawing_page.Views[0]]
+    for _ in views[1:]:
+        drawing_view = ReinforcementDrawingView(
+            "ReinforcementDrawingView"
+        ).Object
+        reinforcement_drawing_page.addView(drawing_view)
+        drawing_views.append(drawing_view)
+
+    # Divide area of template available for drawing into grid cells, leaving
+    # space for dimensions around each view
+    columns = math.ceil(math.sqrt(len(views)))
+    rows = math.ceil(len(views) / columns)
+    template = reinforcement_drawing_page.Template
+    cell_width = (
+        template.Width.Value - drawing_left_offset - drawing_min_right_offset
+    ) / columns
+    cell_height = (
+        template.Height.Value - drawing_top_offset - drawing_min_bottom_offset
+    ) / rows
+    view_max_width = cell_width - dimension_left_offset - dimension_right_offset
+    view_max_height = (
+        cell_height - dimension_top_offset - dimension_bottom_offset
+    )
+    if drawing_max_width:
+        view_max_width = min(view_max_width, drawing_max_width)
+    if drawing_max_height:
+        view_max_height = min(view_max_height, drawing_max_height)
+
+    for i, (view, drawing_view) in enumerate(zip(views, drawing_views)):
+        row, column = divmod(i, columns)
+        setReinforcementDrawingViewProperties(
+            reinforcement_drawing_page,
+            drawing_view,
+            structure,
+            rebars_list,
+            view,
+            rebars_stroke_width,
+            rebars_color_style,
+            rebars_color,
+            structure_stroke_width,
+            structure_color_style,
+            structure_color,
+            drawing_left_offset + column * cell_width + dimension_left_offset,
+            drawing_top_offset + row * cell_height + dimension_top_offset,
+            drawing_min_right_offset,
+            drawing_min_bottom_offset,
+            view_max_width,
+            view_max_height,
+            dimension_left_offset,
+            dimension_right_offset,
+            dimension_top_offset,
+            dimension_bottom_offset,
+        )
+
+    # Extract geometry shared by all views before recomputing them
+    getRebarGeometrySnapshot(rebars_list)
+    for drawing_view in drawing_views:
+        drawing_view.recompute()
+
+    # Use same scale for all views on page
+    scale = min(drawing_view.Scale for drawing_view in drawing_views)
+    for drawing_view in drawing_views:
+        if drawing_view.Scale != scale:
+            drawing_view.ScaleType = "Custom"
+            drawing_view.Scale = scale
+            drawing_view.recompute()
+    reinforcement_drawing_page.recompute(True)
+
+    return [reinforcement_drawing_page]
+
+
 def makeStructuresReinforcementDrawing(
     structure_list=None,
     rebars_list=None,
@@ -235,6 +450,8 @@ def makeStructuresReinforcementDrawing(
     dimension_multi_rebar_text_position_type=(
         DIMENSION_MULTI_REBAR_TEXT_POSITION_TYPE
     ),
+    views_on_single_page=True,
+    dimensioning_layer=True,
 ):
     """makeStructuresReinforcementDrawing([StructureList, RebarsList, View,
     RebarsStrokeWidth, RebarsColorStyle, RebarsColor, StructureStrokeWidth,
@@ -251,7 +468,7 @@ def makeStructuresReinforcementDrawing(
     DimensionRightOffsetIncrement, DimensionTopOffsetIncrement,
     DimensionBottomOffsetIncrement, SingleRebar_OuterDimension,
     MultiRebar_OuterDimension, SingleRebar_TextPositionType,
-    MultiRebar_TextPositionType]):
+    MultiRebar_TextPositionType, ViewsOnSinglePage, DimensioningLayer]):
     Generates Reinforcement Drawing SVG view for structures.
 
     structure_list is the list of structural objects. If not provided,
@@ -261,7 +478,10 @@ def makeStructuresReinforcementDrawing(
     rebars_list is the list of rebar objects. If not provided, rebars objects
     having Host in structure_list will be selected from active document.
 
-    view can be "Front", "Rear", "Left", "Right", "Top" or "Bottom".
+    view can be "Front", "Rear", "Left", "Right", "Top" or "Bottom". It can
+    also be list of views to generate all of them for each structure in one
+    pass, laid out on single drawing page if views_on_single_page is True or
+    on separate drawing pages otherwise.
 
     rebars_color_style/structure_color_style can be "Automatic" to select color
     from rebar/structure shape or "Custom" to use color as defined by parameter
@@ -278,8 +498,13 @@ def makeStructuresReinforcementDrawing(
     dimension_rebars_filter_list is the list of rebars to perform dimensioning.
     Set it to None to dimension all visible rebars in drawing.
 
+    set dimensioning_layer True to hold all dimensions of each drawing view in
+    single ReinforcementDimensioningLayer object, computed in one pass, or
+    False to create one ReinforcementDimensioning object per rebar.
+
     Returns dictionary with structure as key and corresponding reinforcement
-    drawing page as value.
+    drawing page as value. If view is list of views, then value is list of
+    reinforcement drawing pages.
     """
     struct_rebars_dict = getStructureRebarsDict(structure_list, rebars_list)
     if not struct_rebars_dict:
@@ -290,58 +515,126 @@ def makeStructuresReinforcementDrawing(
         return None
     struct_drawing_page_dict = {}
     for structure in struct_rebars_dict:
-        struct_drawing_page_dict[structure] = makeReinforcementDrawing(
-            structure,
-            struct_rebars_dict[structure],
-            view,
-            rebars_stroke_width,
-            rebars_color_style,
-            rebars_color,
-            structure_stroke_width,
-            structure_color_style,
-            structure_color,
-            drawing_left_offset,
-            drawing_top_offset,
-            drawing_min_right_offset,
-            drawing_min_bottom_offset,
-            drawing_max_width,
-            drawing_max_height,
-            template_file,
-            dimension_left_offset,
-            dimension_right_offset,
-            dimension_top_offset,
-            dimension_bottom_offset,
-        )
-        if perform_dimensioning:
-            drawing_page = struct_drawing_page_dict[structure]
-            drawing_view = drawing_page.Views[0]
-            rebars = drawing_view.VisibleRebars
-            if dimension_rebars_filter_list:
-                rebars = list(set(rebars) & set(dimension_rebars_filter_list))
-            for rebar in rebars:
-                makeReinforcementDimensioningObject(
-                    rebar,
-                    drawing_view,
-                    drawing_page,
-                    dimension_label_format,
-                    dimension_font_family,
-                    dimension_font_size,
-                    dimension_stroke_width,
-                    dimension_line_style,
-                    dimension_line_color,
-                    dimension_text_color,
-                    dimension_single_rebar_line_start_symbol,
-                    dimension_single_rebar_line_end_symbol,
-                    dimension_multi_rebar_line_start_symbol,
-                    dimension_multi_rebar_line_end_symbol,
-                    dimension_line_mid_point_symbol,
-                    dimension_left_offset_increment,
-                    dimension_right_offset_increment,
-                    dimension_top_offset_increment,
-                    dimension_bottom_offset_increment,
-                    dimension_single_rebar_outer_dim,
-                    dimension_multi_rebar_outer_dim,
-                    dimension_single_rebar_text_position_type,
-                    dimension_multi_rebar_text_position_type,
+        if isinstance(view, str):
+            drawing_pages = [
+                makeReinforcementDrawing(
+                    structure,
+                    struct_rebars_dict[structure],
+                    view,
+                    rebars_stroke_width,
+                    rebars_color_style,
+                    rebars_color,
+                    structure_stroke_width,
+                    structure_color_style,
+                    structure_color,
+                    drawing_left_offset,
+                    drawing_top_offset,
+                    drawing_min_right_offset,
+                    drawing_min_bottom_offset,
+                    drawing_max_width,
+                    drawing_max_height,
+                    template_file,
+                    dimension_left_offset,
+                    dimension_right_offset,
+                    dimension_top_offset,
+                    dimension_bottom_offset,
                 )
+            ]
+            struct_drawing_page_dict[structure] = drawing_pages[0]
+        else:
+            drawing_pages = makeMultiViewReinforcementDrawing(
+                structure,
+                struct_rebars_dict[structure],
+                list(view),
+                rebars_stroke_width,
+                rebars_color_style,
+                rebars_color,
+                structure_stroke_width,
+                structure_color_style,
+                structure_color,
+                drawing_left_offset,
+                drawing_top_offset,
+                drawing_min_right_offset,
+                drawing_min_bottom_offset,
+                drawing_max_width,
+                drawing_max_height,
+                template_file,
+                dimension_left_offset,
+                dimension_right_offset,
+                dimension_top_offset,
+                dimension_bottom_offset,
+                views_on_single_page,
+            )
+            struct_drawing_page_dict[structure] = drawing_pages
+        if not perform_dimensioning:
+            continue
+        for drawing_page in drawing_pages:
+            drawing_views = [
+                drawing_view
+                for drawing_view in drawing_page.Views
+                if Draft.getType(drawing_view) == "ReinforcementDrawingView"
+            ]
+            for drawing_view in drawing_views:
+                if dimensioning_layer:
+                    makeReinforcementDimensioningLayerObject(
+                        drawing_view,
+                        drawing_page,
+                        dimension_rebars_filter_list,
+                        dimension_label_format,
+                        dimension_font_family,
+                        dimension_font_size,
+                        dimension_stroke_width,
+                        dimension_line_style,
+                        dimension_line_color,
+                        dimension_text_color,
+                        dimension_single_rebar_line_start_symbol,
+                        dimension_single_rebar_line_end_symbol,
+                        dimension_multi_rebar_line_start_symbol,
+                        dimension_multi_rebar_line_end_symbol,
+                        dimension_line_mid_point_symbol,
+                        dimension_left_offset_increment,
+                        dimension_right_offset_increment,
+                        dimension_top_offset_increment,
+                        dimension_bottom_offset_increment,
+                        dimension_single_rebar_outer_dim,
+                        dimension_multi_rebar_outer_dim,
+                        dimension_single_rebar_text_position_type,
+                        dimension_multi_rebar_text_position_type,
+                        recompute=False,
+                    )
+                    continue
+                rebars = drawing_view.VisibleRebars
+                if dimension_rebars_filter_list:
+                    rebars = list(
+                        set(rebars) & set(dimension_rebars_filter_list)
+                    )
+                for rebar in rebars:
+                    makeReinforcementDimensioningObject(
+                        rebar,
+                        drawing_view,
+                        drawing_page,
+                        dimension_label_format,
+                        dimension_font_family,
+                        dimension_font_size,
+                        dimension_stroke_width,
+                        dimension_line_style,
+                        dimension_line_color,
+                        dimension_text_color,
+                        dimension_single_rebar_line_start_symbol,
+                        dimension_single_rebar_line_end_symbol,
+                        dimension_multi_rebar_line_start_symbol,
+                        dimension_multi_rebar_line_end_symbol,
+                        dimension_line_mid_point_symbol,
+                        dimension_left_offset_increment,
+                        dimension_right_offset_increment,
+                        dimension_top_offset_increment,
+                        dimension_bottom_offset_increment,
+                        dimension_single_rebar_outer_dim,
+                        dimension_multi_rebar_outer_dim,
+                        dimension_single_rebar_text_position_type,
+                        dimension_multi_rebar_text_position_type,
+                        layout_dimensionings=False,
+                    )
+                layoutReinforcementDimensionings(drawing_view)
+            drawing_page.recompute(True)
     return struct_drawing_page_dict
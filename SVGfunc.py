@@ -26,12 +26,17 @@ __author__ = "Suraj"
 __url__ = "https://www.freecadweb.org"
 
 
+import copy
 import math
+import re
 from typing import Union
 from xml.etree import ElementTree
 
 import FreeCAD
 
+# Cache of symbol svg elements with (symbol, stroke width, color) as key
+_SYMBOL_SVG_CACHE = {}
+
 
 # --------------------------------------------------------------------------
 # Generic functions
@@ -137,6 +142,259 @@ def isLineInSVG(p1, p2, svg):
         return False
 
 
+def setSVGFillOpacity(svg, opacity):
+    """setSVGFillOpacity(SVG, Opacity):
+    Sets fill-opacity of svg and its sub-elements which have fill or
+    fill-opacity set in their style attribute.
+    """
+    for element in svg.iter():
+        style = element.get("style")
+        if not style:
+            continue
+        style_properties = [
+            [part.strip() for part in declaration.split(":", 1)]
+            for declaration in style.split(";")
+            if ":" in declaration
+        ]
+        style_names = [name for name, _ in style_properties]
+        if "fill" not in style_names and "fill-opacity" not in style_names:
+            continue
+        style_properties = [
+            [name, value]
+            for name, value in style_properties
+            if name != "fill-opacity"
+        ]
+        style_names = [name for name, _ in style_properties]
+        style_properties.insert(
+            style_names.index("fill") if "fill" in style_names else 0,
+            ["fill-opacity", str(opacity)],
+        )
+        element.set(
+            "style",
+            ";".join(
+                "{}:{}".format(name, value) for name, value in style_properties
+            ),
+        )
+    return svg
+
+
+def clipLineToRectangle(x1, y1, x2, y2, clip_rectangle):
+    """clipLineToRectangle(X1, Y1, X2, Y2, ClipRectangle):
+    Clips line from (x1, y1) to (x2, y2) to clip_rectangle
+    (x_min, y_min, x_max, y_max) using Liang-Barsky algorithm.
+
+    Returns tuple (x1, y1, x2, y2) of clipped line or None if line is entirely
+    outside clip_rectangle.
+    """
+    x_min, y_min, x_max, y_max = clip_rectangle
+    dx = x2 - x1
+    dy = y2 - y1
+    t_start = 0
+    t_end = 1
+    for p, q in (
+        (-dx, x1 - x_min),
+        (dx, x_max - x1),
+        (-dy, y1 - y_min),
+        (dy, y_max - y1),
+    ):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            t_start = max(t_start, t)
+        else:
+            t_end = min(t_end, t)
+        if t_start > t_end:
+            return None
+    return (
+        x1 + t_start * dx,
+        y1 + t_start * dy,
+        x1 + t_end * dx,
+        y1 + t_end * dy,
+    )
+
+
+def parseRoundCornerPathData(path_data):
+    """parseRoundCornerPathData(PathData):
+    Returns tuple (x1, y1, radius, sweep_flag, x2, y2) of round corner path
+    data "M{x1} {y1} A{radius} {radius} 0 0 {sweep_flag} {x2} {y2}" or None if
+    path_data is not a round corner path data.
+    """
+    values = path_data.replace("M", "").replace("A", " ").split()
+    if not path_data.startswith("M") or len(values) != 9:
+        return None
+    try:
+        x1, y1, r, _, _, _, sweep_flag, x2, y2 = map(float, values)
+    except ValueError:
+        return None
+    return x1, y1, r, int(sweep_flag), x2, y2
+
+
+def clipSVGElement(svg, clip_rectangle):
+    """clipSVGElement(SVG, ClipRectangle):
+    Clips line elements of svg to clip_rectangle (x_min, y_min, x_max, y_max)
+    and removes line, circle and arc path elements of svg entirely outside
+    clip_rectangle. Other elements are kept as it is.
+    """
+    x_min, y_min, x_max, y_max = clip_rectangle
+    for element in list(svg):
+        if element.tag == "line":
+            clipped_line = clipLineToRectangle(
+                float(element.get("x1")),
+                float(element.get("y1")),
+                float(element.get("x2")),
+                float(element.get("y2")),
+                clip_rectangle,
+            )
+            if clipped_line is None:
+                svg.remove(element)
+                continue
+            for attribute, value in zip(("x1", "y1", "x2", "y2"), clipped_line):
+                element.set(attribute, str(round(value)))
+        elif element.tag == "circle":
+            cx = float(element.get("cx"))
+            cy = float(element.get("cy"))
+            r = float(element.get("r", 0))
+            if (
+                cx + r < x_min
+                or cx - r > x_max
+                or cy + r < y_min
+                or cy - r > y_max
+            ):
+                svg.remove(element)
+        elif element.tag == "path":
+            round_corner = parseRoundCornerPathData(element.get("d", ""))
+            if round_corner is None:
+                continue
+            x1, y1, r, _, x2, y2 = round_corner
+            if (
+                max(x1, x2) + r < x_min
+                or min(x1, x2) - r > x_max
+                or max(y1, y2) + r < y_min
+                or min(y1, y2) - r > y_max
+            ):
+                svg.remove(element)
+        else:
+            clipSVGElement(element, clip_rectangle)
+
+
+def formatSVGNumber(value, precision=0):
+    """formatSVGNumber(Value, [Precision]):
+    Returns shortest string of value rounded to precision decimal places.
+    """
+    value = round(float(value), precision) + 0.0
+    if precision <= 0:
+        return str(int(value))
+    return "{:.{}f}".format(value, precision).rstrip("0").rstrip(".")
+
+
+def roundSVGPathData(path_data, precision=0):
+    """roundSVGPathData(PathData, [Precision]):
+    Returns path_data with all numbers rounded to precision decimal places.
+    """
+    return re.sub(
+        r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+        lambda match: formatSVGNumber(match.group(), precision),
+        path_data,
+    )
+
+
+def compactSVGElement(svg, precision=0):
+    """compactSVGElement(SVG, [Precision]):
+    Merges line, round corner path and circle children of each group of svg
+    having same style into single path element, placed at position of first
+    merged element. If all merged line and round corner paths of group have
+    same style, the style is hoisted to group. Numbers in path data of other
+    path elements are rounded to precision decimal places.
+    """
+    merged_paths = {}
+    for element in list(svg):
+        if element.tag == "line":
+            stroke = element.get("stroke", "black")
+            stroke_width = element.get("stroke-width", "1")
+            x1, y1, x2, y2 = (
+                formatSVGNumber(element.get(attribute), precision)
+                for attribute in ("x1", "y1", "x2", "y2")
+            )
+            key = ("stroke", stroke, stroke_width)
+            start, path_data = "{} {}".format(x1, y1), "L{} {}".format(x2, y2)
+            end = "{} {}".format(x2, y2)
+        elif element.tag == "path":
+            round_corner = parseRoundCornerPathData(element.get("d", ""))
+            stroke = element.get("stroke", "black")
+            if round_corner is None or element.get(
+                "style"
+            ) != "stroke:{};fill:none".format(stroke):
+                element.set(
+                    "d", roundSVGPathData(element.get("d", ""), precision)
+                )
+                continue
+            x1, y1, r, sweep_flag, x2, y2 = round_corner
+            x1, y1, r, x2, y2 = (
+                formatSVGNumber(value, precision)
+                for value in (x1, y1, r, x2, y2)
+            )
+            key = ("stroke", stroke, element.get("stroke-width", "1"))
+            start = "{} {}".format(x1, y1)
+            path_data = "A{r} {r} 0 0 {sweep_flag} {x2} {y2}".format(
+                r=r, sweep_flag=sweep_flag, x2=x2, y2=y2
+            )
+            end = "{} {}".format(x2, y2)
+        elif element.tag == "circle" and element.get("style") is None:
+            try:
+                cx, cy, r = (
+                    float(element.get(attribute))
+                    for attribute in ("cx", "cy", "r")
+                )
+            except (TypeError, ValueError):
+                continue
+            key = ("fill", element.get("fill", "black"))
+            start = "{} {}".format(
+                formatSVGNumber(cx - r, precision),
+                formatSVGNumber(cy, precision),
+            )
+            r, d = formatSVGNumber(r, precision), formatSVGNumber(
+                2 * r, precision
+            )
+            path_data = "a{r} {r} 0 1 0 {d} 0a{r} {r} 0 1 0 -{d} 0Z".format(
+                r=r, d=d
+            )
+            end = None
+        else:
+            compactSVGElement(element, precision)
+            continue
+
+        if key not in merged_paths:
+            merged_path = ElementTree.Element("path")
+            svg.insert(list(svg).index(element), merged_path)
+            merged_paths[key] = [merged_path, [], None]
+        merged_path_data = merged_paths[key]
+        # Skip move command if element starts where previous one ended
+        if merged_path_data[2] != start:
+            merged_path_data[1].append("M" + start)
+        merged_path_data[1].append(path_data)
+        merged_path_data[2] = end
+        svg.remove(element)
+
+    stroke_keys = [key for key in merged_paths if key[0] == "stroke"]
+    for key, (merged_path, path_data, _) in merged_paths.items():
+        merged_path.set("d", "".join(path_data))
+        if key[0] == "fill":
+            merged_path.set("fill", key[1])
+            merged_path.set("stroke", "none")
+        elif len(stroke_keys) == 1:
+            svg.set("stroke", key[1])
+            svg.set("stroke-width", key[2])
+            svg.set("fill", "none")
+        else:
+            merged_path.set("stroke", key[1])
+            merged_path.set("stroke-width", key[2])
+            merged_path.set("fill", "none")
+    return svg
+
+
 def getLinePathElement(
     points_list,
     stroke_width=0.35,
@@ -145,9 +403,10 @@ def getLinePathElement(
     start_symbol="None",
     mid_points_symbol="None",
     end_symbol="None",
+    symbol_defs=None,
 ):
     """getLinePathElement(PointsList, [StrokeWidth, StrokeStyle, Color,
-    StartSymbol, MidPointsSymbol, EndSymbol]):
+    StartSymbol, MidPointsSymbol, EndSymbol, SymbolDefs]):
     Returns line path joining given points.
 
     points_list is a list of points (x, y) defining line path.
@@ -158,6 +417,10 @@ def getLinePathElement(
     start_symbol/end_symbol can be "FilledArrow", "Tick", "Dot" or "None".
 
     mid_points_symbol can be "Tick", "Dot" or "None".
+
+    symbol_defs is the <defs> element of svg. If given, symbols are defined
+    once in symbol_defs and referenced by <use> elements, otherwise symbols
+    are added inline.
     """
     line_svg = ElementTree.Element("g")
     line_path_data = "M{} {}".format(points_list[0][0], points_list[0][1])
@@ -186,89 +449,59 @@ def getLinePathElement(
         line_path.set("stroke-dasharray", str(stroke_style))
 
     # Set start symbol
-    if start_symbol == "FilledArrow":
-        start_symbol_svg = getFilledArrowSVG(stroke_width, color)
-    elif start_symbol == "Tick":
-        start_symbol_svg = getTickSymbolSVG(stroke_width, color)
-    elif start_symbol == "Dot":
-        start_symbol_svg = getPointSVG(
-            point=FreeCAD.Vector(0, 0, 0), radius=2 * stroke_width, fill=color
-        )
-    else:
-        start_symbol_svg = None
+    start_symbol_svg = getPlacedSymbolSVG(
+        start_symbol,
+        points_list[0],
+        math.degrees(
+            math.atan2(
+                points_list[0][1] - points_list[1][1],
+                points_list[0][0] - points_list[1][0],
+            )
+        ),
+        stroke_width,
+        color,
+        symbol_defs,
+    )
     if start_symbol_svg is not None:
-        start_symbol_svg.set(
-            "transform",
-            "translate({} {}) rotate({} 0 0)".format(
-                points_list[0][0],
-                points_list[0][1],
-                math.degrees(
-                    math.atan2(
-                        points_list[0][1] - points_list[1][1],
-                        points_list[0][0] - points_list[1][0],
-                    )
-                ),
-            ),
-        )
         line_svg.append(start_symbol_svg)
 
     # Set mid points symbol
-    if mid_points_symbol == "Tick":
-        mid_point_symbol_svg = getTickSymbolSVG(stroke_width, color)
-    elif mid_points_symbol == "Dot":
-        mid_point_symbol_svg = getPointSVG(
-            FreeCAD.Vector(0, 0, 0), radius=2 * stroke_width, fill=color
-        )
-    else:
-        mid_point_symbol_svg = None
-    if mid_point_symbol_svg is not None:
-        import copy
-
+    if mid_points_symbol in ("Tick", "Dot"):
         mid_points_symbol_svg = ElementTree.Element("g", id="line_mid_points")
         p_point = points_list[0]
         for mid_point in points_list[1:-1]:
-            mid_point_svg = copy.deepcopy(mid_point_symbol_svg)
-            mid_point_svg.set(
-                "transform",
-                "translate({} {}) rotate({} 0 0)".format(
-                    mid_point[0],
-                    mid_point[1],
+            mid_points_symbol_svg.append(
+                getPlacedSymbolSVG(
+                    mid_points_symbol,
+                    mid_point,
                     math.degrees(
                         math.atan2(
                             mid_point[1] - p_point[1], mid_point[0] - p_point[0]
                         )
                     ),
-                ),
+                    stroke_width,
+                    color,
+                    symbol_defs,
+                )
             )
             p_point = mid_point
-            mid_points_symbol_svg.append(mid_point_svg)
         line_svg.append(mid_points_symbol_svg)
 
     # Set end symbol
-    if end_symbol == "FilledArrow":
-        end_symbol_svg = getFilledArrowSVG(stroke_width, color)
-    elif end_symbol == "Tick":
-        end_symbol_svg = getTickSymbolSVG(stroke_width, color)
-    elif end_symbol == "Dot":
-        end_symbol_svg = getPointSVG(
-            point=FreeCAD.Vector(0, 0, 0), radius=2 * stroke_width, fill=color
-        )
-    else:
-        end_symbol_svg = None
+    end_symbol_svg = getPlacedSymbolSVG(
+        end_symbol,
+        points_list[-1],
+        math.degrees(
+            math.atan2(
+                points_list[-1][1] - points_list[-2][1],
+                points_list[-1][0] - points_list[-2][0],
+            )
+        ),
+        stroke_width,
+        color,
+        symbol_defs,
+    )
     if end_symbol_svg is not None:
-        end_symbol_svg.set(
-            "transform",
-            "translate({} {}) rotate({} 0 0)".format(
-                points_list[-1][0],
-                points_list[-1][1],
-                math.degrees(
-                    math.atan2(
-                        points_list[-1][1] - points_list[-2][1],
-                        points_list[-1][0] - points_list[-2][0],
-                    )
-                ),
-            ),
-        )
         line_svg.append(end_symbol_svg)
 
     return line_svg
@@ -391,6 +624,66 @@ def getTickSymbolSVG(stroke_width=0.35, color="black"):
     return tick_svg
 
 
+def getSymbolSVG(symbol, stroke_width=0.35, color="black"):
+    """getSymbolSVG(Symbol, [StrokeWidth, Color]):
+    Returns svg element of symbol placed at origin, with id unique for symbol
+    and its style, or None if symbol is "None". The returned element is
+    cached per style and must not be modified.
+
+    symbol can be "FilledArrow", "Tick" or "Dot".
+    """
+    key = (symbol, str(stroke_width), color)
+    if key not in _SYMBOL_SVG_CACHE:
+        if symbol == "FilledArrow":
+            symbol_svg = getFilledArrowSVG(stroke_width, color)
+        elif symbol == "Tick":
+            symbol_svg = getTickSymbolSVG(stroke_width, color)
+        elif symbol == "Dot":
+            symbol_svg = getPointSVG(
+                point=FreeCAD.Vector(0, 0, 0),
+                radius=2 * stroke_width,
+                fill=color,
+            )
+        else:
+            return None
+        symbol_svg.set("id", re.sub(r"[^\w-]", "_", "-".join(key)))
+        _SYMBOL_SVG_CACHE[key] = symbol_svg
+    return _SYMBOL_SVG_CACHE[key]
+
+
+def getPlacedSymbolSVG(
+    symbol, point, angle, stroke_width=0.35, color="black", symbol_defs=None
+):
+    """getPlacedSymbolSVG(Symbol, Point, Angle, [StrokeWidth, Color,
+    SymbolDefs]):
+    Returns svg element of symbol translated to point (x, y) and rotated by
+    angle in degrees, or None if symbol is "None".
+
+    symbol can be "FilledArrow", "Tick" or "Dot".
+
+    symbol_defs is the <defs> element of svg. If given, symbol is added to
+    symbol_defs if not already defined and the returned element is <use>
+    element referencing it, otherwise copy of symbol element is returned.
+    """
+    symbol_svg = getSymbolSVG(symbol, stroke_width, color)
+    if symbol_svg is None:
+        return None
+    symbol_id = symbol_svg.get("id")
+    if symbol_defs is None:
+        placed_symbol_svg = copy.deepcopy(symbol_svg)
+        del placed_symbol_svg.attrib["id"]
+    else:
+        if symbol_defs.find("*[@id='{}']".format(symbol_id)) is None:
+            symbol_defs.append(copy.deepcopy(symbol_svg))
+        placed_symbol_svg = ElementTree.Element("use")
+        placed_symbol_svg.set("xlink:href", "#{}".format(symbol_id))
+    placed_symbol_svg.set(
+        "transform",
+        "translate({} {}) rotate({} 0 0)".format(point[0], point[1], angle),
+    )
+    return placed_symbol_svg
+
+
 # --------------------------------------------------------------------------
 # TechDraw SVG View functions
 # --------------------------------------------------------------------------
@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 import math
 from pathlib import Path
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -41,6 +40,7 @@ from Rebarfunc import (
     getSelectedFace,
     getFaceNumber,
     getParametersOfFace,
+    getShapeExtent,
     showWarning,
     check_selected_face,
     extendedTangentLength,
@@ -420,11 +420,7 @@ def makeStirrup(
             name="Stirrup",
         )
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             line,
@@ -597,11 +593,7 @@ def editStirrup(
         FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
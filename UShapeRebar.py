@@ -28,7 +28,6 @@ __url__ = "https://www.freecadweb.org"
 from pathlib import Path
 from typing import Tuple, List
 
-import ArchCommands
 import FreeCAD
 import FreeCADGui
 from PySide import QtGui
@@ -41,6 +40,7 @@ from Rebarfunc import (
     getSelectedFace,
     getFaceNumber,
     getParametersOfFace,
+    getShapeExtent,
     showWarning,
     check_selected_face,
     facenormalDirection,
@@ -411,11 +411,7 @@ def makeUShapeRebar(
         )
         FreeCAD.ActiveDocument.recompute()
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         rebar = Arch.makeRebar(
             structure,
             sketch,
@@ -576,11 +572,7 @@ def editUShapeRebar(
         FreeCAD.ActiveDocument.recompute()
         Rebar.AmountCheck = True
     else:
-        size = (
-            ArchCommands.projectToVector(
-                structure.Shape.copy(), face.normalAt(0, 0)
-            )
-        ).Length
+        size = getShapeExtent(structure, face.normalAt(0, 0))
         Rebar.Amount = get_rebar_amount_from_spacing(
             size, diameter, amount_spacing_value
         )
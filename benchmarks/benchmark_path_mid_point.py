@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Dimension Label Path Benchmark"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+# Compares getPathMidPoint() of ReinforcementDimensioningfunc, built on prefix
+# sum of segment lengths, with its previous implementation, which summed
+# segment lengths before each point inside its loop.
+#
+# Run it with python of FreeCAD from root of workbench, e.g.:
+#     FreeCADCmd benchmarks/benchmark_path_mid_point.py
+# or
+#     python benchmarks/benchmark_path_mid_point.py
+# if FreeCAD modules are importable by python.
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ReinforcementDrawing.ReinforcementDimensioningfunc import (  # noqa: E402
+    getPathMidPoint,
+)
+
+PATH_SIZES = (2, 10, 100, 1000)
+RANDOM_PATHS_COUNT = 1200
+
+
+def getPathMidPointQuadratic(points_list, return_left_right_points=False):
+    """getPathMidPointQuadratic(PointsList, [ReturnLeftRightPoints]):
+    getPathMidPoint() as before prefix sum of segment lengths was used, kept
+    as baseline of benchmark.
+
+    if return_left_right_points is True, then left and right points of mid_point
+    are also returned: (left_point, mid_point, right_point)
+    """
+    import math
+
+    points_dist = [
+        math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+        for p1, p2 in zip(points_list, points_list[1:])
+    ]
+    path_length = sum(points_dist)
+
+    if len(points_list) == 2:
+        p1, p2 = points_list
+        segment_length = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+        rem_dist = path_length / 2
+        mid_point = (
+            p1[0] + (p2[0] - p1[0]) * rem_dist / segment_length,
+            p1[1] + (p2[1] - p1[1]) * rem_dist / segment_length,
+        )
+        if return_left_right_points:
+            return p1, mid_point, p2
+        else:
+            return mid_point
+
+    for i, point in enumerate(points_list[1:], start=1):
+        if int(sum(points_dist[:i])) == int(path_length / 2):
+            if return_left_right_points:
+                return points_list[i - 1], point, points_list[i + 1]
+            else:
+                return point
+        elif int(sum(points_dist[:i])) > int(path_length / 2):
+            p1 = points_list[i - 1]
+            p2 = point
+            segment_length = math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+            rem_dist = path_length / 2 - sum(points_dist[: i - 1])
+            mid_point = (
+                p1[0] + (p2[0] - p1[0]) * rem_dist / segment_length,
+                p1[1] + (p2[1] - p1[1]) * rem_dist / segment_length,
+            )
+            if return_left_right_points:
+                return p1, mid_point, p2
+            else:
+                return mid_point
+
+
+def getRandomPath(points_count, rng):
+    """Returns list of points_count random points (x, y) with integer
+    coordinates, so that path often has intermediate point at its middle."""
+    return [
+        (rng.randint(0, 1000), rng.randint(0, 1000))
+        for _ in range(points_count)
+    ]
+
+
+def isSameResult(result1, result2, tolerance=1e-6):
+    return all(
+        abs(a - b) <= tolerance
+        for point1, point2 in zip(result1, result2)
+        for a, b in zip(point1, point2)
+    )
+
+
+def main():
+    rng = random.Random(0)
+
+    mismatches = 0
+    for _ in range(RANDOM_PATHS_COUNT):
+        path = getRandomPath(rng.randint(2, 20), rng)
+        # Zero length path is not supported by previous implementation
+        if all(point == path[0] for point in path):
+            continue
+        if not isSameResult(
+            getPathMidPointQuadratic(path, True), getPathMidPoint(path, True)
+        ):
+            mismatches += 1
+    print(
+        "Mismatches on {} random paths: {}".format(
+            RANDOM_PATHS_COUNT, mismatches
+        )
+    )
+
+    print("Per call with return_left_right_points=True, old -> new:")
+    for points_count in PATH_SIZES:
+        path = getRandomPath(points_count, rng)
+        number = max(10, 20000 // points_count)
+        timings = []
+        for function in (getPathMidPointQuadratic, getPathMidPoint):
+            timings.append(
+                min(
+                    timeit.repeat(
+                        lambda: function(path, True), number=number, repeat=5
+                    )
+                )
+                / number
+                * 1e6
+            )
+        print(
+            "    {:4d} points {:8.1f}us -> {:6.1f}us".format(
+                points_count, *timings
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Tests Configuration"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+# Tests run with FreeCAD python, or with plain python using minimal stubs of
+# FreeCAD, Part, Draft and PySide2 modules defined here, which are enough for
+# bill of material tables and rebar geometry snapshots built from stub
+# reinforcement objects.
+
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+class Quantity:
+    """Stub of FreeCAD.Units.Quantity storing value in internal units of
+    FreeCAD i.e. mm and kg."""
+
+    UNIT_FACTORS = {
+        "mm": 1.0,
+        "cm": 10.0,
+        "m": 1000.0,
+        "kg/mm": 1.0,
+        "kg/m": 1e-3,
+    }
+
+    def __init__(self, value=0.0, unit="mm"):
+        if isinstance(value, str):
+            value, _, unit = value.strip().partition(" ")
+            unit = unit.strip() or "mm"
+        self.Value = float(value) * self.UNIT_FACTORS[unit]
+
+    def getValueAs(self, unit):
+        quantity = Quantity()
+        quantity.Value = self.Value / self.UNIT_FACTORS[unit]
+        return quantity
+
+    def __eq__(self, other):
+        return self.Value == other.Value
+
+    def __lt__(self, other):
+        return self.Value < other.Value
+
+    def __hash__(self):
+        return hash(self.Value)
+
+    def __str__(self):
+        return "{} mm".format(self.Value)
+
+
+def getStubFreeCAD():
+    freecad = types.ModuleType("FreeCAD")
+    freecad.Units = types.SimpleNamespace(Quantity=Quantity)
+    freecad.Console = types.SimpleNamespace(
+        PrintMessage=lambda message: None,
+        PrintWarning=lambda message: None,
+        PrintError=lambda message: None,
+    )
+    freecad.Vector = type("Vector", (), {})
+    freecad.BoundBox = type("BoundBox", (), {})
+    freecad.addDocumentObserver = lambda observer: None
+    freecad.ActiveDocument = None
+    freecad.GuiUp = False
+    return freecad
+
+
+def getStubPart():
+    part = types.ModuleType("Part")
+    part.Edge = type("Edge", (), {})
+    part.Wire = type("Wire", (), {})
+    return part
+
+
+def getStubDraft():
+    draft = types.ModuleType("Draft")
+
+    def get_type(obj):
+        return obj.Proxy.Type
+
+    def get_objects_of_type(objects, object_type):
+        return [obj for obj in objects if get_type(obj) == object_type]
+
+    draft.get_type = get_type
+    draft.getType = get_type
+    draft.get_objects_of_type = get_objects_of_type
+    return draft
+
+
+def getStubPySide2():
+    pyside2 = types.ModuleType("PySide2")
+    pyside2.QtCore = types.ModuleType("PySide2.QtCore")
+    pyside2.QtCore.QT_TRANSLATE_NOOP = lambda context, text: text
+    pyside2.QtGui = types.ModuleType("PySide2.QtGui")
+    return pyside2
+
+
+try:
+    import FreeCAD  # noqa: F401
+except ImportError:
+    sys.modules["FreeCAD"] = getStubFreeCAD()
+    sys.modules["Part"] = getStubPart()
+    sys.modules["Draft"] = getStubDraft()
+    sys.modules["DraftGeomUtils"] = types.ModuleType("DraftGeomUtils")
+    sys.modules["DraftVecUtils"] = types.ModuleType("DraftVecUtils")
+    pyside2 = getStubPySide2()
+    sys.modules["PySide2"] = pyside2
+    sys.modules["PySide2.QtCore"] = pyside2.QtCore
+    sys.modules["PySide2.QtGui"] = pyside2.QtGui
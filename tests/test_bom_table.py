@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "BOMTable Tests"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+import random
+from types import SimpleNamespace
+
+import FreeCAD
+import pytest
+
+from BillOfMaterial.BOMTable import BOMTable
+from BillOfMaterial.BOMfunc import (
+    getBaseRebar,
+    getHostReinforcementsDict,
+    getMarkReinforcementsDict,
+)
+from RebarGeometry import DocumentRevisionObserver
+
+DIAMETERS = (8, 10, 12, 16, 20)
+DIA_WEIGHT_MAP = {
+    diameter: FreeCAD.Units.Quantity("{} kg/m".format(diameter**2 / 162))
+    for diameter in DIAMETERS[:-1]
+}
+
+
+class StubDocument:
+    """Document with objects looked up by name."""
+
+    def __init__(self, name="Document"):
+        self.Name = name
+        self.Objects = []
+
+    def getObject(self, name):
+        return next((obj for obj in self.Objects if obj.Name == name), None)
+
+
+class StubObject:
+    """Document object with Proxy.Type and given properties. Revision of
+    object is bumped on creation and on every property change, as done by
+    document observer of FreeCAD, so that cached rebar geometry snapshots are
+    invalidated."""
+
+    def __init__(self, object_type, **properties):
+        self.__dict__["Proxy"] = SimpleNamespace(Type=object_type)
+        self.__dict__.update(properties)
+        DocumentRevisionObserver.bumpRevision(self)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        DocumentRevisionObserver.bumpRevision(self)
+
+
+def getLength(value):
+    return FreeCAD.Units.Quantity("{} mm".format(value))
+
+
+def makeArchRebar(rng, document, name, hosts):
+    rebar = StubObject(
+        "Rebar",
+        Document=document,
+        Name=name,
+        Label=name,
+        Mark=str(rng.randint(1, 25)),
+        Diameter=getLength(rng.choice(DIAMETERS)),
+        Rounding=2,
+        Length=getLength(rng.randint(500, 9000)),
+        Amount=rng.randint(1, 20),
+        Host=rng.choice(hosts + [None]),
+        Base=None,
+        PlacementList=[],
+        Shape=SimpleNamespace(
+            BoundBox=SimpleNamespace(
+                XMin=0, YMin=0, ZMin=0, XMax=0, YMax=0, ZMax=0
+            )
+        ),
+    )
+    document.Objects.append(rebar)
+    return rebar
+
+
+def makeDocumentObjects(document, seed=0, rebars_count=200):
+    """Adds hosts, base rebars and reinforcement objects with random marks,
+    diameters and lengths to document and returns them as tuple. Marks are
+    shared between ArchRebar objects with different lengths, so representative
+    rebar of each row matters."""
+    rng = random.Random(seed)
+    hosts = [
+        StubObject(
+            "Structure",
+            Document=document,
+            Name="Host{}".format(i),
+            Label="H{}".format(i),
+        )
+        for i in range(6)
+    ]
+    base_rebars = [
+        StubObject(
+            "RebarShape",
+            Document=document,
+            Name="BaseRebar{}".format(i),
+            Label="BaseRebar{}".format(i),
+            MarkNumber=30 + i,
+            Diameter=getLength(rng.choice(DIAMETERS)),
+            Length=getLength(rng.randint(500, 9000)),
+        )
+        for i in range(4)
+    ]
+    document.Objects.extend(hosts + base_rebars)
+    rebars = []
+    for i in range(rebars_count):
+        if i % 5:
+            rebars.append(
+                makeArchRebar(rng, document, "Rebar{}".format(i), hosts)
+            )
+        else:
+            rebars.append(
+                StubObject(
+                    "ReinforcementLinear",
+                    Document=document,
+                    Name="Reinforcement{}".format(i),
+                    Label="Reinforcement{}".format(i),
+                    BaseRebar=rng.choice(base_rebars),
+                    Amount=rng.randint(1, 20),
+                    Host=rng.choice(hosts + [None]),
+                )
+            )
+            document.Objects.append(rebars[-1])
+    return hosts, base_rebars, rebars
+
+
+@pytest.fixture
+def active_document(monkeypatch):
+    document = StubDocument()
+    monkeypatch.setattr(FreeCAD, "ActiveDocument", document, raising=False)
+    return document
+
+
+def getMarkRows(mark_reinforcements_dict, host_label=None):
+    """Returns rows of mark_reinforcements_dict, as they were written to bill
+    of material from getMarkReinforcementsDict()."""
+    rows = []
+    for mark, reinforcements in mark_reinforcements_dict.items():
+        base_rebar = getBaseRebar(reinforcements[0])
+        count = sum(reinforcement.Amount for reinforcement in reinforcements)
+        if host_label is None:
+            hosts = ",".join(
+                sorted(
+                    {
+                        reinforcement.Host.Label
+                        for reinforcement in reinforcements
+                        if reinforcement.Host
+                    }
+                )
+            )
+        else:
+            hosts = host_label
+        rows.append(
+            (
+                hosts,
+                mark,
+                count,
+                base_rebar.Diameter.Value,
+                base_rebar.Length.Value,
+                count * base_rebar.Length.Value,
+            )
+        )
+    return rows
+
+
+def getDictRows(reinforcement_group_by):
+    """Returns rows of bill of material of active document, built from
+    getMarkReinforcementsDict() and getHostReinforcementsDict()."""
+    if reinforcement_group_by == "Mark":
+        return getMarkRows(getMarkReinforcementsDict())
+    rows = []
+    for host, reinforcements in getHostReinforcementsDict().items():
+        rows.extend(
+            getMarkRows(
+                getMarkReinforcementsDict(reinforcements),
+                host.Label if hasattr(host, "Label") else str(host),
+            )
+        )
+    return rows
+
+
+def getTableRows(bom_table):
+    return list(
+        zip(
+            bom_table.hosts,
+            bom_table.marks,
+            bom_table.counts.tolist(),
+            bom_table.diameters.tolist(),
+            bom_table.unit_lengths.tolist(),
+            bom_table.total_lengths.tolist(),
+        )
+    )
+
+
+def assertSameTables(bom_table, expected_table):
+    """Asserts that rows and totals of bom_table are equal to rows and totals
+    of expected_table."""
+    assert getTableRows(bom_table) == pytest.approx(
+        getTableRows(expected_table)
+    )
+    assert bom_table.base_rebars == expected_table.base_rebars
+    assert bom_table.first_host_rows.tolist() == (
+        expected_table.first_host_rows.tolist()
+    )
+    assert bom_table.diameter_values.tolist() == (
+        expected_table.diameter_values.tolist()
+    )
+    assert bom_table.diameter_total_lengths == pytest.approx(
+        expected_table.diameter_total_lengths
+    )
+    assert bom_table.diameter_total_weights == pytest.approx(
+        expected_table.diameter_total_weights, nan_ok=True
+    )
+
+
+@pytest.mark.parametrize("reinforcement_group_by", ["Mark", "Host"])
+def test_rows_match_reinforcements_dicts(
+    active_document, reinforcement_group_by
+):
+    _, _, rebars = makeDocumentObjects(active_document)
+
+    bom_table = BOMTable(
+        rebars, "RealLength", reinforcement_group_by, DIA_WEIGHT_MAP
+    )
+
+    expected_rows = getDictRows(reinforcement_group_by)
+    assert getTableRows(bom_table) == pytest.approx(expected_rows)
+    if reinforcement_group_by == "Host":
+        host_labels = [row[0] for row in expected_rows]
+        assert bom_table.first_host_rows.tolist() == [
+            index == 0 or host_label != host_labels[index - 1]
+            for index, host_label in enumerate(host_labels)
+        ]
+
+
+@pytest.mark.parametrize("reinforcement_group_by", ["Mark", "Host"])
+def test_totals_match_reinforcements_dicts(
+    active_document, reinforcement_group_by
+):
+    _, _, rebars = makeDocumentObjects(active_document, seed=1)
+
+    bom_table = BOMTable(
+        rebars, "RealLength", reinforcement_group_by, DIA_WEIGHT_MAP
+    )
+
+    diameter_total_lengths = {}
+    for _, _, _, diameter, _, total_length in getDictRows(
+        reinforcement_group_by
+    ):
+        diameter_total_lengths[diameter] = (
+            diameter_total_lengths.get(diameter, 0) + total_length
+        )
+    diameters = sorted(diameter_total_lengths)
+    assert bom_table.diameter_values.tolist() == diameters
+    assert bom_table.diameter_total_lengths == pytest.approx(
+        [diameter_total_lengths[diameter] for diameter in diameters]
+    )
+    for index, diameter in enumerate(diameters):
+        if diameter in DIA_WEIGHT_MAP:
+            assert bom_table.hasDiameterWeight(index)
+            assert bom_table.diameter_total_weights[index] == pytest.approx(
+                diameter_total_lengths[diameter]
+                / 1000
+                * DIA_WEIGHT_MAP[diameter].getValueAs("kg/m").Value
+            )
+        else:
+            assert not bom_table.hasDiameterWeight(index)
+
+
+@pytest.mark.parametrize("reinforcement_group_by", ["Mark", "Host"])
+def test_incremental_updates_match_full_rebuild(reinforcement_group_by):
+    rng = random.Random(2)
+    document = StubDocument()
+    hosts, base_rebars, rebars = makeDocumentObjects(
+        document, seed=2, rebars_count=80
+    )
+    bom_table = BOMTable(
+        rebars, "RealLength", reinforcement_group_by, DIA_WEIGHT_MAP
+    )
+    new_rebars_count = 0
+    for _ in range(300):
+        operation = rng.random()
+        rebar = rng.choice(rebars)
+        if operation < 0.3:
+            rebar.Amount = rng.randint(1, 20)
+            bom_table.setReinforcement(rebar)
+        elif operation < 0.4 and hasattr(rebar, "Length"):
+            rebar.Length = getLength(rng.randint(500, 9000))
+            bom_table.setReinforcement(rebar)
+        elif operation < 0.5 and hasattr(rebar, "Mark"):
+            rebar.Mark = str(rng.randint(1, 30))
+            bom_table.setReinforcement(rebar)
+        elif operation < 0.55 and hasattr(rebar, "Diameter"):
+            rebar.Diameter = getLength(rng.choice(DIAMETERS))
+            bom_table.setReinforcement(rebar)
+        elif operation < 0.65:
+            rebar.Host = rng.choice(hosts + [None])
+            bom_table.setReinforcement(rebar)
+        elif operation < 0.7:
+            host = rng.choice(hosts)
+            host.Label = "H{}_{}".format(rng.randint(0, 50), host.Name)
+            bom_table.refreshObject(host)
+        elif operation < 0.75:
+            base_rebar = rng.choice(base_rebars)
+            base_rebar.Length = getLength(rng.randint(500, 9000))
+            base_rebar.MarkNumber = rng.randint(1, 40)
+            bom_table.refreshObject(base_rebar)
+        elif operation < 0.87 and len(rebars) > 10:
+            rebars.remove(rebar)
+            bom_table.removeReinforcement(rebar.Name)
+        else:
+            new_rebars_count += 1
+            rebar = makeArchRebar(
+                rng, document, "NewRebar{}".format(new_rebars_count), hosts
+            )
+            rebars.append(rebar)
+            bom_table.setReinforcement(rebar)
+
+        changed_rows = bom_table.updateRows()
+        expected_table = BOMTable(
+            rebars, "RealLength", reinforcement_group_by, DIA_WEIGHT_MAP
+        )
+        assertSameTables(bom_table, expected_table)
+        if changed_rows is not None:
+            assert all(0 <= row < len(bom_table) for row in changed_rows)
+
+
+def test_update_rows_returns_changed_rows_only():
+    _, _, rebars = makeDocumentObjects(
+        StubDocument(), seed=3, rebars_count=50
+    )
+    bom_table = BOMTable(rebars, "RealLength", "Mark", DIA_WEIGHT_MAP)
+    assert bom_table.updateRows() == []
+
+    rebar = next(rebar for rebar in rebars if hasattr(rebar, "Mark"))
+    rebar.Amount += 1
+    bom_table.setReinforcement(rebar)
+    assert bom_table.updateRows() == [bom_table.marks.index(rebar.Mark)]
+
+    rebar.Mark = "NewMark"
+    bom_table.setReinforcement(rebar)
+    assert bom_table.updateRows() is None
+    assert "NewMark" in bom_table.marks
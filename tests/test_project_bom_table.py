@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2026 - Suraj <dadralj18@gmail.com>                      *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "ProjectBOMTable Tests"
+__author__ = "Suraj"
+__url__ = "https://www.freecadweb.org"
+
+
+import FreeCAD
+import pytest
+
+from BillOfMaterial.BillOfMaterial_Project import (
+    ProjectBOMTable,
+    getDocumentNames,
+)
+
+DIA_WEIGHT_MAP = {
+    12.0: FreeCAD.Units.Quantity("0.888 kg/m"),
+    16.0: FreeCAD.Units.Quantity("1.58 kg/m"),
+}
+
+
+def getTableRows(bom_table):
+    return list(
+        zip(
+            bom_table.hosts,
+            bom_table.marks,
+            bom_table.counts.tolist(),
+            bom_table.diameters.tolist(),
+            bom_table.unit_lengths.tolist(),
+            bom_table.total_lengths.tolist(),
+        )
+    )
+
+
+def test_same_marks_are_merged():
+    bom_table = ProjectBOMTable(
+        {
+            "Block/A.FCStd": [
+                ("1", 12.0, 4, 3000.0, "B1"),
+                ("2", 16.0, 2, 5000.0, "B1"),
+            ],
+            "Block/B.FCStd": [("1", 12.0, 6, 3000.0, "B2")],
+        },
+        dia_weight_map=DIA_WEIGHT_MAP,
+    )
+    assert bom_table.mark_collisions == []
+    assert getTableRows(bom_table) == pytest.approx(
+        [
+            ("A,B", "1", 10, 12.0, 3000.0, 30000.0),
+            ("A", "2", 2, 16.0, 5000.0, 10000.0),
+        ]
+    )
+    assert bom_table.diameter_values.tolist() == [12.0, 16.0]
+    assert bom_table.diameter_total_lengths == pytest.approx([30000, 10000])
+    assert bom_table.diameter_total_weights == pytest.approx(
+        [30 * 0.888, 10 * 1.58]
+    )
+
+
+def test_collided_marks_are_renamed_by_document_name():
+    bom_table = ProjectBOMTable(
+        {
+            "a/Floor2.FCStd": [("1", 12.0, 4, 3000.0, "B1")],
+            "b/Floor2.FCStd": [
+                ("1", 12.0, 2, 2500.0, "B1"),
+                ("2", 12.0, 3, 1000.0, "B2"),
+            ],
+        }
+    )
+    assert bom_table.mark_collisions == [("1", "b/Floor2.FCStd")]
+    assert getTableRows(bom_table) == pytest.approx(
+        [
+            ("a/Floor2", "1", 4, 12.0, 3000.0, 12000.0),
+            ("b/Floor2", "1 (b/Floor2)", 2, 12.0, 2500.0, 5000.0),
+            ("b/Floor2", "2", 3, 12.0, 1000.0, 3000.0),
+        ]
+    )
+
+
+def test_rename_fails_if_renamed_mark_exists():
+    with pytest.raises(ValueError):
+        ProjectBOMTable(
+            {
+                "A.FCStd": [
+                    ("1", 12.0, 4, 3000.0, "B1"),
+                    ("1 (B)", 12.0, 1, 1000.0, "B1"),
+                ],
+                "B.FCStd": [("1", 16.0, 2, 3000.0, "B1")],
+            }
+        )
+
+
+def test_collided_marks_are_merged_with_average_unit_length():
+    bom_table = ProjectBOMTable(
+        {
+            "A.FCStd": [("1", 12.0, 1, 3000.0, "B1")],
+            "B.FCStd": [
+                ("1", 12.0, 3, 1000.0, "B1"),
+                ("1", 16.0, 2, 2000.0, "B1"),
+            ],
+        },
+        mark_collision="Merge",
+    )
+    assert bom_table.mark_collisions == [
+        ("1", "B.FCStd"),
+        ("1", "B.FCStd"),
+    ]
+    assert getTableRows(bom_table) == pytest.approx(
+        [
+            ("A,B", "1", 4, 12.0, 1500.0, 6000.0),
+            ("B", "1", 2, 16.0, 2000.0, 4000.0),
+        ]
+    )
+
+
+def test_mark_collision_error():
+    with pytest.raises(ValueError, match="1 in B.FCStd"):
+        ProjectBOMTable(
+            {
+                "A.FCStd": [("1", 12.0, 1, 3000.0, "B1")],
+                "B.FCStd": [("1", 12.0, 1, 3500.0, "B1")],
+            },
+            mark_collision="Error",
+        )
+
+
+def test_document_names():
+    assert getDocumentNames(
+        ["p/a/Floor2.FCStd", "p/b/Floor2.FCStd", "p/Roof.FCStd"]
+    ) == {
+        "p/a/Floor2.FCStd": "a/Floor2",
+        "p/b/Floor2.FCStd": "b/Floor2",
+        "p/Roof.FCStd": "Roof",
+    }
+    with pytest.raises(ValueError):
+        getDocumentNames(["p/Floor2.FCStd", "p/./Floor2.FCStd"])
+
+
+def test_renamed_mark_collides_with_later_documents():
+    bom_table = ProjectBOMTable(
+        {
+            "A.FCStd": [("1", 12.0, 1, 3000.0, "B1")],
+            "B.FCStd": [("1", 16.0, 1, 3000.0, "B1")],
+            "C.FCStd": [("1 (B)", 12.0, 1, 3000.0, "B1")],
+        }
+    )
+    assert bom_table.mark_collisions == [
+        ("1", "B.FCStd"),
+        ("1 (B)", "C.FCStd"),
+    ]
+    assert bom_table.marks == ["1", "1 (B)", "1 (B) (C)"]